@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""HTTP API yük testi: tek çekirdek ve çok süreçli sürekli istek/saniye.
+
+Her ``--isci`` değeri için ``python -m hum_panel api`` ayrı bir süreçte
+başlatılır. ``--istemci`` istemci süreci keep-alive bağlantıyla
+``--sure`` saniye boyunca istek atar; iki senaryo ölçülür:
+
+* ``tekil``: ``POST /v1/hesap/celik_mil`` tek satır
+* ``toplu``: ``POST /v1/toplu`` karışık ``--toplu`` satır (satır nesneleri)
+
+    python benchmarks/api_yuk.py --isci 1 4 --istemci 8 --sure 5 --toplu 1000
+"""
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import time
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np  # noqa: E402
+
+
+def _toplu_govde(n: int) -> bytes:
+    rng = np.random.default_rng(0)
+    satirlar = []
+    for i, m in enumerate(rng.choice(["celik_mil", "lama", "kosebent", "celik_cek_boru", "npu"], n)):
+        boy = float(rng.integers(100, 6000))
+        if m == "celik_mil":
+            s = {"cap": 50.0, "boy": boy}
+        elif m == "lama":
+            s = {"gen": 40.0, "yuk": 10.0, "boy": boy}
+        elif m == "kosebent":
+            s = {"ebat": 50.0, "et": 5.0, "boy": boy}
+        elif m == "celik_cek_boru":
+            s = {"dis": 60.0, "et": 4.0, "boy": boy}
+        else:
+            s = {"ebat": 80.0, "boy": boy}
+        satirlar.append({"malzeme": str(m), "adet": 1 + i % 5, **s})
+    return json.dumps({"satirlar": satirlar}).encode("utf-8")
+
+
+def _istemci(arg):
+    port, yol, govde, sure = arg
+    con = http.client.HTTPConnection("127.0.0.1", port)
+    basliklar = {"Content-Type": "application/json"}
+    gecikmeler, sunucu_ms, pidler = [], [], set()
+    son = time.perf_counter() + sure
+    while True:
+        t0 = time.perf_counter()
+        if t0 > son:
+            break
+        con.request("POST", yol, govde, basliklar)
+        r = con.getresponse()
+        r.read()
+        gecikmeler.append(time.perf_counter() - t0)
+        zaman = dict(p.split(";dur=") for p in r.getheader("Server-Timing", "").split(", ") if ";dur=" in p)
+        sunucu_ms.append(float(zaman.get("toplam", "nan")))
+    con.close()
+    return gecikmeler, sunucu_ms
+
+
+def _senaryo(port: int, yol: str, govde: bytes, istemci: int, sure: float, satir: int) -> dict:
+    with multiprocessing.get_context("spawn").Pool(istemci) as havuz:
+        sonuclar = havuz.map(_istemci, [(port, yol, govde, sure)] * istemci)
+    gecikme = np.array([g for s in sonuclar for g in s[0]]) * 1000
+    sunucu = np.array([g for s in sonuclar for g in s[1]])
+    istek = len(gecikme)
+    return {
+        "istek_s": round(istek / sure, 1),
+        "satir_s": round(istek * satir / sure),
+        "ms_p50": round(float(np.percentile(gecikme, 50)), 3),
+        "ms_p99": round(float(np.percentile(gecikme, 99)), 3),
+        "sunucu_ms_p50": round(float(np.nanpercentile(sunucu, 50)), 3),
+    }
+
+
+def _bos_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _bekle(port: int, zaman_asimi: float = 30.0):
+    son = time.time() + zaman_asimi
+    while time.time() < son:
+        try:
+            con = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            con.request("GET", "/saglik")
+            if con.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("API sunucusu başlamadı")
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--isci", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    p.add_argument("--istemci", type=int, default=8)
+    p.add_argument("--sure", type=float, default=5.0)
+    p.add_argument("--toplu", type=int, default=1000)
+    a = p.parse_args()
+
+    tekil = json.dumps({"cap": 50.0, "boy": 1000.0, "adet": 2}).encode("utf-8")
+    toplu = _toplu_govde(a.toplu)
+    sonuc = {"cpu": os.cpu_count(), "istemci": a.istemci, "sure_s": a.sure, "toplu_satir": a.toplu}
+    for isci in a.isci:
+        port = _bos_port()
+        sunucu = subprocess.Popen(
+            [sys.executable, "-m", "hum_panel", "api", "--port", str(port), "--isci", str(isci)],
+            cwd=KOK,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            _bekle(port)
+            sonuc[f"isci_{isci}"] = {
+                "tekil": _senaryo(port, "/v1/hesap/celik_mil", tekil, a.istemci, a.sure, 1),
+                "toplu": _senaryo(port, "/v1/toplu", toplu, a.istemci, a.sure, a.toplu),
+            }
+        finally:
+            sunucu.terminate()
+            sunucu.wait()
+    print(json.dumps(sonuc, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Türkçe sayı biçimlendirme: ``fmt`` döngüsü vs ``fmt_dizi`` (kolon).
+
+Ağırlık dağılımına benzer ``--boyut`` değer (pozitif/negatif, %0,1 NaN)
+için ölçülür:
+
+* ``fmt``: ``[fmt(v, nd) for v in kolon]`` (panelin eski yolu)
+* ``fmt_dizi``: varsayılan, ``sabit`` (her zaman ``nd`` ondalık) ve
+  ``binlik`` (binlik ayırıcılı) çağrılar
+* ``fmt_dizi_pandas``: sonucun DataFrame kolonuna atanması dahil
+
+``uyumsuz`` varsayılan ``fmt_dizi`` ile ``fmt`` metinlerinin farklı
+olduğu değer sayısıdır; 0 olmalı.
+
+    python benchmarks/bicim_verim.py --boyut 1000000 --nd 2 3
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from hum.bicim import fmt, fmt_dizi  # noqa: E402
+
+
+def _degerler(n: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    x = rng.lognormal(2.0, 2.0, n) * rng.choice([1.0, -1.0], n, p=[0.95, 0.05])
+    x[rng.random(n) < 0.001] = np.nan
+    return x
+
+
+def _olc(is_, tekrar: int) -> float:
+    en_iyi = float("inf")
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        is_()
+        en_iyi = min(en_iyi, time.perf_counter() - t0)
+    return round(en_iyi, 4)
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--boyut", type=int, default=1_000_000)
+    p.add_argument("--nd", type=int, nargs="+", default=[2, 3])
+    p.add_argument("--tekrar", type=int, default=3)
+    a = p.parse_args()
+
+    x = _degerler(a.boyut)
+    liste = x.tolist()
+    sonuc = {"boyut": a.boyut}
+    for nd in a.nd:
+        eski = [fmt(v, nd) for v in liste]
+        yeni = fmt_dizi(x, nd).tolist()
+        df = pd.DataFrame({"deger": x})
+        r = {
+            "fmt_s": _olc(lambda: [fmt(v, nd) for v in liste], a.tekrar),
+            "fmt_dizi_s": _olc(lambda: fmt_dizi(x, nd), a.tekrar),
+            "sabit_s": _olc(lambda: fmt_dizi(x, nd, sabit=True), a.tekrar),
+            "binlik_s": _olc(lambda: fmt_dizi(x, nd, binlik=True), a.tekrar),
+            "fmt_dizi_pandas_s": _olc(lambda: df.assign(deger=fmt_dizi(df["deger"].to_numpy(), nd)), a.tekrar),
+            "uyumsuz": sum(e != y for e, y in zip(eski, yeni)),
+            "ornek": yeni[:3],
+        }
+        r["hizlanma"] = round(r["fmt_s"] / r["fmt_dizi_s"], 1)
+        sonuc[f"nd_{nd}"] = r
+    print(json.dumps(sonuc, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Benchmark paketini çalıştırır, sonucu JSON olarak yazar ve tabanla karşılaştırır.
+
+    python benchmarks/calistir.py --cikti sonuc.json
+    python benchmarks/calistir.py --cikti yeni.json --karsilastir taban.json --esik 0.25
+
+Karşılaştırmada süre metrikleri (``*_s``, ``ms_p50``) ``esik`` oranından
+fazla kötüleşirse ya da formül ``kontrol`` toplamları değişirse farklar
+listelenir ve çıkış kodu 1 olur; CI'da gerileme yakalamak için kullanılır.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from typing import Dict, Iterator, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import formul_verim  # noqa: E402
+import modul_gecikme  # noqa: E402
+import soguk_baslangic  # noqa: E402
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_SURE_METRIKLERI = ("toplu_s", "skaler_s", "ms_p50")
+
+
+def _ortam() -> dict:
+    import numpy
+    import pandas
+    import streamlit
+
+    from hum import katalog
+
+    try:
+        commit = subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=KOK, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "makine": platform.machine(),
+        "numpy": numpy.__version__,
+        "pandas": pandas.__version__,
+        "streamlit": streamlit.__version__,
+        "katalog_surum": katalog.aktif().surum,
+    }
+
+
+def _duz(d: dict, on_ek: str = "") -> Iterator[Tuple[str, object]]:
+    for k, v in d.items():
+        yol = f"{on_ek}.{k}" if on_ek else k
+        if isinstance(v, dict):
+            yield from _duz(v, yol)
+        else:
+            yield yol, v
+
+
+def karsilastir(taban: dict, yeni: dict, esik: float) -> List[str]:
+    """Gerileme açıklamaları; boş liste = gerileme yok."""
+    eski: Dict[str, object] = dict(_duz(taban.get("sonuc", {})))
+    farklar = []
+    for yol, v in _duz(yeni.get("sonuc", {})):
+        if yol not in eski:
+            continue
+        ad = yol.rsplit(".", 1)[-1]
+        if ad == "kontrol" and v != eski[yol]:
+            farklar.append(f"{yol}: {eski[yol]} -> {v} (sonuç değişti)")
+        elif ad in _SURE_METRIKLERI and eski[yol] and v > eski[yol] * (1 + esik):
+            farklar.append(f"{yol}: {eski[yol]} -> {v} (+{(v / eski[yol] - 1) * 100:.0f}%)")
+    return farklar
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--cikti", default="-", help="JSON çıktı dosyası (varsayılan: stdout)")
+    p.add_argument("--karsilastir", help="taban JSON dosyası")
+    p.add_argument("--esik", type=float, default=0.25, help="izin verilen süre artışı oranı")
+    p.add_argument("--boyut", type=int, nargs="+", default=list(formul_verim.BOYUTLAR))
+    p.add_argument("--skaler-sinir", type=int, default=formul_verim.SKALER_SINIR)
+    p.add_argument("--tekrar", type=int, default=20, help="modül başına rerun sayısı")
+    p.add_argument("--soguk-tekrar", type=int, default=3)
+    p.add_argument("--sadece", choices=["formul", "modul", "soguk"], help="tek bir bölümü çalıştır")
+    a = p.parse_args()
+
+    sonuc = {}
+    if a.sadece in (None, "formul"):
+        sonuc["formul"] = formul_verim.olc(a.boyut, a.skaler_sinir, 3)
+    if a.sadece in (None, "modul"):
+        sonuc["modul"] = modul_gecikme.olc(a.tekrar, a.soguk_tekrar)
+    if a.sadece in (None, "soguk"):
+        sonuc["soguk"] = soguk_baslangic.olc(soguk_baslangic.MODULLER, a.soguk_tekrar)
+    rapor = {"ortam": _ortam(), "sonuc": sonuc}
+
+    metin = json.dumps(rapor, indent=2, ensure_ascii=False)
+    if a.cikti == "-":
+        print(metin)
+    else:
+        with open(a.cikti, "w", encoding="utf-8") as f:
+            f.write(metin + "\n")
+
+    if a.karsilastir:
+        with open(a.karsilastir, encoding="utf-8") as f:
+            farklar = karsilastir(json.load(f), rapor, a.esik)
+        for fark in farklar:
+            print(fark, file=sys.stderr)
+        return 1 if farklar else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
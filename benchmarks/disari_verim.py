@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""Dışa aktarma: biçim başına üretim süresi, önbellek isabeti ve bellek tepesi.
+
+``--satir`` satırlık karışık sipariş (``Siparis.satirlar`` blokları, 16
+kolon) CSV, XLSX ve PDF olarak yazılır:
+
+* ``uretim_s``: boş önbellekte dosya üretimi (özet + yazım)
+* ``isabet_s``: aynı içerik ikinci kez istenince (sadece özet)
+* ``tepe_mb``: yazım sırasında Python yığınının tepe artışı (tracemalloc,
+  ayrı koşuda ölçülür); satır sayısıyla büyümemelidir
+* ``boyut_mb``: dosya boyutu
+
+    python benchmarks/disari_verim.py --satir 50000 200000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from hum import disari, siparis  # noqa: E402
+from hum.hesap import OLCU_ALANLARI  # noqa: E402
+
+
+def _siparis(n: int) -> siparis.Siparis:
+    rng = np.random.default_rng(n)
+    sip = siparis.Siparis({a: float(f) for a, f in zip(siparis.AILELER, rng.uniform(20, 80, len(siparis.AILELER)))})
+    df = pd.DataFrame({a: rng.uniform(1, 300, n) for a in OLCU_ALANLARI})
+    df["boy"] = rng.uniform(100, 6000, n)
+    df["ebat"] = rng.choice([80.0, 100.0, 120.0, 200.0], n)
+    df["malzeme"] = rng.choice(siparis.AILELER, n)
+    df["adet"] = rng.integers(1, 50, n)
+    sip.tablo_ekle(df)
+    return sip
+
+
+def _bolumler(sip: siparis.Siparis, blok: int):
+    K = disari.Kolon
+    kolonlar = (
+        [K("malzeme", "Malzeme", genislik=14)]
+        + [K(a, a, 2, 9) for a in OLCU_ALANLARI]
+        + [K("adet", "Adet", 0, 7), K("birim", "Birim", genislik=5),
+           K("miktar_adet", "Miktar/Adet", 3, 12), K("miktar_toplam", "Miktar Toplam", 3, 14),
+           K("tutar", "Tutar (TL)", 2, 15, sabit=True)]
+    )
+    idler = sip.idler()
+
+    def bloklar():
+        for i in range(0, len(idler), blok):
+            yield sip.satirlar(idler[i:i + blok])
+
+    return [disari.Bolum("Sipariş Satırları", kolonlar, bloklar)]
+
+
+def olc(n: int, blok: int) -> dict:
+    sip = _siparis(n)
+    bolumler = _bolumler(sip, blok)
+    sonuc = {}
+    for bicim in disari.BICIMLER:
+        with tempfile.TemporaryDirectory() as klasor:
+            t0 = time.perf_counter()
+            yol = disari.dosya(bicim, "Sipariş", bolumler, klasor)
+            uretim = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            disari.dosya(bicim, "Sipariş", bolumler, klasor)
+            isabet = time.perf_counter() - t0
+            boyut = os.path.getsize(yol)
+
+        with tempfile.TemporaryDirectory() as klasor:
+            tracemalloc.start()
+            disari.dosya(bicim, "Sipariş", bolumler, klasor)
+            tepe = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        sonuc[bicim] = {
+            "uretim_s": round(uretim, 3),
+            "isabet_s": round(isabet, 3),
+            "tepe_mb": round(tepe / 2**20, 1),
+            "boyut_mb": round(boyut / 2**20, 2),
+        }
+    return sonuc
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--satir", type=int, nargs="+", default=[50_000, 200_000])
+    p.add_argument("--blok", type=int, default=10_000)
+    a = p.parse_args()
+    print(json.dumps({f"satir_{n}": olc(n, a.blok) for n in a.satir}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
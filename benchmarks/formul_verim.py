@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""Ağırlık formüllerinin verimi: satır satır (skaler) vs tek çağrı (toplu).
+
+Her ``hesap.FORMULLER`` modülü için sentetik bir BOM üretilir ve
+
+* ``skaler``: formül her satır için ayrı ayrı Python float'larıyla çağrılır
+  (panelin eski, hücre başına hesap yolu)
+* ``toplu``: tüm kolonlar tek bir vektörel ``modul_hesapla`` çağrısıyla
+
+ölçülür. Skaler ölçüm büyük boyutlarda dakikalar sürdüğünden
+``--skaler-sinir`` satırdan büyük boyutlar için atlanır. ``kontrol``
+değeri sonuçların toplamıdır; formül ya da katalog değişirse değişir.
+
+    python benchmarks/formul_verim.py --boyut 1000 100000 10000000
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from typing import Dict, Sequence
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from hum import hesap, katalog  # noqa: E402
+
+BOYUTLAR = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+SKALER_SINIR = 100_000
+
+# Sentetik ölçü aralıkları (mm); profil ebatları katalogdan seçilir.
+_ARALIK = {
+    "kal": (1, 100), "en": (10, 3000), "boy": (10, 12000), "cap": (5, 500),
+    "ebat": (5, 200), "gen": (10, 300), "yuk": (2, 60), "et": (1, 20),
+    "dis": (10, 500), "ic": (0, 5),
+}
+
+
+def sentetik_bom(mod_id: str, n: int, tohum: int = 0) -> Dict[str, np.ndarray]:
+    """``mod_id`` için ``n`` satırlık, yaklaşık %1'i eksik ölçülü kolonlar."""
+    rng = np.random.default_rng(tohum)
+    kolonlar = {}
+    for alan in hesap.FORMULLER[mod_id].alanlar:
+        if alan == "ebat" and mod_id in katalog.aktif().moduller:
+            ebatlar = np.fromiter(katalog.aktif().modul_katsayi(mod_id), np.float64)
+            kolonlar[alan] = rng.choice(ebatlar, n)
+        else:
+            alt, ust = _ARALIK[alan]
+            kolonlar[alan] = rng.uniform(alt, ust, n).round(1)
+    kolonlar["boy"][rng.random(n) < 0.01] = 0.0
+    return kolonlar
+
+
+def _sure(fn, tekrar: int) -> float:
+    en_iyi = math.inf
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        fn()
+        en_iyi = min(en_iyi, time.perf_counter() - t0)
+    return en_iyi
+
+
+def _skaler(mod_id: str, kolonlar: Dict[str, np.ndarray]) -> float:
+    formul = hesap.FORMULLER[mod_id]
+    satirlar = zip(*(kolonlar[a].tolist() for a in formul.alanlar))
+    return sum(
+        v for v in (float(formul.fonksiyon(*s)) for s in satirlar) if not math.isnan(v)
+    )
+
+
+def olc(boyutlar: Sequence[int], skaler_sinir: int, tekrar: int) -> dict:
+    sonuc = {}
+    for mod_id in hesap.FORMULLER:
+        sonuc[mod_id] = {}
+        for n in boyutlar:
+            kolonlar = sentetik_bom(mod_id, n)
+            toplu = _sure(lambda: hesap.modul_hesapla(mod_id, kolonlar), tekrar)
+            kayit = {
+                "toplu_s": round(toplu, 6),
+                "toplu_satir_s": round(n / toplu),
+                "kontrol": round(float(np.nansum(hesap.modul_hesapla(mod_id, kolonlar))), 3),
+            }
+            if n <= skaler_sinir:
+                skaler = _sure(lambda: _skaler(mod_id, kolonlar), 1)
+                kayit.update(
+                    skaler_s=round(skaler, 6),
+                    skaler_satir_s=round(n / skaler),
+                    hizlanma=round(skaler / toplu, 1),
+                )
+            sonuc[mod_id][str(n)] = kayit
+    return sonuc
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--boyut", type=int, nargs="+", default=list(BOYUTLAR))
+    p.add_argument("--skaler-sinir", type=int, default=SKALER_SINIR)
+    p.add_argument("--tekrar", type=int, default=3, help="toplu ölçümde en iyi N")
+    a = p.parse_args()
+    print(json.dumps(olc(a.boyut, a.skaler_sinir, a.tekrar), indent=2))
+
+
+if __name__ == "__main__":
+    main()
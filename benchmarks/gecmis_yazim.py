@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""Hesap geçmişi: UI iş parçacığının ödediği yazma gecikmesi ve sayfa okuma.
+
+``--oturum`` iş parçacığı aynı anda rerun başına ``--satir`` kayıt bırakır.
+Kuyruklu yazma (``GecmisDeposu.ekle``) ile her rerun'da doğrudan
+``INSERT + COMMIT`` karşılaştırılır; ardından ``--dolgu`` kayıtlık
+veritabanında sipariş sayfaları okunur.
+
+    python benchmarks/gecmis_yazim.py --oturum 200 --rerun 20 --dolgu 1000000
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from hum import gecmis  # noqa: E402
+
+
+def _satirlar(n: int):
+    return [({"cap": 50.0, "boy": 1000.0 + i}, 15.4 + i) for i in range(n)]
+
+
+def _paralel(oturum: int, rerun: int, is_):
+    sureler = [[] for _ in range(oturum)]
+
+    def calis(k):
+        for r in range(rerun):
+            t0 = time.perf_counter()
+            is_(k, r)
+            sureler[k].append(time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    iplikler = [threading.Thread(target=calis, args=(k,)) for k in range(oturum)]
+    for t in iplikler:
+        t.start()
+    for t in iplikler:
+        t.join()
+    return time.perf_counter() - t0, np.array([s for l in sureler for s in l]) * 1000
+
+
+def _ozet(ms):
+    return {"ms_p50": round(float(np.percentile(ms, 50)), 3), "ms_p99": round(float(np.percentile(ms, 99)), 3)}
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--oturum", type=int, default=200)
+    p.add_argument("--rerun", type=int, default=20)
+    p.add_argument("--satir", type=int, default=5)
+    p.add_argument("--dolgu", type=int, default=1_000_000)
+    p.add_argument("--siparis", type=int, default=1000)
+    a = p.parse_args()
+    satirlar = _satirlar(a.satir)
+    sonuc = {}
+
+    with tempfile.TemporaryDirectory() as klasor:
+        # Kuyruklu (panelin yolu)
+        d = gecmis.GecmisDeposu(os.path.join(klasor, "kuyruk.sqlite"))
+        sure, ms = _paralel(a.oturum, a.rerun, lambda k, r: d.ekle(f"k{k}", f"S-{k}", "celik_mil", satirlar))
+        t0 = time.perf_counter()
+        d.bosalt(60.0)
+        sonuc["kuyruklu"] = dict(_ozet(ms), toplam_s=round(sure, 3),
+                                 bosaltma_s=round(time.perf_counter() - t0, 3), yazilan=d.yazilan)
+
+        # Doğrudan: her rerun kendi bağlantısıyla INSERT + COMMIT
+        yol = os.path.join(klasor, "dogrudan.sqlite")
+        gecmis.GecmisDeposu(yol)
+        yerel = threading.local()
+
+        def dogrudan(k, r):
+            con = getattr(yerel, "con", None) or gecmis._baglan(yol)
+            yerel.con = con
+            with con:
+                con.executemany(gecmis._EKLE, [
+                    (time.time(), f"k{k}", f"S-{k}", "celik_mil", json.dumps(g), m, "kg") for g, m in satirlar
+                ])
+
+        sure, ms = _paralel(a.oturum, a.rerun, dogrudan)
+        sonuc["dogrudan"] = dict(_ozet(ms), toplam_s=round(sure, 3))
+
+        # Sayfa okuma: --dolgu kayıt, --siparis sipariş
+        yol = os.path.join(klasor, "dolgu.sqlite")
+        d = gecmis.GecmisDeposu(yol)
+        rng = np.random.default_rng(0)
+        siparisler = rng.integers(0, a.siparis, a.dolgu)
+        t0 = time.perf_counter()
+        con = sqlite3.connect(yol)
+        with con:
+            con.executemany(gecmis._EKLE, (
+                (0.0, "k", f"S-{s}", "celik_mil", '{"cap":50.0,"boy":1000.0}', 15.4, "kg") for s in siparisler.tolist()
+            ))
+        con.close()
+        dolgu_s = time.perf_counter() - t0
+
+        ilk, derin, sayim = [], [], []
+        for s in range(50):
+            t0 = time.perf_counter()
+            sayfa = d.sayfa(f"S-{s}", None, 50)
+            ilk.append(time.perf_counter() - t0)
+            once = sayfa[-1].id
+            t0 = time.perf_counter()
+            for _ in range(10):  # 11. sayfaya kadar imleçle ilerle
+                sayfa = d.sayfa(f"S-{s}", once, 50)
+                once = sayfa[-1].id if sayfa else once
+            derin.append((time.perf_counter() - t0) / 10)
+            t0 = time.perf_counter()
+            d.sayi(f"S-{s}")
+            sayim.append(time.perf_counter() - t0)
+        sonuc["okuma"] = {
+            "dolgu": a.dolgu,
+            "dolgu_s": round(dolgu_s, 2),
+            "ilk_sayfa_ms": _ozet(np.array(ilk) * 1000)["ms_p50"],
+            "sonraki_sayfa_ms": _ozet(np.array(derin) * 1000)["ms_p50"],
+            "sayim_ms": _ozet(np.array(sayim) * 1000)["ms_p50"],
+        }
+    print(json.dumps(sonuc, indent=2))
+
+
+if __name__ == "__main__":
+    main()
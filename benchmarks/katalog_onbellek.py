@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Statik katalogların rerun başına maliyeti: her seferinde kurmak vs paylaşmak.
+
+Çok sayıda eşzamanlı oturumu thread'lerle taklit eder ve rerun başına
+CPU süresi (process_time) ile tahsis edilen belleği (tracemalloc) ölçer.
+
+    python benchmarks/katalog_onbellek.py --oturum 50 --rerun 200
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+
+from hum import arayuz, katalog  # noqa: E402
+
+
+def eski_rerun():
+    """Önbelleksiz sürüm: her rerun'da yapılan kurulum işleri."""
+    css = arayuz._CSS_KAYNAK.strip()
+    modules = [tuple(m) for m in arayuz.MODULES]
+    labels = [lbl for _, lbl in modules]
+    df = pd.DataFrame(katalog.aktif().profil_rows(), columns=["Malzeme", "1 mt/Kg", "Boy=6 mt/Kg"])
+    return css, labels, df
+
+
+def yeni_rerun():
+    """Önbellekli sürüm: süreç düzeyindeki nesnelere erişim."""
+    kat = katalog.aktif()
+    return arayuz.CSS, arayuz.MODUL_ETIKETLERI, arayuz.profil_tablosu(kat.surum, kat)
+
+
+def olc(fn, oturum: int, rerun: int) -> dict:
+    fn()  # ısınma
+    tracemalloc.start()
+    cpu0, t0 = time.process_time(), time.perf_counter()
+    with ThreadPoolExecutor(max_workers=oturum) as ex:
+        list(ex.map(lambda _: [fn() for _ in range(rerun)], range(oturum)))
+    cpu, duvar = time.process_time() - cpu0, time.perf_counter() - t0
+    _, tepe = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    n = oturum * rerun
+    return {
+        "rerun": n,
+        "cpu_us_per_rerun": round(cpu / n * 1e6, 2),
+        "wall_s": round(duvar, 3),
+        "peak_alloc_kb": round(tepe / 1024, 1),
+        "css_bytes": len(fn()[0]),
+    }
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--oturum", type=int, default=50)
+    p.add_argument("--rerun", type=int, default=200)
+    a = p.parse_args()
+    sonuc = {
+        "eski": olc(eski_rerun, a.oturum, a.rerun),
+        "yeni": olc(yeni_rerun, a.oturum, a.rerun),
+    }
+    print(json.dumps(sonuc, indent=2))
+
+
+if __name__ == "__main__":
+    main()
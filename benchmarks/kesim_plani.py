@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Kesim planı süresi ve kalitesi: sadece sezgisel vs iyileştirme bütçesi.
+
+Rastgele parça listeleri (``--tip`` farklı boy, toplam ``--parca`` adet)
+6 m stoka planlanır; süre, bar sayısı, alt sınır ve verim raporlanır.
+
+    python benchmarks/kesim_plani.py --parca 50000 --tip 200 --sure 0 0.5 2
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from hum import kesim  # noqa: E402
+
+
+def parca_listesi(tip: int, parca: int, tohum: int = 0):
+    rng = np.random.default_rng(tohum)
+    boylar = rng.integers(150, 3200, tip)
+    adetler = rng.multinomial(parca - tip, np.full(tip, 1 / tip)) + 1
+    return list(zip(boylar.tolist(), adetler.tolist()))
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--parca", type=int, default=50_000)
+    p.add_argument("--tip", type=int, default=200)
+    p.add_argument("--stok", type=float, nargs="+", default=[6000.0])
+    p.add_argument("--kerf", type=float, default=3.0)
+    p.add_argument("--sure", type=float, nargs="+", default=[0.0, 0.5, 2.0])
+    a = p.parse_args()
+
+    parcalar = parca_listesi(a.tip, a.parca)
+    sonuc = {}
+    for sure in a.sure:
+        t0 = time.perf_counter()
+        plan = kesim.planla(parcalar, a.stok, kerf=a.kerf, sure=sure)
+        sonuc[f"sure_{sure:g}"] = {
+            "s": round(time.perf_counter() - t0, 3),
+            "bar": plan.bar_sayisi,
+            "alt_sinir": plan.alt_sinir,
+            "verim": round(plan.verim, 4),
+            "desen": len(plan.desenler),
+        }
+    print(json.dumps(sonuc, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""Kesit motoru: önbellekli toplu kg hesabı ve kapalı formüllerle sapma.
+
+``--satir`` satır, ``--benzersiz`` farklı ebatla her şekil için:
+
+* ``soguk_ms``: boş önbellekte (tüm benzersiz kesitler çizilip alanı
+  hesaplanır)
+* ``sicak_ms``: aynı satırlar ikinci kez (alanlar önbellekten)
+* ``sapma``: motor alanının kapalı formülden en büyük göreli farkı
+  (daire/boru 64 köşeli eşit alanlı çokgendir)
+* ``hesap_ms``: varsa ``hum.hesap``'taki elle yazılmış formül (π ve
+  katsayılar yuvarlanmış)
+
+    python benchmarks/kesit_verim.py --satir 10000 1000000 --benzersiz 1000
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from hum import hesap, kesit  # noqa: E402
+
+
+def _sekiller(rng: np.random.Generator, n: int, u: int) -> dict:
+    ebat = rng.integers(10, 10 + u, n).astype(float)
+    et = rng.choice([2.0, 3.0, 5.0], n)
+    return {
+        "daire": ({"cap": ebat}, math.pi / 4 * ebat**2, lambda boy: hesap.celik_mil_kg(ebat, boy)),
+        "boru": ({"dis": ebat, "et": et}, math.pi / 4 * (ebat**2 - (ebat - 2 * et) ** 2),
+                 lambda boy: hesap.celik_cek_boru_kg(ebat, et, boy)),
+        "altikose": ({"ebat": ebat}, math.sqrt(3) / 2 * ebat**2, lambda boy: hesap.altikose_kg(ebat, boy)),
+        "kosebent": ({"ebat": ebat, "et": et}, 2 * ebat * et - et**2, lambda boy: hesap.kosebent_kg(ebat, et, boy)),
+        "kutu": ({"gen": ebat, "yuk": ebat / 2, "et": et}, ebat * ebat / 2 - (ebat - 2 * et) * (ebat / 2 - 2 * et),
+                 None),
+        "i_profil": ({"yuk": 2 * ebat, "gen": ebat, "et": et, "kal": 1.5 * et},
+                     2 * ebat * 1.5 * et + (2 * ebat - 3 * et) * et, None),
+    }
+
+
+def olc(n: int, u: int) -> dict:
+    rng = np.random.default_rng(n)
+    boy = rng.uniform(100, 6000, n)
+    sonuc = {}
+    for ad, (parametre, beklenen, formul) in _sekiller(rng, n, u).items():
+        kesit._alanlar.pop(ad, None)
+        t0 = time.perf_counter()
+        kesit.kg(ad, parametre, boy)
+        soguk = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        kesit.kg(ad, parametre, boy)
+        sicak = time.perf_counter() - t0
+        alan = kesit.alan(ad, parametre)
+        r = {
+            "soguk_ms": round(soguk * 1000, 2),
+            "sicak_ms": round(sicak * 1000, 2),
+            "sapma": float(np.nanmax(np.abs(alan / beklenen - 1))),
+        }
+        if formul is not None:
+            t0 = time.perf_counter()
+            formul(boy)
+            r["hesap_ms"] = round((time.perf_counter() - t0) * 1000, 2)
+        sonuc[ad] = r
+    return sonuc
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--satir", type=int, nargs="+", default=[10_000, 1_000_000])
+    p.add_argument("--benzersiz", type=int, default=1000)
+    a = p.parse_args()
+    print(json.dumps({f"satir_{n}": olc(n, a.benzersiz) for n in a.satir}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
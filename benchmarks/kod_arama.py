@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Kod önek araması: indeks kurma süresi ve sorgu gecikmesi.
+
+Geçici bir depoya ``--kod`` adet sentetik yarı mamul kodu yazılır, sıralı
+indeks kurulur ve farklı seçicilikte önekler sorgulanır.
+
+    python benchmarks/kod_arama.py --kod 2000000
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hum import kod_arama, kodlama  # noqa: E402
+
+ONEKLER = ("Y", "YHK", "YHK-2024", "YHK-2024-01", "YHK-2024-0100-R3", "YFT-9999")
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--kod", type=int, default=2_000_000)
+    p.add_argument("--tekrar", type=int, default=200)
+    a = p.parse_args()
+
+    with tempfile.TemporaryDirectory() as dizin:
+        yol = os.path.join(dizin, "kodlar")
+        ureticiler = list(kodlama.URETICI_MAP)
+        with open(yol + ".txt", "w", encoding="utf-8") as f:
+            for i in range(a.kod):
+                f.write(kodlama.build_yari_mamul_code(
+                    "Y", ureticiler[i % 4], str(2020 + i % 6), f"{i // 100 % 10000:04d}",
+                    f"R{i % 100}", str(i // 1_000_000 + 1),
+                ) + "\n")
+
+        t0 = time.perf_counter()
+        ix = kod_arama.KodIndeksi(yol)
+        kurma = time.perf_counter() - t0
+
+        sonuc = {"kod": len(ix), "kurma_s": round(kurma, 2), "sorgu": {}}
+        for onek in ONEKLER:
+            sureler = []
+            for _ in range(a.tekrar):
+                t0 = time.perf_counter()
+                toplam, _ = ix.ara(onek, 100)
+                sureler.append((time.perf_counter() - t0) * 1000)
+            sonuc["sorgu"][onek] = {"eslesen": toplam, "ms_p50": round(statistics.median(sureler), 4)}
+
+        t0 = time.perf_counter()
+        kod_arama.KodIndeksi(yol)
+        sonuc["yeniden_acma_ms"] = round((time.perf_counter() - t0) * 1000, 2)
+    print(json.dumps(sonuc, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Levha yerleşim süresi: ilk hesap ve aynı siparişin yeniden açılması.
+
+Rastgele bir sipariş (``--tip`` farklı parça, toplam ~``--parca`` adet,
+iki malzeme x üç kalınlık) standart levhalara yerleştirilir. ``--tek-grup``
+tüm parçaları tek malzeme/kalınlığa (10 mm çelik levha) koyar; yerleşim
+grup başına çalıştığı için büyüme en iyi bu durumda görülür.
+
+    python benchmarks/levha_yerlesim.py --parca 5000 --tip 300
+    python benchmarks/levha_yerlesim.py --parca 1000 2000 5000 --tek-grup
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from hum import yerlesim  # noqa: E402
+
+
+def siparis(tip: int, parca: int, tohum: int = 0, tek_grup: bool = False):
+    rng = np.random.default_rng(tohum)
+    adetler = rng.multinomial(parca - tip, np.full(tip, 1 / tip)) + 1
+    return [
+        (
+            "celik_levha" if tek_grup else yerlesim.MALZEMELER[int(rng.integers(2))],
+            10.0 if tek_grup else float(rng.choice([5, 10, 20])),
+            float(rng.integers(50, 900)),
+            float(rng.integers(50, 1200)),
+            int(n),
+        )
+        for n in adetler
+    ]
+
+
+def olc(parca: int, tip: int, kerf: float, tek_grup: bool) -> dict:
+    parcalar = siparis(tip, parca, tek_grup=tek_grup)
+    t0 = time.perf_counter()
+    plan = yerlesim.yerlestir(parcalar, kerf=kerf)
+    ilk = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    yerlesim.yerlestir(list(reversed(parcalar)), kerf=kerf)
+    tekrar = time.perf_counter() - t0
+    return {
+        "parca": sum(g.parca_adedi for g in plan.gruplar),
+        "grup": len(plan.gruplar),
+        "levha": plan.levha_sayisi,
+        "verim": round(sum(g.parca_alani for g in plan.gruplar)
+                       / sum(g.levha_alani for g in plan.gruplar), 4),
+        "ilk_s": round(ilk, 3),
+        "onbellek_ms": round(tekrar * 1000, 2),
+    }
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--parca", type=int, nargs="+", default=[5_000])
+    p.add_argument("--tip", type=int, default=300)
+    p.add_argument("--kerf", type=float, default=3.0)
+    p.add_argument("--tek-grup", action="store_true", help="tüm parçalar tek malzeme/kalınlıkta")
+    a = p.parse_args()
+    print(json.dumps({f"parca_{n}": olc(n, a.tip, a.kerf, a.tek_grup) for n in a.parca}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Panelin soğuk başlangıç süresi ve modül başına rerun gecikmesi (AppTest).
+
+* ``soguk_baslangic``: temiz bir Python sürecinde ``hum_panel.py``'nin ilk
+  çalışması (import'lar + katalog + ilk çizim), ayrı süreçlerde tekrarlanır
+* ``moduller``: ``arayuz.MODULES``'daki her modül için kenar çubuğundan
+  seçim (``gecis``) ve modülün tipik bir girdisinin değiştirilmesi
+  (``etkilesim``) sonrası rerun süresi
+
+AppTest tarayıcı ve websocket maliyetini içermez; sadece betik süresidir.
+
+    python benchmarks/modul_gecikme.py --tekrar 20
+"""
+import argparse
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import time
+import warnings
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, KOK)
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from hum.arayuz import MODULES  # noqa: E402
+
+PANEL = os.path.join(KOK, "hum_panel.py")
+
+# Modül -> (widget tipi, key ya da sıra, denenecek değerler)
+_ETKILESIM = {
+    "bom": ("number_input", "bom_parca", [20_000.0, 30_000.0]),
+    "profil_cetveli": ("text_input", 0, ["HEB 200", "NPU", "220", ""]),
+    "kodlama": ("text_input", "kod_sip_m", ["2401", "2402"]),
+}
+
+_SOGUK = f"""
+import logging, time, warnings
+logging.disable(logging.CRITICAL)
+warnings.filterwarnings("ignore")
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({PANEL!r}, default_timeout=120).run()
+assert not at.exception
+print(time.perf_counter() - t0)
+"""
+
+
+def _ozet(sureler) -> dict:
+    ms = sorted(s * 1000 for s in sureler)
+    return {
+        "ms_p50": round(statistics.median(ms), 2),
+        "ms_p95": round(ms[min(len(ms) - 1, int(len(ms) * 0.95))], 2),
+        "ms_ort": round(statistics.mean(ms), 2),
+    }
+
+
+def _calistir(at: AppTest) -> float:
+    t0 = time.perf_counter()
+    at.run()
+    sure = time.perf_counter() - t0
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return sure
+
+
+def soguk_baslangic(tekrar: int) -> dict:
+    sureler = [
+        float(subprocess.check_output([sys.executable, "-c", _SOGUK], cwd=KOK, text=True))
+        for _ in range(tekrar)
+    ]
+    return _ozet(sureler)
+
+
+def _widget(at: AppTest, mod_id: str):
+    tip, anahtar, degerler = _ETKILESIM.get(
+        mod_id, ("number_input", f"{mod_id}_boy_1", [1000.0, 2500.0, 6000.0])
+    )
+    elemanlar = getattr(at, tip)
+    return (elemanlar[anahtar] if isinstance(anahtar, int) else elemanlar(key=anahtar)), degerler
+
+
+def moduller(tekrar: int) -> dict:
+    at = AppTest.from_file(PANEL, default_timeout=60).run()
+    sonuc = {}
+    for mod_id, etiket in MODULES:
+        gecis = []
+        for _ in range(tekrar):
+            at.sidebar.radio[0].set_value(MODULES[0][1] if mod_id != MODULES[0][0] else MODULES[1][1])
+            at.run()
+            at.sidebar.radio[0].set_value(etiket)
+            gecis.append(_calistir(at))
+
+        etkilesim = []
+        for i in range(tekrar):
+            widget, degerler = _widget(at, mod_id)
+            widget.set_value(degerler[i % len(degerler)])
+            etkilesim.append(_calistir(at))
+
+        sonuc[mod_id] = {"gecis": _ozet(gecis), "etkilesim": _ozet(etkilesim)}
+    return sonuc
+
+
+def olc(tekrar: int, soguk_tekrar: int) -> dict:
+    logging.disable(logging.CRITICAL)
+    warnings.filterwarnings("ignore")
+    return {
+        "soguk_baslangic": soguk_baslangic(soguk_tekrar),
+        "moduller": moduller(tekrar),
+    }
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--tekrar", type=int, default=20)
+    p.add_argument("--soguk-tekrar", type=int, default=3)
+    a = p.parse_args()
+    print(json.dumps(olc(a.tekrar, a.soguk_tekrar), indent=2))
+
+
+if __name__ == "__main__":
+    main()
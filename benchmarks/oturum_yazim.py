@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""Oturum deposu: tuş başına yazım maliyeti, birleştirme oranı ve kopyadan okuma.
+
+``--oturum`` iş parçacığı (kullanıcı) ``--tus`` kez, ``--aralik`` ms arayla
+modül girişlerini değiştirir. İki yol karşılaştırılır:
+
+* ``birlestirilmis``: ``depo.yaz`` (panelin yolu; yazım arka planda toplanır)
+* ``dogrudan``: her tuşta depoya senkron yazım (süreç başına tek bağlantı)
+
+``depo_yazimi`` depoya giden kayıt sayısıdır. Ardından aynı depoya ikinci
+bir örnekle (başka bir kopya) bağlanılıp oturumlar okunur.
+
+    python benchmarks/oturum_yazim.py --oturum 50 --tus 40 --aralik 50
+    python benchmarks/oturum_yazim.py --redis redis://127.0.0.1:6379/0
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from hum import oturum  # noqa: E402
+
+
+def _degerler(k: int, t: int) -> dict:
+    """Tipik bir oturum: seçili modül, sipariş ve 5 satırlık formül girişleri."""
+    d = {"secili_modul": "ÇELİK MİL AD-MM-KG", "siparis_no": f"S-{k}", "canli_mod": True}
+    for i in range(1, 6):
+        d[f"celik_mil_cap_{i}"] = 50.0 + i
+        d[f"celik_mil_boy_{i}"] = 1000.0 + t * i
+    return d
+
+
+def _kullanicilar(oturum_sayisi: int, tus: int, aralik: float, is_) -> np.ndarray:
+    sureler = [[] for _ in range(oturum_sayisi)]
+
+    def calis(k):
+        for t in range(tus):
+            t0 = time.perf_counter()
+            is_(k, t)
+            sureler[k].append(time.perf_counter() - t0)
+            time.sleep(aralik)
+
+    iplikler = [threading.Thread(target=calis, args=(k,)) for k in range(oturum_sayisi)]
+    for i in iplikler:
+        i.start()
+    for i in iplikler:
+        i.join()
+    return np.array([s for l in sureler for s in l]) * 1000
+
+
+def _ozet(ms: np.ndarray) -> dict:
+    return {"ms_p50": round(float(np.percentile(ms, 50)), 3), "ms_p99": round(float(np.percentile(ms, 99)), 3)}
+
+
+def _olc(yeni_depo, a) -> dict:
+    jetonlar = [oturum.yeni_jeton() for _ in range(a.oturum)]
+    tus_sayisi = a.oturum * a.tus
+
+    d = yeni_depo()
+    ms = _kullanicilar(a.oturum, a.tus, a.aralik / 1000, lambda k, t: d.yaz(jetonlar[k], _degerler(k, t)))
+    d.bosalt()
+    birlesik = dict(_ozet(ms), tus=tus_sayisi, depo_yazimi=d.yazilan,
+                    paket_bayt=len(oturum.paketle(_degerler(0, 0))))
+
+    # Süreç başına tek bağlantı; her tuş bir gidiş-dönüş.
+    d2 = yeni_depo()
+
+    def dogrudan_yaz(k, t):
+        with d2._gonderim:
+            d2._kaydet({jetonlar[k]: oturum.paketle(_degerler(k, t))})
+
+    ms = _kullanicilar(a.oturum, a.tus, a.aralik / 1000, dogrudan_yaz)
+    dogrudan = dict(_ozet(ms), tus=tus_sayisi, depo_yazimi=tus_sayisi)
+
+    # Başka kopya: aynı depoya yeni örnek, bekleyen yerel yazım yok.
+    kopya = yeni_depo()
+    okuma = []
+    for k, j in enumerate(jetonlar):
+        t0 = time.perf_counter()
+        degerler = kopya.oku(j)
+        okuma.append(time.perf_counter() - t0)
+        assert degerler == _degerler(k, a.tus - 1), "kopya son girişleri görmedi"
+    return {"birlestirilmis": birlesik, "dogrudan": dogrudan, "kopyadan_okuma": _ozet(np.array(okuma) * 1000)}
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--oturum", type=int, default=50)
+    p.add_argument("--tus", type=int, default=40)
+    p.add_argument("--aralik", type=float, default=50.0, help="tuşlar arası ms")
+    p.add_argument("--redis", help="redis://host:port/db (verilirse Redis de ölçülür)")
+    a = p.parse_args()
+
+    sonuc = {"oturum": a.oturum, "tus": a.tus, "aralik_ms": a.aralik, "toplama_suresi_s": oturum.TOPLAMA_SURESI}
+    with tempfile.TemporaryDirectory() as klasor:
+        yol = os.path.join(klasor, "oturum.sqlite")
+        sonuc["sqlite"] = _olc(lambda: oturum.SqliteOturumDeposu(yol), a)
+    if a.redis:
+        sonuc["redis"] = _olc(lambda: oturum.RedisOturumDeposu(a.redis), a)
+    print(json.dumps(sonuc, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""Ters profil araması: aile başına sıralı dizi + bisect vs tam tarama.
+
+``--profil`` girişlik sentetik bir katalog (``--aile`` aile) derlenip
+açılır; üç sorgu türü rastgele hedeflerle ölçülür:
+
+* ``aralik``: iki sınır arasındaki tüm profiller (sıralı)
+* ``en_hafif``: aile başına hedefi karşılayan en hafif profil
+* ``en_yakin``: hedefe en yakın 5 profil
+
+``tarama`` aynı sorgunun tüm katalog üzerinde numpy maske + sıralama ile
+cevabıdır; ``ayni`` iki yolun aynı sonucu verdiğini doğrular.
+
+    python benchmarks/profil_ters_arama.py --profil 1000 5000 50000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from hum import katalog  # noqa: E402
+
+
+def _katalog(n: int, aile_sayisi: int, klasor: str) -> katalog.Katalog:
+    rng = np.random.default_rng(n)
+    yol = os.path.join(klasor, "katalog.csv")
+    with open(yol, "w", encoding="utf-8") as f:
+        f.write("tip,aile,ebat,deger,modul\nyogunluk,celik,,7.85,\n")
+        for a in range(aile_sayisi):
+            m = n // aile_sayisi
+            ebat = np.arange(1, m + 1) * 10.0
+            kg = np.round(np.sort(rng.uniform(2, 400, m)), 2)
+            f.writelines(f"profil,P{a:02d},{e:g},{k},\n" for e, k in zip(ebat, kg))
+    return katalog.Katalog(katalog.derle(yol))
+
+
+def _tarama(kat: katalog.Katalog, tur: str, a: float, b: float):
+    kg = kat.kg_m
+    if tur == "aralik":
+        idx = np.flatnonzero((kg >= a) & (kg <= b))
+        return idx[np.argsort(kg[idx], kind="stable")]
+    if tur == "en_hafif":
+        idx = np.flatnonzero(kg >= a)
+        # aile başına en hafif: aileye, sonra kg'ye göre sırala, ilkini al
+        idx = idx[np.lexsort((kg[idx], kat.aile[idx]))]
+        ilk = idx[np.r_[True, kat.aile[idx][1:] != kat.aile[idx][:-1]]]
+        return ilk[np.argsort(kg[ilk], kind="stable")]
+    idx = np.argsort(np.abs(kg - a), kind="stable")[:5]
+    return idx
+
+
+def _ms(sureler) -> dict:
+    us = np.array(sureler) * 1e6
+    return {"us_p50": round(float(np.percentile(us, 50)), 1), "us_p99": round(float(np.percentile(us, 99)), 1)}
+
+
+def olc(n: int, aile_sayisi: int, tekrar: int) -> dict:
+    with tempfile.TemporaryDirectory() as klasor:
+        kat = _katalog(n, aile_sayisi, klasor)
+        t0 = time.perf_counter()
+        indeks = kat.agirlik_indeksi()
+        sonuc = {"kurulum_ms": round((time.perf_counter() - t0) * 1000, 2)}
+        rng = np.random.default_rng(0)
+        sorgular = {
+            "aralik": lambda a, b: indeks.aralik(a, b),
+            "en_hafif": lambda a, b: indeks.en_hafif(a),
+            "en_yakin": lambda a, b: indeks.en_yakin(a, 5),
+        }
+        for tur, sorgu in sorgular.items():
+            indeksli, tarama, ayni = [], [], True
+            for _ in range(tekrar):
+                a = float(rng.uniform(2, 390))
+                b = a + float(rng.uniform(0.5, 10))
+                t0 = time.perf_counter()
+                profiller = sorgu(a, b)
+                indeksli.append(time.perf_counter() - t0)
+                t0 = time.perf_counter()
+                idx = _tarama(kat, tur, a, b)
+                tarama.append(time.perf_counter() - t0)
+                ayni &= [p.kg_m for p in profiller] == kat.kg_m[idx].tolist()
+            sonuc[tur] = {"indeks": _ms(indeksli), "tarama": _ms(tarama), "ayni": bool(ayni)}
+        del indeks, kat
+    return sonuc
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--profil", type=int, nargs="+", default=[1000, 5000, 50000])
+    p.add_argument("--aile", type=int, default=20)
+    p.add_argument("--tekrar", type=int, default=2000)
+    a = p.parse_args()
+    print(json.dumps({f"profil_{n}": olc(n, a.aile, a.tekrar) for n in a.profil}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
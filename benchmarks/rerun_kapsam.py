@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""Tek bir giriş değişikliğinin rerun maliyeti: tüm uygulama vs fragment.
+
+Gerçek bir Streamlit sunucusu başlatır, tarayıcı gibi websocket'ten
+bağlanır ve ÇELİK ÇEKME BORU modülünde "Boy (mm)" alanını değiştirir.
+Her etkileşim için gecikme (rerun isteğinden ``script_finished``'e kadar)
+ve sunucudan gelen ForwardMsg bayt sayısı ölçülür:
+
+* ``tum_uygulama``: fragment kimliği olmadan rerun (eski davranış)
+* ``fragment``: sadece modül parçasının rerun'u (yeni davranış)
+
+Gecikmeye sunucunun mesaj boşaltma aralığı da dahildir; bu yüzden bayt
+farkı süre farkından daha belirgindir.
+
+Canlı hesap kapalıyken (form modu) giriş değişiklikleri hiç rerun
+tetiklemez; sadece 'Hesapla' bir fragment rerun'u yapar.
+
+    python benchmarks/rerun_kapsam.py --tekrar 30
+
+``websockets`` paketi gerekir (``pip install -r requirements-dev.txt``).
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ClientState_pb2 import ClientState
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState, WidgetStates
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODUL = "ÇELİK ÇEKME BORU AD-MM-KG"
+
+
+def _bos_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class Istemci:
+    """Minimal Streamlit websocket istemcisi."""
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.durumlar = {}
+        self.elemanlar = []  # (eleman tipi, proto, fragment_id)
+        # Tarayıcı gibi: büyük mesajların hash'leri bildirilir, sunucu referans gönderir.
+        self.onbellek = set()
+
+    async def rerun(self, fragment_id: str = ""):
+        msg = BackMsg(
+            rerun_script=ClientState(
+                widget_states=WidgetStates(widgets=list(self.durumlar.values())),
+                fragment_id=fragment_id,
+                cached_message_hashes=sorted(self.onbellek),
+            )
+        )
+        t0 = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        bayt = 0
+        self.elemanlar = []
+        while True:
+            ham = await self.ws.recv()
+            bayt += len(ham)
+            fm = ForwardMsg()
+            fm.ParseFromString(ham)
+            if fm.metadata.cacheable and fm.hash:
+                self.onbellek.add(fm.hash)
+            tip = fm.WhichOneof("type")
+            if tip == "delta" and fm.delta.WhichOneof("type") == "new_element":
+                el = fm.delta.new_element
+                self.elemanlar.append((el.WhichOneof("type"), el, fm.delta.fragment_id))
+            elif tip == "script_finished":
+                return time.perf_counter() - t0, bayt
+
+    def bul(self, tip: str, etiket: str):
+        for t, el, fid in self.elemanlar:
+            if t == tip and getattr(el, t).label == etiket:
+                return getattr(el, t), fid
+        raise LookupError(f"{tip} {etiket!r} bulunamadı")
+
+
+async def olc(port: int, tekrar: int) -> dict:
+    url = f"ws://127.0.0.1:{port}/_stcore/stream"
+    async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as ws:
+        c = Istemci(ws)
+        await c.rerun()
+
+        radyo, _ = c.bul("radio", "İşlem seç:")
+        # Yeni sürümler radyo değerini metin, eskiler indeks olarak taşır.
+        for durum in (
+            WidgetState(id=radyo.id, string_value=MODUL),
+            WidgetState(id=radyo.id, int_value=list(radyo.options).index(MODUL)),
+        ):
+            c.durumlar[radyo.id] = durum
+            await c.rerun()
+            try:
+                boy, fragment_id = c.bul("number_input", "Boy (mm)")
+                break
+            except LookupError:
+                continue
+        else:
+            raise LookupError(f"{MODUL} modülü açılamadı")
+
+        sonuc = {}
+        for ad, fid in (("tum_uygulama", ""), ("fragment", fragment_id)):
+            sureler, baytlar = [], []
+            for i in range(tekrar):
+                c.durumlar[boy.id] = WidgetState(id=boy.id, double_value=1000.0 + i)
+                sure, bayt = await c.rerun(fid)
+                sureler.append(sure * 1000)
+                baytlar.append(bayt)
+            sonuc[ad] = {
+                "ms_p50": round(statistics.median(sureler), 2),
+                "ms_ort": round(statistics.mean(sureler), 2),
+                "bayt_ort": round(statistics.mean(baytlar)),
+            }
+        sonuc["fragment_id_var"] = bool(fragment_id)
+        return sonuc
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--tekrar", type=int, default=30)
+    a = p.parse_args()
+
+    port = _bos_port()
+    sunucu = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", os.path.join(KOK, "hum_panel.py"),
+            "--server.headless", "true",
+            "--server.port", str(port),
+            "--server.enableXsrfProtection", "false",
+            "--browser.gatherUsageStats", "false",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        for _ in range(100):
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+                break
+            except OSError:
+                time.sleep(0.2)
+        print(json.dumps(asyncio.run(olc(port, a.tekrar)), indent=2))
+    finally:
+        sunucu.terminate()
+        sunucu.wait()
+
+
+if __name__ == "__main__":
+    main()
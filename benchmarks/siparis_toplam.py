@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""Sipariş çalışma alanı: artımlı toplam vs her düzenlemede yeniden gruplama.
+
+``--satir`` satırlık karışık (tüm aileler) sipariş kurulur. Her düzenleme
+``--degisen`` satırın girdisini değiştirir; iki yol karşılaştırılır:
+
+* ``artimli``: ``Siparis.guncelle`` (sadece değişen satırlar hesaplanır,
+  aile toplamlarına fark uygulanır)
+* ``yeniden``: tüm sipariş ``karisik_hesapla`` + pandas ``groupby`` (panelin
+  her rerun'da tabloyu baştan toplaması)
+
+``sayfa_uygula``, 500 satırlık düzenleyici sayfasında tek hücre
+değişikliğinin işlenmesidir (fark + güncelleme + sonuç tablosu).
+``sapma`` artımlı toplamlarla baştan toplama arasındaki en büyük göreli
+farktır.
+
+    python benchmarks/siparis_toplam.py --satir 50000 200000 --degisen 1 100
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from hum import siparis  # noqa: E402
+from hum.hesap import karisik_hesapla  # noqa: E402
+
+
+def _satirlar(n: int, rng: np.random.Generator) -> pd.DataFrame:
+    return pd.DataFrame({
+        "malzeme": rng.choice(siparis.AILELER, n),
+        "kal": rng.uniform(1, 50, n),
+        "en": rng.uniform(100, 2000, n),
+        "boy": rng.uniform(100, 6000, n),
+        "cap": rng.uniform(10, 300, n),
+        "ebat": rng.choice([80.0, 100.0, 120.0, 200.0], n),
+        "gen": rng.uniform(10, 100, n),
+        "yuk": rng.uniform(5, 50, n),
+        "et": rng.uniform(1, 10, n),
+        "dis": rng.uniform(20, 300, n),
+        "adet": rng.integers(1, 50, n).astype(float),
+    })
+
+
+def _yeniden(df: pd.DataFrame, fiyat: pd.Series) -> pd.DataFrame:
+    kolonlar = {c: df[c].to_numpy() for c in df.columns if c not in ("malzeme", "adet")}
+    toplam = karisik_hesapla(df["malzeme"].to_numpy(), kolonlar) * df["adet"].to_numpy()
+    g = pd.DataFrame({"malzeme": df["malzeme"], "adet": df["adet"], "miktar": toplam}).dropna()
+    g = g.groupby("malzeme").agg(satir=("adet", "size"), adet=("adet", "sum"), miktar=("miktar", "sum"))
+    g["tutar"] = g["miktar"] * fiyat.reindex(g.index)
+    return g
+
+
+def _ms(sureler) -> dict:
+    ms = np.array(sureler) * 1000
+    return {"ms_p50": round(float(np.percentile(ms, 50)), 3), "ms_p99": round(float(np.percentile(ms, 99)), 3)}
+
+
+def olc(n: int, degisen_listesi, tekrar: int) -> dict:
+    rng = np.random.default_rng(n)
+    df = _satirlar(n, rng)
+    fiyat = pd.Series(rng.uniform(20, 80, len(siparis.AILELER)), index=siparis.AILELER)
+    olculer = [c for c in df.columns if c not in ("malzeme", "adet")]
+
+    sip = siparis.Siparis(fiyat.to_dict())
+    t0 = time.perf_counter()
+    sip.tablo_ekle(df)
+    sonuc = {"kurulum_ms": round((time.perf_counter() - t0) * 1000, 2)}
+
+    for k in degisen_listesi:
+        artimli, yeniden = [], []
+        for _ in range(tekrar):
+            idx = rng.choice(n, k, replace=False)
+            boy = rng.uniform(100, 6000, k)
+            df.loc[idx, "boy"] = boy
+
+            t0 = time.perf_counter()
+            alt = df.loc[idx]
+            sip.guncelle(idx, alt["malzeme"].tolist(), {c: alt[c].to_numpy() for c in olculer}, alt["adet"].to_numpy())
+            sip.aile_toplamlari()
+            artimli.append(time.perf_counter() - t0)
+
+            t0 = time.perf_counter()
+            _yeniden(df, fiyat)
+            yeniden.append(time.perf_counter() - t0)
+        r = {"artimli": _ms(artimli), "yeniden": _ms(yeniden)}
+        r["hizlanma"] = round(r["yeniden"]["ms_p50"] / max(r["artimli"]["ms_p50"], 1e-6), 1)
+        sonuc[f"degisen_{k}"] = r
+
+    # Panel yolu: 500 satırlık sayfada tek hücre düzenlemesi.
+    sayfa = siparis.SiparisSayfasi(sip, sip.idler()[:500])
+    duzenlenen = sayfa.taban.copy()
+    sureler = []
+    for t in range(tekrar):
+        duzenlenen.loc[t % len(duzenlenen), "adet"] = float(t + 100)
+        t0 = time.perf_counter()
+        sayfa.uygula(duzenlenen)
+        sayfa.sonuclar()
+        sureler.append(time.perf_counter() - t0)
+    sonuc["sayfa_uygula"] = _ms(sureler)
+
+    t0 = time.perf_counter()
+    sip.fiyat_ayarla({a: v * 1.1 for a, v in sip.fiyatlar().items()})
+    sip.aile_toplamlari()
+    sonuc["fiyat_degisimi_ms"] = round((time.perf_counter() - t0) * 1000, 3)
+
+    artimli = sip.aile_toplamlari().set_index("Aile")["Miktar"].to_numpy()
+    sip.yeniden_topla()
+    bastan = sip.aile_toplamlari().set_index("Aile")["Miktar"].to_numpy()
+    sonuc["sapma"] = float(np.max(np.abs(artimli - bastan) / np.maximum(np.abs(bastan), 1e-12)))
+    return sonuc
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--satir", type=int, nargs="+", default=[50_000, 200_000])
+    p.add_argument("--degisen", type=int, nargs="+", default=[1, 100])
+    p.add_argument("--tekrar", type=int, default=50)
+    a = p.parse_args()
+    print(json.dumps({f"satir_{n}": olc(n, a.degisen, a.tekrar) for n in a.satir}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
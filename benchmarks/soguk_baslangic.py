@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""Soğuk başlangıç: seçili modülle ilk çizim süresi ve import profili.
+
+Her ``--modul`` için temiz bir Python sürecinde Streamlit yüklendikten
+sonra (sunucuda zaten yüklüdür) panelin ilk çalışması ölçülür; modül
+kenar çubuğu seçimi oturum durumuna önceden yazılarak açılır.
+
+* ``ilk_cizim``: ilk çalışmanın süresi (ms) ve yüklenen ağır paketler
+* ``ice_aktarim``: ``python -X importtime`` çıktısından, panelin çalışması
+  sırasında yüklenen modüllerin paket başına öz süresi (ms, en büyükler)
+
+    python benchmarks/soguk_baslangic.py --modul kodlama kestamit bom --tekrar 5
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, KOK)
+
+from hum.arayuz import MODULES  # noqa: E402
+
+PANEL = os.path.join(KOK, "hum_panel.py")
+AGIR = ("pandas", "numpy", "pyarrow", "PIL", "openpyxl", "sqlite3", "concurrent.futures.process")
+_ISARET = "--- panel ---"
+# pandas gerektirmeyen üç sayfa (varsayılan dahil) ve gerektiren iki sayfa.
+MODULLER = (MODULES[0][0], "celik_mil", "kodlama", "profil_cetveli", "bom")
+
+_ILK = """
+import json, logging, sys, time, warnings
+logging.disable(logging.CRITICAL)
+warnings.filterwarnings("ignore")
+from streamlit.testing.v1 import AppTest
+sys.stderr.write({isaret!r} + "\\n")
+sys.stderr.flush()
+at = AppTest.from_file({panel!r}, default_timeout=120)
+if {etiket!r}:
+    at.session_state["secili_modul"] = {etiket!r}
+t0 = time.perf_counter()
+at.run()
+sure = time.perf_counter() - t0
+assert not at.exception, at.exception[0].message
+print(json.dumps({{"ms": sure * 1000, "yuklu": [m for m in {agir!r} if m in sys.modules]}}))
+"""
+
+_SATIR = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def _calistir(etiket: str, importtime: bool):
+    kod = _ILK.format(isaret=_ISARET, panel=PANEL, etiket=etiket, agir=AGIR)
+    komut = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", kod]
+    p = subprocess.run(komut, cwd=KOK, capture_output=True, text=True, check=True)
+    return json.loads(p.stdout.strip().splitlines()[-1]), p.stderr
+
+
+def _profil(stderr: str, en_cok: int) -> dict:
+    """Panel çalışması sırasında yüklenen modüllerin kök paket başına öz süresi."""
+    _, _, panel = stderr.partition(_ISARET)
+    paket = defaultdict(int)
+    for oz, _birikimli, _girinti, ad in _SATIR.findall(panel):
+        paket[ad.split(".")[0]] += int(oz)
+    sirali = sorted(paket.items(), key=lambda p: -p[1])[:en_cok]
+    return {
+        "toplam_ms": round(sum(paket.values()) / 1000, 1),
+        "paketler_ms": {ad: round(us / 1000, 1) for ad, us in sirali},
+    }
+
+
+def olc(moduller, tekrar: int, en_cok: int = 12) -> dict:
+    etiketler = dict(MODULES)
+    sonuc = {}
+    for mod_id in moduller:
+        etiket = etiketler[mod_id]
+        kosular = [_calistir(etiket, False)[0] for _ in range(tekrar)]
+        ms = sorted(k["ms"] for k in kosular)
+        _, stderr = _calistir(etiket, True)
+        sonuc[mod_id] = {
+            "ilk_cizim": {
+                "ms_p50": round(statistics.median(ms), 1),
+                "ms_min": round(ms[0], 1),
+                "yuklu": kosular[-1]["yuklu"],
+            },
+            "ice_aktarim": _profil(stderr, en_cok),
+        }
+    return sonuc
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--modul", nargs="+", default=list(MODULLER))
+    p.add_argument("--tekrar", type=int, default=5)
+    p.add_argument("--en-cok", type=int, default=12)
+    a = p.parse_args()
+    print(json.dumps(olc(a.modul, a.tekrar, a.en_cok), indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+"""Hesap motoru için yerel HTTP/JSON API.
+
+Streamlit ve pandas yüklenmez; ``hum.hesap`` formülleri doğrudan
+çağrılır. Sunucu standart kütüphanedir (``ThreadingHTTPServer``),
+HTTP/1.1 keep-alive ile bağlantılar istekler arasında açık kalır.
+``isci > 1`` ise aynı port ``SO_REUSEPORT`` ile birden çok sürece
+açılır; çekirdek bağlantıları süreçlere dağıtır (GIL süreç başınadır).
+
+Uç noktalar::
+
+    GET  /saglik                 -> {"durum": "ok", "katalog": sürüm, "pid": ...}
+    GET  /v1/moduller            -> modül başına alanlar ve birim
+    GET  /v1/profil?...          -> ağırlık/kesitten profil: ``alt``/``ust`` (aralık),
+                                    ``en_az`` (aile başına en hafif) ya da
+                                    ``en_yakin`` (+ ``k``); ``aile=HEB,NPI``,
+                                    ``olcu=kg_m|kesit``
+    POST /v1/hesap/<modül>       -> tek satır {"cap": 50, "boy": 1000, "adet": 2},
+                                    satır listesi [{...}, ...] ya da
+                                    kolonlar {"kolonlar": {"cap": [...], ...}}
+    POST /v1/toplu               -> karışık liste: {"satirlar": [{"malzeme": ..., ...}]}
+                                    ya da {"kolonlar": {"malzeme": [...], ...}}
+
+Hesaplanamayan satırlar ``null`` döner (panelde "—"). Her yanıtta
+``Server-Timing`` başlığı okuma/hesap/toplam sürelerini (ms) taşır.
+"""
+import json
+import logging
+import math
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs
+
+import numpy as np
+
+from hum import hesap, katalog, olcum
+
+VARSAYILAN_PORT = 8765
+GOVDE_SINIRI = 32 * 1024 * 1024  # bayt
+SATIR_SINIRI = 200_000
+BOSTA_SURE = 60.0  # s; boştaki keep-alive bağlantısı kapanır
+
+log = logging.getLogger("hum.api")
+
+
+# -------------------------------------------------
+# GİRDİ / ÇIKTI
+# -------------------------------------------------
+def _sayilar(degerler: Sequence[Any], ad: str) -> np.ndarray:
+    """JSON değer listesi -> float64; ``null`` NaN olur."""
+    try:
+        dizi = np.array(degerler, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise ValueError(f"'{ad}' alanında sayı olmayan değer var") from None
+    if dizi.ndim != 1:
+        raise ValueError(f"'{ad}' alanı düz bir sayı listesi olmalı")
+    return dizi
+
+
+def _liste(dizi: np.ndarray) -> List[Optional[float]]:
+    return [None if v != v else v for v in dizi.tolist()]
+
+
+def _kolonlar(govde: Any, alanlar: Sequence[str]) -> Tuple[Dict[str, Any], int, bool, bool]:
+    """İstek gövdesinden ham kolonlar; ``(kolonlar, n, kolon_bicimi, tek_satir)``.
+
+    Gövdede hiç geçmeyen alanlar ``None`` döner.
+    """
+    if isinstance(govde, dict) and "kolonlar" in govde:
+        kolonlar = govde["kolonlar"]
+        if not isinstance(kolonlar, dict):
+            raise ValueError("'kolonlar' bir nesne olmalı")
+        uzunluklar = {len(v) for v in kolonlar.values() if isinstance(v, list)}
+        if len(uzunluklar) > 1 or any(not isinstance(v, list) for v in kolonlar.values()):
+            raise ValueError("'kolonlar' eşit uzunlukta listelerden oluşmalı")
+        return {a: kolonlar.get(a) for a in alanlar}, uzunluklar.pop() if uzunluklar else 0, True, False
+    if isinstance(govde, dict) and "satirlar" in govde:
+        govde = govde["satirlar"]
+    tek = isinstance(govde, dict)
+    satirlar = [govde] if tek else govde
+    if not isinstance(satirlar, list) or not all(isinstance(s, dict) for s in satirlar):
+        raise ValueError("Gövde satır nesnesi, satır listesi ya da 'kolonlar' olmalı")
+    # Sadece gövdede geçen alanlar toplanır (karışık listede 11 alanın çoğu boştur).
+    mevcut = set().union(*satirlar)
+    return (
+        {a: [s.get(a) for s in satirlar] if a in mevcut else None for a in alanlar},
+        len(satirlar),
+        False,
+        tek,
+    )
+
+
+def _hesapla(modul: Optional[str], govde: Any) -> Dict[str, Any]:
+    """Tek modül (``modul``) ya da ``malzeme`` kolonlu karışık hesap."""
+    alanlar = hesap.FORMULLER[modul].alanlar if modul else hesap.OLCU_ALANLARI
+    ham, n, kolon_bicimi, tek = _kolonlar(govde, (*alanlar, "adet") + (() if modul else ("malzeme",)))
+    if n > SATIR_SINIRI:
+        raise OverflowError(f"En çok {SATIR_SINIRI} satır gönderilebilir")
+
+    kolonlar = {
+        a: _sayilar(ham[a], a) if ham[a] is not None else np.full(n, np.nan) for a in alanlar
+    }
+    adet = _sayilar(ham["adet"], "adet") if ham["adet"] is not None else np.ones(n)
+    adet = np.where(np.isnan(adet), 1.0, adet)
+    if modul:
+        miktar = hesap.modul_hesapla(modul, kolonlar)
+        birim: Any = hesap.FORMULLER[modul].birim
+    else:
+        malzeme = [str(m or "").strip().lower() for m in (ham["malzeme"] or [""] * n)]
+        miktar = hesap.karisik_hesapla(malzeme, kolonlar)
+        birim = [hesap.FORMULLER[m].birim if m in hesap.FORMULLER else None for m in malzeme]
+    m, t = _liste(miktar), _liste(miktar * adet)
+
+    sonuc: Dict[str, Any] = {"modul": modul} if modul else {}
+    if tek:
+        sonuc.update(birim=birim if modul else birim[0], miktar_adet=m[0], miktar_toplam=t[0])
+    elif kolon_bicimi:
+        sonuc.update(n=n, birim=birim, miktar_adet=m, miktar_toplam=t)
+    elif modul:
+        sonuc.update(n=n, birim=birim, sonuclar=[
+            {"miktar_adet": x, "miktar_toplam": y} for x, y in zip(m, t)
+        ])
+    else:
+        sonuc.update(n=n, sonuclar=[
+            {"birim": b, "miktar_adet": x, "miktar_toplam": y} for b, x, y in zip(birim, m, t)
+        ])
+    return sonuc
+
+
+def moduller() -> Dict[str, Any]:
+    return {
+        m: {"alanlar": list(f.alanlar) + ["adet"], "birim": f.birim}
+        for m, f in hesap.FORMULLER.items()
+    }
+
+
+def _sorgu_sayisi(sorgu: Dict[str, str], ad: str) -> Optional[float]:
+    if ad not in sorgu:
+        return None
+    try:
+        deger = float(sorgu[ad].replace(",", "."))
+    except ValueError:
+        deger = math.nan
+    if not math.isfinite(deger):
+        raise ValueError(f"'{ad}' bir sayı olmalı")
+    return deger
+
+
+def profil_ara(sorgu: Dict[str, str]) -> Dict[str, Any]:
+    """Katalogda ağırlık (kg/m) ya da kesit (cm²) ile ters arama."""
+    indeks = katalog.aktif().agirlik_indeksi()
+    olcu = sorgu.get("olcu", "kg_m")
+    aileler = [a for a in sorgu.get("aile", "").split(",") if a.strip()]
+    en_az, en_yakin = _sorgu_sayisi(sorgu, "en_az"), _sorgu_sayisi(sorgu, "en_yakin")
+    if en_az is not None:
+        profiller = indeks.en_hafif(en_az, aileler, olcu)
+    elif en_yakin is not None:
+        k = _sorgu_sayisi(sorgu, "k")
+        if k is not None and k < 0:
+            raise ValueError("'k' negatif olamaz")
+        profiller = indeks.en_yakin(en_yakin, int(k) if k is not None else 5, aileler, olcu)
+    else:
+        alt, ust = _sorgu_sayisi(sorgu, "alt"), _sorgu_sayisi(sorgu, "ust")
+        if alt is None and ust is None:
+            raise ValueError("'alt'/'ust', 'en_az' ya da 'en_yakin' gerekli")
+        profiller = indeks.aralik(alt, ust, aileler, olcu)
+    return {
+        "n": len(profiller),
+        "profiller": [
+            {"ad": p.ad, "aile": p.aile, "ebat": p.ebat, "kg_m": p.kg_m, "kesit": round(p.kesit, 3)}
+            for p in profiller
+        ],
+    }
+
+
+# -------------------------------------------------
+# HTTP
+# -------------------------------------------------
+class _Istek(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "HUM-API/1"
+    timeout = BOSTA_SURE
+    # Başlık ve gövde ayrı yazılır; Nagle + gecikmeli ACK keep-alive'da ~40 ms bekletir.
+    disable_nagle_algorithm = True
+
+    def _yanitla(self, kod: int, veri: Any, t0: float, sureler: Dict[str, float], etiket: str):
+        govde = json.dumps(veri, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        sureler["toplam"] = time.perf_counter() - t0
+        self.send_response(kod)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(govde)))
+        self.send_header("Server-Timing", ", ".join(f"{k};dur={v * 1000:.3f}" for k, v in sureler.items()))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(govde)
+        olcum.gozlem("hum_api_seconds", sureler["toplam"], yol=etiket)
+        olcum.say("hum_api_total", yol=etiket, kod=str(kod))
+
+    def _hata(self, kod: int, mesaj: str, t0: float, etiket: str):
+        self._yanitla(kod, {"hata": mesaj}, t0, {}, etiket)
+
+    def do_GET(self):
+        t0 = time.perf_counter()
+        yol, _, sorgu = self.path.partition("?")
+        yol = yol.rstrip("/")
+        if yol == "/saglik":
+            durum = {"durum": "ok", "katalog": katalog.aktif().surum, "pid": os.getpid()}
+            self._yanitla(200, durum, t0, {}, yol)
+        elif yol == "/v1/moduller":
+            self._yanitla(200, moduller(), t0, {}, yol)
+        elif yol == "/v1/profil":
+            try:
+                sonuc = profil_ara({k: v[-1] for k, v in parse_qs(sorgu).items()})
+            except ValueError as e:
+                self._hata(400, str(e), t0, yol)
+                return
+            self._yanitla(200, sonuc, t0, {}, yol)
+        else:
+            self._hata(404, "Bulunamadı", t0, "diger")
+
+    def do_POST(self):
+        t0 = time.perf_counter()
+        yol = self.path.split("?")[0].rstrip("/")
+        if yol == "/v1/toplu":
+            modul, etiket = None, yol
+        elif yol.startswith("/v1/hesap/") and yol[len("/v1/hesap/"):] in hesap.FORMULLER:
+            modul, etiket = yol[len("/v1/hesap/"):], "/v1/hesap"
+        else:
+            modul, etiket = "", "diger"
+
+        uzunluk = self.headers.get("Content-Length")
+        if uzunluk is None:
+            self.close_connection = True
+            self._hata(411, "Content-Length gerekli", t0, etiket)
+            return
+        uzunluk = uzunluk.strip()
+        if not (uzunluk.isascii() and uzunluk.isdigit()):
+            # Gövdenin nerede bittiği bilinmiyor; bağlantı yeniden kullanılamaz.
+            self.close_connection = True
+            self._hata(400, "Geçersiz Content-Length", t0, etiket)
+            return
+        if int(uzunluk) > GOVDE_SINIRI:
+            # Gövde okunmadığı için bağlantı yeniden kullanılamaz.
+            self.close_connection = True
+            self._hata(413, f"Gövde en çok {GOVDE_SINIRI} bayt olabilir", t0, etiket)
+            return
+        ham = self.rfile.read(int(uzunluk))
+        if modul == "":
+            self._hata(404, "Bulunamadı", t0, etiket)
+            return
+
+        try:
+            govde = json.loads(ham)
+        except ValueError:
+            self._hata(400, "Geçersiz JSON", t0, etiket)
+            return
+        t1 = time.perf_counter()
+        try:
+            sonuc = _hesapla(modul, govde)
+        except OverflowError as e:
+            self._hata(413, str(e), t0, etiket)
+            return
+        except ValueError as e:
+            self._hata(400, str(e), t0, etiket)
+            return
+        t2 = time.perf_counter()
+        self._yanitla(200, sonuc, t0, {"okuma": t1 - t0, "hesap": t2 - t1}, etiket)
+
+    def log_message(self, *args):
+        pass
+
+
+class _Sunucu(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+
+def _sunucu(adres: str, port: int, paylasimli: bool) -> _Sunucu:
+    sunucu = _Sunucu((adres, port), _Istek, bind_and_activate=False)
+    sunucu.allow_reuse_port = paylasimli
+    try:
+        sunucu.server_bind()
+        sunucu.server_activate()
+    except OSError:
+        sunucu.server_close()
+        raise
+    return sunucu
+
+
+def _calis(adres: str, port: int, paylasimli: bool):
+    katalog.izlemeyi_baslat()
+    katalog.aktif()
+    olcum.baslat()
+    sunucu = _sunucu(adres, port, paylasimli)
+    try:
+        sunucu.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sunucu.server_close()
+
+
+def servis(adres: str = "127.0.0.1", port: int = VARSAYILAN_PORT, isci: int = 1):
+    """API sunucusunu çalıştırır (bloklar). ``isci`` süreç aynı portu paylaşır."""
+    if isci > 1 and not hasattr(socket, "SO_REUSEPORT"):
+        log.warning("SO_REUSEPORT yok; tek süreçle çalışılıyor.")
+        isci = 1
+    if isci <= 1:
+        _calis(adres, port, False)
+        return
+
+    # fork: ana süreçte henüz iş parçacığı yok; spawn ise ``python -m hum_panel``
+    # ana modülünü (Streamlit betiği) işçide yeniden çalıştırırdı.
+    baglam = multiprocessing.get_context("fork")
+    surecler = [
+        baglam.Process(target=_calis, args=(adres, port, True), name=f"hum-api-{i}", daemon=True)
+        for i in range(isci)
+    ]
+    for s in surecler:
+        s.start()
+    # SIGTERM'de de işçiler kapatılır (aksi halde portu tutan yetimler kalır).
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        for s in surecler:
+            s.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for s in surecler:
+            s.terminate()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Profil cetveli için önceden kurulmuş token/önek indeksi.
+
+Her profil adı token'lara ayrılır (``"HEB 200"`` -> ``HEB``, ``200``) ve
+her token'ın tüm önekleri satır dizilerine eşlenir. Ağırlıklar ayrıca
+indekslenir (``42,6`` / ``42.6``). Sorgu token'ları vektörel olarak
+puanlanıp kesiştirilir, sonuçlar eşleşme kalitesine göre sıralanır.
+"""
+import re
+from typing import Dict, List, Sequence, Set, Tuple
+
+import numpy as np
+
+_TOKEN = re.compile(r"[A-ZÇĞİÖŞÜ]+|\d+(?:[.,]\d+)?")
+
+# Puanlar: ad/ebat token'ı tam eşleşme > önek eşleşme > ağırlık eşleşmesi
+_TAM = 4
+_ONEK = 2
+_AGIRLIK = 1
+
+
+def tokenlar(metin: str) -> List[str]:
+    """``"heb200"`` -> ``["HEB", "200"]``; ondalık ayırıcı noktaya çevrilir."""
+    return [t.replace(",", ".") for t in _TOKEN.findall(metin.upper())]
+
+
+def _agirlik_tokenlari(v: float) -> Set[str]:
+    tam = f"{v:.2f}".rstrip("0").rstrip(".")
+    return {tam, f"{v:.2f}"}
+
+
+class ProfilIndeksi:
+    """``(ad, kg/m, ...)`` satırları üzerinde önek araması."""
+
+    def __init__(self, rows: Sequence[Tuple]):
+        self.rows = list(rows)
+        tam: Dict[str, Set[int]] = {}
+        onek: Dict[str, Set[int]] = {}
+        agirlik: Dict[str, Set[int]] = {}
+
+        for i, row in enumerate(self.rows):
+            for t in tokenlar(str(row[0])):
+                tam.setdefault(t, set()).add(i)
+                for n in range(1, len(t) + 1):
+                    onek.setdefault(t[:n], set()).add(i)
+            for t in _agirlik_tokenlari(float(row[1])):
+                for n in range(1, len(t) + 1):
+                    agirlik.setdefault(t[:n], set()).add(i)
+
+        # Kümeler sıralı int32 dizilere çevrilir: sorgu sırasında puanlama vektöreldir.
+        self._tam = _dizilere(tam)
+        self._onek = _dizilere(onek)
+        self._agirlik = _dizilere(agirlik)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _puanlar(self, token: str) -> np.ndarray:
+        puan = np.zeros(len(self.rows), dtype=np.int8)
+        puan[self._agirlik.get(token, _BOS)] = _AGIRLIK
+        puan[self._onek.get(token, _BOS)] = _ONEK
+        puan[self._tam.get(token, _BOS)] = _TAM
+        return puan
+
+    def ara(self, sorgu: str) -> np.ndarray:
+        """Eşleşen satır indekslerini en iyi eşleşme önce olacak şekilde döner.
+
+        Boş sorgu tüm satırları katalog sırasıyla döner.
+        """
+        sorgu_tokenlari = tokenlar(sorgu)
+        if not sorgu_tokenlari:
+            return np.arange(len(self.rows))
+
+        toplam = np.zeros(len(self.rows), dtype=np.int16)
+        eslesen = np.ones(len(self.rows), dtype=bool)
+        for t in sorgu_tokenlari:
+            puan = self._puanlar(t)
+            eslesen &= puan > 0
+            toplam += puan
+
+        idx = np.flatnonzero(eslesen)
+        # Kararlı sıralama: eşit puanlarda katalog sırası korunur.
+        return idx[np.argsort(-toplam[idx], kind="stable")]
+
+    def sayfa(self, sorgu: str, sayfa: int = 1, sayfa_boyu: int = 50) -> Tuple[int, List[int]]:
+        """``(toplam eşleşme, bu sayfadaki satır indeksleri)``."""
+        sonuc = self.ara(sorgu)
+        bas = max(sayfa - 1, 0) * sayfa_boyu
+        return len(sonuc), sonuc[bas:bas + sayfa_boyu].tolist()
+
+
+_BOS = np.zeros(0, dtype=np.int32)
+
+
+def _dizilere(kumeler: Dict[str, Set[int]]) -> Dict[str, np.ndarray]:
+    return {k: np.fromiter(sorted(v), np.int32, len(v)) for k, v in kumeler.items()}
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""Panelin statik arayüz verileri.
+
+Bu modül süreç başına bir kez import edilir; Streamlit her etkileşimde
+``hum_panel.py``'yi yeniden çalıştırsa da buradaki nesneler yeniden
+kurulmaz.
+"""
+import base64
+import io
+import os
+import re
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+import streamlit as st
+
+from hum.arama import ProfilIndeksi
+from hum.bicim import fmt_dizi
+from hum import katalog, olcum
+
+if TYPE_CHECKING:  # pandas ilk tablo çiziminde yüklenir
+    import pandas as pd
+
+# -------------------------------------------------
+# GENEL TASARIM (CSS)
+# -------------------------------------------------
+_CSS_KAYNAK = """
+<style>
+/* Genel arka plan ve yazı rengi */
+body {
+    background-color: #050814 !important;
+    color: #f5f5f5 !important;
+}
+
+section[data-testid="stSidebar"] {
+    background-color: #050814 !important;
+    border-right: 1px solid #1f2933;
+}
+
+/* Ana içerik alanı */
+div[data-testid="stAppViewContainer"] {
+    background-color: #050814;
+}
+
+/* Kart benzeri beyaz paneller */
+.hum-card {
+    background-color: #0f172a;
+    padding: 1.5rem;
+    border-radius: 0.6rem;
+    box-shadow: 0 0 18px rgba(0, 0, 0, 0.45);
+    margin-bottom: 1.2rem;
+}
+
+/* Üst navbar */
+.hum-navbar {
+    background-color: #0B1F33;
+    color: white;
+    padding: 0.7rem 1.5rem;
+    font-size: 20px;
+    font-weight: 600;
+    margin-bottom: 0.8rem;
+    text-align: center;
+    border-radius: 0.4rem;
+}
+
+/* Başlıklar */
+h1, h2, h3, h4 {
+    color: #f9fafb !important;
+}
+
+/* Sidebar başlık */
+.sidebar-title {
+    font-size: 20px;
+    font-weight: 700;
+    color: #e5e7eb;
+    margin-top: 0.5rem;
+    margin-bottom: 0.5rem;
+}
+
+/* Radio buton yazıları */
+label[data-baseweb="radio"] > div {
+    color: #e5e7eb !important;
+}
+
+</style>
+"""
+
+
+def _css_kucult(css: str) -> str:
+    """Yorumları ve gereksiz boşlukları atar (her rerun'da gönderilen veri azalır)."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};:,>])\s*", r"\1", css).strip()
+
+
+CSS = _css_kucult(_CSS_KAYNAK)
+
+# -------------------------------------------------
+# LOGO
+# -------------------------------------------------
+LOGO_YOLU = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "hum_logo.png"
+)
+# Küçültülmüş logo burada saklanır; soğuk başlangıçta PIL yüklenmez.
+LOGO_ONBELLEK = os.path.join(os.path.dirname(LOGO_YOLU), "veri")
+# Sidebar genişliği (px); HiDPI ekranlar için bir miktar pay bırakılır.
+LOGO_GENISLIK = 320
+
+
+def _logo_png(genislik: int) -> bytes:
+    """Küçültülmüş logo PNG'si; kaynak logo değişince yeniden üretilir."""
+    hedef = os.path.join(LOGO_ONBELLEK, f"hum_logo.{genislik}.png")
+    try:
+        if os.path.getmtime(hedef) >= os.path.getmtime(LOGO_YOLU):
+            with open(hedef, "rb") as f:
+                return f.read()
+    except OSError:
+        pass
+
+    from PIL import Image
+
+    with Image.open(LOGO_YOLU) as im:
+        im.thumbnail((genislik, genislik))
+        tampon = io.BytesIO()
+        im.save(tampon, "PNG", optimize=True)
+    veri = tampon.getvalue()
+    gecici = f"{hedef}.{os.getpid()}.tmp"
+    try:
+        with open(gecici, "wb") as f:
+            f.write(veri)
+        os.replace(gecici, hedef)
+    except OSError:  # salt okunur disk: her süreç yeniden küçültür
+        pass
+    return veri
+
+
+@st.cache_resource(show_spinner=False)
+def logo_html(genislik: int = LOGO_GENISLIK) -> str:
+    """Paketteki logoyu küçültülmüş haliyle gömülü ``<img>`` olarak döner.
+
+    Görsel data URI olarak mesajın içinde gider: ağdan ayrı bir istek
+    yapılmaz. 10 KB üstü elemanları Streamlit tarayıcıda hash ile
+    önbelleğe aldığından sonraki rerun'larda sadece referans gönderilir.
+    """
+    veri = base64.b64encode(_logo_png(genislik)).decode("ascii")
+    return f'<img src="data:image/png;base64,{veri}" alt="HUM" style="width:100%;height:auto;">'
+
+
+# -------------------------------------------------
+# MODÜL LİSTESİ
+# -------------------------------------------------
+MODULES: List[Tuple[str, str]] = [
+    ("kestamit", "KESTAMİT LEVHALAR AD-KG"),
+    ("celik_levha", "ÇELİK LEVHALAR AD-KG"),
+    ("celik_mil", "ÇELİK MİL AD-MM-KG"),
+    ("altikose", "ALTIKÖŞE AD-MM-KG"),
+    ("kare", "KARE AD-MM-KG"),
+    ("lama", "LAMA AD-MM-KG"),
+    ("kosebent", "KÖŞEBENT AD-MM-KG"),
+    ("celik_cek_boru", "ÇELİK ÇEKME BORU AD-MM-KG"),
+    ("dik_boru_kutu", "DİK BORU & KUTU PROFİL AD-MM-MT"),
+    ("npu", "NPU AD-MM-KG"),
+    ("heb", "HEB AD-MM-KG"),
+    ("ozel_kesit", "ÖZEL KESİT AD-MM-KG"),
+    ("kesim", "Kesim Planı (Boy)"),
+    ("levha_yerlesim", "Levha Yerleşim (Nesting)"),
+    ("bom", "Toplu BOM Hesabı"),
+    ("siparis", "Sipariş Çalışma Alanı"),
+    ("profil_cetveli", "Profil Ağırlık Cetveli"),
+    ("kodlama", "Kodlama Sistematiği"),
+    ("gecmis", "Hesap Geçmişi"),
+    ("isler", "Arka Plan İşleri"),
+]
+
+# Ölçü alanlarının ekran etiketleri (ızgara modu kolon başlıkları)
+ALAN_ETIKETLERI: Dict[str, str] = {
+    "kal": "Kalınlık (mm)",
+    "en": "En (mm)",
+    "boy": "Boy (mm)",
+    "cap": "Çap (mm)",
+    "ebat": "Ebat (mm)",
+    "gen": "Genişlik (mm)",
+    "yuk": "Yükseklik (mm)",
+    "et": "Et (mm)",
+    "dis": "Dış Çap (mm)",
+    "ic": "İç Çap (mm) (opsiyonel)",
+    "adet": "Adet",
+}
+
+MODUL_ETIKETLERI: List[str] = [lbl for _, lbl in MODULES]
+MODUL_KODU: Dict[str, str] = {lbl: mid for mid, lbl in MODULES}
+
+
+# -------------------------------------------------
+# PROFİL AĞIRLIK CETVELİ
+# -------------------------------------------------
+# Önbellek anahtarı katalog sürümüdür (``_kat`` hash'lenmez); katalog
+# yeniden yüklenince tablolar da yeniden kurulur.
+@st.cache_resource(show_spinner=False, max_entries=2)
+@olcum.zamanla("hum_tablo_seconds")
+def profil_tablosu(surum: str, _kat: katalog.Katalog) -> "pd.DataFrame":
+    """Profil cetveli DataFrame'i; tüm oturumlarca paylaşılır, değiştirilmemeli."""
+    import pandas as pd
+
+    return pd.DataFrame(
+        _kat.profil_rows(),
+        columns=["Malzeme", "1 mt/Kg", "Boy=6 mt/Kg"],
+    )
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+@olcum.zamanla("hum_tablo_seconds")
+def profil_gorunum(surum: str, _kat: katalog.Katalog) -> "pd.DataFrame":
+    """Türkçe formatlanmış, gösterime hazır cetvel (bir kez, kolon kolon formatlanır)."""
+    df = profil_tablosu(surum, _kat).copy()
+    for c in ["1 mt/Kg", "Boy=6 mt/Kg"]:
+        df[c] = fmt_dizi(df[c].to_numpy(), 2)
+    return df
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+@olcum.zamanla("hum_tablo_seconds")
+def profil_indeksi(surum: str, _kat: katalog.Katalog) -> ProfilIndeksi:
+    """Cetvel arama indeksi."""
+    return ProfilIndeksi(_kat.profil_rows())
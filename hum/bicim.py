@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Türkçe sayı biçimlendirme.
+
+``fmt`` tek değer içindir. Tablolar için ``fmt_dizi`` bütün kolonu NumPy
+ile biçimler: rakamlar tamsayı aritmetiğiyle bir kod noktası matrisine
+(``uint32``) yazılır ve matris kopyasız ``<U`` dizisine görünür. Python
+``round`` ile aynı sonucu vermesi için yuvarlamanın tam ortaya düştüğü
+(ikili gösterimde belirsiz) ve çok büyük değerler tek tek biçimlenir.
+"""
+import math
+from typing import Any
+
+import numpy as np
+
+# 0..999 için "%03d" kod noktaları: üç basamak tek seferde yazılır.
+_UC3 = np.array([[ord(c) for c in f"{i:03d}"] for i in range(1000)], dtype=np.uint32)
+# |x|·10^nd bu sınırı geçince komşu double'lar 10^-nd'den seyrekleşir:
+# ``round``un en kısa gösterimi (``fmt``) tam ondalık açılımdan ayrışır.
+_TAM_SINIR = 2.0 ** 52
+
+
+def fmt(x: float, nd: int = 3) -> str:
+    """Türkçe virgüllü sayı formatı, boşsa '—'."""
+    if x is None:
+        return "—"
+    try:
+        v = float(x)
+    except Exception:
+        return "—"
+    if math.isnan(v):
+        return "—"
+    return str(round(v, nd)).replace(".", ",")
+
+
+def _tek(v: float, nd: int, binlik: bool, sabit: bool) -> str:
+    """``fmt_dizi``nin tek değerlik karşılığı (sonlu ``v``).
+
+    ``sabit`` değilse rakamlar ``fmt`` gibi ``round``un en kısa
+    gösteriminden alınır; üstel gösterimde tam ondalık açılıma dönülür.
+    """
+    metin = f"{abs(v):.{nd}f}" if sabit else repr(round(abs(v), nd))
+    if "e" in metin:
+        metin = f"{abs(v):.{nd}f}"
+    tam, _, kesir = metin.partition(".")
+    if binlik:
+        tam = f"{int(tam):,}".replace(",", ".")
+    if not sabit:
+        kesir = kesir.rstrip("0") or "0"
+    return ("-" if math.copysign(1.0, v) < 0 else "") + tam + ("," + kesir if kesir else "")
+
+
+def fmt_dizi(
+    x: Any, nd: int = 3, binlik: bool = False, sabit: bool = False, bos: str = "—"
+) -> np.ndarray:
+    """Sayı dizisini Türkçe metne çevirir; ``<U`` dizisi döner.
+
+    Varsayılanlar ``fmt`` ile aynı metni verir (sondaki sıfırlar atılır,
+    en az bir ondalık kalır; ``fmt``un üstel yazdığı 1e16 ve üstü hariç). ``sabit=True`` her zaman ``nd`` ondalık,
+    ``binlik=True`` binlik ayırıcı ('.') yazar. NaN/sonsuz ``bos`` olur.
+    """
+    v = np.asarray(x, dtype=np.float64)
+    sekil = v.shape
+    v = v.ravel()
+    n = len(v)
+    olcek = 10 ** nd
+    ondalik = nd if sabit else max(nd, 1)
+
+    sonlu = np.isfinite(v)
+    a = np.where(sonlu, np.abs(v), 0.0) * olcek
+    q = np.rint(a)
+    # Yarıya çok yakın kesirlerde ``rint`` ile doğru ondalık yuvarlama ayrışabilir.
+    kesir = a - np.floor(a)
+    tek_tek = np.flatnonzero(sonlu & ((np.abs(kesir - 0.5) <= a * 1e-15 + 1e-9) | (a >= _TAM_SINIR)))
+    q = np.where(a >= _TAM_SINIR, 0.0, q).astype(np.int64)
+    buyuk = []
+    for i in tek_tek.tolist():
+        if a[i] >= _TAM_SINIR:
+            buyuk.append(i)
+        else:
+            q[i] = int(f"{abs(v[i]):.{nd}f}".replace(".", ""))
+
+    tam, kes = np.divmod(q, olcek)
+    grup = max(-(-len(str(int(tam.max()))) // 3), 1) if n else 1
+    ayr = 1 if binlik else 0
+    tam_gen = 1 + grup * (3 + ayr) - ayr  # işaret + rakamlar + ayırıcılar
+    pay = 3 * -(-ondalik // 3)  # ondalıklar 3'lü gruplarla yazılır
+    genislik = max(tam_gen + (1 + pay if ondalik else 0), len(bos))
+    kod = np.zeros((n, genislik), dtype=np.uint32)
+
+    # Tam kısım 3'lü gruplarla sağa yaslı yazılır (baştaki sıfırlar dahil);
+    # sondaki sola kaydırma baştaki sıfırları ve boş işaret yerini atar.
+    kalan, sag = tam, tam_gen
+    for g in range(grup):
+        kalan, c = np.divmod(kalan, 1000)
+        kod[:, sag - 3:sag] = np.take(_UC3, c, axis=0)
+        sag -= 3
+        if ayr and g < grup - 1:
+            kod[:, sag - 1] = ord(".")
+            sag -= 1
+    hane = np.ones(n, dtype=np.int64)
+    for j in range(1, grup * 3):
+        hane += tam >= 10 ** j
+    eksi = np.signbit(v) & sonlu
+    kayma = tam_gen - (eksi + hane + ((hane - 1) // 3 if binlik else 0))
+    e = np.flatnonzero(eksi)
+    kod[e, kayma[e]] = ord("-")
+
+    if ondalik:
+        kod[:, tam_gen] = ord(",")
+        kalan, sag = kes * 10 ** (pay - nd), tam_gen + 1 + pay
+        for _ in range(pay // 3):
+            kalan, c = np.divmod(kalan, 1000)
+            kod[:, sag - 3:sag] = np.take(_UC3, c, axis=0)
+            sag -= 3
+        kod[:, tam_gen + 1 + ondalik:] = 0
+        if not sabit:
+            # Sondaki sıfırlar atılır, en az bir ondalık kalır.
+            for k in range(1, nd):
+                kod[kes % 10 ** k == 0, tam_gen + 1 + nd - k] = 0
+
+    # Sola yaslama: kayma az sayıda farklı değer alır.
+    for s in np.flatnonzero(np.bincount(kayma)).tolist():
+        if s:
+            satir = np.flatnonzero(kayma == s)
+            kod[satir, :genislik - s] = kod[satir, s:]
+            kod[satir, genislik - s:] = 0
+
+    sonuc = kod.view(f"<U{genislik}").ravel()
+    sonuc[~sonlu] = bos
+    if buyuk:
+        ekler = [_tek(float(v[i]), nd, binlik, sabit) for i in buyuk]
+        sonuc = sonuc.astype(f"<U{max(genislik, max(map(len, ekler)))}")
+        sonuc[buyuk] = ekler
+    return sonuc.reshape(sekil)
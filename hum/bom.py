@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""Toplu BOM (malzeme listesi) dosyalarının parça parça hesaplanması.
+
+Dosya hiçbir zaman tamamen belleğe alınmaz: satırlar ``parca_boyu``
+büyüklüğünde bloklar halinde okunur, hesaplanır ve dışarı verilir.
+Malzeme bazındaki toplamlar ``BomToplam`` içinde birikir.
+
+Beklenen kolonlar: ``malzeme`` (modül kodu, örn. ``celik_mil``),
+ilgili ölçü kolonları (``kal``, ``en``, ``boy``, ``cap``, ``ebat``,
+``gen``, ``yuk``, ``et``, ``dis``, ``ic``) ve ``adet``.
+"""
+from typing import IO, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from hum.hesap import FORMULLER, OLCU_ALANLARI, karisik_hesapla
+
+PARCA_BOYU = 50_000
+
+Kaynak = Union[str, IO[bytes]]
+
+
+def _kolon_adi(c) -> str:
+    return str(c).strip().lower()
+
+
+def _csv_ayarlari(kaynak: Kaynak) -> Dict[str, str]:
+    """İlk satıra bakarak ayırıcıyı seçer; ';' ise ondalık virgül kabul edilir."""
+    if isinstance(kaynak, str):
+        with open(kaynak, "rb") as f:
+            ilk = f.readline()
+    else:
+        konum = kaynak.tell()
+        ilk = kaynak.readline()
+        kaynak.seek(konum)
+    if b";" in ilk:
+        return {"sep": ";", "decimal": ","}
+    return {"sep": ",", "decimal": "."}
+
+
+def _csv_parcalari(kaynak: Kaynak, parca_boyu: int, metin: bool = False) -> Iterator[pd.DataFrame]:
+    ayar = _csv_ayarlari(kaynak)
+    okuyucu = pd.read_csv(
+        kaynak,
+        chunksize=parca_boyu,
+        dtype=str if metin else {"malzeme": str},
+        keep_default_na=not metin,
+        skipinitialspace=True,
+        **ayar,
+    )
+    with okuyucu:
+        for df in okuyucu:
+            yield df
+
+
+def _xlsx_parcalari(kaynak: Kaynak, parca_boyu: int) -> Iterator[pd.DataFrame]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError as e:  # pragma: no cover - opsiyonel bağımlılık
+        raise RuntimeError("XLSX okumak için openpyxl kurulmalı.") from e
+
+    wb = load_workbook(kaynak, read_only=True, data_only=True)
+    try:
+        satirlar = wb.active.iter_rows(values_only=True)
+        basliklar = next(satirlar, None)
+        if basliklar is None:
+            return
+        blok: List[tuple] = []
+        for satir in satirlar:
+            blok.append(satir)
+            if len(blok) >= parca_boyu:
+                yield pd.DataFrame(blok, columns=basliklar)
+                blok = []
+        if blok:
+            yield pd.DataFrame(blok, columns=basliklar)
+    finally:
+        wb.close()
+
+
+def bom_parcalari(
+    kaynak: Kaynak,
+    dosya_adi: Optional[str] = None,
+    parca_boyu: int = PARCA_BOYU,
+    metin: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """CSV/XLSX BOM dosyasını ham DataFrame blokları halinde okur.
+
+    ``metin=True`` ise CSV kolonları olduğu gibi (baştaki sıfırlar dahil)
+    metin okunur; boş hücreler ``""`` olur.
+    """
+    ad = (dosya_adi or (kaynak if isinstance(kaynak, str) else "")).lower()
+    if ad.endswith((".xlsx", ".xlsm")):
+        return _xlsx_parcalari(kaynak, parca_boyu)
+    return _csv_parcalari(kaynak, parca_boyu, metin)
+
+
+def parca_hesapla(df: pd.DataFrame) -> pd.DataFrame:
+    """Bir BOM bloğuna ``birim``, ``miktar_adet`` ve ``miktar_toplam`` ekler."""
+    df = df.rename(columns=_kolon_adi)
+    n = len(df)
+    malzeme = (
+        df["malzeme"].astype(str).str.strip().str.lower().to_numpy()
+        if "malzeme" in df
+        else np.full(n, "", dtype=object)
+    )
+    kolonlar = {
+        c: pd.to_numeric(df[c], errors="coerce").to_numpy(dtype=np.float64)
+        for c in OLCU_ALANLARI
+        if c in df
+    }
+    adet = (
+        pd.to_numeric(df["adet"], errors="coerce").fillna(1).to_numpy(dtype=np.float64)
+        if "adet" in df
+        else np.ones(n)
+    )
+
+    birim_adet = karisik_hesapla(malzeme, kolonlar)
+    birimler = {m: f.birim for m, f in FORMULLER.items()}
+
+    df["malzeme"] = malzeme
+    df["adet"] = adet
+    df["birim"] = pd.Series(malzeme).map(birimler).to_numpy()
+    df["miktar_adet"] = birim_adet
+    df["miktar_toplam"] = birim_adet * adet
+    return df
+
+
+class BomToplam:
+    """Malzeme bazında artımlı toplamlar (satır, adet, miktar)."""
+
+    def __init__(self):
+        self._satir: Dict[str, int] = {}
+        self._adet: Dict[str, float] = {}
+        self._miktar: Dict[str, float] = {}
+        self.hatali = 0
+
+    def ekle(self, df: pd.DataFrame):
+        gecerli = df["miktar_toplam"].notna()
+        self.hatali += int((~gecerli).sum())
+        g = df[gecerli].groupby("malzeme", sort=False).agg(
+            satir=("adet", "size"),
+            adet=("adet", "sum"),
+            miktar=("miktar_toplam", "sum"),
+        )
+        for m, satir, adet, miktar in g.itertuples():
+            self._satir[m] = self._satir.get(m, 0) + int(satir)
+            self._adet[m] = self._adet.get(m, 0.0) + float(adet)
+            self._miktar[m] = self._miktar.get(m, 0.0) + float(miktar)
+
+    def tablo(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            [
+                (m, FORMULLER[m].birim, self._satir[m], self._adet[m], self._miktar[m])
+                for m in sorted(self._satir)
+            ],
+            columns=["Malzeme", "Birim", "Satır", "Adet", "Toplam"],
+        )
+
+
+def bom_isle(
+    kaynak: Kaynak,
+    dosya_adi: Optional[str] = None,
+    parca_boyu: int = PARCA_BOYU,
+    toplam: Optional[BomToplam] = None,
+) -> Iterator[pd.DataFrame]:
+    """BOM dosyasını okuyup hesaplanmış blokları sırayla verir.
+
+    ``toplam`` verilirse her blok ona eklenir.
+    """
+    for df in bom_parcalari(kaynak, dosya_adi, parca_boyu):
+        sonuc = parca_hesapla(df)
+        if toplam is not None:
+            toplam.ekle(sonuc)
+        yield sonuc
+
+
+def bom_csv_yaz(
+    kaynak: Kaynak,
+    hedef: IO[str],
+    dosya_adi: Optional[str] = None,
+    parca_boyu: int = PARCA_BOYU,
+) -> BomToplam:
+    """Hesaplanan blokları ``hedef``e CSV olarak akıtır, toplamları döner."""
+    toplam = BomToplam()
+    for i, df in enumerate(bom_isle(kaynak, dosya_adi, parca_boyu, toplam)):
+        df.to_csv(hedef, index=False, header=(i == 0))
+    return toplam
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""Komut satırı toplu hesap modu.
+
+Streamlit ve pandas yüklenmez; sadece ``hum.hesap`` ve katalog.
+
+Örnekler::
+
+    python -m hum_panel calc celik_mil --input bom.csv
+    python -m hum_panel calc bom --format json < karisik.csv
+    python -m hum_panel moduller
+    python -m hum_panel katalog
+    python -m hum_panel api --port 8765 --isci 4
+"""
+import argparse
+import csv
+import json
+import math
+import sys
+from typing import IO, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from hum import hesap, katalog
+
+PARCA_BOYU = 10_000
+KARISIK = "bom"
+
+
+def _sayi(v: Optional[str], ondalik_virgul: bool) -> float:
+    if v is None:
+        return math.nan
+    v = v.strip()
+    if not v:
+        return math.nan
+    if ondalik_virgul and "," in v:
+        v = v.replace(".", "").replace(",", ".")
+    try:
+        return float(v)
+    except ValueError:
+        return math.nan
+
+
+def _okuyucu(girdi: IO[str]) -> Tuple[csv.DictReader, bool]:
+    """Ayırıcıyı ilk satırdan seçer; ';' ise ondalık virgül kabul edilir."""
+    ilk = girdi.readline()
+    ayirici = ";" if ";" in ilk else ","
+    basliklar = [h.strip().lower() for h in next(csv.reader([ilk], delimiter=ayirici), [])]
+    okuyucu = csv.DictReader(girdi, fieldnames=basliklar, delimiter=ayirici)
+    return okuyucu, ayirici == ";"
+
+
+def _bloklar(okuyucu: Iterator[dict], boyut: int) -> Iterator[List[dict]]:
+    blok: List[dict] = []
+    for satir in okuyucu:
+        blok.append(satir)
+        if len(blok) >= boyut:
+            yield blok
+            blok = []
+    if blok:
+        yield blok
+
+
+def _blok_hesapla(modul: str, blok: List[dict], ondalik_virgul: bool):
+    """Bir satır bloğu için (birim, miktar/adet, adet) dizileri."""
+    alanlar = hesap.OLCU_ALANLARI if modul == KARISIK else hesap.FORMULLER[modul].alanlar
+    kolonlar = {
+        a: np.fromiter((_sayi(s.get(a), ondalik_virgul) for s in blok), np.float64, len(blok))
+        for a in alanlar
+    }
+    adet = np.fromiter((_sayi(s.get("adet"), ondalik_virgul) for s in blok), np.float64, len(blok))
+    adet = np.where(np.isnan(adet), 1.0, adet)
+
+    if modul == KARISIK:
+        malzeme = [(s.get("malzeme") or "").strip().lower() for s in blok]
+        miktar = hesap.karisik_hesapla(malzeme, kolonlar)
+        birim = [hesap.FORMULLER[m].birim if m in hesap.FORMULLER else "" for m in malzeme]
+    else:
+        miktar = hesap.modul_hesapla(modul, kolonlar)
+        birim = [hesap.FORMULLER[modul].birim] * len(blok)
+    return birim, miktar, adet
+
+
+def _csv_deger(v: float) -> str:
+    return "" if math.isnan(v) else repr(v)
+
+
+def _json_deger(v: float) -> Optional[float]:
+    return None if math.isnan(v) else v
+
+
+def calc(modul: str, girdi: IO[str], cikti: IO[str], bicim: str, boyut: int) -> int:
+    """Girdi CSV'sini bloklar halinde hesaplayıp ``cikti``ya yazar; satır sayısı döner."""
+    okuyucu, ondalik_virgul = _okuyucu(girdi)
+    giris_kolonlari = list(okuyucu.fieldnames or [])
+    ek_kolonlar = ["birim", "miktar_adet", "miktar_toplam"]
+    n = 0
+
+    if bicim == "csv":
+        yazici = csv.writer(cikti, lineterminator="\n")
+        yazici.writerow(giris_kolonlari + ek_kolonlar)
+    else:
+        cikti.write("[")
+
+    for blok in _bloklar(okuyucu, boyut):
+        birim, miktar, adet = _blok_hesapla(modul, blok, ondalik_virgul)
+        toplam = miktar * adet
+        for satir, b, m, t in zip(blok, birim, miktar.tolist(), toplam.tolist()):
+            if bicim == "csv":
+                yazici.writerow(
+                    [satir.get(k) or "" for k in giris_kolonlari]
+                    + [b, _csv_deger(m), _csv_deger(t)]
+                )
+            else:
+                kayit = {k: satir.get(k) for k in giris_kolonlari}
+                kayit.update(birim=b, miktar_adet=_json_deger(m), miktar_toplam=_json_deger(t))
+                cikti.write(("," if n else "") + json.dumps(kayit, ensure_ascii=False))
+            n += 1
+
+    if bicim == "json":
+        cikti.write("]\n")
+    return n
+
+
+def _parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="python -m hum_panel", description="HUM hesap komut satırı")
+    alt = p.add_subparsers(dest="komut", required=True)
+
+    c = alt.add_parser("calc", help="CSV girdiyi hesapla")
+    c.add_argument("modul", choices=sorted(hesap.FORMULLER) + [KARISIK],
+                   help=f"modül kodu; '{KARISIK}' = 'malzeme' kolonlu karışık liste")
+    c.add_argument("--input", "-i", default="-", help="girdi CSV (varsayılan: stdin)")
+    c.add_argument("--output", "-o", default="-", help="çıktı dosyası (varsayılan: stdout)")
+    c.add_argument("--format", "-f", choices=["csv", "json"], default="csv")
+    c.add_argument("--chunk", type=int, default=PARCA_BOYU, help="blok boyu (satır)")
+
+    alt.add_parser("moduller", help="modülleri ve beklenen kolonları listele")
+
+    k = alt.add_parser("katalog", help="CSV kataloğu ikili formata (.humk) derle")
+    k.add_argument("--kaynak", default=None, help="katalog CSV (varsayılan: HUM_KATALOG ya da veri/katalog.csv)")
+
+    a = alt.add_parser("api", help="HTTP/JSON hesap API'sini başlat")
+    a.add_argument("--adres", default="127.0.0.1", help="dinlenen adres (dışarıya açmak için 0.0.0.0)")
+    a.add_argument("--port", type=int, default=8765)
+    a.add_argument("--isci", type=int, default=1, help="aynı portu paylaşan süreç sayısı")
+    return p
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parser().parse_args(argv)
+
+    if args.komut == "moduller":
+        for mod_id, f in hesap.FORMULLER.items():
+            print(f"{mod_id}\t{f.birim}\t{','.join(f.alanlar)},adet")
+        return 0
+
+    if args.komut == "api":
+        from hum import api
+
+        print(f"HUM API http://{args.adres}:{args.port} ({args.isci} süreç)", file=sys.stderr)
+        api.servis(args.adres, args.port, max(args.isci, 1))
+        return 0
+
+    if args.komut == "katalog":
+        hedef = katalog.derle(args.kaynak or katalog.csv_yolu())
+        print(hedef)
+        return 0
+
+    try:
+        girdi = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8-sig", newline="")
+    except OSError as e:
+        print(f"Girdi açılamadı: {e}", file=sys.stderr)
+        return 1
+    try:
+        cikti = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+    except OSError as e:
+        print(f"Çıktı açılamadı: {e}", file=sys.stderr)
+        if girdi is not sys.stdin:
+            girdi.close()
+        return 1
+    try:
+        calc(args.modul, girdi, cikti, args.format, max(args.chunk, 1))
+    except BrokenPipeError:
+        # `| head` gibi kullanımlarda sessizce çık
+        sys.stderr.close()
+    finally:
+        if girdi is not sys.stdin:
+            girdi.close()
+        if cikti is not sys.stdout:
+            cikti.close()
+    return 0
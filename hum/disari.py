@@ -0,0 +1,457 @@
+# -*- coding: utf-8 -*-
+"""Hesap sonuçlarının CSV, XLSX ve PDF olarak dışa aktarımı.
+
+Bir rapor bir ya da daha çok ``Bolum``dan oluşur; her bölümün satırları
+DataFrame blokları halinde üretilir ve dosyaya blok blok yazılır. Bellekte
+en çok bir blok (PDF'te ayrıca bir sayfa) tutulur; XLSX çalışma sayfaları
+zip içine akış olarak yazılır, kitap bellekte kurulmaz.
+
+Sayılar Türkçe biçimlenir: CSV ``;`` ayırıcılı ve ondalık virgüllüdür
+(Toplu BOM okuyucusu geri okuyabilir), PDF binlik noktalıdır; XLSX
+hücreleri sayı kalır, ondalık/binlik biçimi hücre biçiminden gelir.
+
+Üretilen dosyalar içerik özetiyle (biçim + kolonlar + blok verisi)
+``veri/disari/`` altında saklanır (``HUM_DISARI``); aynı içerik tekrar
+istendiğinde dosya yeniden üretilmez. Önbellek ``ONBELLEK_SINIRI``
+baytı aşınca en eski dosyalar silinir.
+"""
+import codecs
+import csv
+import hashlib
+import io
+import itertools
+import os
+import tempfile
+import zipfile
+import zlib
+from typing import TYPE_CHECKING, BinaryIO, Callable, Iterable, List, NamedTuple, Optional, Sequence
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+from hum import olcum
+from hum.bicim import fmt_dizi
+
+# pandas sadece dosya üretilirken yüklenir; panel düğmeleri pandas'sız kurulur.
+if TYPE_CHECKING:
+    import pandas as pd
+
+VARSAYILAN_KLASOR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "veri", "disari"
+)
+ONBELLEK_SINIRI = 256 * 1024 * 1024  # bayt
+# Yazıcılar değişince eski önbellek dosyaları kullanılmasın diye özete girer.
+BICIM_SURUMU = 1
+
+BICIMLER = {
+    "csv": ("text/csv", ".csv"),
+    "xlsx": ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", ".xlsx"),
+    "pdf": ("application/pdf", ".pdf"),
+}
+
+
+class Kolon(NamedTuple):
+    ad: str
+    baslik: str
+    nd: Optional[int] = None  # None: metin, aksi halde ondalık sayısı
+    genislik: int = 10  # PDF karakter / XLSX kolon genişliği
+    sabit: bool = False  # her zaman ``nd`` ondalık (tutarlar); nd=0 hep sabittir
+
+
+class Bolum(NamedTuple):
+    baslik: str
+    kolonlar: Sequence[Kolon]
+    bloklar: Callable[[], Iterable["pd.DataFrame"]]
+
+
+def klasor() -> str:
+    return os.environ.get("HUM_DISARI", VARSAYILAN_KLASOR)
+
+
+# -------------------------------------------------
+# HÜCRE METİNLERİ
+# -------------------------------------------------
+def _metin(df: "pd.DataFrame", k: Kolon) -> List[str]:
+    return ["" if v is None or v != v else str(v) for v in df[k.ad].tolist()]
+
+
+def _sayi(df: "pd.DataFrame", k: Kolon) -> np.ndarray:
+    import pandas as pd
+
+    return pd.to_numeric(df[k.ad], errors="coerce").to_numpy(dtype=np.float64)
+
+
+def _sayi_metni(df: "pd.DataFrame", k: Kolon, binlik: bool) -> np.ndarray:
+    # nd=0 (adet, satır) için fmt_dizi'nin "3,0" gösterimi yerine "3".
+    return fmt_dizi(_sayi(df, k), k.nd, binlik=binlik, sabit=k.sabit or k.nd == 0, bos="")
+
+
+def _turkce(df: "pd.DataFrame", k: Kolon, binlik: bool) -> List[str]:
+    if k.nd is None:
+        return _metin(df, k)
+    return _sayi_metni(df, k, binlik).tolist()
+
+
+# -------------------------------------------------
+# CSV
+# -------------------------------------------------
+def _csv_yaz(f: BinaryIO, baslik: str, bolumler: Sequence[Bolum]):
+    """';' ayırıcılı, ondalık virgüllü UTF-8 (BOM'lu, Excel için) CSV.
+
+    Birden çok bölüm boş satır ve bölüm başlığıyla ayrılır.
+    """
+    f.write(codecs.BOM_UTF8)
+    metin = io.TextIOWrapper(f, encoding="utf-8", newline="")
+    yazici = csv.writer(metin, delimiter=";", lineterminator="\r\n")
+    for i, b in enumerate(bolumler):
+        if len(bolumler) > 1:
+            if i:
+                yazici.writerow([])
+            yazici.writerow([b.baslik])
+        yazici.writerow([k.baslik for k in b.kolonlar])
+        for df in b.bloklar():
+            yazici.writerows(zip(*(_turkce(df, k, binlik=False) for k in b.kolonlar)))
+    metin.flush()
+    metin.detach()
+
+
+# -------------------------------------------------
+# XLSX (zip içine akış)
+# -------------------------------------------------
+_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PAKET_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_XML = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_EN_COK_ND = 6
+_XLSX_ND = 6
+# cellXfs: 0 varsayılan, 1 kalın başlık, 2 + nd sayı biçimleri
+_BASLIK_STILI = 1
+
+
+def _sayi_stili(nd: int) -> int:
+    return 2 + min(max(nd, 0), _EN_COK_ND)
+
+
+def _stiller() -> str:
+    bicimler = "".join(
+        f'<numFmt numFmtId="{164 + nd}" formatCode="#,##0{"." + "0" * nd if nd else ""}"/>'
+        for nd in range(_EN_COK_ND + 1)
+    )
+    xf = '<xf numFmtId="{}" fontId="{}" fillId="0" borderId="0" xfId="0"{}/>'
+    hucreler = [xf.format(0, 0, ""), xf.format(0, 1, ' applyFont="1"')] + [
+        xf.format(164 + nd, 0, ' applyNumberFormat="1"') for nd in range(_EN_COK_ND + 1)
+    ]
+    return (
+        f'{_XML}<styleSheet xmlns="{_NS}">'
+        f'<numFmts count="{_EN_COK_ND + 1}">{bicimler}</numFmts>'
+        '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+        '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        f'<cellXfs count="{len(hucreler)}">{"".join(hucreler)}</cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        "</styleSheet>"
+    )
+
+
+def _sayfa_adlari(bolumler: Sequence[Bolum]) -> List[str]:
+    """Excel sayfa adları: en çok 31 karakter, yasak karakterler yok, benzersiz."""
+    adlar: List[str] = []
+    for b in bolumler:
+        ad = "".join(" " if c in '[]:*?/\\' else c for c in b.baslik).strip()[:31] or "Sayfa"
+        aday, i = ad, 2
+        while aday.lower() in (a.lower() for a in adlar):
+            aday = f"{ad[:28]} {i}"
+            i += 1
+        adlar.append(aday)
+    return adlar
+
+
+def _xlsx_hucreler(df: "pd.DataFrame", k: Kolon) -> List[str]:
+    if k.nd is None:
+        return [f'<c t="inlineStr"><is><t>{escape(v)}</t></is></c>' for v in _metin(df, k)]
+    # Değer en az _XLSX_ND ondalıkla saklanır, gösterim hücre biçiminden gelir.
+    # Metin fmt_dizi ile kolon kolon üretilir; ondalık virgül noktaya çevrilir.
+    metin = fmt_dizi(_sayi(df, k), max(k.nd, _XLSX_ND), bos="")
+    kod = metin.view(np.uint32)
+    kod[kod == ord(",")] = ord(".")
+    hucre = np.char.add(np.char.add(f'<c s="{_sayi_stili(k.nd)}"><v>', metin), "</v></c>")
+    return np.where(metin != "", hucre, "<c/>").tolist()
+
+
+def _xlsx_yaz(f: BinaryIO, baslik: str, bolumler: Sequence[Bolum]):
+    adlar = _sayfa_adlari(bolumler)
+    n = len(bolumler)
+    with zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as z:
+        z.writestr("[Content_Types].xml", (
+            f'{_XML}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/styles.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+            + "".join(
+                f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                for i in range(1, n + 1)
+            )
+            + "</Types>"
+        ))
+        z.writestr("_rels/.rels", (
+            f'{_XML}<Relationships xmlns="{_PAKET_NS}"><Relationship Id="rId1" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+            'Target="xl/workbook.xml"/></Relationships>'
+        ))
+        z.writestr("xl/workbook.xml", (
+            f'{_XML}<workbook xmlns="{_NS}" xmlns:r="{_R_NS}"><sheets>'
+            + "".join(
+                f'<sheet name="{escape(ad, {chr(34): "&quot;"})}" sheetId="{i}" r:id="rId{i}"/>'
+                for i, ad in enumerate(adlar, 1)
+            )
+            + "</sheets></workbook>"
+        ))
+        z.writestr("xl/_rels/workbook.xml.rels", (
+            f'{_XML}<Relationships xmlns="{_PAKET_NS}">'
+            + "".join(
+                f'<Relationship Id="rId{i}" Type="{_R_NS}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+                for i in range(1, n + 1)
+            )
+            + f'<Relationship Id="rId{n + 1}" Type="{_R_NS}/styles" Target="styles.xml"/>'
+            "</Relationships>"
+        ))
+        z.writestr("xl/styles.xml", _stiller())
+
+        for i, b in enumerate(bolumler, 1):
+            with z.open(f"xl/worksheets/sheet{i}.xml", "w") as s:
+                genislikler = "".join(
+                    f'<col min="{j}" max="{j}" width="{max(k.genislik, len(k.baslik)) + 2}" customWidth="1"/>'
+                    for j, k in enumerate(b.kolonlar, 1)
+                )
+                s.write((
+                    f'{_XML}<worksheet xmlns="{_NS}"><sheetViews><sheetView workbookViewId="0">'
+                    '<pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>'
+                    f"</sheetView></sheetViews><cols>{genislikler}</cols><sheetData><row>"
+                    + "".join(
+                        f'<c t="inlineStr" s="{_BASLIK_STILI}"><is><t>{escape(k.baslik)}</t></is></c>'
+                        for k in b.kolonlar
+                    )
+                    + "</row>"
+                ).encode("utf-8"))
+                for df in b.bloklar():
+                    satirlar = zip(*(_xlsx_hucreler(df, k) for k in b.kolonlar))
+                    s.write("".join("<row>" + "".join(r) + "</row>" for r in satirlar).encode("utf-8"))
+                s.write(b"</sheetData></worksheet>")
+
+
+# -------------------------------------------------
+# PDF (Courier, A4 yatay)
+# -------------------------------------------------
+# Standart Courier yazı tipi gömülmez; Türkçe harfler cp1254 kod
+# noktalarına WinAnsi üzerinde /Differences ile eşlenir.
+_PDF_FARKLAR = b"[208 /Gbreve 221 /Idotaccent 222 /Scedilla 240 /gbreve 253 /dotlessi 254 /scedilla]"
+_SAYFA_EN, _SAYFA_BOY, _KENAR = 842, 595, 36
+_PUNTO, _SATIR_ARALIGI = 7, 9
+_SATIR_SAYISI = (_SAYFA_BOY - 2 * _KENAR) // _SATIR_ARALIGI
+_KARAKTER_SAYISI = int((_SAYFA_EN - 2 * _KENAR) / (_PUNTO * 0.6))
+
+
+def _pdf_metni(s: str) -> bytes:
+    b = s.encode("cp1254", errors="replace")
+    return b.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+class _Pdf:
+    """Sayfa sayfa yazılan PDF; bellekte sadece açık sayfanın satırları durur."""
+
+    def __init__(self, f: BinaryIO, baslik: str):
+        self.f = f
+        self.baslik = baslik
+        self.ofset = {}
+        self.sayfalar: List[int] = []
+        self._no = 4  # 1 katalog, 2 sayfa ağacı, 3-4 yazı tipleri
+        self._satirlar: List[tuple] = []
+        self.ust_bilgi: List[tuple] = []  # her sayfada tekrarlanan kolon başlığı
+        self._yaz(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        for no, ad in ((3, b"Courier"), (4, b"Courier-Bold")):
+            self._nesne(no, (
+                b"<< /Type /Font /Subtype /Type1 /BaseFont /" + ad
+                + b" /Encoding << /Type /Encoding /BaseEncoding /WinAnsiEncoding /Differences "
+                + _PDF_FARKLAR + b" >> >>"
+            ))
+
+    def _yaz(self, b: bytes):
+        self.f.write(b)
+
+    def _nesne(self, no: int, govde: bytes):
+        self.ofset[no] = self.f.tell()
+        self._yaz(b"%d 0 obj\n" % no + govde + b"\nendobj\n")
+
+    def _yeni_no(self) -> int:
+        self._no += 1
+        return self._no
+
+    def bos_yer(self) -> int:
+        return _SATIR_SAYISI - len(self._satirlar)
+
+    def satir(self, metin: str, kalin: bool = False):
+        if not self._satirlar:
+            sayfa = f"Sayfa {len(self.sayfalar) + 1}"
+            ust = self.baslik[: _KARAKTER_SAYISI - len(sayfa) - 1]
+            self._satirlar = [(ust.ljust(_KARAKTER_SAYISI - len(sayfa)) + sayfa, True), ("", False)]
+            self._satirlar += self.ust_bilgi
+        self._satirlar.append((metin, kalin))
+        if self.bos_yer() <= 0:
+            self.sayfa_bitir()
+
+    def sayfa_bitir(self):
+        if not self._satirlar:
+            return
+        akis = [b"BT /F1 %d Tf %d TL %d %d Td" % (_PUNTO, _SATIR_ARALIGI, _KENAR, _SAYFA_BOY - _KENAR - _PUNTO)]
+        # Aynı yazı tipli ardışık satırlar tek seferde kodlanır.
+        for kalin, grup in itertools.groupby(self._satirlar, key=lambda s: s[1]):
+            metin = _pdf_metni("\n".join(m for m, _ in grup))
+            akis.append(b"/F%d %d Tf (" % (2 if kalin else 1, _PUNTO) + metin.replace(b"\n", b") Tj T*\n(") + b") Tj T*")
+        akis.append(b"ET")
+        veri = zlib.compress(b"\n".join(akis), 1)
+
+        icerik, sayfa = self._yeni_no(), self._yeni_no()
+        self._nesne(icerik, b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(veri) + veri + b"\nendstream")
+        self._nesne(sayfa, (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] " % (_SAYFA_EN, _SAYFA_BOY)
+            + b"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents %d 0 R >>" % icerik
+        ))
+        self.sayfalar.append(sayfa)
+        self._satirlar = []
+
+    def kapat(self):
+        if not self.sayfalar:
+            self.satir("")
+        self.sayfa_bitir()
+        kidler = b" ".join(b"%d 0 R" % s for s in self.sayfalar)
+        self._nesne(2, b"<< /Type /Pages /Kids [" + kidler + b"] /Count %d >>" % len(self.sayfalar))
+        self._nesne(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        bilgi = self._yeni_no()
+        self._nesne(bilgi, b"<< /Title (" + _pdf_metni(self.baslik) + b") /Producer (HUM Paneli) >>")
+        xref = self.f.tell()
+        self._yaz(b"xref\n0 %d\n0000000000 65535 f \n" % (self._no + 1))
+        for no in range(1, self._no + 1):
+            self._yaz(b"%010d 00000 n \n" % self.ofset[no])
+        self._yaz(b"trailer\n<< /Size %d /Root 1 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+            self._no + 1, bilgi, xref))
+
+
+def _pdf_hucreler(df: "pd.DataFrame", k: Kolon) -> List[str]:
+    w = k.genislik
+    if k.nd is None:
+        metin = (" ".join(v.split()) for v in _metin(df, k))  # satır sonları tek satıra
+        return [v.ljust(w) if len(v) <= w else v[: w - 1] + "…" for v in metin]
+    sayi = _sayi_metni(df, k, binlik=True)
+    # Sığmayan sayı kesilmez, Excel gibi '#' ile doldurulur.
+    return np.where(np.char.str_len(sayi) <= w, np.char.rjust(sayi, w), "#" * w).tolist()
+
+
+def _pdf_yaz(f: BinaryIO, baslik: str, bolumler: Sequence[Bolum]):
+    pdf = _Pdf(f, baslik)
+    for b in bolumler:
+        kolon_satiri = " ".join(
+            (k.baslik.ljust if k.nd is None else k.baslik.rjust)(k.genislik)[: k.genislik] for k in b.kolonlar
+        )
+        # Bölüm başlığı ve birkaç satır sığmıyorsa yeni sayfadan başlanır.
+        if pdf.bos_yer() < 6:
+            pdf.sayfa_bitir()
+        pdf.ust_bilgi = []
+        if pdf.bos_yer() < _SATIR_SAYISI:
+            pdf.satir("")
+        pdf.satir(b.baslik, kalin=True)
+        pdf.satir(kolon_satiri, kalin=True)
+        pdf.ust_bilgi = [(kolon_satiri, True)]
+        for df in b.bloklar():
+            for satir in zip(*(_pdf_hucreler(df, k) for k in b.kolonlar)):
+                pdf.satir(" ".join(satir))
+    pdf.kapat()
+
+
+_YAZICILAR = {"csv": _csv_yaz, "xlsx": _xlsx_yaz, "pdf": _pdf_yaz}
+
+
+# -------------------------------------------------
+# İÇERİK ÖZETLİ ÖNBELLEK
+# -------------------------------------------------
+def ozet(bicim: str, baslik: str, bolumler: Sequence[Bolum]) -> str:
+    """Rapor içeriğinin özeti; blok verisi dosya yazılmadan okunur."""
+    import pandas as pd
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr((BICIM_SURUMU, bicim, baslik)).encode("utf-8"))
+    for b in bolumler:
+        h.update(repr((b.baslik, tuple(b.kolonlar))).encode("utf-8"))
+        for df in b.bloklar():
+            alt = df[[k.ad for k in b.kolonlar]]
+            h.update(pd.util.hash_pandas_object(alt, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def _onbellegi_kirp(hedef: str, sinir: int):
+    """Klasör ``sinir``ı aşarsa en eski (son kullanımı en eski) dosyaları siler."""
+    dosyalar = []
+    for e in os.scandir(hedef):
+        if e.is_file() and os.path.splitext(e.name)[1] in {u for _, u in BICIMLER.values()}:
+            st = e.stat()
+            dosyalar.append((st.st_mtime, st.st_size, e.path))
+    toplam = sum(d[1] for d in dosyalar)
+    for _, boyut, yol in sorted(dosyalar):
+        if toplam <= sinir:
+            break
+        try:
+            os.unlink(yol)
+            toplam -= boyut
+        except OSError:
+            pass
+
+
+def dosya(
+    bicim: str,
+    baslik: str,
+    bolumler: Sequence[Bolum],
+    hedef: Optional[str] = None,
+) -> str:
+    """Raporu ``bicim``de üretir ya da önbellekten verir; dosya yolunu döner.
+
+    ``bolumler``deki ``bloklar`` iki kez çağrılabilir (özet ve yazım);
+    her çağrıda aynı veriyi üretmelidir.
+    """
+    if bicim not in _YAZICILAR:
+        raise ValueError(f"Bilinmeyen biçim: {bicim}")
+    hedef = hedef or klasor()
+    os.makedirs(hedef, exist_ok=True)
+    yol = os.path.join(hedef, ozet(bicim, baslik, bolumler) + BICIMLER[bicim][1])
+
+    if os.path.exists(yol):
+        try:
+            os.utime(yol)  # kırpmada son kullanım sayılır
+        except OSError:
+            pass
+        olcum.say("hum_disari_total", bicim=bicim, onbellek="isabet")
+        return yol
+
+    with olcum.sure("hum_disari_seconds", bicim=bicim):
+        fd, gecici = tempfile.mkstemp(dir=hedef, suffix=".gecici")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                _YAZICILAR[bicim](f, baslik, bolumler)
+            os.replace(gecici, yol)
+        except BaseException:
+            os.unlink(gecici)
+            raise
+    olcum.say("hum_disari_total", bicim=bicim, onbellek="uretim")
+    _onbellegi_kirp(hedef, ONBELLEK_SINIRI)
+    return yol
+
+
+def parcala(df: "pd.DataFrame", boyut: int = 10_000) -> Iterable["pd.DataFrame"]:
+    """Bellekteki tabloyu ``boyut`` satırlık bloklara böler."""
+    for i in range(0, max(len(df), 1), boyut):
+        yield df.iloc[i:i + boyut]
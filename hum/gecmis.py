@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""Hesap geçmişi: modül sonuçlarının kalıcı kaydı (SQLite, WAL).
+
+Panel her hesaplanan satırı ``ekle`` ile kuyruğa bırakır; çağrı veritabanına
+dokunmaz. Arka plandaki tek yazıcı iş parçacığı kuyruğu ``TOPLAMA_SURESI``
+boyunca (en çok ``PARTI`` kayıt) biriktirip tek işlemde ``executemany``
+ile yazar. WAL kipinde okuyucular yazıcıyı beklemez; birden çok panel
+süreci aynı dosyaya yazabilir.
+
+Geçmiş sipariş başına ``(siparis, id)`` indeksiyle, ``id`` imleçli
+(keyset) sayfalarla okunur: sayfa maliyeti geçmişin uzunluğundan
+bağımsızdır. ``HUM_GECMIS`` ortam değişkeni veritabanı yolunu değiştirir.
+"""
+import atexit
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+VARSAYILAN_YOL = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "veri", "gecmis.sqlite"
+)
+PARTI = 1000
+TOPLAMA_SURESI = 0.25  # s
+KUYRUK_SINIRI = 200_000
+
+_SEMA = """
+CREATE TABLE IF NOT EXISTS hesaplar (
+    id        INTEGER PRIMARY KEY,
+    zaman     REAL    NOT NULL,
+    kullanici TEXT    NOT NULL,
+    siparis   TEXT    NOT NULL,
+    modul     TEXT    NOT NULL,
+    girdiler  TEXT    NOT NULL,
+    miktar    REAL    NOT NULL,
+    birim     TEXT    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS hesaplar_siparis ON hesaplar (siparis, id);
+"""
+_EKLE = (
+    "INSERT INTO hesaplar (zaman, kullanici, siparis, modul, girdiler, miktar, birim) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+class Kayit(NamedTuple):
+    id: int
+    zaman: float  # epoch (s)
+    kullanici: str
+    siparis: str
+    modul: str
+    girdiler: Dict[str, float]
+    miktar: float
+    birim: str
+
+
+def gecmis_yolu() -> str:
+    return os.environ.get("HUM_GECMIS", VARSAYILAN_YOL)
+
+
+def _baglan(yol: str) -> sqlite3.Connection:
+    con = sqlite3.connect(yol, timeout=30.0, check_same_thread=False)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("PRAGMA synchronous=NORMAL")
+    return con
+
+
+class GecmisDeposu:
+    """Kuyruk + toplu yazıcı iş parçacığı + sayfalı okuma."""
+
+    def __init__(self, yol: str):
+        self.yol = yol
+        os.makedirs(os.path.dirname(os.path.abspath(yol)), exist_ok=True)
+        con = _baglan(yol)
+        con.executescript(_SEMA)
+        con.close()
+        self.dusen = 0  # kuyruk dolu olduğu için atılan kayıt
+        self.yazilan = 0
+        self._kuyruk: "queue.Queue" = queue.Queue(maxsize=KUYRUK_SINIRI)
+        self._okuma = threading.local()
+        self._yazici = threading.Thread(target=self._yaz, name="hum-gecmis", daemon=True)
+        self._yazici.start()
+
+    # ---------------- yazma ----------------
+    def ekle(
+        self,
+        kullanici: str,
+        siparis: str,
+        modul: str,
+        satirlar: Iterable[Tuple[Dict[str, float], float]],
+        birim: str = "kg",
+    ) -> int:
+        """``(girdiler, miktar)`` satırlarını kuyruğa bırakır; bekletmez."""
+        zaman = time.time()
+        n = 0
+        for girdiler, miktar in satirlar:
+            kayit = (
+                zaman, kullanici, siparis, modul,
+                json.dumps(girdiler, separators=(",", ":"), ensure_ascii=False),
+                float(miktar), birim,
+            )
+            try:
+                self._kuyruk.put_nowait(kayit)
+            except queue.Full:
+                self.dusen += 1
+                continue
+            n += 1
+        return n
+
+    def bosalt(self, zaman_asimi: float = 5.0) -> bool:
+        """Şu ana kadar kuyruğa girenler yazılınca True (çıkışta, ölçümde)."""
+        bitti = threading.Event()
+        try:
+            self._kuyruk.put(bitti, timeout=zaman_asimi)
+        except queue.Full:
+            return False
+        return bitti.wait(zaman_asimi)
+
+    def _yaz(self):
+        con = _baglan(self.yol)
+        while True:
+            parti, isaretler = [], []
+            oge = self._kuyruk.get()
+            son = time.monotonic() + TOPLAMA_SURESI
+            while True:
+                if isinstance(oge, threading.Event):
+                    isaretler.append(oge)
+                    # Boşaltma isteği partiyi beklemeden kapatır.
+                    son = 0.0
+                else:
+                    parti.append(oge)
+                if len(parti) >= PARTI:
+                    break
+                try:
+                    kalan = son - time.monotonic()
+                    oge = self._kuyruk.get(timeout=kalan) if kalan > 0 else self._kuyruk.get_nowait()
+                except queue.Empty:
+                    break
+            if parti:
+                try:
+                    with con:
+                        con.executemany(_EKLE, parti)
+                    self.yazilan += len(parti)
+                except sqlite3.Error:
+                    # Disk/kilit hatası paneli durdurmaz; parti düşer.
+                    self.dusen += len(parti)
+            for e in isaretler:
+                e.set()
+
+    # ---------------- okuma ----------------
+    def _con(self) -> sqlite3.Connection:
+        con = getattr(self._okuma, "con", None)
+        if con is None:
+            con = self._okuma.con = _baglan(self.yol)
+        return con
+
+    def sayfa(self, siparis: str, once: Optional[int] = None, boyut: int = 50) -> List[Kayit]:
+        """Siparişin ``once`` id'sinden eski (yoksa en yeni) ``boyut`` kaydı, yeniden eskiye."""
+        sql = "SELECT * FROM hesaplar WHERE siparis = ?"
+        arg: list = [siparis]
+        if once is not None:
+            sql += " AND id < ?"
+            arg.append(int(once))
+        sql += " ORDER BY id DESC LIMIT ?"
+        arg.append(int(boyut))
+        return [
+            Kayit(r[0], r[1], r[2], r[3], r[4], json.loads(r[5]), r[6], r[7])
+            for r in self._con().execute(sql, arg)
+        ]
+
+    def sayi(self, siparis: str) -> int:
+        return self._con().execute(
+            "SELECT COUNT(*) FROM hesaplar WHERE siparis = ?", (siparis,)
+        ).fetchone()[0]
+
+
+_depolar: Dict[str, GecmisDeposu] = {}
+_depo_kilidi = threading.Lock()
+
+
+def depo(yol: Optional[str] = None) -> GecmisDeposu:
+    """Süreç başına tek ``GecmisDeposu`` (yol başına); çıkışta kuyruk boşaltılır."""
+    yol = yol or gecmis_yolu()
+    with _depo_kilidi:
+        if yol not in _depolar:
+            _depolar[yol] = d = GecmisDeposu(yol)
+            atexit.register(d.bosalt, 2.0)
+        return _depolar[yol]
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""Vektörel ağırlık formülleri.
+
+Her fonksiyon skaler ya da dizi alır, ``float64`` dizi döner. Eksik
+satırlar (sıfır, boş ya da negatif ölçü) ``NaN`` olarak gelir.
+"""
+import math
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from hum import katalog
+
+# Silindir hacim katsayısı: cap² * 0.0062832 * boy * yoğunluk / 8000 (Br-3)
+MIL_KATSAYI = 0.0062832 / 8000
+# Kesit katsayısı: mm² * mm * yoğunluk -> kg (Br-3)
+KESIT_KATSAYI = 1e-6
+ALTIKOSE_KATSAYI = 0.012 / (math.sqrt(3) * 1000)
+
+
+def _dizi(x) -> np.ndarray:
+    return np.asarray(x, dtype=np.float64)
+
+
+def _celik(yogunluk: Optional[float]) -> float:
+    """Yoğunluk verilmemişse katalogdaki çelik yoğunluğu."""
+    return katalog.aktif().yogunluk("celik") if yogunluk is None else yogunluk
+
+
+def _dolu(*xs: np.ndarray) -> np.ndarray:
+    """Tüm ölçüleri pozitif olan satırlar için True."""
+    mask = xs[0] > 0
+    for x in xs[1:]:
+        mask = mask & (x > 0)
+    return mask
+
+
+def levha_kg(kal, en, boy, yogunluk: float) -> np.ndarray:
+    """Kestamit & Çelik Levha kg/adet (Br-2)."""
+    kal, en, boy = _dizi(kal), _dizi(en), _dizi(boy)
+    kg = yogunluk * kal * (en / 1000) * (boy / 1000)
+    return np.where(_dolu(kal, en, boy), kg, np.nan)
+
+
+def celik_mil_kg(cap, boy, yogunluk: Optional[float] = None) -> np.ndarray:
+    """Çelik mil kg/adet (Br-3)."""
+    cap, boy = _dizi(cap), _dizi(boy)
+    kg = cap * cap * boy * (MIL_KATSAYI * _celik(yogunluk))
+    return np.where(_dolu(cap, boy), kg, np.nan)
+
+
+def altikose_kg(ebat, boy) -> np.ndarray:
+    """Altıköşe kg/adet (Br-3)."""
+    ebat, boy = _dizi(ebat), _dizi(boy)
+    kg = ebat * ebat * boy * ALTIKOSE_KATSAYI
+    return np.where(_dolu(ebat, boy), kg, np.nan)
+
+
+def kare_kg(ebat, boy, yogunluk: Optional[float] = None) -> np.ndarray:
+    """Kare kg/adet (Br-3)."""
+    ebat, boy = _dizi(ebat), _dizi(boy)
+    kg = ebat * ebat * boy * (KESIT_KATSAYI * _celik(yogunluk))
+    return np.where(_dolu(ebat, boy), kg, np.nan)
+
+
+def lama_kg(gen, yuk, boy, yogunluk: Optional[float] = None) -> np.ndarray:
+    """Lama kg/adet (Br-3)."""
+    gen, yuk, boy = _dizi(gen), _dizi(yuk), _dizi(boy)
+    kg = gen * yuk * boy * (KESIT_KATSAYI * _celik(yogunluk))
+    return np.where(_dolu(gen, yuk, boy), kg, np.nan)
+
+
+def kosebent_kg(ebat, et, boy, yogunluk: Optional[float] = None) -> np.ndarray:
+    """Köşebent kg/adet (Br-3)."""
+    ebat, et, boy = _dizi(ebat), _dizi(et), _dizi(boy)
+    kg = 2 * ebat * et * boy * (KESIT_KATSAYI * _celik(yogunluk))
+    return np.where(_dolu(ebat, et, boy), kg, np.nan)
+
+
+def celik_cek_boru_kg(dis, et, boy, ic=0.0, yogunluk: Optional[float] = None) -> np.ndarray:
+    """Çelik çekme boru kg/adet (Br-3).
+
+    İç çap verilmişse (> 0) et yerine o kullanılır.
+    """
+    dis, et, boy, ic = _dizi(dis), _dizi(et), _dizi(boy), _dizi(ic)
+    ic_var = ic > 0
+    ic_eff = np.where(ic_var, ic, np.maximum(dis - 2 * et, 0))
+    kg = (dis * dis - ic_eff * ic_eff) * boy * (MIL_KATSAYI * _celik(yogunluk))
+    return np.where(_dolu(dis, boy) & ((et > 0) | ic_var), kg, np.nan)
+
+
+def dik_boru_mt(boy) -> np.ndarray:
+    """Dik boru & kutu profil mt/adet."""
+    boy = _dizi(boy)
+    return np.where(boy > 0, boy / 1000, np.nan)
+
+
+def profil_kg(ebat, boy, kats: Dict[int, float]) -> np.ndarray:
+    """NPU/HEB gibi katsayı tablolu profiller için kg/adet (Br-3).
+
+    Tabloda olmayan ebatlar ``NaN`` döner.
+    """
+    ebat, boy = _dizi(ebat), _dizi(boy)
+    anahtar = np.array(sorted(kats), dtype=np.float64)
+    deger = np.array([kats[k] for k in sorted(kats)], dtype=np.float64)
+    idx = np.clip(np.searchsorted(anahtar, ebat), 0, len(anahtar) - 1)
+    bulundu = anahtar[idx] == ebat
+    kg = deger[idx] * boy / 1000
+    return np.where(bulundu & (boy > 0), kg, np.nan)
+
+
+# -------------------------------------------------
+# MODÜL FORMÜL TABLOSU
+# -------------------------------------------------
+class Formul(NamedTuple):
+    alanlar: Tuple[str, ...]
+    fonksiyon: Callable[..., np.ndarray]
+    birim: str = "kg"
+
+
+def _kestamit_kg(kal, en, boy) -> np.ndarray:
+    return levha_kg(kal, en, boy, katalog.aktif().yogunluk("kestamit"))
+
+
+def _celik_levha_kg(kal, en, boy) -> np.ndarray:
+    return levha_kg(kal, en, boy, katalog.aktif().yogunluk("celik"))
+
+
+def _npu_kg(ebat, boy) -> np.ndarray:
+    return profil_kg(ebat, boy, katalog.aktif().modul_katsayi("npu"))
+
+
+def _heb_kg(ebat, boy) -> np.ndarray:
+    return profil_kg(ebat, boy, katalog.aktif().modul_katsayi("heb"))
+
+
+# Katalog değerleri her çağrıda ``katalog.aktif()``ten okunur (sıcak yükleme).
+FORMULLER: Dict[str, Formul] = {
+    "kestamit": Formul(("kal", "en", "boy"), _kestamit_kg),
+    "celik_levha": Formul(("kal", "en", "boy"), _celik_levha_kg),
+    "celik_mil": Formul(("cap", "boy"), celik_mil_kg),
+    "altikose": Formul(("ebat", "boy"), altikose_kg),
+    "kare": Formul(("ebat", "boy"), kare_kg),
+    "lama": Formul(("gen", "yuk", "boy"), lama_kg),
+    "kosebent": Formul(("ebat", "et", "boy"), kosebent_kg),
+    "celik_cek_boru": Formul(("dis", "et", "boy", "ic"), celik_cek_boru_kg),
+    "dik_boru_kutu": Formul(("boy",), dik_boru_mt, "mt"),
+    "npu": Formul(("ebat", "boy"), _npu_kg),
+    "heb": Formul(("ebat", "boy"), _heb_kg),
+}
+
+OLCU_ALANLARI: Tuple[str, ...] = tuple(sorted({a for f in FORMULLER.values() for a in f.alanlar}))
+
+
+def modul_hesapla(mod_id: str, kolonlar: Mapping[str, Any], n: Optional[int] = None) -> np.ndarray:
+    """Tek modül için kolon sözlüğünden birim/adet hesabı.
+
+    Eksik kolonlar boş (0) kabul edilir. ``n`` satır sayısıdır; verilmezse
+    ilk kolonun uzunluğu alınır (kolon yoksa 0).
+    """
+    formul = FORMULLER[mod_id]
+    if n is None:
+        n = len(next(iter(kolonlar.values()))) if kolonlar else 0
+    bos = np.zeros(n)
+    return formul.fonksiyon(*(kolonlar.get(a, bos) for a in formul.alanlar))
+
+
+def karisik_hesapla(malzeme: Sequence[str], kolonlar: Mapping[str, Any]) -> np.ndarray:
+    """Farklı malzemelerden oluşan satırları modül bazında gruplayarak hesaplar.
+
+    Tanınmayan malzemeler ``NaN`` döner.
+    """
+    malzeme = np.asarray(malzeme, dtype=object).astype(str)
+    kolonlar = {a: _dizi(v) for a, v in kolonlar.items()}
+    sonuc = np.full(len(malzeme), np.nan)
+    for mod_id in np.unique(malzeme):
+        if mod_id not in FORMULLER:
+            continue
+        idx = np.flatnonzero(malzeme == mod_id)
+        alt = {a: v[idx] for a, v in kolonlar.items()}
+        sonuc[idx] = modul_hesapla(mod_id, alt, len(idx))
+    return sonuc
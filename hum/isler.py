@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+"""Arka plan işleri: ağır toplu hesapların süreç havuzunda çalıştırılması.
+
+Toplu BOM hesabı, kesim planı ve toplu kod üretimi panel rerun'u yerine
+sınırlı bir ``ProcessPoolExecutor``da çalışır; GIL'i oturumlarla
+paylaşmaz. Her iş ``<klasör>/<id>/`` altında tutulur:
+
+* ``is.json``: tür, ad, ayarlar, sahip panel süreci (makine + pid) ve son
+  durum (sadece sahip süreç yazar)
+* ``ilerleme.json``: oran ve mesaj (sadece işçi yazar)
+* ``iptal``: panelin bıraktığı iptal işareti; işçi bloklar arasında bakar
+* ``girdi.*`` / ``sonuc.csv``: yüklenen dosya ve indirilecek sonuç
+
+Dosyalar geçici dosya + ``os.replace`` ile yazılır; panel yeniden
+başlasa da biten işlerin sonuçları indirilebilir. Panel açılırken sadece
+sahibi artık çalışmayan yarım işler hataya çekilir; aynı klasörü paylaşan
+diğer kopyaların işlerine dokunulmaz (başka makinedeki sahip, o makinedeki
+panel yeniden başlayınca kapatılır). ``HUM_ISLER`` ortam
+değişkeni klasörü, ``HUM_ISCI`` işçi sayısını değiştirir.
+"""
+import atexit
+import json
+import multiprocessing
+import os
+import secrets
+import shutil
+import socket
+import threading
+import time
+from contextlib import contextmanager, suppress
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import pandas as pd
+
+from hum import bom, kesim, kodlama
+
+VARSAYILAN_KLASOR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "veri", "isler"
+)
+BEKLEYEN_SINIRI = 16  # kuyrukta + çalışan iş
+ILERLEME_ARALIGI = 0.2  # s; işçinin ilerleme yazma sıklığı
+
+TURLER = ("bom", "kesim", "kod")
+BITMIS = ("bitti", "hata", "iptal")
+
+
+class Is(NamedTuple):
+    id: str
+    tur: str
+    ad: str
+    durum: str  # bekliyor | calisiyor | bitti | hata | iptal
+    ilerleme: float  # 0..1
+    mesaj: str
+    olusturma: float
+    bitis: Optional[float]
+    ozet: Dict[str, Any]
+    sonuc: Optional[str]  # indirilecek dosya
+
+
+class IsIptal(Exception):
+    """İşçi iptal işaretini gördü."""
+
+
+def klasor_yolu() -> str:
+    return os.environ.get("HUM_ISLER", VARSAYILAN_KLASOR)
+
+
+def isci_sayisi() -> int:
+    return int(os.environ.get("HUM_ISCI", max(1, min(4, (os.cpu_count() or 2) // 2))))
+
+
+def _json_yaz(yol: str, veri: dict):
+    gecici = f"{yol}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(gecici, "w", encoding="utf-8") as f:
+        json.dump(veri, f, ensure_ascii=False)
+    os.replace(gecici, yol)
+
+
+def _json_oku(yol: str) -> dict:
+    try:
+        with open(yol, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+# -------------------------------------------------
+# İŞÇİ TARAFI
+# -------------------------------------------------
+class _Ilerleme:
+    """İşçinin ilerleme yazıcısı; her çağrıda iptal işaretine bakar."""
+
+    def __init__(self, klasor: str):
+        self.klasor = klasor
+        self._son = 0.0
+
+    def __call__(self, oran: float, mesaj: str = "", zorla: bool = False):
+        if os.path.exists(os.path.join(self.klasor, "iptal")):
+            raise IsIptal()
+        simdi = time.monotonic()
+        if zorla or simdi - self._son >= ILERLEME_ARALIGI:
+            self._son = simdi
+            _json_yaz(
+                os.path.join(self.klasor, "ilerleme.json"),
+                {"ilerleme": min(max(oran, 0.0), 1.0), "mesaj": mesaj, "basladi": True},
+            )
+
+
+def _satir_sayisi(yol: str) -> Optional[int]:
+    """CSV veri satırı sayısı (ilerleme oranı için); XLSX'te boyut kaydı."""
+    if yol.lower().endswith((".xlsx", ".xlsm")):
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            return None
+        wb = load_workbook(yol, read_only=True)
+        try:
+            n = wb.active.max_row
+        finally:
+            wb.close()
+        return n - 1 if n else None
+    with open(yol, "rb") as f:
+        n = sum(blok.count(b"\n") for blok in iter(lambda: f.read(1 << 20), b""))
+    return max(n - 1, 1)
+
+
+@contextmanager
+def _sonuc_yazici(klasor: str):
+    """``sonuc.csv``yi geçici dosyaya yazar; hata ya da iptalde geçici dosya silinir."""
+    gecici = os.path.join(klasor, "sonuc.csv.tmp")
+    try:
+        with open(gecici, "w", encoding="utf-8", newline="") as f:
+            yield f
+        os.replace(gecici, os.path.join(klasor, "sonuc.csv"))
+    except BaseException:
+        _gecici_sil(klasor)
+        raise
+
+
+def _gecici_sil(klasor: str):
+    with suppress(FileNotFoundError):
+        os.remove(os.path.join(klasor, "sonuc.csv.tmp"))
+
+
+def _sayac_metni(n: int, toplam: Optional[int]) -> str:
+    return f"{n:,}".replace(",", ".") + (f" / {toplam:,}".replace(",", ".") if toplam else "") + " satır"
+
+
+def _is_bom(klasor: str, ayar: dict, ilerle: _Ilerleme) -> dict:
+    girdi = os.path.join(klasor, ayar["girdi"])
+    toplam_satir = _satir_sayisi(girdi)
+    toplam = bom.BomToplam()
+    n = 0
+    with _sonuc_yazici(klasor) as f:
+        for i, df in enumerate(bom.bom_isle(girdi, girdi, ayar["parca_boyu"], toplam)):
+            df.to_csv(f, index=False, header=(i == 0))
+            n += len(df)
+            ilerle(n / toplam_satir if toplam_satir else 0.0, _sayac_metni(n, toplam_satir))
+    return {
+        "satir": n,
+        "hatali": toplam.hatali,
+        "toplamlar": toplam.tablo().to_dict("records"),
+    }
+
+
+def _is_kesim(klasor: str, ayar: dict, ilerle: _Ilerleme) -> dict:
+    ilerle(0.0, "Planlanıyor", zorla=True)
+    plan = kesim.planla(
+        [tuple(p) for p in ayar["parcalar"]], ayar["stoklar"], kerf=ayar["kerf"], sure=ayar["sure"],
+        kontrol=lambda: ilerle(0.0, "Planlanıyor"),
+    )
+    ilerle(0.9, "Yazılıyor")
+    with _sonuc_yazici(klasor) as f:
+        pd.DataFrame(
+            {
+                "adet": [d.adet for d in plan.desenler],
+                "stok_mm": [d.stok for d in plan.desenler],
+                "kesimler_mm": [" + ".join(f"{p:g}" for p in d.parcalar) for d in plan.desenler],
+                "fire_mm": [round(d.fire, 1) for d in plan.desenler],
+            }
+        ).to_csv(f, index=False)
+    return {
+        "bar_sayisi": plan.bar_sayisi,
+        "alt_sinir": plan.alt_sinir,
+        "verim": plan.verim,
+        "fire_mm": plan.fire_mm,
+        "satin_alma_kg": plan.satin_alma_kg(ayar["kg_m"]),
+        "stok_adetleri": {f"{s:g}": n for s, n in plan.stok_adetleri.items()},
+    }
+
+
+def _is_kod(klasor: str, ayar: dict, ilerle: _Ilerleme) -> dict:
+    girdi = os.path.join(klasor, ayar["girdi"])
+    toplam_satir = _satir_sayisi(girdi)
+    depo = kodlama.depo(ayar["depo"])
+    sayilar: Dict[str, int] = {}
+    yeni: List[str] = []
+    n = 0
+    with _sonuc_yazici(klasor) as f:
+        parcalar = bom.bom_parcalari(girdi, girdi, bom.PARCA_BOYU, metin=True)
+        for i, df in enumerate(kodlama.toplu_kodla(parcalar, depo)):
+            df.to_csv(f, index=False, header=(i == 0))
+            for d, k in df["durum"].value_counts().items():
+                sayilar[d] = sayilar.get(d, 0) + int(k)
+            if ayar["kaydet"]:
+                yeni += df.loc[df["durum"] == "yeni", "kod"].tolist()
+            n += len(df)
+            ilerle(n / toplam_satir if toplam_satir else 0.0, _sayac_metni(n, toplam_satir))
+    # Kayıt en sonda: iptal edilen iş depoya yarım kod bırakmaz.
+    ilerle(1.0, "Depoya kaydediliyor", zorla=True)
+    return {"satir": n, "durum": sayilar, "kaydedilen": depo.kaydet(yeni) if yeni else 0}
+
+
+_ISLEYICILER: Dict[str, Callable[[str, dict, _Ilerleme], dict]] = {
+    "bom": _is_bom,
+    "kesim": _is_kesim,
+    "kod": _is_kod,
+}
+
+
+def _calistir(tur: str, klasor: str, ayar: dict) -> dict:
+    """İşçi süreç giriş noktası; özet sözlüğü döner."""
+    ilerle = _Ilerleme(klasor)
+    ilerle(0.0, "Başladı", zorla=True)
+    ozet = _ISLEYICILER[tur](klasor, ayar, ilerle)
+    ilerle(1.0, "Bitti", zorla=True)
+    return ozet
+
+
+# -------------------------------------------------
+# PANEL TARAFI
+# -------------------------------------------------
+class IsYoneticisi:
+    """İş kuyruğu: gönderme, izleme, iptal ve kalıcı sonuçlar."""
+
+    def __init__(self, klasor: str, isci: int):
+        self.klasor = klasor
+        self.isci = isci
+        self._kilit = threading.Lock()
+        self._havuz: Optional[ProcessPoolExecutor] = None
+        self._isler: Dict[str, Future] = {}
+        self.sahip = {"makine": socket.gethostname(), "pid": os.getpid()}
+        os.makedirs(klasor, exist_ok=True)
+        # Sahibi kapanmış yarım işler hiçbir havuzda devam etmez.
+        for is_id in os.listdir(klasor):
+            yol = os.path.join(klasor, is_id, "is.json")
+            kayit = _json_oku(yol)
+            if kayit and kayit.get("durum") not in BITMIS and not self._sahip_calisiyor(kayit.get("sahip")):
+                kayit.update(durum="hata", mesaj="Panel yeniden başladı", bitis=time.time())
+                _json_yaz(yol, kayit)
+                _gecici_sil(os.path.join(klasor, is_id))
+
+    def _sahip_calisiyor(self, sahip: Optional[dict]) -> bool:
+        """İşi gönderen panel süreci hâlâ çalışıyor mu (başka makinedekiler öyle kabul edilir)."""
+        if not sahip:
+            return False
+        if sahip.get("makine") != self.sahip["makine"]:
+            return True
+        pid = sahip.get("pid")
+        # Aynı pid bu süreçse (konteynerde pid 1) önceki süreçten kalmıştır.
+        if not isinstance(pid, int) or pid == self.sahip["pid"]:
+            return False
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
+
+    def _havuz_al(self) -> ProcessPoolExecutor:
+        if self._havuz is None:
+            # spawn: Streamlit iş parçacıkları ve kilitleri işçiye kopyalanmaz.
+            self._havuz = ProcessPoolExecutor(
+                max_workers=self.isci, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._havuz
+
+    def _yol(self, is_id: str, *ad: str) -> str:
+        return os.path.join(self.klasor, is_id, *ad)
+
+    def gonder(
+        self,
+        tur: str,
+        ad: str,
+        ayar: Dict[str, Any],
+        girdi: Optional[bytes] = None,
+        girdi_adi: str = "",
+    ) -> str:
+        """İşi kuyruğa alır, iş id'si döner. Kuyruk doluysa ``RuntimeError``."""
+        if tur not in _ISLEYICILER:
+            raise ValueError(f"Bilinmeyen iş türü: {tur!r}")
+        with self._kilit:
+            if sum(not f.done() for f in self._isler.values()) >= BEKLEYEN_SINIRI:
+                raise RuntimeError(f"İş kuyruğu dolu ({BEKLEYEN_SINIRI} iş); biraz sonra tekrar deneyin.")
+            is_id = time.strftime("%Y%m%d-%H%M%S-") + secrets.token_hex(3)
+            os.makedirs(self._yol(is_id))
+            ayar = dict(ayar)
+            if girdi is not None:
+                ayar["girdi"] = "girdi" + os.path.splitext(girdi_adi)[1].lower()
+                with open(self._yol(is_id, ayar["girdi"]), "wb") as f:
+                    f.write(girdi)
+            _json_yaz(self._yol(is_id, "is.json"), {
+                "tur": tur, "ad": ad, "ayar": ayar, "durum": "bekliyor", "sahip": self.sahip,
+                "mesaj": "", "olusturma": time.time(), "bitis": None, "ozet": {},
+            })
+            gelecek = self._havuz_al().submit(_calistir, tur, self._yol(is_id), ayar)
+            self._isler[is_id] = gelecek
+        gelecek.add_done_callback(lambda f, is_id=is_id: self._bitti(is_id, f))
+        return is_id
+
+    def _bitti(self, is_id: str, gelecek: Future):
+        yol = self._yol(is_id, "is.json")
+        kayit = _json_oku(yol)
+        kayit["bitis"] = time.time()
+        try:
+            kayit.update(durum="bitti", ozet=gelecek.result(), mesaj="")
+        except (CancelledError, IsIptal):
+            kayit.update(durum="iptal", mesaj="İptal edildi")
+        except BrokenProcessPool as e:
+            # Çöken işçi havuzu kullanılamaz kılar; sonraki gönderim yenisini kurar.
+            kayit.update(durum="hata", mesaj=f"İşçi süreci çöktü: {e}")
+            with self._kilit:
+                self._havuz = None
+        except Exception as e:
+            kayit.update(durum="hata", mesaj=str(e) or type(e).__name__)
+        if kayit["durum"] != "bitti":
+            # Çöken işçi geçici dosyasını silemez.
+            _gecici_sil(self._yol(is_id))
+        _json_yaz(yol, kayit)
+
+    def iptal(self, is_id: str):
+        """Bekleyen iş hemen, çalışan iş bir sonraki blokta durur."""
+        with self._kilit:
+            gelecek = self._isler.get(is_id)
+        if gelecek is not None and gelecek.cancel():
+            return
+        if os.path.isdir(self._yol(is_id)):
+            open(self._yol(is_id, "iptal"), "w").close()
+
+    def sil(self, is_id: str):
+        """Bitmiş işin klasörünü siler."""
+        if self.durum(is_id).durum in BITMIS:
+            shutil.rmtree(self._yol(is_id), ignore_errors=True)
+            with self._kilit:
+                self._isler.pop(is_id, None)
+
+    def durum(self, is_id: str) -> Is:
+        kayit = _json_oku(self._yol(is_id, "is.json"))
+        durum = kayit.get("durum", "hata")
+        ilerleme = _json_oku(self._yol(is_id, "ilerleme.json"))
+        if durum == "bekliyor" and ilerleme.get("basladi"):
+            durum = "calisiyor"
+        sonuc = self._yol(is_id, "sonuc.csv")
+        return Is(
+            id=is_id,
+            tur=kayit.get("tur", ""),
+            ad=kayit.get("ad", ""),
+            durum=durum,
+            ilerleme=1.0 if durum == "bitti" else float(ilerleme.get("ilerleme", 0.0)),
+            mesaj=kayit.get("mesaj") or ilerleme.get("mesaj", ""),
+            olusturma=kayit.get("olusturma", 0.0),
+            bitis=kayit.get("bitis"),
+            ozet=kayit.get("ozet") or {},
+            sonuc=sonuc if durum == "bitti" and os.path.exists(sonuc) else None,
+        )
+
+    def liste(self, limit: int = 50) -> List[Is]:
+        """En yeni ``limit`` iş (id zaman sıralıdır)."""
+        try:
+            idler = sorted(os.listdir(self.klasor), reverse=True)[:limit]
+        except FileNotFoundError:
+            return []
+        return [self.durum(i) for i in idler if os.path.isdir(self._yol(i))]
+
+    def kapat(self):
+        with self._kilit:
+            if self._havuz is not None:
+                self._havuz.shutdown(wait=False, cancel_futures=True)
+                self._havuz = None
+
+
+_yoneticiler: Dict[str, IsYoneticisi] = {}
+_yonetici_kilidi = threading.Lock()
+
+
+def yonetici(klasor: Optional[str] = None) -> IsYoneticisi:
+    """Süreç başına tek ``IsYoneticisi`` (klasör başına)."""
+    klasor = klasor or klasor_yolu()
+    with _yonetici_kilidi:
+        if klasor not in _yoneticiler:
+            _yoneticiler[klasor] = y = IsYoneticisi(klasor, isci_sayisi())
+            atexit.register(y.kapat)
+        return _yoneticiler[klasor]
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Izgara (data_editor) modu için artımlı hesap.
+
+Her rerun'da düzenlenen tablo bir önceki hâliyle index bazında
+karşılaştırılır; sadece değişen/eklenen satırlar vektörel formüllerden
+geçirilir, silinen satırların katkısı toplamdan düşülür.
+"""
+from typing import Dict, Hashable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hum.hesap import FORMULLER, modul_hesapla
+
+
+class IzgaraHesap:
+    """Tek modülün ızgara durumu: girdiler, satır sonuçları ve toplamlar."""
+
+    def __init__(self, mod_id: str):
+        self.mod_id = mod_id
+        self.alanlar: List[str] = list(FORMULLER[mod_id].alanlar)
+        self.kolonlar: List[str] = self.alanlar + ["adet"]
+        self._girdi = pd.DataFrame(columns=self.kolonlar, dtype=np.float64)
+        self._miktar = pd.Series(dtype=np.float64)
+        self._katki = pd.Series(dtype=np.float64)
+        self.toplam = 0.0
+        self.son_kirli = 0
+        self._kirli = pd.Index([])
+
+    def _sayisal(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = df.reindex(columns=self.kolonlar)
+        return df.apply(pd.to_numeric, errors="coerce").astype(np.float64)
+
+    def guncelle(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Düzenlenmiş tabloyu işler; ``miktar_adet`` ve ``miktar_toplam`` döner."""
+        yeni = self._sayisal(df)
+        eski = self._girdi.reindex(yeni.index)
+
+        ayni = (yeni == eski) | (yeni.isna() & eski.isna())
+        kirli = yeni.index[~ayni.all(axis=1).to_numpy()]
+        silinen = self._girdi.index.difference(yeni.index)
+        self.son_kirli = len(kirli)
+        self._kirli = kirli
+
+        # Değişen ve silinen satırların eski katkısı toplamdan çıkar.
+        self.toplam -= float(self._katki.reindex(kirli.union(silinen)).fillna(0).sum())
+
+        miktar = self._miktar.reindex(yeni.index)
+        if len(kirli):
+            alt = yeni.loc[kirli]
+            miktar.loc[kirli] = modul_hesapla(
+                self.mod_id, {a: alt[a].to_numpy() for a in self.alanlar}
+            )
+        adet = yeni["adet"].fillna(1)
+        katki = (miktar * adet).fillna(0)
+        self.toplam += float(katki.loc[kirli].sum())
+
+        self._girdi, self._miktar, self._katki = yeni, miktar, katki
+        return pd.DataFrame(
+            {"miktar_adet": miktar, "miktar_toplam": miktar * adet},
+            index=yeni.index,
+        )
+
+    def son_hesaplananlar(self) -> List[Tuple[Hashable, Dict[str, float], float]]:
+        """Son ``guncelle``de hesaplanıp sonuç veren satırlar: ``(index, girdiler, miktar)``."""
+        girdi = self._girdi.loc[self._kirli]
+        miktar = self._miktar.loc[self._kirli].tolist()
+        return [
+            (i, {a: v for a, v in g.items() if v == v}, m)
+            for i, g, m in zip(girdi.index, girdi.to_dict("records"), miktar)
+            if m == m
+        ]
+
+    def dolu_satirlar(self) -> pd.DataFrame:
+        """Sonuç veren satırlar: girdiler (boş adet 1) ve ``miktar_adet``."""
+        dolu = self._miktar.notna()
+        girdi = self._girdi[dolu]
+        return girdi.assign(adet=girdi["adet"].fillna(1), miktar_adet=self._miktar[dolu])
+
+    @property
+    def satir(self) -> int:
+        return int(self._miktar.notna().sum())
+
+    @property
+    def adet(self) -> float:
+        return float(self._girdi["adet"].fillna(1)[self._miktar.notna()].sum())
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+"""Ortak malzeme kataloğu (profil kg/m katsayıları ve yoğunluklar).
+
+Kaynak ``veri/katalog.csv`` dosyasıdır; ilk kullanımda yanına sütunlu
+ikili bir dosya (``.humk``) derlenir ve ``mmap`` ile okunur. Tüm modüller
+ve aynı diski gören tüm sunucu kopyaları bu tek dosyayı kullanır. Tablolar
+küçük olduğu için eşlemeden kopyalanır ve eşleme hemen kapatılır: açık
+eşleme Windows'ta dosyanın ``os.replace`` ile değiştirilmesini engeller.
+
+``HUM_KATALOG`` ortam değişkeni CSV yolunu değiştirir. ``izlemeyi_baslat``
+dosyaları izler, değişiklikte kataloğu yeniden derleyip yükler ve
+``aktif()`` referansını tek atamayla değiştirir.
+
+İkili format (little-endian)::
+
+    "HUMK" | u32 sürüm | u32 başlık_uzunluğu | JSON başlık | dolgu (8)
+    ebat  f8[n] | kg_m f8[n] | aile u2[n] | modul u1[n]
+"""
+import csv
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from hum import olcum
+
+if TYPE_CHECKING:
+    from hum.ters_arama import AgirlikIndeksi
+
+VARSAYILAN_CSV = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "veri", "katalog.csv"
+)
+
+_SIHIR = b"HUMK"
+_FORMAT_SURUMU = 1
+_ON_EK = struct.Struct("<4sII")
+_KOLONLAR = (("ebat", "<f8"), ("kg_m", "<f8"), ("aile", "<u2"), ("modul", "u1"))
+
+log = logging.getLogger("hum.katalog")
+
+
+def csv_yolu() -> str:
+    return os.environ.get("HUM_KATALOG", VARSAYILAN_CSV)
+
+
+def ikili_yol(kaynak: str) -> str:
+    return os.path.splitext(kaynak)[0] + ".humk"
+
+
+# -------------------------------------------------
+# DERLEME (CSV -> .humk)
+# -------------------------------------------------
+def derle(kaynak: str, hedef: Optional[str] = None) -> str:
+    """CSV kataloğu ikili formata derler; hedef dosya atomik olarak değiştirilir."""
+    hedef = hedef or ikili_yol(kaynak)
+    with open(kaynak, "rb") as f:
+        ham = f.read()
+
+    aileler: List[str] = []
+    moduller: List[str] = []
+    yogunluk: Dict[str, float] = {}
+    ebat, kg_m, aile, modul = [], [], [], []
+
+    for satir in csv.DictReader(ham.decode("utf-8-sig").splitlines()):
+        tip = satir["tip"].strip()
+        if tip == "yogunluk":
+            yogunluk[satir["aile"].strip()] = float(satir["deger"])
+        elif tip == "profil":
+            ad = satir["aile"].strip().upper()
+            if ad not in aileler:
+                aileler.append(ad)
+            mod = (satir.get("modul") or "").strip()
+            if mod and mod not in moduller:
+                moduller.append(mod)
+            ebat.append(float(satir["ebat"]))
+            kg_m.append(float(satir["deger"]))
+            aile.append(aileler.index(ad))
+            modul.append(moduller.index(mod) + 1 if mod else 0)
+        else:
+            raise ValueError(f"Bilinmeyen katalog satır tipi: {tip!r}")
+
+    diziler = {
+        "ebat": np.asarray(ebat, dtype="<f8"),
+        "kg_m": np.asarray(kg_m, dtype="<f8"),
+        "aile": np.asarray(aile, dtype="<u2"),
+        "modul": np.asarray(modul, dtype="u1"),
+    }
+    baslik = {
+        "n": len(ebat),
+        "aileler": aileler,
+        "moduller": moduller,
+        "yogunluk": yogunluk,
+        "kaynak_sha1": hashlib.sha1(ham).hexdigest(),
+    }
+    baslik_ham = json.dumps(baslik, ensure_ascii=False).encode("utf-8")
+    on = _ON_EK.pack(_SIHIR, _FORMAT_SURUMU, len(baslik_ham)) + baslik_ham
+    on += b"\0" * (-len(on) % 8)
+
+    gecici = f"{hedef}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(gecici, "wb") as f:
+        f.write(on)
+        for ad, _ in _KOLONLAR:
+            f.write(diziler[ad].tobytes())
+    os.replace(gecici, hedef)
+    return hedef
+
+
+# -------------------------------------------------
+# KATALOG
+# -------------------------------------------------
+class Katalog:
+    """İkili katalog; (aile, ebat) araması O(1)."""
+
+    def __init__(self, yol: str):
+        self.yol = yol
+        with open(yol, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            sihir, surum, baslik_uz = _ON_EK.unpack_from(mm, 0)
+            if sihir != _SIHIR or surum != _FORMAT_SURUMU:
+                raise ValueError(f"Geçersiz katalog dosyası: {yol}")
+            baslik = json.loads(mm[_ON_EK.size:_ON_EK.size + baslik_uz].decode("utf-8"))
+
+            n = baslik["n"]
+            ofset = _ON_EK.size + baslik_uz
+            ofset += -ofset % 8
+            for ad, dtype in _KOLONLAR:
+                # Kopya: eşleme kapanınca da geçerli kalır.
+                dizi = np.frombuffer(mm, dtype=dtype, count=n, offset=ofset).copy()
+                setattr(self, ad, dizi)
+                ofset += dizi.nbytes
+
+        self.aileler: List[str] = baslik["aileler"]
+        self.moduller: List[str] = baslik["moduller"]
+        self.kaynak_sha1: str = baslik["kaynak_sha1"]
+        self.surum: str = self.kaynak_sha1[:12]
+        self._yogunluk: Dict[str, float] = baslik["yogunluk"]
+        self._anahtar: Dict[Tuple[str, float], int] = {
+            (self.aileler[a], e): i
+            for i, (a, e) in enumerate(zip(self.aile.tolist(), self.ebat.tolist()))
+        }
+        self._modul_katsayi: Dict[str, Dict[int, float]] = {}
+        self._profil_rows: Optional[List[Tuple[str, float, float]]] = None
+        self._agirlik_indeksi: Optional["AgirlikIndeksi"] = None
+
+    def __len__(self) -> int:
+        return len(self.ebat)
+
+    @olcum.zamanla("hum_katalog_seconds")
+    def katsayi(self, aile: str, ebat: float) -> Optional[float]:
+        """Profil kg/m değeri; katalogda yoksa None."""
+        i = self._anahtar.get((aile.upper(), float(ebat)))
+        return None if i is None else float(self.kg_m[i])
+
+    def yogunluk(self, malzeme: str) -> float:
+        return self._yogunluk[malzeme]
+
+    def malzemeler(self) -> List[str]:
+        """Yoğunluğu tanımlı malzemeler (katalog sırasıyla)."""
+        return list(self._yogunluk)
+
+    @olcum.zamanla("hum_katalog_seconds")
+    def modul_katsayi(self, mod_id: str) -> Dict[int, float]:
+        """Panel modülünde (npu, heb) sunulan ebat -> kg/m tablosu."""
+        if mod_id not in self._modul_katsayi:
+            kod = self.moduller.index(mod_id) + 1 if mod_id in self.moduller else -1
+            idx = np.flatnonzero(self.modul == kod)
+            self._modul_katsayi[mod_id] = {
+                int(self.ebat[i]): float(self.kg_m[i]) for i in idx
+            }
+        return self._modul_katsayi[mod_id]
+
+    def profil_rows(self) -> List[Tuple[str, float, float]]:
+        """Profil Ağırlık Cetveli satırları: (ad, 1 mt/kg, 6 mt/kg)."""
+        if self._profil_rows is None:
+            self._profil_rows = [
+                (f"{self.aileler[a]} {e:g}", k, round(k * 6, 2))
+                for a, e, k in zip(self.aile.tolist(), self.ebat.tolist(), self.kg_m.tolist())
+            ]
+        return self._profil_rows
+
+    def agirlik_indeksi(self) -> "AgirlikIndeksi":
+        """Ağırlık/kesitten profile ters arama indeksi (ilk çağrıda kurulur)."""
+        if self._agirlik_indeksi is None:
+            from hum.ters_arama import AgirlikIndeksi
+
+            self._agirlik_indeksi = AgirlikIndeksi(self)
+        return self._agirlik_indeksi
+
+
+# -------------------------------------------------
+# AKTİF KATALOG & SICAK YENİDEN YÜKLEME
+# -------------------------------------------------
+_aktif: Optional[Katalog] = None
+_kilit = threading.Lock()
+_izleyici: Optional[threading.Thread] = None
+
+
+def _guncel_katalog(kaynak: str) -> Katalog:
+    """İkili dosyayı açar; yoksa ya da CSV içeriği değişmişse önce derler.
+
+    Karşılaştırma mtime yerine CSV'nin SHA-1'i ile yapılır; kaba zaman
+    damgalı dosya sistemlerinde de değişiklik kaçmaz.
+    """
+    hedef = ikili_yol(kaynak)
+    with open(kaynak, "rb") as f:
+        ozet = hashlib.sha1(f.read()).hexdigest()
+    try:
+        kat = Katalog(hedef)
+        if kat.kaynak_sha1 == ozet:
+            return kat
+    except (FileNotFoundError, ValueError):
+        pass
+    return Katalog(derle(kaynak, hedef))
+
+
+@olcum.zamanla("hum_katalog_seconds")
+def yeniden_yukle() -> Katalog:
+    """Kataloğu diskten okur ve aktif referansı atomik olarak değiştirir."""
+    global _aktif
+    with _kilit:
+        yeni = _guncel_katalog(csv_yolu())
+        _aktif = yeni
+    return yeni
+
+
+def aktif() -> Katalog:
+    """Geçerli katalog (ilk çağrıda yüklenir)."""
+    kat = _aktif
+    if kat is None:
+        kat = yeniden_yukle()
+    return kat
+
+
+def _imza(yol: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        durum = os.stat(yol)
+    except FileNotFoundError:
+        return None
+    return durum.st_mtime_ns, durum.st_size, durum.st_ino
+
+
+def _izle(aralik: float):
+    kaynak = csv_yolu()
+    son = (_imza(kaynak), _imza(ikili_yol(kaynak)))
+    while True:
+        time.sleep(aralik)
+        simdi = (_imza(kaynak), _imza(ikili_yol(kaynak)))
+        if simdi == son:
+            continue
+        try:
+            yeniden_yukle()
+        except Exception:
+            # Yarım yazılmış CSV vb.: eski katalogla devam, sonraki turda tekrar dene.
+            log.exception("Katalog yeniden yüklenemedi (%s); eski katalogla devam ediliyor", kaynak)
+            continue
+        son = (_imza(kaynak), _imza(ikili_yol(kaynak)))
+
+
+def izlemeyi_baslat(aralik: float = 2.0):
+    """Katalog dosyalarını arka planda izler (süreç başına bir kez)."""
+    global _izleyici
+    with _kilit:
+        if _izleyici is None:
+            _izleyici = threading.Thread(target=_izle, args=(aralik,), name="hum-katalog", daemon=True)
+            _izleyici.start()
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""Boy kesim planı (1D cutting-stock): parça boyları -> stok bar ataması.
+
+Sezgisel: en uzun parçadan başlayarak *best-fit decreasing*. Açık barların
+kalan boyları sıralı bir listede tutulur; her parça için parçayı alan en
+dar bar ikili aramayla bulunur (O(n log b)). Yeni bar en uzun stokla
+açılır, plan bitince her bar içini karşılayan en kısa stoka küçültülür.
+
+İsteğe bağlı iyileştirme (``sure`` saniye bütçesiyle):
+
+1. Desen sezgiseli: kalan talep için bara en iyi dolan kesim deseni
+   (sınırlı sırt çantası, mm çözünürlüklü NumPy DP) bulunur ve talep
+   izin verdiği kadar tekrarlanır; süre biterse kalan parçalar
+   best-fit ile yerleşir. Daha az bar veren plan seçilir.
+2. Bar boşaltma: en boş barlardan başlayarak barın tüm parçaları diğer
+   barların boşluklarına sığıyorsa bar kaldırılır.
+
+Her iki döngü de turda bir ``kontrol`` geri çağrısını çalıştırır; arka
+plan işleri iptali buradan fırlatılan istisnayla yapar.
+
+Testere payı (``kerf``): her parça ``boy + kerf`` yer kaplar; bar boyuna
+da bir ``kerf`` eklenir, böylece son parçadan sonra kesim gerekmez.
+Tüm uzunluklar mm'dir.
+"""
+import math
+import time
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+_EPS = 1e-6
+# Desen DP'sinin karar tablosu için üst sınır (bayt)
+DP_BELLEK = 64 * 1024 * 1024
+
+
+class KesimDeseni(NamedTuple):
+    """Aynı şekilde kesilen barlar."""
+    stok: float
+    parcalar: Tuple[float, ...]
+    adet: int
+
+    @property
+    def fire(self) -> float:
+        """Bar başına fire (mm, testere payı dahil)."""
+        return self.stok - sum(self.parcalar)
+
+
+class KesimPlani(NamedTuple):
+    desenler: List[KesimDeseni]
+    bar_sayisi: int
+    stok_adetleri: Dict[float, int]
+    stok_mm: float
+    parca_mm: float
+    alt_sinir: int
+    kaldirilan: int  # iyileştirme turunun kaldırdığı bar sayısı
+
+    @property
+    def fire_mm(self) -> float:
+        return self.stok_mm - self.parca_mm
+
+    @property
+    def verim(self) -> float:
+        return self.parca_mm / self.stok_mm if self.stok_mm else 0.0
+
+    def satin_alma_kg(self, kg_m: float) -> float:
+        """Satın alınacak stokun toplam ağırlığı."""
+        return self.stok_mm / 1000.0 * kg_m
+
+
+def _parca_listesi(parcalar: Iterable[Tuple[float, int]]) -> List[Tuple[float, int]]:
+    birlesik: Dict[float, int] = {}
+    hatali = []
+    for sira, (boy, adet) in enumerate(parcalar, 1):
+        boy, adet = float(boy), float(adet)
+        if not (adet >= 1 and adet.is_integer()):
+            hatali.append(f"{sira}. satır ({adet:g})")
+        elif boy > 0:
+            birlesik[boy] = birlesik.get(boy, 0) + int(adet)
+    if hatali:
+        raise ValueError("Adet pozitif tam sayı olmalı: " + ", ".join(hatali))
+    return sorted(birlesik.items(), reverse=True)
+
+
+def _yerlestir(liste, kap: float, kerf: float):
+    """Best-fit decreasing; ``(barlar, kalan)`` döner (kalan: etkin mm)."""
+    barlar: List[List[float]] = []
+    kalan: List[float] = []
+    bos: List[Tuple[float, int]] = []  # (kalan, bar no), sıralı
+
+    for boy, adet in liste:
+        p = boy + kerf
+        for _ in range(adet):
+            i = bisect_left(bos, (p - _EPS, -1))
+            if i < len(bos):
+                k, no = bos.pop(i)
+            else:
+                no, k = len(barlar), kap
+                barlar.append([])
+                kalan.append(kap)
+            barlar[no].append(boy)
+            kalan[no] = k - p
+            insort(bos, (k - p, no))
+    return barlar, kalan
+
+
+def _en_iyi_desen(agirlik: Sequence[int], talep: Sequence[int], kap: int) -> List[int]:
+    """Kapasiteyi en çok dolduran desen: tip başına adet (0/1 DP, ikili bölme)."""
+    ogeler: List[Tuple[int, int]] = []  # (tip, kopya)
+    for t, (w, d) in enumerate(zip(agirlik, talep)):
+        kalan_adet, k = min(d, kap // w), 1
+        while kalan_adet > 0:
+            k = min(k, kalan_adet)
+            ogeler.append((t, k))
+            kalan_adet -= k
+            k *= 2
+
+    dp = np.zeros(kap + 1, dtype=np.int64)
+    secim = []
+    for t, k in ogeler:
+        w = agirlik[t] * k
+        aday = dp[:kap + 1 - w] + w
+        al = np.zeros(kap + 1, dtype=bool)
+        al[w:] = aday > dp[w:]
+        dp[w:] = np.where(al[w:], aday, dp[w:])
+        secim.append(al)
+
+    desen = [0] * len(agirlik)
+    c = kap
+    for (t, k), al in zip(reversed(ogeler), reversed(secim)):
+        if al[c]:
+            desen[t] += k
+            c -= agirlik[t] * k
+    return desen
+
+
+def _desenle(liste, kap: float, kerf: float, son: float, kontrol: Callable[[], None]):
+    """Desen sezgiseli; süre biterse kalan talep best-fit ile yerleşir."""
+    boylar = [b for b, _ in liste]
+    talep = [n for _, n in liste]
+    agirlik = [math.ceil(b + kerf - _EPS) for b in boylar]
+    tam_kap = int(math.floor(kap + _EPS))
+    barlar: List[List[float]] = []
+    kalan: List[float] = []
+
+    while any(talep) and time.perf_counter() < son:
+        kontrol()
+        desen = _en_iyi_desen(agirlik, talep, tam_kap)
+        if not any(desen):
+            break
+        tekrar = min(talep[t] // n for t, n in enumerate(desen) if n)
+        bar = [boylar[t] for t, n in enumerate(desen) for _ in range(n)]
+        dolu = sum(b + kerf for b in bar)
+        for _ in range(tekrar):
+            barlar.append(list(bar))
+            kalan.append(kap - dolu)
+        for t, n in enumerate(desen):
+            talep[t] -= n * tekrar
+
+    if any(talep):
+        b2, k2 = _yerlestir([(b, n) for b, n in zip(boylar, talep) if n], kap, kerf)
+        barlar += b2
+        kalan += k2
+    return barlar, kalan
+
+
+def _iyilestir(
+    barlar: List[List[float]], kalan: List[float], kerf: float, son: float, kontrol: Callable[[], None]
+) -> int:
+    """En boş barları diğerlerine dağıtmayı dener; kaldırılan bar sayısı döner."""
+    bos = sorted((k, i) for i, k in enumerate(kalan))
+    kaldirilan = 0
+    for i in sorted(range(len(barlar)), key=kalan.__getitem__, reverse=True):
+        if time.perf_counter() > son:
+            break
+        kontrol()
+        del bos[bisect_left(bos, (kalan[i], i))]
+        hamleler = []
+        for boy in sorted(barlar[i], reverse=True):
+            p = boy + kerf
+            j = bisect_left(bos, (p - _EPS, -1))
+            if j == len(bos):
+                break
+            k, hedef = bos.pop(j)
+            insort(bos, (k - p, hedef))
+            hamleler.append((k, hedef, boy))
+        else:
+            for k, hedef, boy in hamleler:
+                barlar[hedef].append(boy)
+                kalan[hedef] -= boy + kerf
+            barlar[i] = []
+            kaldirilan += 1
+            continue
+        # Sığmadı: hamleler geri alınır, bar yerinde kalır.
+        for k, hedef, boy in reversed(hamleler):
+            del bos[bisect_left(bos, (k - boy - kerf, hedef))]
+            insort(bos, (k, hedef))
+        insort(bos, (kalan[i], i))
+    return kaldirilan
+
+
+def planla(
+    parcalar: Iterable[Tuple[float, int]],
+    stoklar: Sequence[float] = (6000.0,),
+    kerf: float = 0.0,
+    sure: float = 0.0,
+    kontrol: Optional[Callable[[], None]] = None,
+) -> KesimPlani:
+    """``(boy, adet)`` parçalarını ``stoklar`` boylarındaki barlara yerleştirir.
+
+    Stok adedi sınırsız kabul edilir. Adedi pozitif tam sayı olmayan satır
+    ya da en uzun stoktan uzun parça varsa ``ValueError``. ``kontrol``
+    iyileştirme döngülerinde her turda çağrılır; fırlattığı istisna planı
+    keser.
+    """
+    liste = _parca_listesi(parcalar)
+    stoklar = sorted({float(s) for s in stoklar if float(s) > 0})
+    if not stoklar:
+        raise ValueError("En az bir stok boyu gerekli")
+    if liste and liste[0][0] > stoklar[-1] + _EPS:
+        raise ValueError(f"{liste[0][0]:g} mm parça en uzun stoktan ({stoklar[-1]:g} mm) uzun")
+
+    kap = stoklar[-1] + kerf
+    t0 = time.perf_counter()
+    barlar, kalan = _yerlestir(liste, kap, kerf)
+    kaldirilan = 0
+    if sure > 0:
+        kontrol = kontrol or (lambda: None)
+        son = t0 + sure
+        # Karar tablosu: (öğe sayısı ~ tip × log adet) × kapasite bayt
+        oge = sum(max(1, int(n).bit_length()) for _, n in liste)
+        if oge * (kap + 1) <= DP_BELLEK:
+            b2, k2 = _desenle(liste, kap, kerf, son, kontrol)
+            if len(b2) < len(barlar):
+                barlar, kalan = b2, k2
+        kaldirilan = _iyilestir(barlar, kalan, kerf, son, kontrol)
+
+    desenler: Counter = Counter()
+    for bar, k in zip(barlar, kalan):
+        if not bar:
+            continue
+        dolu = kap - k
+        stok = next(s for s in stoklar if s + kerf >= dolu - _EPS)
+        desenler[(stok, tuple(sorted(bar, reverse=True)))] += 1
+
+    sirali = [
+        KesimDeseni(stok, p, n)
+        for (stok, p), n in sorted(desenler.items(), key=lambda d: (-d[1], d[0][0]))
+    ]
+    stok_adetleri: Dict[float, int] = {}
+    for d in sirali:
+        stok_adetleri[d.stok] = stok_adetleri.get(d.stok, 0) + d.adet
+    toplam_etkin = sum((b + kerf) * n for b, n in liste)
+    return KesimPlani(
+        desenler=sirali,
+        bar_sayisi=sum(stok_adetleri.values()),
+        stok_adetleri=dict(sorted(stok_adetleri.items())),
+        stok_mm=sum(s * n for s, n in stok_adetleri.items()),
+        parca_mm=sum(b * n for b, n in liste),
+        alt_sinir=math.ceil(toplam_etkin / kap - _EPS) if liste else 0,
+        kaldirilan=kaldirilan,
+    )
@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+"""Genel kesit motoru: parametrik ya da çokgen kesitlerden kg.
+
+Bir kesit dış çokgen ve delik çokgenlerinden oluşur (mm). Şekiller
+``SEKILLER`` tablosundadır; her şekil parametre dizilerinden köşe
+dizileri (``m × k × 2``) üretir, alan shoelace (Gauss) formülüyle aynı
+tipteki tüm kesitler için tek numpy işlemiyle bulunur. Daireler eşit
+alanlı düzgün çokgendir: alan tamdır, sadece çizim yaklaşıktır.
+
+Alanlar şekil başına parametre anahtarıyla süreç içinde önbelleklenir;
+kg = alan · boy · yoğunluk · 1e-6 her çağrıda vektörel hesaplanır.
+Yoğunluklar katalogdan okunur; yeni malzeme için ``veri/katalog.csv``'ye
+``yogunluk`` satırı, yeni profil tipi için ``sekil_ekle`` yeterlidir.
+"""
+import math
+import threading
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from hum import katalog
+from hum.hesap import KESIT_KATSAYI
+
+# Dairenin çokgen köşe sayısı ve alanı koruyan yarıçap ölçeği.
+DAIRE_KOSE = 64
+_DAIRE_OLCEK = math.sqrt(2 * math.pi / (DAIRE_KOSE * math.sin(2 * math.pi / DAIRE_KOSE)))
+ONBELLEK_SINIRI = 100_000  # şekil başına anahtar
+
+Cizim = Callable[..., Tuple[np.ndarray, List[np.ndarray]]]
+
+
+def _dizi(x) -> np.ndarray:
+    return np.asarray(x, dtype=np.float64)
+
+
+class Sekil(NamedTuple):
+    etiket: str
+    alanlar: Tuple[str, ...]
+    # parametre dizileri -> (dış köşeler m×k×2, [delik köşeleri m×k×2, ...])
+    cizim: Cizim
+    # parametre dizileri -> geçerli satır maskesi (pozitiflik her zaman aranır)
+    kosul: Optional[Callable[..., np.ndarray]] = None
+    # ``ALAN_ETIKETLERI``nden farklı ekran etiketleri
+    etiketler: Tuple[Tuple[str, str], ...] = ()
+
+
+# -------------------------------------------------
+# GEOMETRİ
+# -------------------------------------------------
+def shoelace(koseler: np.ndarray) -> np.ndarray:
+    """``(m, k, 2)`` köşe dizisinden m çokgenin alanı (yön fark etmez)."""
+    x, y = koseler[..., 0], koseler[..., 1]
+    return 0.5 * np.abs(np.sum(x * np.roll(y, -1, axis=-1) - np.roll(x, -1, axis=-1) * y, axis=-1))
+
+
+def _cokgen(*koseler) -> np.ndarray:
+    """``(x, y)`` köşe çiftlerinden (skaler ya da m'lik dizi) ``(m, k, 2)``."""
+    x = np.broadcast_arrays(*(_dizi(k[0]) for k in koseler), *(_dizi(k[1]) for k in koseler))
+    k = len(koseler)
+    return np.stack([np.stack([x[i], x[k + i]], axis=-1) for i in range(k)], axis=-2)
+
+
+def _daire(r: np.ndarray) -> np.ndarray:
+    aci = np.linspace(0, 2 * np.pi, DAIRE_KOSE, endpoint=False)
+    R = (_dizi(r) * _DAIRE_OLCEK)[:, None]
+    return np.stack([R * np.cos(aci), R * np.sin(aci)], axis=-1)
+
+
+def _dikdortgen(gen, yuk, x0=0.0, y0=0.0) -> np.ndarray:
+    return _cokgen((x0, y0), (x0 + gen, y0), (x0 + gen, y0 + yuk), (x0, y0 + yuk))
+
+
+def _altikose(ebat) -> np.ndarray:
+    # ebat: karşılıklı yüzeyler arası; köşe yarıçapı ebat/√3
+    aci = np.arange(6) * (np.pi / 3)
+    R = (_dizi(ebat) / math.sqrt(3))[:, None]
+    return np.stack([R * np.cos(aci), R * np.sin(aci)], axis=-1)
+
+
+def _kosebent(ebat, et) -> np.ndarray:
+    # L kesit; köşedeki et × et bindirme bir kez sayılır.
+    return _cokgen((0, 0), (ebat, 0), (ebat, et), (et, et), (et, ebat), (0, ebat))
+
+
+def _i_profil(yuk, gen, et, kal) -> np.ndarray:
+    sol, sag = (gen - et) / 2, (gen + et) / 2
+    return _cokgen(
+        (0, 0), (gen, 0), (gen, kal), (sag, kal), (sag, yuk - kal), (gen, yuk - kal),
+        (gen, yuk), (0, yuk), (0, yuk - kal), (sol, yuk - kal), (sol, kal), (0, kal),
+    )
+
+
+def _u_profil(yuk, gen, et, kal) -> np.ndarray:
+    return _cokgen(
+        (0, 0), (gen, 0), (gen, kal), (et, kal), (et, yuk - kal), (gen, yuk - kal), (gen, yuk), (0, yuk),
+    )
+
+
+_GOVDE_BASLIK = (("et", "Gövde Et (mm)"), ("kal", "Başlık Kalınlığı (mm)"))
+
+SEKILLER: Dict[str, Sekil] = {
+    "daire": Sekil("Dolu Yuvarlak", ("cap",), lambda cap: (_daire(cap / 2), [])),
+    "boru": Sekil(
+        "Boru", ("dis", "et"),
+        lambda dis, et: (_daire(dis / 2), [_daire(dis / 2 - et)]),
+        kosul=lambda dis, et: 2 * et <= dis,
+    ),
+    "altikose": Sekil("Altıköşe", ("ebat",), lambda ebat: (_altikose(ebat), [])),
+    "kare": Sekil("Kare", ("ebat",), lambda ebat: (_dikdortgen(ebat, ebat), [])),
+    "dikdortgen": Sekil("Dikdörtgen / Lama", ("gen", "yuk"), lambda gen, yuk: (_dikdortgen(gen, yuk), [])),
+    "kosebent": Sekil(
+        "Köşebent (L)", ("ebat", "et"), lambda ebat, et: (_kosebent(ebat, et), []),
+        kosul=lambda ebat, et: et < ebat,
+    ),
+    "kutu": Sekil(
+        "Kutu Profil", ("gen", "yuk", "et"),
+        lambda gen, yuk, et: (_dikdortgen(gen, yuk), [_dikdortgen(gen - 2 * et, yuk - 2 * et, et, et)]),
+        kosul=lambda gen, yuk, et: 2 * et < np.minimum(gen, yuk),
+    ),
+    "i_profil": Sekil(
+        "I Profil", ("yuk", "gen", "et", "kal"), lambda *p: (_i_profil(*p), []),
+        kosul=lambda yuk, gen, et, kal: (2 * kal < yuk) & (et < gen),
+        etiketler=_GOVDE_BASLIK,
+    ),
+    "u_profil": Sekil(
+        "U Profil", ("yuk", "gen", "et", "kal"), lambda *p: (_u_profil(*p), []),
+        kosul=lambda yuk, gen, et, kal: (2 * kal < yuk) & (et < gen),
+        etiketler=_GOVDE_BASLIK,
+    ),
+}
+
+
+def cokgen(dis: Sequence[Sequence[float]], delikler: Sequence[Sequence[Sequence[float]]] = (),
+           etiket: str = "Çokgen") -> Sekil:
+    """Sabit köşeli (parametresiz) kesit; köşeler ``[(x, y), ...]`` mm.
+
+    Kenarların kesişmediği ve deliklerin dış çokgenin içinde olduğu
+    varsayılır; sadece köşe sayısı ve alanlar denetlenir.
+    """
+    parcalar = [np.asarray(dis, dtype=np.float64)] + [np.asarray(d, dtype=np.float64) for d in delikler]
+    for p in parcalar:
+        if p.ndim != 2 or p.shape[1] != 2 or len(p) < 3 or not np.isfinite(p).all():
+            raise ValueError("Her çokgen en az 3 sonlu (x, y) köşesinden oluşmalı")
+    alanlar = [float(shoelace(p)) for p in parcalar]
+    if alanlar[0] <= 0 or sum(alanlar[1:]) >= alanlar[0]:
+        raise ValueError("Dış çokgenin alanı sıfır ya da delikler dış alandan büyük")
+    dis_k, delik_k = parcalar[0], parcalar[1:]
+    return Sekil(etiket, (), lambda: (dis_k[None], [d[None] for d in delik_k]))
+
+
+def sekil_ekle(ad: str, sekil: Sekil):
+    """Şekli tabloya ekler ya da değiştirir; o şeklin alan önbelleği silinir."""
+    SEKILLER[ad] = sekil
+    _alanlar.pop(ad, None)
+
+
+# -------------------------------------------------
+# ALAN (ÖNBELLEKLİ) & KG
+# -------------------------------------------------
+class _Onbellek:
+    """Şekil başına alan önbelleği; satır dizileri ve yuva tablosu ikiye katlanarak büyür.
+
+    İlk ``n`` satır doludur. Yeni anahtarlar yerinde eklenir (önce satır,
+    sonra yuva yazılır; okuyucu yarım yuvayı eşleşmeyen sayar); doluluk
+    1/2'yi aşınca iki kat büyük yeni nesne kurulup sözlükte değiştirilir.
+    """
+
+    __slots__ = ("n", "ozet", "kolonlar", "alan", "yuva_ozet", "yuva_sira")
+
+    def __init__(self, boyut: int, p: int):
+        self.n = 0
+        self.ozet = np.zeros(boyut // 2, dtype=np.uint64)  # parametre özetleri
+        self.kolonlar = [np.zeros(boyut // 2) for _ in range(p)]  # özet eşleşmesi bununla doğrulanır
+        self.alan = np.zeros(boyut // 2)  # mm²
+        # Açık adresli tablo (doğrusal yoklama): yuva -> özet / satır (-1 boş)
+        self.yuva_ozet = np.zeros(boyut, dtype=np.uint64)
+        self.yuva_sira = np.full(boyut, -1, dtype=np.intp)
+
+    def ekle(self, ozet: np.ndarray, kolonlar: List[np.ndarray], alan: np.ndarray):
+        """Satırları ekler; çağıran yer olduğunu (``n + len(ozet) <= boyut / 2``) bilir."""
+        bas, son = self.n, self.n + len(ozet)
+        self.ozet[bas:son] = ozet
+        for e, k in zip(self.kolonlar, kolonlar):
+            e[bas:son] = k
+        self.alan[bas:son] = alan
+        maske = len(self.yuva_sira) - 1
+        bekleyen = np.arange(bas, son)
+        yuva = (ozet & np.uint64(maske)).astype(np.intp)
+        while len(bekleyen):
+            # Boş yuvaya düşenlerin ilki yerleşir; kalanlar bir sonraki yuvayı dener.
+            bos = np.flatnonzero(self.yuva_sira[yuva] < 0)
+            _, ilk = np.unique(yuva[bos], return_index=True)
+            yerlesen = bos[ilk]
+            self.yuva_ozet[yuva[yerlesen]] = self.ozet[bekleyen[yerlesen]]
+            self.yuva_sira[yuva[yerlesen]] = bekleyen[yerlesen]
+            kalan = np.ones(len(bekleyen), dtype=bool)
+            kalan[yerlesen] = False
+            bekleyen, yuva = bekleyen[kalan], (yuva[kalan] + 1) & maske
+        self.n = son
+
+
+# şekil -> önbellek; büyütmede nesne bütün olarak değiştirilir (kilitsiz okuma)
+_alanlar: Dict[str, _Onbellek] = {}
+_kaydet_kilidi = threading.Lock()
+
+_C1, _C2 = np.uint64(0xBF58476D1CE4E5B9), np.uint64(0x94D049BB133111EB)
+_S30, _S27, _S31 = np.uint64(30), np.uint64(27), np.uint64(31)
+
+
+def _karistir(z: np.ndarray) -> np.ndarray:
+    """splitmix64 son adımı: float'ların yüksek bitleri de tüm özete dağılır."""
+    z = (z ^ (z >> _S30)) * _C1
+    z = (z ^ (z >> _S27)) * _C2
+    return z ^ (z >> _S31)
+
+
+def _ozet(kolonlar: List[np.ndarray], n: int) -> np.ndarray:
+    """Parametre satırlarının 64 bit özeti (float bitleri üzerinden)."""
+    ozet = np.zeros(n, dtype=np.uint64)
+    for k in kolonlar:
+        ozet = _karistir(ozet ^ k.view(np.uint64))
+    return ozet
+
+
+def _ayni(a: List[np.ndarray], b: List[np.ndarray]) -> np.ndarray:
+    esit = np.ones(len(a[0]) if a else 1, dtype=bool)
+    for x, y in zip(a, b):
+        esit &= x == y
+    return esit
+
+
+def _kaydet(sekil: str, ozet: np.ndarray, kolonlar: List[np.ndarray], alan: np.ndarray):
+    """Yeni alanları ekler; sadece doluluk 1/2'yi aşınca tablo iki katına kurulur.
+
+    Eklenen kadar iş yapılır (büyütmeler toplamda doğrusal). Sınır aşılırsa
+    eskiler atılır.
+    """
+    with _kaydet_kilidi:
+        ob = _alanlar.get(sekil)
+        if ob is not None and ob.n:
+            # Başka bir oturum aynı anahtarları araya eklemiş olabilir.
+            yeni = _bul(ob, ozet, kolonlar) < 0
+            if not yeni.all():
+                ozet, kolonlar, alan = ozet[yeni], [k[yeni] for k in kolonlar], alan[yeni]
+        if not len(ozet):
+            return
+        if ob is None or ob.n + len(ozet) > ONBELLEK_SINIRI:
+            ob = None
+        if ob is None or 2 * (ob.n + len(ozet)) > len(ob.yuva_sira):
+            gerek = len(ozet) + (ob.n if ob is not None else 0)
+            boyut = len(ob.yuva_sira) if ob is not None else 8
+            while 2 * gerek > boyut:
+                boyut *= 2
+            buyuk = _Onbellek(boyut, len(kolonlar))
+            if ob is not None:
+                buyuk.ekle(ob.ozet[:ob.n], [k[:ob.n] for k in ob.kolonlar], ob.alan[:ob.n])
+            buyuk.ekle(ozet, kolonlar, alan)
+            _alanlar[sekil] = buyuk
+        else:
+            ob.ekle(ozet, kolonlar, alan)
+
+
+def _bul(ob: _Onbellek, ozet: np.ndarray, kolonlar: List[np.ndarray]) -> np.ndarray:
+    """Satır başına önbellek sırası; bulunamayan -1."""
+    maske = len(ob.yuva_sira) - 1
+    yuva = (ozet & np.uint64(maske)).astype(np.intp)
+    # İlk yoklama tüm satırlar için doğrudan; çoğu satır burada biter.
+    j = ob.yuva_sira[yuva]
+    eslesen = (j >= 0) & (ob.yuva_ozet[yuva] == ozet)
+    sonuc = np.where(eslesen, j, -1)
+    bekleyen = np.flatnonzero((j >= 0) & ~eslesen)
+    yuva = (yuva[bekleyen] + 1) & maske
+    while len(bekleyen):
+        j = ob.yuva_sira[yuva]
+        dolu = j >= 0
+        eslesen = dolu & (ob.yuva_ozet[yuva] == ozet[bekleyen])
+        sonuc[bekleyen[eslesen]] = j[eslesen]
+        devam = dolu & ~eslesen
+        bekleyen, yuva = bekleyen[devam], (yuva[devam] + 1) & maske
+    idx = np.maximum(sonuc, 0)
+    sonuc[~_ayni([k[idx] for k in ob.kolonlar], kolonlar)] = -1
+    return sonuc
+
+
+def alan(sekil: Union[str, Sekil], parametreler: Mapping[str, Any]) -> np.ndarray:
+    """Kesit alanı (mm²); eksik/geçersiz ölçülü satırlar ``NaN``.
+
+    ``sekil`` ``SEKILLER`` adı ya da (örn. ``cokgen`` ile kurulmuş) bir
+    ``Sekil``dir; önbellek sadece adlı şekiller için tutulur. Her benzersiz
+    parametre demetinin alanı bir kez hesaplanır; eksik parametre 0 (boş)
+    sayılır. Parametresiz şekiller tek satır döner.
+    """
+    s = SEKILLER[sekil] if isinstance(sekil, str) else sekil
+    kolonlar = list(np.broadcast_arrays(*(_dizi(parametreler.get(a, 0.0)).reshape(-1) for a in s.alanlar)))
+    n = len(kolonlar[0]) if kolonlar else 1
+    sonuc = np.full(n, np.nan)
+    gecerli = np.ones(n, dtype=bool)
+    for k in kolonlar:
+        gecerli &= k > 0
+    if s.kosul is not None and gecerli.any():
+        gecerli[gecerli] = s.kosul(*(k[gecerli] for k in kolonlar))
+    if not gecerli.any():
+        return sonuc
+    if not gecerli.all():
+        kolonlar = [k[gecerli] for k in kolonlar]
+
+    # Önbellek araması sıralamasızdır: özet + hash tablosu + parametre doğrulaması.
+    m = int(np.count_nonzero(gecerli))
+    ozet = _ozet(kolonlar, m)
+    ob = _alanlar.get(sekil) if isinstance(sekil, str) else None
+    if ob is not None:
+        konum = _bul(ob, ozet, kolonlar)
+        isabet = konum >= 0
+        alanlar = np.where(isabet, ob.alan[np.maximum(konum, 0)], np.nan)
+    else:
+        isabet = np.zeros(m, dtype=bool)
+        alanlar = np.full(m, np.nan)
+
+    eksik = np.flatnonzero(~isabet)
+    if len(eksik):
+        # Eksik demetler tekilleştirilir; hepsi tek çizim + tek shoelace ile hesaplanır.
+        _, ilk, ters = np.unique(ozet[eksik], return_index=True, return_inverse=True)
+        secilen, ters = eksik[ilk], ters.ravel()
+        U = [k[secilen] for k in kolonlar]
+        cakisma = not _ayni([u[ters] for u in U], [k[eksik] for k in kolonlar]).all()
+        if cakisma:
+            u, ters = np.unique(np.column_stack([k[eksik] for k in kolonlar]), axis=0, return_inverse=True)
+            U, ters = list(u.T), ters.ravel()
+        dis, delikler = s.cizim(*U)
+        yeni = shoelace(dis)
+        for d in delikler:
+            yeni = yeni - shoelace(d)
+        alanlar[eksik] = yeni[ters]
+        if isinstance(sekil, str) and not cakisma:
+            _kaydet(sekil, ozet[secilen], U, yeni)
+    if m == n:
+        return alanlar
+    sonuc[gecerli] = alanlar
+    return sonuc
+
+
+def yogunluklar(malzeme: Union[str, Sequence[str]], n: int) -> np.ndarray:
+    """Malzeme adı (tek ya da satır başına) -> yoğunluk dizisi; tanınmayan ``NaN``."""
+    kat = katalog.aktif()
+    bilinen = set(kat.malzemeler())
+    if isinstance(malzeme, str):
+        return np.full(n, kat.yogunluk(malzeme) if malzeme in bilinen else np.nan)
+    adlar, ters = np.unique(np.asarray(malzeme, dtype=object).astype(str), return_inverse=True)
+    return np.array([kat.yogunluk(m) if m in bilinen else np.nan for m in adlar])[ters.ravel()]
+
+
+def kg(
+    sekil: Union[str, Sekil], parametreler: Mapping[str, Any], boy, malzeme: Union[str, Sequence[str]] = "celik"
+) -> np.ndarray:
+    """Kesitten kg/adet (Br-3); boy mm, yoğunluk katalogdan.
+
+    Alan, boy ve malzeme dizileri birbirine yayınlanır (tek değer tüm satırlara).
+    """
+    a, boy = np.broadcast_arrays(alan(sekil, parametreler), _dizi(boy).reshape(-1))
+    kg = a * boy * yogunluklar(malzeme, len(a)) * KESIT_KATSAYI
+    return np.where(boy > 0, kg, np.nan)
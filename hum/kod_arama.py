@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""Verilmiş kodlar üzerinde önek araması (sıralı dizi indeksi).
+
+Depo (``<yol>.txt``) ekleme sırasıyla büyür; arama için yanında sıralı,
+sabit genişlikli bir bayt dizisi (``<yol>.idx``) tutulur ve ``mmap``
+ile açılır. Bir önekle başlayan kodlar iki ``searchsorted`` ile bulunan
+bitişik bir aralıktır: milyonlarca kodda O(log n).
+
+İndeks kurulduktan sonra depoya eklenen kodlar ``.txt`` sonundan
+okunup küçük, sıralı bir kuyrukta tutulur; kuyruk ``KUYRUK_SINIRI``nı
+aşınca indeks yeniden kurulur.
+
+İkili format (little-endian)::
+
+    "HUMX" | u32 sürüm | u64 n | u32 genişlik | u64 txt_ofset | dolgu (8)
+    kodlar S<genişlik>[n] (UTF-8, sıralı)
+"""
+import mmap
+import os
+import struct
+import threading
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from hum import kodlama
+
+KUYRUK_SINIRI = 200_000
+
+_SIHIR = b"HUMX"
+_FORMAT_SURUMU = 1
+_BASLIK = struct.Struct("<4sIQIQ")
+_VERI_OFSETI = _BASLIK.size + (-_BASLIK.size % 8)
+
+
+def _satirlar(yol: str, ofset: int) -> Tuple[List[bytes], int]:
+    """``ofset``ten itibaren tamamlanmış satırlar ve yeni ofset."""
+    try:
+        with open(yol, "rb") as f:
+            f.seek(ofset)
+            ham = f.read()
+    except FileNotFoundError:
+        return [], ofset
+    ham = ham[:ham.rfind(b"\n") + 1]
+    return ham.splitlines(), ofset + len(ham)
+
+
+def derle(kod_yolu: str, hedef: str) -> str:
+    """``.txt`` deposundan sıralı indeks dosyasını kurar (atomik değiştirme)."""
+    kodlar, ofset = _satirlar(kod_yolu, 0)
+    dizi = np.array(kodlar, dtype=bytes) if kodlar else np.zeros(0, dtype="S1")
+    dizi.sort()
+    gecici = f"{hedef}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(gecici, "wb") as f:
+        f.write(_BASLIK.pack(_SIHIR, _FORMAT_SURUMU, len(dizi), dizi.dtype.itemsize, ofset))
+        f.write(b"\0" * (_VERI_OFSETI - _BASLIK.size))
+        f.write(dizi.tobytes())
+    os.replace(gecici, hedef)
+    return hedef
+
+
+class KodIndeksi:
+    """Önek araması: mmap'lenmiş sıralı dizi + sonradan eklenenler kuyruğu."""
+
+    def __init__(self, depo_yolu: str):
+        self.kod_yolu = depo_yolu + ".txt"
+        self.idx_yolu = depo_yolu + ".idx"
+        self._kilit = threading.Lock()
+        self._ac()
+
+    def _ac(self):
+        try:
+            self._yukle()
+        except (FileNotFoundError, ValueError):
+            derle(self.kod_yolu, self.idx_yolu)
+            self._yukle()
+        self._sinirla()
+
+    def _sinirla(self):
+        """Kuyruk ``KUYRUK_SINIRI``nı aştıysa indeksi yeniden kurar."""
+        if len(self._kuyruk) > KUYRUK_SINIRI:
+            derle(self.kod_yolu, self.idx_yolu)
+            self._yukle()
+
+    def _yukle(self):
+        with open(self.idx_yolu, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        sihir, surum, n, genislik, ofset = _BASLIK.unpack_from(mm, 0)
+        if sihir != _SIHIR or surum != _FORMAT_SURUMU:
+            raise ValueError(f"Geçersiz kod indeksi: {self.idx_yolu}")
+        self._mm = mm
+        self._ana = np.frombuffer(mm, dtype=f"S{genislik}", count=n, offset=_VERI_OFSETI)
+        self._ofset = ofset
+        self._kuyruk: List[bytes] = []
+        self._tazele()
+
+    def _tazele(self):
+        yeni, self._ofset = _satirlar(self.kod_yolu, self._ofset)
+        if len(yeni) > 64:
+            self._kuyruk = sorted(self._kuyruk + yeni)
+        else:
+            for k in yeni:
+                insort(self._kuyruk, k)
+
+    def tazele(self):
+        """Depoya eklenen kodları kuyruğa alır (dosya büyümediyse maliyetsiz)."""
+        with self._kilit:
+            try:
+                boyut = os.path.getsize(self.kod_yolu)
+            except FileNotFoundError:
+                return
+            if boyut != self._ofset:
+                self._tazele()
+                self._sinirla()
+
+    def __len__(self) -> int:
+        return len(self._ana) + len(self._kuyruk)
+
+    def ara(self, onek: str, limit: int = 100) -> Tuple[int, List[str]]:
+        """``(eşleşen toplam, sıralı ilk ``limit`` kod)``."""
+        alt = onek.encode("utf-8")
+        ust = alt + b"\xff"
+        with self._kilit:
+            ana, kuyruk = self._ana, self._kuyruk
+            # b"\xff" geçerli UTF-8'de geçmez: [alt, ust) tam olarak önek aralığıdır.
+            i, j = np.searchsorted(ana, [alt, ust])
+            k, m = bisect_left(kuyruk, alt), bisect_left(kuyruk, ust)
+            secim = ana[i:min(j, i + limit)].tolist() + kuyruk[k:min(m, k + limit)]
+        secim.sort()
+        return int(j - i) + (m - k), [b.decode("utf-8") for b in secim[:limit]]
+
+
+_indeksler: Dict[str, KodIndeksi] = {}
+_indeks_kilidi = threading.Lock()
+
+
+def indeks(depo_yolu: Optional[str] = None) -> KodIndeksi:
+    """Süreç başına tek ``KodIndeksi`` (depo başına); çağrıda tazelenir."""
+    depo_yolu = depo_yolu or kodlama.depo_yolu()
+    with _indeks_kilidi:
+        if depo_yolu not in _indeksler:
+            _indeksler[depo_yolu] = KodIndeksi(depo_yolu)
+        ix = _indeksler[depo_yolu]
+    ix.tazele()
+    return ix
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""Kodlama sistematiği: mamul / yarı mamul kodları ve verilmiş kod deposu.
+
+Tekil kodlar ``build_mamul_code`` / ``build_yari_mamul_code`` ile, bir
+sipariş ağacının tüm kodları tablo blokları halinde ``toplu_kodla`` ile
+üretilir. Verilmiş kodlar ``KodDeposu``nda kalıcı tutulur:
+
+* ``<yol>.txt``: her satırda bir kod (ekleme sırasıyla)
+* ``<yol>.hash``: aynı sırada kodların 64 bit BLAKE2b özetleri (u8, LE)
+
+Özetler açılışta bir kümeye yüklenir; çakışma kontrolü kod başına O(1).
+Diğer süreçlerin eklediği kodlar dosya sonundan artımlı okunur, yazma
+dosya kilidi altında yapılır. ``HUM_KOD_DEPOSU`` ortam değişkeni depo
+yolunu (uzantısız) değiştirir.
+"""
+import hashlib
+import os
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:  # pandas sadece toplu kodlamada yüklenir
+    import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+URETICI_MAP = {
+    "HK": "HUM kaynaklı imalat",
+    "HT": "HUM talaşlı imalat",
+    "FL": "Lazerci & sac işleme fason",
+    "FT": "Fason talaşlı imalat",
+}
+
+VARSAYILAN_DEPO = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "veri", "kodlar"
+)
+
+# Toplu tablo kolonları (küçük harf); eksik kolonlar boş kabul edilir.
+KOLONLAR = ("tip", "siparis", "unite", "mamul_no", "uretici", "resim", "a1", "a2", "a3")
+
+MAMUL = "MAMUL"
+YARI_MAMUL = "YARI MAMUL"
+_TIPLER = {"MAMUL": MAMUL, "M": MAMUL, "YARI MAMUL": YARI_MAMUL, "YARI_MAMUL": YARI_MAMUL, "Y": YARI_MAMUL}
+
+
+# -------------------------------------------------
+# KOD ÜRETİMİ
+# -------------------------------------------------
+def build_mamul_code(prefix="M", siparis="", unite="", mamul_no=""):
+    parts = [prefix, siparis, unite, mamul_no]
+    return "-".join([p for p in parts if p.strip()])
+
+
+def build_yari_mamul_code(
+    prefix="Y", uretici="HK", sip="", mno="", res="", a1="", a2="", a3=""
+):
+    parts = [prefix + uretici, sip, mno]
+    if res.strip():
+        parts.append(res)
+    for x in (a1, a2, a3):
+        if x.strip():
+            parts.append(x)
+    return "-".join(parts)
+
+
+class KodAlanlari(NamedTuple):
+    tip: str
+    uretici: str
+    siparis: str
+    unite: str
+    mamul_no: str
+    resim: str
+    alt_poz: Tuple[str, ...]
+
+
+def kod_coz(kod: str) -> Optional[KodAlanlari]:
+    """Kodu alanlarına ayırır; sistematiğe uymuyorsa None.
+
+    Kodlar tek anlamlı değildir: ünitesiz mamul kodunda üç, üniteli
+    olanda dört parça vardır; yarı mamulde dördüncü parça resim no,
+    sonrakiler alt pozlar kabul edilir (resimsiz alt pozlu kodlar bu
+    yüzden resimli gibi okunur).
+    """
+    parcalar = kod.strip().split("-")
+    if not all(parcalar):
+        return None
+    bas = parcalar[0]
+    if bas == "M" and len(parcalar) in (3, 4):
+        unite = parcalar[2] if len(parcalar) == 4 else ""
+        return KodAlanlari(MAMUL, "", parcalar[1], unite, parcalar[-1], "", ())
+    if bas[:1] == "Y" and bas[1:] in URETICI_MAP and 3 <= len(parcalar) <= 7:
+        resim = parcalar[3] if len(parcalar) > 3 else ""
+        return KodAlanlari(YARI_MAMUL, bas[1:], parcalar[1], "", parcalar[2], resim, tuple(parcalar[4:]))
+    return None
+
+
+def _metin(v) -> str:
+    """Hücre değeri -> metin; XLSX'ten gelen ``12.0`` -> ``"12"``."""
+    if v is None or (isinstance(v, float) and v != v):
+        return ""
+    if isinstance(v, float) and v.is_integer():
+        return str(int(v))
+    return str(v).strip()
+
+
+def _kolon(df: "pd.DataFrame", ad: str) -> "pd.Series":
+    import pandas as pd
+
+    if ad not in df:
+        return pd.Series("", index=df.index, dtype=object)
+    s = df[ad]
+    if pd.api.types.is_numeric_dtype(s):
+        return s.map(_metin).astype(object)
+    return s.fillna("").astype(str).str.strip()
+
+
+def _ek(s: "pd.Series") -> "pd.Series":
+    """Boş değilse ``"-" + değer``."""
+    return ("-" + s).where(s != "", "")
+
+
+def kod_tablosu(df: "pd.DataFrame") -> "pd.DataFrame":
+    """Blok için ``kod`` ve ``hata`` kolonları (depo kontrolü yapılmaz).
+
+    Kodlar ``build_mamul_code`` / ``build_yari_mamul_code`` ile aynıdır;
+    blok boyunca kolon işlemleriyle üretilir.
+    """
+    import pandas as pd
+
+    df = df.rename(columns=lambda c: str(c).strip().lower())
+    a = {c: _kolon(df, c) for c in KOLONLAR}
+    uretici = a["uretici"].str.upper()
+    tip = a["tip"].str.upper().map(_TIPLER)
+    tip = tip.where(a["tip"] != "", np.where(uretici != "", YARI_MAMUL, MAMUL))
+
+    mamul = "M-" + a["siparis"] + _ek(a["unite"]) + "-" + a["mamul_no"]
+    yari = (
+        "Y" + uretici + "-" + a["siparis"] + "-" + a["mamul_no"]
+        + _ek(a["resim"]) + _ek(a["a1"]) + _ek(a["a2"]) + _ek(a["a3"])
+    )
+
+    # Öncelik sırası: ilk eşleşen hata yazılır.
+    hatalar = [
+        (tip.isna(), "bilinmeyen tip"),
+        (pd.concat([a[c].str.contains("-", regex=False) for c in KOLONLAR[1:]], axis=1).any(axis=1),
+         "alan içinde '-'"),
+        ((a["siparis"] == "") | (a["mamul_no"] == ""), "sipariş/mamul no eksik"),
+        ((tip == YARI_MAMUL) & ~uretici.isin(list(URETICI_MAP)), "bilinmeyen üretici"),
+        ((tip == YARI_MAMUL) & (((a["a2"] != "") & (a["a1"] == "")) | ((a["a3"] != "") & (a["a2"] == ""))),
+         "alt poz sırası"),
+    ]
+    hata = pd.Series("", index=df.index, dtype=object)
+    for maske, mesaj in reversed(hatalar):
+        hata = hata.mask(maske, mesaj)
+
+    df["kod"] = np.where(hata != "", "", np.where(tip == MAMUL, mamul, yari))
+    df["hata"] = hata
+    return df
+
+
+def toplu_kodla(parcalar: Iterable["pd.DataFrame"], depo: "KodDeposu") -> Iterator["pd.DataFrame"]:
+    """Tablo bloklarına ``kod``, ``hata`` ve ``durum`` ekler.
+
+    ``durum``: ``yeni`` | ``mevcut`` (depoda var) | ``tekrar`` (bu işte
+    daha önce üretildi) | ``hatali``. Bloklar arası tekrarlar da yakalanır.
+    """
+    gorulen: Set[int] = set()
+    for df in parcalar:
+        df = kod_tablosu(df)
+        durum = []
+        for kod, hata in zip(df["kod"].tolist(), df["hata"].tolist()):
+            if hata:
+                durum.append("hatali")
+                continue
+            oz = kod_ozeti(kod)
+            if oz in gorulen:
+                durum.append("tekrar")
+            elif depo.ozet_var(oz):
+                durum.append("mevcut")
+            else:
+                durum.append("yeni")
+            gorulen.add(oz)
+        df["durum"] = durum
+        yield df
+
+
+# -------------------------------------------------
+# VERİLMİŞ KOD DEPOSU
+# -------------------------------------------------
+def kod_ozeti(kod: str) -> int:
+    return int.from_bytes(hashlib.blake2b(kod.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def depo_yolu() -> str:
+    return os.environ.get("HUM_KOD_DEPOSU", VARSAYILAN_DEPO)
+
+
+@contextmanager
+def _dosya_kilidi(yol: str):
+    if fcntl is None:
+        yield
+        return
+    with open(yol, "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class KodDeposu:
+    """Verilmiş kodlar; üyelik kontrolü 64 bit özet kümesiyle."""
+
+    def __init__(self, yol: str):
+        self.yol = yol
+        self.kod_yolu = yol + ".txt"
+        self.ozet_yolu = yol + ".hash"
+        self._kilit_yolu = yol + ".lock"
+        self._ozetler: Set[int] = set()
+        self._okunan = 0
+        self._kilit = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(yol)), exist_ok=True)
+        with self._kilit, _dosya_kilidi(self._kilit_yolu):
+            self._onar()
+            self._tazele()
+
+    def _onar(self):
+        """Yarım kalmış yazmadan sonra ``.hash`` dosyasını ``.txt``'den yeniden kurar."""
+        if not os.path.exists(self.kod_yolu):
+            return
+        with open(self.kod_yolu, "rb") as f:
+            ham = f.read()
+        if ham and not ham.endswith(b"\n"):
+            ham = ham[:ham.rfind(b"\n") + 1]
+            with open(self.kod_yolu, "r+b") as f:
+                f.truncate(len(ham))
+        kodlar = ham.decode("utf-8").splitlines()
+        mevcut = os.path.getsize(self.ozet_yolu) // 8 if os.path.exists(self.ozet_yolu) else 0
+        if mevcut == len(kodlar):
+            return
+        gecici = f"{self.ozet_yolu}.{os.getpid()}.tmp"
+        with open(gecici, "wb") as f:
+            f.write(np.fromiter((kod_ozeti(k) for k in kodlar), "<u8", len(kodlar)).tobytes())
+        os.replace(gecici, self.ozet_yolu)
+
+    def _tazele(self):
+        """Başka süreçlerin eklediği özetleri okur."""
+        try:
+            with open(self.ozet_yolu, "rb") as f:
+                f.seek(self._okunan)
+                ham = f.read()
+        except FileNotFoundError:
+            return
+        ham = ham[:len(ham) - len(ham) % 8]
+        if ham:
+            self._ozetler.update(np.frombuffer(ham, "<u8").tolist())
+            self._okunan += len(ham)
+
+    def __len__(self) -> int:
+        return len(self._ozetler)
+
+    def ozet_var(self, ozet: int) -> bool:
+        return ozet in self._ozetler
+
+    def __contains__(self, kod: str) -> bool:
+        return kod_ozeti(kod) in self._ozetler
+
+    def tazele(self):
+        with self._kilit:
+            self._tazele()
+
+    def kaydet(self, kodlar: Iterable[str]) -> int:
+        """Depoda olmayan kodları ekler; eklenen kod sayısı döner."""
+        with self._kilit, _dosya_kilidi(self._kilit_yolu):
+            self._tazele()
+            yeni: Dict[int, str] = {}
+            for kod in kodlar:
+                oz = kod_ozeti(kod)
+                if oz not in self._ozetler and oz not in yeni:
+                    yeni[oz] = kod
+            if not yeni:
+                return 0
+            # Önce kodlar, sonra özetler: özeti olan her kod dosyada vardır.
+            with open(self.kod_yolu, "a", encoding="utf-8", newline="\n") as f:
+                f.write("".join(k + "\n" for k in yeni.values()))
+                f.flush()
+                os.fsync(f.fileno())
+            ozetler = np.fromiter(yeni, "<u8", len(yeni))
+            with open(self.ozet_yolu, "ab") as f:
+                f.write(ozetler.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+            self._ozetler.update(yeni)
+            self._okunan += ozetler.nbytes
+            return len(yeni)
+
+
+_depolar: Dict[str, KodDeposu] = {}
+_depo_kilidi = threading.Lock()
+
+
+def depo(yol: Optional[str] = None) -> KodDeposu:
+    """Süreç başına tek ``KodDeposu`` (yol başına)."""
+    yol = yol or depo_yolu()
+    with _depo_kilidi:
+        if yol not in _depolar:
+            _depolar[yol] = KodDeposu(yol)
+        d = _depolar[yol]
+    d.tazele()
+    return d
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""İsteğe bağlı performans ölçümü (rerun, render_*, katalog aramaları).
+
+``HUM_OLCUM=1`` ile açılır; kapalıyken ``zamanla`` fonksiyonu olduğu gibi
+döner ve ``sure``/``say`` hiçbir şey kaydetmez. Açıkken:
+
+* ``HUM_OLCUM_PORT`` (varsayılan 9464): ``/metrics`` adresinde Prometheus
+  metin formatı (``0`` ile kapatılır); ``HUM_OLCUM_ADRES`` dinlenen adres
+  (varsayılan ``127.0.0.1``, dışarıdan kazıma için ``0.0.0.0``)
+* ``HUM_OLCUM_LOG`` (saniye, varsayılan 0): bu aralıkla ``hum.olcum``
+  logger'ına özet satırları
+
+Süreler seri başına son ``PENCERE`` gözlemden p50/p95/p99 olarak
+raporlanır; ``_count``/``_sum`` ise süreç başından beri toplamdır.
+"""
+import functools
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Deque, Dict, List, Optional, Tuple
+
+ACIK = os.environ.get("HUM_OLCUM", "").strip().lower() in ("1", "true", "evet", "on")
+PENCERE = 4096
+YUZDELIKLER = (0.5, 0.95, 0.99)
+OTURUM_SINIRI = 500
+
+_Anahtar = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+_kilit = threading.Lock()
+_sureler: Dict[_Anahtar, Deque[float]] = {}
+_toplamlar: Dict[_Anahtar, List[float]] = {}  # [adet, toplam süre]
+_sayaclar: Dict[_Anahtar, int] = {}
+_oturumlar: "OrderedDict[str, int]" = OrderedDict()
+_baslatildi = False
+
+log = logging.getLogger("hum.olcum")
+
+
+def _anahtar(ad: str, etiketler: Dict[str, object]) -> _Anahtar:
+    return ad, tuple(sorted((k, str(v)) for k, v in etiketler.items()))
+
+
+# -------------------------------------------------
+# KAYIT
+# -------------------------------------------------
+def gozlem(ad: str, saniye: float, **etiketler):
+    """Bir süre gözlemi ekler."""
+    if not ACIK:
+        return
+    k = _anahtar(ad, etiketler)
+    with _kilit:
+        pencere = _sureler.get(k)
+        if pencere is None:
+            pencere = _sureler[k] = deque(maxlen=PENCERE)
+            _toplamlar[k] = [0, 0.0]
+        pencere.append(saniye)
+        t = _toplamlar[k]
+        t[0] += 1
+        t[1] += saniye
+
+
+def say(ad: str, n: int = 1, **etiketler):
+    """Sayaç artırır."""
+    if not ACIK:
+        return
+    k = _anahtar(ad, etiketler)
+    with _kilit:
+        _sayaclar[k] = _sayaclar.get(k, 0) + n
+
+
+def oturum_say(oturum: Optional[str]):
+    """Oturum başına rerun sayısı; en eski oturumlar ``OTURUM_SINIRI``'nda düşer."""
+    if not ACIK or not oturum:
+        return
+    with _kilit:
+        _oturumlar[oturum] = _oturumlar.pop(oturum, 0) + 1
+        while len(_oturumlar) > OTURUM_SINIRI:
+            _oturumlar.popitem(last=False)
+
+
+@contextmanager
+def sure(ad: str, **etiketler):
+    """``with sure("hum_render_seconds", fonk="x"):`` bloğunun süresini kaydeder."""
+    if not ACIK:
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        gozlem(ad, time.perf_counter() - t0, **etiketler)
+
+
+def zamanla(ad: str, **etiketler):
+    """Fonksiyon dekoratörü; ölçüm kapalıysa fonksiyonu değiştirmez."""
+    def sarici(fn):
+        if not ACIK:
+            return fn
+        etiket = dict(etiketler) or {"fonk": fn.__name__}
+
+        @functools.wraps(fn)
+        def olculen(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                gozlem(ad, time.perf_counter() - t0, **etiket)
+        return olculen
+    return sarici
+
+
+# -------------------------------------------------
+# RAPOR
+# -------------------------------------------------
+def _yuzdelik(sirali: List[float], q: float) -> float:
+    return sirali[min(len(sirali) - 1, int(q * len(sirali)))]
+
+
+def _etiket_metni(etiketler, ek: Tuple[Tuple[str, str], ...] = ()) -> str:
+    hepsi = tuple(etiketler) + ek
+    if not hepsi:
+        return ""
+    kacis = lambda v: v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")  # noqa: E731
+    return "{" + ",".join(f'{k}="{kacis(v)}"' for k, v in hepsi) + "}"
+
+
+def ozet() -> Dict[_Anahtar, dict]:
+    """Seri başına ``{adet, toplam, p50, p95, p99}``."""
+    with _kilit:
+        kopya = {k: (sorted(v), list(_toplamlar[k])) for k, v in _sureler.items()}
+    return {
+        k: dict(
+            adet=int(t[0]),
+            toplam=t[1],
+            **{f"p{int(q * 100)}": _yuzdelik(s, q) for q in YUZDELIKLER},
+        )
+        for k, (s, t) in kopya.items()
+        if s
+    }
+
+
+def prometheus_metni() -> str:
+    """Prometheus metin formatı (0.0.4)."""
+    satirlar: List[str] = []
+    tipler = set()
+
+    for (ad, etiketler), o in sorted(ozet().items()):
+        if ad not in tipler:
+            tipler.add(ad)
+            satirlar.append(f"# TYPE {ad} summary")
+        for q in YUZDELIKLER:
+            e = _etiket_metni(etiketler, (("quantile", str(q)),))
+            satirlar.append(f"{ad}{e} {o[f'p{int(q * 100)}']:.6g}")
+        satirlar.append(f"{ad}_count{_etiket_metni(etiketler)} {o['adet']}")
+        satirlar.append(f"{ad}_sum{_etiket_metni(etiketler)} {o['toplam']:.6g}")
+
+    with _kilit:
+        sayaclar = sorted(_sayaclar.items())
+        oturumlar = list(_oturumlar.items())
+    for (ad, etiketler), n in sayaclar:
+        if ad not in tipler:
+            tipler.add(ad)
+            satirlar.append(f"# TYPE {ad} counter")
+        satirlar.append(f"{ad}{_etiket_metni(etiketler)} {n}")
+
+    if oturumlar:
+        # Oturum kimliği etiket olmaz (sınırsız kardinalite); son
+        # ``OTURUM_SINIRI`` oturumun rerun sayılarının dağılımı yayınlanır.
+        sayilar = sorted(float(n) for _, n in oturumlar)
+        satirlar.append("# TYPE hum_oturum_rerun summary")
+        for q in YUZDELIKLER:
+            satirlar.append(f'hum_oturum_rerun{{quantile="{q}"}} {_yuzdelik(sayilar, q):.6g}')
+        satirlar.append(f"hum_oturum_rerun_count {len(sayilar)}")
+        satirlar.append(f"hum_oturum_rerun_sum {sum(sayilar):.6g}")
+        satirlar.append("# TYPE hum_oturum_sayisi gauge")
+        satirlar.append(f"hum_oturum_sayisi {len(oturumlar)}")
+    return "\n".join(satirlar) + "\n"
+
+
+def log_satirlari() -> List[str]:
+    return [
+        f"{ad}{_etiket_metni(etiketler)} n={o['adet']} "
+        f"p50={o['p50'] * 1000:.1f}ms p95={o['p95'] * 1000:.1f}ms p99={o['p99'] * 1000:.1f}ms"
+        for (ad, etiketler), o in sorted(ozet().items())
+    ]
+
+
+# -------------------------------------------------
+# YAYIN (HTTP /metrics ve periyodik log)
+# -------------------------------------------------
+def _metrik_sunucusu(adres: str, port: int):
+    """``/metrics`` sunan HTTP sunucusu; ``http.server`` sadece burada yüklenir
+    (katalog bu modülü import eder, komut satırının açılışı uzamasın)."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class _MetrikIstegi(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            govde = prometheus_metni().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(govde)))
+            self.end_headers()
+            self.wfile.write(govde)
+
+        def log_message(self, *args):
+            pass
+
+    return ThreadingHTTPServer((adres, port), _MetrikIstegi)
+
+
+def _log_dongusu(aralik: float):
+    while True:
+        time.sleep(aralik)
+        for satir in log_satirlari():
+            log.info(satir)
+
+
+def baslat():
+    """Ölçüm açıksa metrik sunucusunu/log döngüsünü başlatır (süreç başına bir kez)."""
+    global _baslatildi
+    if not ACIK:
+        return
+    with _kilit:
+        if _baslatildi:
+            return
+        _baslatildi = True
+
+    port = int(os.environ.get("HUM_OLCUM_PORT", "9464"))
+    if port:
+        try:
+            adres = os.environ.get("HUM_OLCUM_ADRES", "127.0.0.1")
+            sunucu = _metrik_sunucusu(adres, port)
+        except OSError as e:
+            # Aynı makinede ikinci sunucu kopyası: port doluysa sadece log.
+            log.warning("Metrik portu açılamadı (%s): %s", port, e)
+        else:
+            sunucu.daemon_threads = True
+            threading.Thread(target=sunucu.serve_forever, name="hum-olcum-http", daemon=True).start()
+
+    aralik = float(os.environ.get("HUM_OLCUM_LOG", "0"))
+    if aralik > 0:
+        threading.Thread(target=_log_dongusu, args=(aralik,), name="hum-olcum-log", daemon=True).start()
@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+"""Panel oturum durumunun süreç dışında saklanması (çok kopyalı çalışma).
+
+Streamlit oturumu tek sürece bağlıdır; yük dengeleyici kullanıcıyı başka
+bir kopyaya gönderirse girişler kaybolur. Panel modül girişlerini URL'deki
+``?oturum=<jeton>`` ile anahtarlanmış olarak burada saklar ve yeni bir
+Streamlit oturumu açıldığında (yenileme, başka kopya) geri yükler.
+
+``yaz`` depoya dokunmaz: jeton başına son değer bellekte tutulur, sonraki
+yazım öncekinin yerini alır. Büyük değerler (sipariş) fonksiyon olarak
+bırakılabilir; paket yazıcıda, birleşmeden sonra bir kez üretilir. Arka plandaki yazıcı bekleyenleri en geç
+``TOPLAMA_SURESI`` sonra tek işlemde (SQLite) ya da tek boru hattında
+(Redis) yazar; art arda girişler tek gidiş-dönüşe iner. Değerler JSON +
+zlib olarak paketlenir.
+
+``HUM_OTURUM`` ortam değişkeni::
+
+    (boş)                      -> kapalı; durum süreçte kalır
+    redis://[:parola@]host:port/db -> Redis uyumlu sunucu (RESP, GET/SET EX)
+    diğer                      -> SQLite dosya yolu (WAL; aynı diski gören kopyalar)
+"""
+import atexit
+import json
+import os
+import re
+import secrets
+import socket
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+from urllib.parse import unquote, urlsplit
+
+from hum import olcum
+
+TOPLAMA_SURESI = 0.5  # s
+OMUR = 7 * 24 * 3600  # s; bu süre yazılmayan oturum silinir
+REDIS_ONEK = b"hum:oturum:"
+REDIS_ZAMAN_ASIMI = 2.0  # s
+
+_JETON = re.compile(r"^[A-Za-z0-9_-]{16,64}$")
+
+_SEMA = """
+CREATE TABLE IF NOT EXISTS oturumlar (
+    jeton TEXT PRIMARY KEY,
+    zaman REAL NOT NULL,
+    veri  BLOB NOT NULL
+);
+"""
+
+
+# -------------------------------------------------
+# JETON / PAKET
+# -------------------------------------------------
+def yeni_jeton() -> str:
+    return secrets.token_urlsafe(16)
+
+
+def gecerli_jeton(jeton: Optional[str]) -> bool:
+    return bool(jeton) and _JETON.match(jeton) is not None
+
+
+def paketle(degerler: Dict[str, Any]) -> bytes:
+    return zlib.compress(json.dumps(degerler, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+
+
+def coz(ham: Optional[bytes]) -> Dict[str, Any]:
+    """Paketi açar; bozuk ya da boş veri boş sözlük olur."""
+    if not ham:
+        return {}
+    try:
+        degerler = json.loads(zlib.decompress(ham))
+    except (zlib.error, ValueError):
+        return {}
+    return degerler if isinstance(degerler, dict) else {}
+
+
+# -------------------------------------------------
+# ORTAK YAZICI
+# -------------------------------------------------
+class _Depo:
+    """Jeton başına son değeri biriktirip toplu yazan temel sınıf.
+
+    Alt sınıflar ``_getir(jeton)`` ve ``_kaydet({jeton: paket})`` yazar.
+    """
+
+    def __init__(self):
+        self.yazilan = 0
+        self.birlesen = 0  # yazılmadan yerine yenisi gelen kayıt
+        self.hata = 0
+        self._bekleyen: Dict[str, Union[bytes, Callable[[], Dict[str, Any]]]] = {}
+        self._yaziliyor: Dict[str, Union[bytes, Callable[[], Dict[str, Any]]]] = {}
+        self._kilit = threading.Lock()
+        self._gonderim = threading.Lock()
+        self._olay = threading.Event()
+        self._yazici = threading.Thread(target=self._dongu, name="hum-oturum", daemon=True)
+        self._yazici.start()
+
+    def _getir(self, jeton: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def _kaydet(self, parti: Dict[str, bytes]):
+        raise NotImplementedError
+
+    def oku(self, jeton: str) -> Dict[str, Any]:
+        """Jetonun son değerleri; henüz yazılmamış yerel değer öncelikli."""
+        with self._kilit:
+            ham = self._bekleyen.get(jeton) or self._yaziliyor.get(jeton)
+        if callable(ham):
+            return ham()
+        if ham is None:
+            try:
+                ham = self._getir(jeton)
+            except (OSError, sqlite3.Error):
+                # Depo erişilemezse oturum boş başlar; panel çalışmaya devam eder.
+                self.hata += 1
+                olcum.say("hum_oturum_hata_total", islem="oku")
+        return coz(ham)
+
+    def yaz(self, jeton: str, degerler: Union[Dict[str, Any], Callable[[], Dict[str, Any]]]):
+        """Değerleri yazılmak üzere bırakır; bekletmez.
+
+        Sözlük hemen paketlenir. Fonksiyon verilirse yazıcı iş parçacığında
+        çağrılır; yakaladığı veri sonradan değişmemelidir.
+        """
+        ham = degerler if callable(degerler) else paketle(degerler)
+        with self._kilit:
+            if jeton in self._bekleyen:
+                self.birlesen += 1
+            self._bekleyen[jeton] = ham
+        self._olay.set()
+
+    def bosalt(self) -> bool:
+        """Bekleyenleri hemen yazar (çıkışta, ölçümde); hata yoksa True."""
+        return self._gonder()
+
+    def _dongu(self):
+        while True:
+            self._olay.wait()
+            time.sleep(TOPLAMA_SURESI)
+            self._olay.clear()
+            self._gonder()
+
+    def _gonder(self) -> bool:
+        with self._gonderim:
+            with self._kilit:
+                parti, self._bekleyen = self._bekleyen, {}
+                self._yaziliyor = parti
+            if not parti:
+                return True
+            try:
+                for jeton, ham in parti.items():
+                    if callable(ham):
+                        parti[jeton] = paketle(ham())
+                self._kaydet(parti)
+            except (OSError, sqlite3.Error):
+                # Yazılamayanlar, yerlerine yenisi gelmediyse sonraki turda denenir.
+                self.hata += 1
+                olcum.say("hum_oturum_hata_total", islem="yaz")
+                with self._kilit:
+                    for jeton, ham in parti.items():
+                        self._bekleyen.setdefault(jeton, ham)
+                    self._yaziliyor = {}
+                return False
+            with self._kilit:
+                self._yaziliyor = {}
+            self.yazilan += len(parti)
+            olcum.say("hum_oturum_yazim_total", len(parti))
+            return True
+
+
+# -------------------------------------------------
+# SQLITE
+# -------------------------------------------------
+def _baglan(yol: str) -> sqlite3.Connection:
+    con = sqlite3.connect(yol, timeout=5.0, check_same_thread=False)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("PRAGMA synchronous=NORMAL")
+    return con
+
+
+class SqliteOturumDeposu(_Depo):
+    """Tek dosyada ``jeton -> paket``; aynı diski gören kopyalar paylaşır."""
+
+    def __init__(self, yol: str, omur: float = OMUR):
+        self.yol = yol
+        self.omur = omur
+        os.makedirs(os.path.dirname(os.path.abspath(yol)), exist_ok=True)
+        con = _baglan(yol)
+        con.executescript(_SEMA)
+        with con:
+            con.execute("DELETE FROM oturumlar WHERE zaman < ?", (time.time() - omur,))
+        con.close()
+        self._okuma = threading.local()
+        self._yazma: Optional[sqlite3.Connection] = None
+        super().__init__()
+
+    def _getir(self, jeton: str) -> Optional[bytes]:
+        con = getattr(self._okuma, "con", None)
+        if con is None:
+            con = self._okuma.con = _baglan(self.yol)
+        satir = con.execute(
+            "SELECT veri FROM oturumlar WHERE jeton = ? AND zaman >= ?", (jeton, time.time() - self.omur)
+        ).fetchone()
+        return satir[0] if satir else None
+
+    def _kaydet(self, parti: Dict[str, bytes]):
+        if self._yazma is None:
+            self._yazma = _baglan(self.yol)
+        zaman = time.time()
+        with self._yazma:
+            self._yazma.executemany(
+                "INSERT OR REPLACE INTO oturumlar (jeton, zaman, veri) VALUES (?, ?, ?)",
+                [(j, zaman, ham) for j, ham in parti.items()],
+            )
+
+
+# -------------------------------------------------
+# REDIS (RESP)
+# -------------------------------------------------
+class RespHatasi(OSError):
+    """Sunucunun ``-ERR ...`` yanıtı."""
+
+
+class _Resp:
+    """En küçük RESP2 istemcisi: komut gönderir, yanıtları sırayla okur."""
+
+    def __init__(self, host: str, port: int, zaman_asimi: float):
+        self._soket = socket.create_connection((host, port), timeout=zaman_asimi)
+        self._soket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._okuyucu = self._soket.makefile("rb")
+
+    @staticmethod
+    def _kodla(komut: Sequence[Any]) -> bytes:
+        parcalar = [b"*%d\r\n" % len(komut)]
+        for arg in komut:
+            b = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+            parcalar.append(b"$%d\r\n%s\r\n" % (len(b), b))
+        return b"".join(parcalar)
+
+    def _yanit(self) -> Any:
+        satir = self._okuyucu.readline()
+        if not satir.endswith(b"\r\n"):
+            raise ConnectionError("Redis bağlantısı kapandı")
+        tur, govde = satir[:1], satir[1:-2]
+        if tur == b"+":
+            return govde
+        if tur == b"-":
+            raise RespHatasi(govde.decode("utf-8", "replace"))
+        if tur == b":":
+            return int(govde)
+        if tur == b"$":
+            n = int(govde)
+            if n < 0:
+                return None
+            veri = self._okuyucu.read(n + 2)
+            if len(veri) != n + 2:
+                raise ConnectionError("Redis bağlantısı kapandı")
+            return veri[:-2]
+        if tur == b"*":
+            n = int(govde)
+            return None if n < 0 else [self._yanit() for _ in range(n)]
+        raise ConnectionError(f"Beklenmeyen RESP yanıtı: {satir[:20]!r}")
+
+    def boru(self, komutlar: List[Sequence[Any]]) -> List[Any]:
+        """Komutları tek yazımda gönderir (pipeline), yanıtları döner."""
+        self._soket.sendall(b"".join(self._kodla(k) for k in komutlar))
+        return [self._yanit() for _ in komutlar]
+
+    def komut(self, *komut: Any) -> Any:
+        return self.boru([komut])[0]
+
+    def kapat(self):
+        try:
+            self._okuyucu.close()
+            self._soket.close()
+        except OSError:
+            pass
+
+
+class RedisOturumDeposu(_Depo):
+    """Redis uyumlu sunucuda ``hum:oturum:<jeton>`` anahtarları (``EX omur``)."""
+
+    def __init__(self, adres: str, omur: float = OMUR, zaman_asimi: float = REDIS_ZAMAN_ASIMI):
+        u = urlsplit(adres)
+        self.host = u.hostname or "127.0.0.1"
+        self.port = u.port or 6379
+        self.db = int((u.path or "/0").strip("/") or 0)
+        self._parola = unquote(u.password) if u.password else None
+        self.omur = int(omur)
+        self.zaman_asimi = zaman_asimi
+        self._yerel = threading.local()
+        super().__init__()
+
+    def _istemci(self) -> _Resp:
+        """İş parçacığı başına bağlantı (okuyan oturumlar yazıcıyı beklemez)."""
+        istemci = getattr(self._yerel, "istemci", None)
+        if istemci is None:
+            istemci = _Resp(self.host, self.port, self.zaman_asimi)
+            try:
+                if self._parola:
+                    istemci.komut("AUTH", self._parola)
+                if self.db:
+                    istemci.komut("SELECT", self.db)
+            except OSError:
+                istemci.kapat()
+                raise
+            self._yerel.istemci = istemci
+        return istemci
+
+    def _calistir(self, komutlar: List[Sequence[Any]]) -> List[Any]:
+        istemci = self._istemci()
+        try:
+            return istemci.boru(komutlar)
+        except RespHatasi:
+            raise
+        except OSError:
+            # Kopan bağlantı bir sonraki çağrıda yeniden kurulur.
+            istemci.kapat()
+            self._yerel.istemci = None
+            raise
+
+    def _getir(self, jeton: str) -> Optional[bytes]:
+        return self._calistir([("GET", REDIS_ONEK + jeton.encode("ascii"))])[0]
+
+    def _kaydet(self, parti: Dict[str, bytes]):
+        self._calistir([
+            ("SET", REDIS_ONEK + j.encode("ascii"), ham, "EX", self.omur) for j, ham in parti.items()
+        ])
+
+
+# -------------------------------------------------
+# SÜREÇ BAŞINA DEPO
+# -------------------------------------------------
+_depolar: Dict[str, _Depo] = {}
+_depo_kilidi = threading.Lock()
+
+
+def depo_adresi() -> str:
+    return os.environ.get("HUM_OTURUM", "").strip()
+
+
+def depo(adres: Optional[str] = None) -> Optional[_Depo]:
+    """``HUM_OTURUM``'a göre süreç başına tek depo; kapalıysa None."""
+    adres = depo_adresi() if adres is None else adres
+    if not adres:
+        return None
+    with _depo_kilidi:
+        if adres not in _depolar:
+            if adres.startswith("redis://"):
+                d: _Depo = RedisOturumDeposu(adres)
+            else:
+                d = SqliteOturumDeposu(adres)
+            _depolar[adres] = d
+            atexit.register(d.bosalt)
+        return _depolar[adres]
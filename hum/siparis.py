@@ -0,0 +1,459 @@
+# -*- coding: utf-8 -*-
+"""Sipariş çalışma alanı: tüm modüllerden satırlar, adet, fiyat ve toplamlar.
+
+Satırlar kolon dizilerinde tutulur (satır kimliği = dizideki yer, silinen
+satır işaretlenir, kimlik yeniden kullanılmaz). Ekleme, güncelleme ve
+silme sadece dokunulan satırları formüllerden geçirir; aile (modül)
+toplamlarına bu satırların eski katkısı düşülüp yenisi eklenir. 50k+
+satırlık siparişte bir düzenleme tabloyu yeniden gruplamaz.
+
+``anlik`` satırların kopyasını alır, ``paket`` bunu JSON uyumlu
+sıkıştırılmış bir sözlüğe çevirir, ``Siparis.paketten`` geri kurar; panel
+siparişi bununla oturum deposunda saklar (çok kopyalı çalışma).
+
+Tutar aile toplamı × aile birim fiyatıdır (TL/kg, dik boru için TL/mt);
+fiyat değişikliği satırlara dokunmaz. Varsayılan fiyatlar
+``veri/fiyatlar.csv`` dosyasından (``aile,fiyat``) okunur; ``HUM_FIYAT``
+başka bir yol verir.
+"""
+import base64
+import csv
+import os
+import zlib
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hum.hesap import FORMULLER, OLCU_ALANLARI, modul_hesapla
+
+VARSAYILAN_FIYAT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "veri", "fiyatlar.csv"
+)
+_BASLANGIC = 1024
+
+# Aile = formül modülü; malzeme toplamları ailelerin üstünde toplanır.
+AILELER: Tuple[str, ...] = tuple(FORMULLER)
+AILE_ETIKETLERI: Dict[str, str] = {
+    "kestamit": "Kestamit Levha",
+    "celik_levha": "Çelik Levha",
+    "celik_mil": "Çelik Mil",
+    "altikose": "Altıköşe",
+    "kare": "Kare",
+    "lama": "Lama",
+    "kosebent": "Köşebent",
+    "celik_cek_boru": "Çelik Çekme Boru",
+    "dik_boru_kutu": "Dik Boru & Kutu Profil",
+    "npu": "NPU",
+    "heb": "HEB",
+}
+AILE_MALZEMESI: Dict[str, str] = {a: "Kestamit" if a == "kestamit" else "Çelik" for a in AILELER}
+_AILE_KODU: Dict[str, int] = {a: i for i, a in enumerate(AILELER)}
+_BIRIM = np.array([FORMULLER[a].birim for a in AILELER], dtype=object)
+
+
+def fiyat_yolu() -> str:
+    return os.environ.get("HUM_FIYAT", VARSAYILAN_FIYAT)
+
+
+def fiyatlari_oku(yol: Optional[str] = None) -> Dict[str, float]:
+    """``aile,fiyat`` CSV'sinden birim fiyatlar; dosya yoksa boş sözlük.
+
+    ';' ayırıcılı dosyada ondalık virgül kabul edilir. Tanınmayan aileler
+    ve sayı olmayan fiyatlar atlanır.
+    """
+    yol = yol or fiyat_yolu()
+    try:
+        with open(yol, encoding="utf-8-sig", newline="") as f:
+            metin = f.read()
+    except FileNotFoundError:
+        return {}
+    ayirici = ";" if ";" in metin.split("\n", 1)[0] else ","
+    fiyatlar = {}
+    for satir in csv.DictReader(metin.splitlines(), delimiter=ayirici):
+        satir = {str(k).strip().lower(): (v or "").strip() for k, v in satir.items()}
+        aile = satir.get("aile", "").lower()
+        deger = satir.get("fiyat", "")
+        if ayirici == ";":
+            deger = deger.replace(".", "").replace(",", ".")
+        try:
+            if aile in _AILE_KODU:
+                fiyatlar[aile] = float(deger)
+        except ValueError:
+            continue
+    return fiyatlar
+
+
+def _aile_kodlari(malzeme: Iterable[Any]) -> np.ndarray:
+    """Modül kodlarını aile numarasına çevirir; tanınmayanlar -1."""
+    return np.array(
+        [_AILE_KODU.get(str(m).strip().lower(), -1) for m in malzeme], dtype=np.int16
+    )
+
+
+# -------------------------------------------------
+# SİPARİŞ
+# -------------------------------------------------
+class Siparis:
+    """Sipariş satırları ve aile bazında artımlı toplamlar (satır, adet, miktar)."""
+
+    def __init__(self, fiyatlar: Optional[Mapping[str, float]] = None):
+        self._n = 0
+        self._aile = np.full(_BASLANGIC, -1, dtype=np.int16)
+        self._olcu = {a: np.full(_BASLANGIC, np.nan) for a in OLCU_ALANLARI}
+        self._adet = np.ones(_BASLANGIC)
+        self._miktar = np.full(_BASLANGIC, np.nan)  # birim/adet
+        self._canli = np.zeros(_BASLANGIC, dtype=bool)
+        self._canli_sayi = 0
+
+        g = len(AILELER)
+        self._g_satir = np.zeros(g, dtype=np.int64)
+        self._g_adet = np.zeros(g)
+        self._g_miktar = np.zeros(g)
+        self.fiyat = np.zeros(g)
+        self.hatali = 0
+        # Her satır değişikliğinde artar; sayfa tabanları buna bakarak yenilenir.
+        self.surum = 0
+        if fiyatlar:
+            self.fiyat_ayarla(fiyatlar)
+
+    # ---- iç işler ----
+    def _buyut(self, n: int):
+        kap = len(self._adet)
+        if n <= kap:
+            return
+        yeni = max(n, 2 * kap)
+
+        def genislet(d: np.ndarray, dolgu) -> np.ndarray:
+            e = np.full(yeni, dolgu, dtype=d.dtype)
+            e[:kap] = d
+            return e
+
+        self._aile = genislet(self._aile, -1)
+        self._olcu = {a: genislet(v, np.nan) for a, v in self._olcu.items()}
+        self._adet = genislet(self._adet, 1.0)
+        self._miktar = genislet(self._miktar, np.nan)
+        self._canli = genislet(self._canli, False)
+
+    def _kimlikler(self, idler: Iterable[int]) -> np.ndarray:
+        idx = np.asarray(idler, dtype=np.int64).reshape(-1)
+        if len(idx) and (
+            idx.min() < 0 or idx.max() >= self._n or not self._canli[idx].all()
+        ):
+            raise KeyError("Siparişte olmayan satır kimliği.")
+        return idx
+
+    def _yaz(self, idx: np.ndarray, malzeme, kolonlar: Mapping[str, Any], adet):
+        self._aile[idx] = _aile_kodlari(malzeme)
+        for a in OLCU_ALANLARI:
+            v = kolonlar.get(a)
+            self._olcu[a][idx] = np.nan if v is None else np.asarray(v, dtype=np.float64)
+        if adet is None:
+            self._adet[idx] = 1.0
+        else:
+            self._adet[idx] = np.nan_to_num(np.asarray(adet, dtype=np.float64), nan=1.0)
+
+    def _hesapla(self, idx: np.ndarray):
+        aile = self._aile[idx]
+        miktar = np.full(len(idx), np.nan)
+        for g in np.unique(aile):
+            if g < 0:
+                continue
+            sec = aile == g
+            alt = idx[sec]
+            mod_id = AILELER[g]
+            miktar[sec] = modul_hesapla(
+                mod_id, {a: self._olcu[a][alt] for a in FORMULLER[mod_id].alanlar}
+            )
+        self._miktar[idx] = miktar
+
+    def _katki(self, idx: np.ndarray, isaret: int):
+        """``idx`` satırlarının katkısını aile toplamlarına ekler (+1) ya da düşer (-1)."""
+        g = len(AILELER)
+        miktar = self._miktar[idx] * self._adet[idx]
+        gecerli = ~np.isnan(miktar)
+        aile = self._aile[idx][gecerli]
+        self._g_satir += isaret * np.bincount(aile, minlength=g)
+        self._g_adet += isaret * np.bincount(aile, weights=self._adet[idx][gecerli], minlength=g)
+        self._g_miktar += isaret * np.bincount(aile, weights=miktar[gecerli], minlength=g)
+        self.hatali += isaret * int(len(idx) - gecerli.sum())
+        # Boşalan ailede kayan nokta artığı kalmasın.
+        bos = self._g_satir == 0
+        self._g_adet[bos] = 0.0
+        self._g_miktar[bos] = 0.0
+
+    # ---- satır işlemleri ----
+    def ekle(
+        self,
+        malzeme: Sequence[Any],
+        kolonlar: Mapping[str, Any],
+        adet: Optional[Sequence[float]] = None,
+    ) -> np.ndarray:
+        """Satırları ekler ve kimliklerini döner.
+
+        ``malzeme`` modül kodudur (örn. ``celik_mil``); eksik ölçü kolonları
+        boş, eksik adet 1 kabul edilir. Hesaplanamayan satırlar da eklenir
+        ve ``hatali`` sayılır.
+        """
+        n = len(malzeme)
+        idx = np.arange(self._n, self._n + n)
+        self._buyut(self._n + n)
+        self._yaz(idx, malzeme, kolonlar, adet)
+        self._canli[idx] = True
+        self._n += n
+        self._canli_sayi += n
+        self._hesapla(idx)
+        self._katki(idx, +1)
+        self.surum += 1
+        return idx
+
+    def guncelle(
+        self,
+        idler: Sequence[int],
+        malzeme: Sequence[Any],
+        kolonlar: Mapping[str, Any],
+        adet: Optional[Sequence[float]] = None,
+    ):
+        """Verilen (birbirinden farklı) satırların tüm girdilerini değiştirir."""
+        idx = self._kimlikler(idler)
+        self._katki(idx, -1)
+        self._yaz(idx, malzeme, kolonlar, adet)
+        self._hesapla(idx)
+        self._katki(idx, +1)
+        self.surum += 1
+
+    def sil(self, idler: Sequence[int]):
+        idx = self._kimlikler(idler)
+        self._katki(idx, -1)
+        self._canli[idx] = False
+        self._canli_sayi -= len(idx)
+        self.surum += 1
+
+    def tablo_ekle(self, df: pd.DataFrame) -> np.ndarray:
+        """BOM biçimli tablodan (``malzeme``, ölçüler, ``adet``) satır ekler."""
+        df = df.rename(columns=lambda c: str(c).strip().lower())
+        malzeme = df["malzeme"].tolist() if "malzeme" in df else [""] * len(df)
+        kolonlar = {
+            a: pd.to_numeric(df[a], errors="coerce").to_numpy(dtype=np.float64)
+            for a in OLCU_ALANLARI
+            if a in df
+        }
+        adet = pd.to_numeric(df["adet"], errors="coerce").to_numpy(dtype=np.float64) if "adet" in df else None
+        return self.ekle(malzeme, kolonlar, adet)
+
+    def temizle(self):
+        """Tüm satırları siler; fiyatlar korunur."""
+        fiyatlar, surum = self.fiyatlar(), self.surum
+        self.__init__(fiyatlar)
+        self.surum = surum + 1
+
+    def fiyat_ayarla(self, fiyatlar: Mapping[str, float]):
+        """Aile birim fiyatlarını değiştirir; satırlar yeniden hesaplanmaz."""
+        for aile, fiyat in fiyatlar.items():
+            if aile in _AILE_KODU:
+                self.fiyat[_AILE_KODU[aile]] = float(fiyat)
+
+    def fiyatlar(self) -> Dict[str, float]:
+        return dict(zip(AILELER, self.fiyat.tolist()))
+
+    # ---- okuma ----
+    def __len__(self) -> int:
+        return self._canli_sayi
+
+    def idler(self) -> np.ndarray:
+        """Canlı satır kimlikleri, eklenme sırasıyla."""
+        return np.flatnonzero(self._canli[:self._n])
+
+    def satirlar(self, idler: Optional[Sequence[int]] = None) -> pd.DataFrame:
+        """Satırların girdileri ve sonuçları; index satır kimliğidir."""
+        idx = self.idler() if idler is None else self._kimlikler(idler)
+        aile = self._aile[idx]
+        bilinen = aile >= 0
+        miktar = self._miktar[idx]
+        adet = self._adet[idx]
+        fiyat = np.where(bilinen, self.fiyat[aile], np.nan)
+        kolonlar = {"malzeme": np.where(bilinen, np.array(AILELER, dtype=object)[aile], "")}
+        kolonlar.update((a, self._olcu[a][idx]) for a in OLCU_ALANLARI)
+        kolonlar.update(
+            adet=adet,
+            birim=np.where(bilinen, _BIRIM[aile], ""),
+            miktar_adet=miktar,
+            miktar_toplam=miktar * adet,
+            birim_fiyat=fiyat,
+            tutar=miktar * adet * fiyat,
+        )
+        return pd.DataFrame(kolonlar, index=pd.Index(idx, name="kimlik"))
+
+    def aile_toplamlari(self) -> pd.DataFrame:
+        """Hesaplanan satırı olan ailelerin toplamları ve tutarları."""
+        g = np.flatnonzero(self._g_satir)
+        return pd.DataFrame({
+            "Malzeme": [AILE_MALZEMESI[AILELER[i]] for i in g],
+            "Aile": [AILE_ETIKETLERI[AILELER[i]] for i in g],
+            "Birim": _BIRIM[g],
+            "Satır": self._g_satir[g],
+            "Adet": self._g_adet[g],
+            "Miktar": self._g_miktar[g],
+            "Birim Fiyat": self.fiyat[g],
+            "Tutar": self._g_miktar[g] * self.fiyat[g],
+        })
+
+    def malzeme_toplamlari(self) -> pd.DataFrame:
+        """Aile toplamlarının malzeme ve birim bazında özeti."""
+        return (
+            self.aile_toplamlari()
+            .groupby(["Malzeme", "Birim"], sort=True, as_index=False)[["Satır", "Adet", "Miktar", "Tutar"]]
+            .sum()
+        )
+
+    def toplam(self, birim: str = "kg") -> float:
+        return float(self._g_miktar[_BIRIM == birim].sum())
+
+    @property
+    def tutar(self) -> float:
+        return float(self._g_miktar @ self.fiyat)
+
+    # ---- kalıcılık ----
+    def anlik(self) -> Dict[str, Any]:
+        """Canlı satırların ve fiyatların kopyası (``paket`` ile paketlenir).
+
+        Sadece kopyalar; büyük siparişte sıkıştırma çağıranı bekletmesin diye
+        ``paket`` ayrı, örn. oturum yazıcısında çağrılır.
+        """
+        idx = self.idler()
+        return {
+            "fiyat": self.fiyatlar(),
+            "aile": self._aile[idx],
+            "olcu": {a: self._olcu[a][idx] for a in OLCU_ALANLARI},
+            "adet": self._adet[idx],
+        }
+
+    @classmethod
+    def paketten(cls, veri: Mapping[str, Any]) -> "Siparis":
+        """``paket`` çıktısından siparişi kurar; bozuk pakette ``ValueError``."""
+        try:
+            n = int(veri["n"])
+            ham = zlib.decompress(base64.b64decode(veri["diziler"]))
+            aileler = list(veri["aileler"])
+            kolonlar = list(veri["kolonlar"])
+            fiyatlar = dict(veri.get("fiyat") or {})
+        except (KeyError, TypeError, ValueError, zlib.error) as e:
+            raise ValueError(f"Geçersiz sipariş paketi: {e}") from None
+        if len(ham) != n * (2 + 8 * (len(kolonlar) + 1)):
+            raise ValueError("Geçersiz sipariş paketi: boyut uyuşmuyor")
+        sip = cls(fiyatlar)
+        if not n:
+            return sip
+        kod = np.frombuffer(ham, "<i2", n)
+        if kod.max() >= len(aileler):
+            raise ValueError("Geçersiz sipariş paketi: aile kodu")
+        diziler = np.frombuffer(ham, "<f8", n * (len(kolonlar) + 1), offset=2 * n).reshape(-1, n)
+        # Aile kodları pakettekine göre; sürümler arasında sıra değişmiş olabilir.
+        malzeme = np.where(kod >= 0, np.array(aileler + [""], dtype=object)[kod], "")
+        sip.ekle(malzeme, {a: d for a, d in zip(kolonlar, diziler) if a in OLCU_ALANLARI}, diziler[-1])
+        return sip
+
+    def yeniden_topla(self):
+        """Toplamları satırlardan baştan kurar (doğrulama/kayan nokta artığı için)."""
+        self._g_satir[:] = 0
+        self._g_adet[:] = 0.0
+        self._g_miktar[:] = 0.0
+        self.hatali = 0
+        self._katki(self.idler(), +1)
+
+
+def paket(anlik: Mapping[str, Any]) -> Dict[str, Any]:
+    """``Siparis.anlik`` kopyasını JSON uyumlu pakete çevirir (diziler zlib + base64)."""
+    kolonlar = list(anlik["olcu"])
+    ham = b"".join(
+        [np.ascontiguousarray(anlik["aile"], "<i2").tobytes()]
+        + [np.ascontiguousarray(anlik["olcu"][a], "<f8").tobytes() for a in kolonlar]
+        + [np.ascontiguousarray(anlik["adet"], "<f8").tobytes()]
+    )
+    return {
+        "n": len(anlik["adet"]),
+        "aileler": list(AILELER),
+        "kolonlar": kolonlar,
+        "fiyat": anlik["fiyat"],
+        "diziler": base64.b64encode(zlib.compress(ham, 1)).decode("ascii"),
+    }
+
+
+# -------------------------------------------------
+# SAYFA DÜZENLEME (data_editor)
+# -------------------------------------------------
+GIRDI_KOLONLARI: List[str] = ["malzeme", *OLCU_ALANLARI, "adet"]
+
+
+def _girdi_tablosu(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.reindex(columns=GIRDI_KOLONLARI)
+    sayisal = df[GIRDI_KOLONLARI[1:]].apply(pd.to_numeric, errors="coerce").astype(np.float64)
+    sayisal.insert(0, "malzeme", df["malzeme"].fillna("").astype(str).str.strip().str.lower())
+    return sayisal
+
+
+class SiparisSayfasi:
+    """Siparişin bir sayfası için data_editor tabanı ve düzenleme farkı.
+
+    Taban konumsal index'lidir (data_editor eklenen satırları sadece
+    RangeIndex'te korur); konum -> satır kimliği eşlemesi burada tutulur.
+    ``uygula`` düzenlenen tabloyu bir önceki hâliyle karşılaştırır ve
+    sadece değişen, silinen ve eklenen satırları siparişe işler.
+    """
+
+    def __init__(self, siparis: Siparis, idler: Sequence[int]):
+        self.siparis = siparis
+        self.taban = _girdi_tablosu(siparis.satirlar(idler)).reset_index(drop=True)
+        self._kimlik: Dict[int, int] = dict(enumerate(int(i) for i in idler))
+        self._onceki = self.taban
+        self.surum = siparis.surum
+
+    @property
+    def guncel(self) -> bool:
+        """Sipariş bu sayfa dışından değişmediyse True."""
+        return self.surum == self.siparis.surum
+
+    def idler(self) -> List[int]:
+        """Sayfadaki satırların kimlikleri, tablodaki sırayla."""
+        return [self._kimlik[k] for k in self._onceki.index]
+
+    def sonuclar(self) -> pd.DataFrame:
+        """Sayfadaki satırların ``Siparis.satirlar`` çıktısı; index düzenleyicideki konumdur."""
+        df = self.siparis.satirlar(self.idler())
+        df.index = self._onceki.index
+        return df
+
+    def uygula(self, duzenlenen: pd.DataFrame) -> int:
+        """Düzenlenen tabloyu siparişe işler; dokunulan satır sayısını döner."""
+        yeni = _girdi_tablosu(duzenlenen)
+        eski = self._onceki
+        ortak = yeni.index.intersection(eski.index)
+        y, e = yeni.loc[ortak], eski.loc[ortak]
+        ayni = (y == e) | (y.isna() & e.isna())
+        degisen = ortak[~ayni.all(axis=1).to_numpy()]
+        silinen = eski.index.difference(yeni.index)
+        eklenen = yeni.index.difference(eski.index)
+
+        sip = self.siparis
+        if len(silinen):
+            sip.sil([self._kimlik.pop(k) for k in silinen])
+        if len(degisen):
+            alt = yeni.loc[degisen]
+            sip.guncelle(
+                [self._kimlik[k] for k in degisen],
+                alt["malzeme"].tolist(),
+                {a: alt[a].to_numpy() for a in OLCU_ALANLARI},
+                alt["adet"].to_numpy(),
+            )
+        if len(eklenen):
+            alt = yeni.loc[eklenen]
+            idler = sip.ekle(
+                alt["malzeme"].tolist(),
+                {a: alt[a].to_numpy() for a in OLCU_ALANLARI},
+                alt["adet"].to_numpy(),
+            )
+            self._kimlik.update(zip(eklenen.tolist(), idler.tolist()))
+
+        self._onceki = yeni
+        self.surum = sip.surum
+        return len(degisen) + len(silinen) + len(eklenen)
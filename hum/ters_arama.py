@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""Katalogda ters arama: hedef ağırlığa (kg/m) ya da kesite (cm²) göre profil.
+
+Tüm katalog ve her aile için kg/m'ye göre sıralı listeler tutulur;
+sorgular ``bisect`` ile O(log n) konum bulup dilim döner, aile süzgecinde
+aile dilimleri birleştirilir. Kesit, çelik yoğunluğuyla kg/m'ye çevrilir
+(A [cm²] = kg/m / (ρ · 0,1)); sıralama ikisi için de aynıdır.
+
+İndeks ``Katalog.agirlik_indeksi()`` ile katalog nesnesine bağlı kurulur;
+katalog yeniden yüklenince yenisi kurulur.
+"""
+import heapq
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from hum import olcum
+
+if TYPE_CHECKING:
+    from hum.katalog import Katalog
+
+OLCULER = ("kg_m", "kesit")
+
+
+class Profil(NamedTuple):
+    aile: str
+    ebat: float
+    kg_m: float
+    kesit: float  # cm²
+
+    @property
+    def ad(self) -> str:
+        return f"{self.aile} {self.ebat:g}"
+
+
+_KG = attrgetter("kg_m")
+
+
+class AgirlikIndeksi:
+    """Tüm katalog ve aile başına kg/m'ye göre sıralı profiller."""
+
+    def __init__(self, kat: "Katalog"):
+        # 1 cm² kesit, 1 m boyda 100 cm³: kg/m = A · ρ[g/cm³] · 0,1
+        self._kesit_kg = kat.yogunluk("celik") * 0.1
+        self.aileler: List[str] = list(kat.aileler)
+        self._kg: Dict[str, List[float]] = {}
+        self._profiller: Dict[str, List[Profil]] = {}
+
+        # kg/m, sonra aile ve ebat sırası; aile listeleri bu sırayı korur.
+        sira = np.lexsort((kat.ebat, kat.aile, kat.kg_m))
+        self._tum_kg: List[float] = kat.kg_m[sira].tolist()
+        self._tum: List[Profil] = [
+            Profil(self.aileler[a], e, k, k / self._kesit_kg)
+            for a, e, k in zip(kat.aile[sira].tolist(), kat.ebat[sira].tolist(), self._tum_kg)
+        ]
+        for p in self._tum:
+            self._kg.setdefault(p.aile, []).append(p.kg_m)
+            self._profiller.setdefault(p.aile, []).append(p)
+
+    def __len__(self) -> int:
+        return len(self._tum)
+
+    def _secili(self, aileler: Optional[Iterable[str]]) -> List[str]:
+        secili = [a.strip().upper() for a in aileler or () if a.strip()]
+        if not secili:
+            return list(self._kg)
+        bilinmeyen = [a for a in secili if a not in self._kg]
+        if bilinmeyen:
+            raise ValueError(f"Bilinmeyen profil ailesi: {', '.join(bilinmeyen)}")
+        return list(dict.fromkeys(secili))
+
+    def _listeler(self, aileler: Optional[Iterable[str]]) -> List[Tuple[List[float], List[Profil]]]:
+        """Taranacak ``(kg, profiller)`` listeleri; filtre yoksa tek birleşik liste."""
+        secili = self._secili(aileler)
+        if len(secili) == len(self._kg):
+            return [(self._tum_kg, self._tum)]
+        return [(self._kg[a], self._profiller[a]) for a in secili]
+
+    def kg_m(self, deger: float, olcu: str = "kg_m") -> float:
+        """Sorgu değerini kg/m'ye çevirir (``olcu``: ``kg_m`` ya da ``kesit``)."""
+        if olcu == "kg_m":
+            return float(deger)
+        if olcu == "kesit":
+            return float(deger) * self._kesit_kg
+        raise ValueError(f"Bilinmeyen ölçü: {olcu!r} ({', '.join(OLCULER)})")
+
+    @olcum.zamanla("hum_katalog_seconds")
+    def aralik(
+        self,
+        alt: Optional[float] = None,
+        ust: Optional[float] = None,
+        aileler: Optional[Iterable[str]] = None,
+        olcu: str = "kg_m",
+    ) -> List[Profil]:
+        """``alt <= değer <= ust`` olan profiller, hafiften ağıra."""
+        alt_kg = -np.inf if alt is None else self.kg_m(alt, olcu)
+        ust_kg = np.inf if ust is None else self.kg_m(ust, olcu)
+        listeler = self._listeler(aileler)
+        sonuc: List[Profil] = []
+        for kg, profiller in listeler:
+            sonuc += profiller[bisect_left(kg, alt_kg):bisect_right(kg, ust_kg)]
+        if len(listeler) > 1:
+            # Sıralı parçaların birleşimi: timsort parçaları koşu olarak birleştirir.
+            sonuc.sort(key=_KG)
+        return sonuc
+
+    @olcum.zamanla("hum_katalog_seconds")
+    def en_hafif(
+        self, en_az: float, aileler: Optional[Iterable[str]] = None, olcu: str = "kg_m"
+    ) -> List[Profil]:
+        """Her ailenin ``en_az`` değerini karşılayan en hafif profili, hafiften ağıra.
+
+        İlk eleman seçili aileler içindeki en hafif profildir.
+        """
+        hedef = self.kg_m(en_az, olcu)
+        sonuc = []
+        for a in self._secili(aileler):
+            i = bisect_left(self._kg[a], hedef)
+            if i < len(self._kg[a]):
+                sonuc.append(self._profiller[a][i])
+        sonuc.sort(key=_KG)
+        return sonuc
+
+    @olcum.zamanla("hum_katalog_seconds")
+    def en_yakin(
+        self, hedef: float, k: int = 5, aileler: Optional[Iterable[str]] = None, olcu: str = "kg_m"
+    ) -> List[Profil]:
+        """Hedef değere en yakın ``k`` profil, yakından uzağa."""
+        hedef_kg = self.kg_m(hedef, olcu)
+        adaylar: List[Profil] = []
+        for kg, profiller in self._listeler(aileler):
+            # Bu listenin en yakın k'sı, konumun iki yanından genişleyerek bulunur.
+            sag = bisect_left(kg, hedef_kg)
+            sol = sag - 1
+            for _ in range(min(k, len(kg))):
+                if sag >= len(kg) or (sol >= 0 and hedef_kg - kg[sol] <= kg[sag] - hedef_kg):
+                    adaylar.append(profiller[sol])
+                    sol -= 1
+                else:
+                    adaylar.append(profiller[sag])
+                    sag += 1
+        return heapq.nsmallest(k, adaylar, key=lambda p: abs(p.kg_m - hedef_kg))
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+"""Levha yerleşim tahmini (2D nesting): dikdörtgen parçalar -> standart levhalar.
+
+Parçalar malzeme ve kalınlığa göre gruplanır; her grup her aday levha
+ölçüsüne giyotin yöntemiyle yerleştirilir ve en az levha alanı satın
+alınan ölçü seçilir.
+
+Giyotin yerleşim: parçalar alana göre büyükten küçüğe; açık levhalar
+sırayla denenir (first-fit; serbest dikdörtgenleri parçayı alamayacak
+levhalar bir segment ağacıyla atlanır), levha içinde boşluğu en az kalan
+serbest dikdörtgen seçilir (best-area-fit), kalan alan kısa artık ekseni
+boyunca ikiye bölünür. En küçük parçanın sığmayacağı artıklar atılır. Kesim payı
+1D kesimdeki gibi parça ve levha ölçülerine eklenir.
+
+Sonuçlar sipariş özeti (SHA-1) ile süreç içinde önbelleğe alınır; aynı
+sipariş yeniden açıldığında hesap tekrarlanmaz.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from hum import hesap
+
+MALZEMELER = ("kestamit", "celik_levha")
+# Yaygın ticari levha ölçüleri (en x boy, mm)
+STANDART_LEVHALAR: Dict[str, Tuple[Tuple[float, float], ...]] = {
+    "kestamit": ((1000.0, 2000.0), (1220.0, 2440.0)),
+    "celik_levha": ((1000.0, 2000.0), (1250.0, 2500.0), (1500.0, 3000.0), (2000.0, 6000.0)),
+}
+ONBELLEK_SINIRI = 64
+
+
+class Yerlesim(NamedTuple):
+    x: float
+    y: float
+    en: float
+    boy: float
+    dondu: bool
+
+
+class GrupPlani(NamedTuple):
+    malzeme: str
+    kal: float
+    levha_en: float
+    levha_boy: float
+    levhalar: List[Tuple[Yerlesim, ...]]
+    parca_adedi: int
+    parca_alani: float  # mm²
+    kg: float  # satın alınan levha ağırlığı
+
+    @property
+    def levha_sayisi(self) -> int:
+        return len(self.levhalar)
+
+    @property
+    def levha_alani(self) -> float:
+        return self.levha_sayisi * self.levha_en * self.levha_boy
+
+    @property
+    def verim(self) -> float:
+        return self.parca_alani / self.levha_alani if self.levhalar else 0.0
+
+
+class YerlesimPlani(NamedTuple):
+    ozet: str
+    gruplar: List[GrupPlani]
+    sure: float  # hesap süresi (s); önbellekten gelse de ilk hesabınki
+
+    @property
+    def levha_sayisi(self) -> int:
+        return sum(g.levha_sayisi for g in self.gruplar)
+
+    @property
+    def kg(self) -> float:
+        return sum(g.kg for g in self.gruplar)
+
+
+# -------------------------------------------------
+# GİYOTİN YERLEŞİM
+# -------------------------------------------------
+class _SinirAgaci:
+    """Levha başına serbest dikdörtgen ölçü sınırları (maksimum segment ağacı).
+
+    Her levha için serbest dikdörtgenlerin en büyük kısa kenarı, uzun kenarı
+    ve alanı tutulur (çevirme yoksa en, boy ve alan). Parçanın sığması için
+    üçünün de parçanınkini karşılaması gerekir; ``ara`` bu koşulu sağlayan
+    ilk levhayı ağaçta budayarak bulur. First-fit sırası korunur, parçayı
+    alamayacak levhalar taranmaz.
+    """
+
+    def __init__(self):
+        self._n = 1
+        self._d: List[List[float]] = [[-1.0] * 2 for _ in range(3)]
+
+    def ayarla(self, i: int, sinir: Tuple[float, float, float]):
+        while i >= self._n:
+            for k in range(3):
+                yapraklar = self._d[k][self._n:] + [-1.0] * self._n
+                self._d[k] = [-1.0] * (2 * self._n) + yapraklar
+            self._n *= 2
+            for k in range(3):
+                d = self._d[k]
+                for j in range(self._n - 1, 0, -1):
+                    d[j] = max(d[2 * j], d[2 * j + 1])
+        j = i + self._n
+        for k in range(3):
+            self._d[k][j] = sinir[k]
+        j >>= 1
+        while j:
+            for d in self._d:
+                d[j] = max(d[2 * j], d[2 * j + 1])
+            j >>= 1
+
+    def ara(self, parca: Tuple[float, float, float], dene: Callable[[int], bool]) -> int:
+        """Sınırları ``parca``'yı karşılayan levhaları sırayla ``dene``'ye verir;
+        ``dene``'nin kabul ettiği ilk levha (yoksa -1)."""
+        a, b, c = self._d
+        p0, p1, p2 = parca
+        yigin = [1]
+        while yigin:
+            j = yigin.pop()
+            if a[j] < p0 or b[j] < p1 or c[j] < p2:
+                continue
+            if j >= self._n:
+                if dene(j - self._n):
+                    return j - self._n
+                continue
+            yigin.append(2 * j + 1)
+            yigin.append(2 * j)
+        return -1
+
+
+def _levhalara_yerlestir(
+    parcalar: Sequence[Tuple[float, float]], en: float, boy: float, kerf: float, dondur: bool
+) -> Optional[List[List[Yerlesim]]]:
+    """Parçaları ``en x boy`` levhalara yerleştirir; sığmayan parça varsa None."""
+    W, H = en + kerf, boy + kerf
+    etkin = sorted(((e + kerf, b + kerf) for e, b in parcalar), key=lambda p: p[0] * p[1], reverse=True)
+    for e, b in etkin:
+        if not ((e <= W and b <= H) or (dondur and b <= W and e <= H)):
+            return None
+    en_kisa = min((min(p) for p in etkin), default=0.0)
+
+    levhalar: List[List[Yerlesim]] = []
+    serbest: List[List[List[float]]] = []  # levha başına [x, y, w, h]
+    sinir = _SinirAgaci()
+    olcu = _donuk_sinir if dondur else _sinir
+    for pe, pb in etkin:
+        # Sadece serbest dikdörtgenleri parçayı alabilecek levhalar denenir.
+        li = sinir.ara(
+            olcu(pe, pb),
+            lambda i: _levhaya_koy(serbest[i], levhalar[i], pe, pb, kerf, dondur, en_kisa),
+        )
+        if li < 0:
+            li = len(serbest)
+            serbest.append([[0.0, 0.0, W, H]])
+            levhalar.append([])
+            _levhaya_koy(serbest[li], levhalar[li], pe, pb, kerf, dondur, en_kisa)
+        sinir.ayarla(li, _levha_siniri(serbest[li], olcu))
+    return levhalar
+
+
+def _sinir(w: float, h: float) -> Tuple[float, float, float]:
+    return w, h, w * h
+
+
+def _donuk_sinir(w: float, h: float) -> Tuple[float, float, float]:
+    return (w, h, w * h) if w <= h else (h, w, w * h)
+
+
+def _levha_siniri(bos, olcu) -> Tuple[float, float, float]:
+    if not bos:
+        return -1.0, -1.0, -1.0
+    return tuple(max(v) for v in zip(*(olcu(r[2], r[3]) for r in bos)))
+
+
+def _levhaya_koy(bos, levha, pe, pb, kerf, dondur, en_kisa) -> bool:
+    en_iyi = None
+    for i, (x, y, w, h) in enumerate(bos):
+        for e, b, d in ((pe, pb, False), (pb, pe, True)) if dondur else ((pe, pb, False),):
+            if e <= w and b <= h:
+                artik = w * h - e * b
+                if en_iyi is None or artik < en_iyi[0]:
+                    en_iyi = (artik, i, e, b, d)
+    if en_iyi is None:
+        return False
+
+    _, i, e, b, d = en_iyi
+    x, y, w, h = bos.pop(i)
+    levha.append(Yerlesim(x, y, e - kerf, b - kerf, d))
+    dw, dh = w - e, h - b
+    # Kısa artık ekseni kuralı: büyük artık dikdörtgen bütün kalır.
+    if dw < dh:
+        yeni = ((x + e, y, dw, b), (x, y + b, w, dh))
+    else:
+        yeni = ((x + e, y, dw, h), (x, y + b, e, dh))
+    for r in yeni:
+        if r[2] >= en_kisa and r[3] >= en_kisa:
+            bos.append(list(r))
+    return True
+
+
+# -------------------------------------------------
+# SİPARİŞ
+# -------------------------------------------------
+_onbellek: "OrderedDict[str, YerlesimPlani]" = OrderedDict()
+_kilit = threading.Lock()
+
+
+def _gruplar(parcalar: Iterable[Tuple[str, float, float, float, int]]):
+    gruplar: Dict[Tuple[str, float], Dict[Tuple[float, float], int]] = {}
+    for malzeme, kal, en, boy, adet in parcalar:
+        kal, en, boy, adet = float(kal), float(en), float(boy), int(adet)
+        if malzeme not in MALZEMELER:
+            raise ValueError(f"Bilinmeyen levha malzemesi: {malzeme!r}")
+        if min(kal, en, boy) <= 0 or adet <= 0:
+            continue
+        g = gruplar.setdefault((malzeme, kal), {})
+        g[(en, boy)] = g.get((en, boy), 0) + adet
+    return {k: sorted(v.items()) for k, v in sorted(gruplar.items())}
+
+
+def siparis_ozeti(gruplar, levhalar, kerf: float, dondur: bool) -> str:
+    """Sıradan bağımsız sipariş anahtarı."""
+    ham = json.dumps(
+        {
+            "g": [[m, k, p] for (m, k), p in gruplar.items()],
+            "l": {m: sorted(v) for m, v in sorted(levhalar.items())},
+            "k": kerf,
+            "d": dondur,
+        },
+        separators=(",", ":"),
+    )
+    return hashlib.sha1(ham.encode("utf-8")).hexdigest()
+
+
+def _grup_planla(malzeme, kal, parcalar, adaylar, kerf, dondur) -> GrupPlani:
+    acik = [(e, b) for (e, b), n in parcalar for _ in range(n)]
+    en_iyi = None
+    for en, boy in adaylar:
+        levhalar = _levhalara_yerlestir(acik, en, boy, kerf, dondur)
+        if levhalar is not None and (
+            en_iyi is None or len(levhalar) * en * boy < len(en_iyi[2]) * en_iyi[0] * en_iyi[1]
+        ):
+            en_iyi = (en, boy, levhalar)
+    if en_iyi is None:
+        en, boy = max(acik, key=lambda p: p[0] * p[1])
+        raise ValueError(f"{malzeme} {kal:g} mm: {en:g}x{boy:g} parça hiçbir levhaya sığmıyor")
+
+    en, boy, levhalar = en_iyi
+    tek = float(hesap.modul_hesapla(malzeme, {"kal": [kal], "en": [en], "boy": [boy]})[0])
+    return GrupPlani(
+        malzeme=malzeme,
+        kal=kal,
+        levha_en=en,
+        levha_boy=boy,
+        levhalar=[tuple(lv) for lv in levhalar],
+        parca_adedi=len(acik),
+        parca_alani=sum(e * b for e, b in acik),
+        kg=tek * len(levhalar),
+    )
+
+
+def yerlestir(
+    parcalar: Iterable[Tuple[str, float, float, float, int]],
+    levhalar: Optional[Dict[str, Sequence[Tuple[float, float]]]] = None,
+    kerf: float = 0.0,
+    dondur: bool = True,
+) -> YerlesimPlani:
+    """``(malzeme, kal, en, boy, adet)`` parçalarını levhalara yerleştirir.
+
+    ``levhalar`` malzeme başına aday levha ölçüleridir (varsayılan
+    ``STANDART_LEVHALAR``). ``dondur`` parçaların 90° çevrilmesine izin verir.
+    """
+    gruplar = _gruplar(parcalar)
+    levhalar = {
+        m: tuple(sorted((float(e), float(b)) for e, b in (levhalar or {}).get(m) or STANDART_LEVHALAR[m]))
+        for m in {m for m, _ in gruplar}
+    }
+    ozet = siparis_ozeti(gruplar, levhalar, float(kerf), bool(dondur))
+    with _kilit:
+        if ozet in _onbellek:
+            _onbellek.move_to_end(ozet)
+            return _onbellek[ozet]
+
+    t0 = time.perf_counter()
+    plan = YerlesimPlani(
+        ozet=ozet,
+        gruplar=[
+            _grup_planla(m, kal, p, levhalar[m], float(kerf), bool(dondur))
+            for (m, kal), p in gruplar.items()
+        ],
+        sure=0.0,
+    )
+    plan = plan._replace(sure=time.perf_counter() - t0)
+    with _kilit:
+        _onbellek[ozet] = plan
+        while len(_onbellek) > ONBELLEK_SINIRI:
+            _onbellek.popitem(last=False)
+    return plan
@@ -1,725 +1,1911 @@
-# -*- coding: utf-8 -*-
-import math
-import sys
-from typing import Dict, List
-
-import streamlit as st
-import pandas as pd
-
-# -------------------------------------------------
-# GENEL AYARLAR
-# -------------------------------------------------
-st.set_page_config(
-    page_title="HUM İşlemler Paneli",
-    layout="wide",
-)
-
-# HUM logosu (GitHub raw link)
-LOGO_URL = "https://raw.githubusercontent.com/SUDE830/hum-panel/main/hum_logo.png"
-
-# -------------------------------------------------
-# GENEL TASARIM (CSS)
-# -------------------------------------------------
-st.markdown(
-    """
-    <style>
-    /* Genel arka plan ve yazı rengi */
-    body {
-        background-color: #050814 !important;
-        color: #f5f5f5 !important;
-    }
-
-    section[data-testid="stSidebar"] {
-        background-color: #050814 !important;
-        border-right: 1px solid #1f2933;
-    }
-
-    /* Ana içerik alanı */
-    div[data-testid="stAppViewContainer"] {
-        background-color: #050814;
-    }
-
-    /* Kart benzeri beyaz paneller */
-    .hum-card {
-        background-color: #0f172a;
-        padding: 1.5rem;
-        border-radius: 0.6rem;
-        box-shadow: 0 0 18px rgba(0, 0, 0, 0.45);
-        margin-bottom: 1.2rem;
-    }
-
-    /* Üst navbar */
-    .hum-navbar {
-        background-color: #0B1F33;
-        color: white;
-        padding: 0.7rem 1.5rem;
-        font-size: 20px;
-        font-weight: 600;
-        margin-bottom: 0.8rem;
-        text-align: center;
-        border-radius: 0.4rem;
-    }
-
-    /* Başlıklar */
-    h1, h2, h3, h4 {
-        color: #f9fafb !important;
-    }
-
-    /* Sidebar başlık */
-    .sidebar-title {
-        font-size: 20px;
-        font-weight: 700;
-        color: #e5e7eb;
-        margin-top: 0.5rem;
-        margin-bottom: 0.5rem;
-    }
-
-    /* Radio buton yazıları */
-    label[data-baseweb="radio"] > div {
-        color: #e5e7eb !important;
-    }
-
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
-
-# -------------------------------------------------
-# YARDIMCI FONKSİYONLAR
-# -------------------------------------------------
-def fmt(x: float, nd: int = 3) -> str:
-    """Türkçe virgüllü sayı formatı, boşsa '—'."""
-    if x is None:
-        return "—"
-    try:
-        return str(round(float(x), nd)).replace(".", ",")
-    except Exception:
-        return "—"
-
-
-def key(mod_id: str, field: str, row: int) -> str:
-    """Benzersiz Streamlit key üretimi."""
-    return f"{mod_id}_{field}_{row}"
-
-
-# -------------------------------------------------
-# RESET FONKSİYONLARI
-# -------------------------------------------------
-RESET_FIELDS: Dict[str, List[str]] = {
-    "kestamit": ["kal", "en", "boy"],
-    "celik_levha": ["kal", "en", "boy"],
-    "celik_mil": ["cap", "boy"],
-    "altikose": ["ebat", "boy"],
-    "kare": ["ebat", "boy"],
-    "lama": ["gen", "yuk", "boy"],
-    "kosebent": ["ebat", "et", "boy"],
-    "celik_cek_boru": ["dis", "et", "boy", "ic"],
-    "dik_boru_kutu": ["boy"],
-    "npu": ["ebat", "boy"],
-    "heb": ["ebat", "boy"],
-}
-
-
-def reset_module_state(mod_id: str):
-    for i in range(1, 6):
-        for f in RESET_FIELDS.get(mod_id, []):
-            kname = key(mod_id, f, i)
-            if kname in st.session_state:
-                del st.session_state[kname]
-
-
-def reset_all():
-    for mod in RESET_FIELDS:
-        reset_module_state(mod)
-    st.rerun()
-
-
-# -------------------------------------------------
-# KATSAYILAR (Br-3 kg/mt)
-# -------------------------------------------------
-# NPU modülü: sadece 65, 80, 100, 120, 140, 160, 180, 200, 300, 320
-NPU_KATSAYI = {
-    65: 7.09,
-    80: 8.64,
-    100: 10.60,
-    120: 13.40,
-    140: 16.00,
-    160: 18.80,
-    180: 22.00,
-    200: 25.30,
-    300: 46.20,
-    320: 59.50,
-}
-
-# HEB modülü: sadece 100, 120, 160, 180, 200, 220, 240, 320
-HEB_KATSAYI = {
-    100: 20.40,
-    120: 26.70,
-    160: 42.60,
-    180: 51.20,
-    200: 61.30,
-    220: 71.50,
-    240: 83.20,
-    320: 127.00,
-}
-
-# -------------------------------------------------
-# PROFİL AĞIRLIK CETVELİ VERİLERİ
-# -------------------------------------------------
-profil_rows = [
-    # HEA / HEB
-    ("HEA 100", 16.70, 100.20),
-    ("HEB 100", 20.40, 122.40),
-    ("HEA 120", 19.90, 119.40),
-    ("HEB 120", 26.70, 160.20),
-    ("HEA 140", 24.70, 148.20),
-    ("HEB 140", 33.70, 202.20),
-    ("HEA 160", 30.40, 182.40),
-    ("HEB 160", 42.60, 255.60),
-    ("HEA 180", 35.50, 213.00),
-    ("HEB 180", 51.20, 307.20),
-    ("HEA 200", 42.30, 253.80),
-    ("HEB 200", 61.30, 367.80),
-    ("HEA 220", 50.50, 303.00),
-    ("HEB 220", 71.50, 429.00),
-    ("HEA 240", 60.30, 361.80),
-    ("HEB 240", 83.20, 499.20),
-    ("HEA 260", 68.20, 409.20),
-    ("HEB 260", 93.00, 558.00),
-    ("HEA 280", 76.40, 458.40),
-    ("HEB 280", 103.00, 618.00),
-    ("HEA 300", 88.30, 529.80),
-    ("HEB 300", 117.00, 702.00),
-    ("HEA 320", 97.60, 585.60),
-    ("HEB 320", 127.00, 762.00),
-    ("HEA 340", 105.00, 630.00),
-    ("HEB 340", 134.00, 804.00),
-    ("HEA 360", 112.00, 672.00),
-    ("HEB 360", 142.00, 852.00),
-    ("HEA 400", 125.00, 750.00),
-    ("HEB 400", 155.00, 930.00),
-    ("HEA 450", 140.00, 840.00),
-    ("HEB 450", 171.00, 1026.00),
-    ("HEA 500", 155.00, 930.00),
-    ("HEB 500", 187.00, 1122.00),
-    ("HEA 550", 166.00, 996.00),
-    ("HEB 550", 199.00, 1194.00),
-    ("HEA 600", 178.00, 1068.00),
-    ("HEB 600", 212.00, 1272.00),
-    # NPU
-    ("NPU 60", 5.07, 30.42),
-    ("NPU 65", 7.09, 42.54),
-    ("NPU 80", 8.64, 51.84),
-    ("NPU 100", 10.60, 63.60),
-    ("NPU 120", 13.40, 80.40),
-    ("NPU 140", 16.00, 96.00),
-    ("NPU 160", 18.80, 112.80),
-    ("NPU 180", 22.00, 132.00),
-    ("NPU 200", 25.30, 151.80),
-    ("NPU 220", 29.40, 176.40),
-    ("NPU 240", 33.20, 199.20),
-    ("NPU 260", 37.90, 227.40),
-    ("NPU 280", 47.80, 286.80),
-    ("NPU 300", 46.20, 277.20),
-    ("NPU 320", 59.50, 357.00),
-    ("NPU 350", 60.60, 363.60),
-    ("NPU 400", 71.80, 430.80),
-    # NPI
-    ("NPI 80", 5.94, 35.64),
-    ("NPI 100", 8.34, 50.04),
-    ("NPI 120", 11.10, 66.60),
-    ("NPI 140", 14.30, 85.80),
-    ("NPI 160", 17.90, 107.40),
-    ("NPI 180", 21.90, 131.40),
-    ("NPI 200", 26.20, 157.20),
-    ("NPI 220", 31.10, 186.60),
-    ("NPI 240", 36.20, 217.20),
-    ("NPI 260", 41.90, 251.40),
-    ("NPI 280", 47.90, 287.40),
-    ("NPI 300", 54.20, 325.20),
-    ("NPI 320", 61.00, 366.00),
-    ("NPI 340", 68.00, 408.00),
-    ("NPI 360", 76.10, 456.60),
-    ("NPI 380", 84.00, 504.00),
-    ("NPI 400", 92.40, 554.40),
-    ("NPI 425", 104.00, 624.00),
-    ("NPI 450", 115.00, 690.00),
-    ("NPI 475", 128.00, 768.00),
-    ("NPI 500", 141.00, 846.00),
-    ("NPI 550", 166.00, 996.00),
-    ("NPI 600", 199.00, 1194.00),
-]
-
-profil_df = pd.DataFrame(
-    profil_rows,
-    columns=["Malzeme", "1 mt/Kg", "Boy=6 mt/Kg"],
-)
-
-# -------------------------------------------------
-# SIDEBAR
-# -------------------------------------------------
-with st.sidebar:
-    if LOGO_URL:
-        st.image(LOGO_URL, use_column_width=True)
-
-    st.markdown('<div class="sidebar-title">İŞLEMLER</div>', unsafe_allow_html=True)
-
-    if st.button("Tümünü Sıfırla"):
-        reset_all()
-
-    st.markdown("---")
-
-    MODULES = [
-        ("kestamit", "KESTAMİT LEVHALAR AD-KG"),
-        ("celik_levha", "ÇELİK LEVHALAR AD-KG"),
-        ("celik_mil", "ÇELİK MİL AD-MM-KG"),
-        ("altikose", "ALTIKÖŞE AD-MM-KG"),
-        ("kare", "KARE AD-MM-KG"),
-        ("lama", "LAMA AD-MM-KG"),
-        ("kosebent", "KÖŞEBENT AD-MM-KG"),
-        ("celik_cek_boru", "ÇELİK ÇEKME BORU AD-MM-KG"),
-        ("dik_boru_kutu", "DİK BORU & KUTU PROFİL AD-MM-MT"),
-        ("npu", "NPU AD-MM-KG"),
-        ("heb", "HEB AD-MM-KG"),
-        ("profil_cetveli", "Profil Ağırlık Cetveli"),
-        ("kodlama", "Kodlama Sistematiği"),
-    ]
-
-    labels = [lbl for _, lbl in MODULES]
-    selection = st.radio("İşlem seç:", labels)
-    selected_mod = [mid for mid, lbl in MODULES if lbl == selection][0]
-
-# -------------------------------------------------
-# NAVBAR
-# -------------------------------------------------
-st.markdown(
-    '<div class="hum-navbar">HUM Makine Paneli</div>',
-    unsafe_allow_html=True,
-)
-
-# -------------------------------------------------
-# MODÜLLER
-# -------------------------------------------------
-def render_levha_multi(mod_id: str, title: str, yogunluk: float):
-    """Kestamit & Çelik Levha modülü (Br-2)."""
-    st.header(title)
-    st.subheader("Kg/Adet (Br-2) hesaplanır")
-
-    br = "(Br-2)"
-
-    with st.container():
-        for i in range(1, 6):
-            cols = st.columns([0.45, 1, 1, 1, 1])
-            cols[0].markdown(f"**{i}. Ürün**")
-
-            kal = cols[1].number_input(
-                "Kalınlık (mm)",
-                min_value=0.0,
-                step=0.1,
-                key=key(mod_id, "kal", i),
-                label_visibility="visible" if i == 1 else "collapsed",
-            )
-            en = cols[2].number_input(
-                "En (mm)",
-                min_value=0.0,
-                step=1.0,
-                key=key(mod_id, "en", i),
-                label_visibility="visible" if i == 1 else "collapsed",
-            )
-            boy = cols[3].number_input(
-                "Boy (mm)",
-                min_value=0.0,
-                step=1.0,
-                key=key(mod_id, "boy", i),
-                label_visibility="visible" if i == 1 else "collapsed",
-            )
-
-            kg = yogunluk * kal * (en / 1000) * (boy / 1000) if kal and en and boy else None
-            cols[4].markdown(f"**Kg/Adet {br}:** {fmt(kg)}")
-
-
-def render_celik_mil():
-    st.header("ÇELİK MİL AD-MM-KG")
-    st.subheader("Kg/Adet (Br-3)")
-
-    for i in range(1, 6):
-        cols = st.columns([0.45, 1, 1, 1])
-        cols[0].markdown(f"**{i}. Ürün**")
-
-        cap = cols[1].number_input(
-            "Çap (mm)",
-            min_value=0.0,
-            step=0.1,
-            key=key("celik_mil", "cap", i),
-            label_visibility="visible" if i == 1 else "collapsed",
-        )
-        boy = cols[2].number_input(
-            "Boy (mm)",
-            min_value=0.0,
-            step=1.0,
-            key=key("celik_mil", "boy", i),
-            label_visibility="visible" if i == 1 else "collapsed",
-        )
-
-        if cap and boy:
-            kg = (cap ** 2) * 0.0062832 * boy * 7.85 / 8000
-        else:
-            kg = None
-
-        cols[3].markdown(f"**Kg/Adet (Br-3):** {fmt(kg)}")
-
-
-def render_altikose():
-    st.header("ALTIKÖŞE AD-MM-KG")
-    st.subheader("Kg/Adet (Br-3)")
-
-    for i in range(1, 6):
-        cols = st.columns([0.45, 1, 1, 1])
-        cols[0].markdown(f"**{i}. Ürün**")
-
-        ebat = cols[1].number_input(
-            "Ebat (mm)",
-            min_value=0.0,
-            step=0.1,
-            key=key("altikose", "ebat", i),
-            label_visibility="visible" if i == 1 else "collapsed",
-        )
-        boy = cols[2].number_input(
-            "Boy (mm)",
-            min_value=0.0,
-            step=1.0,
-            key=key("altikose", "boy", i),
-            label_visibility="visible" if i == 1 else "collapsed",
-        )
-
-        kg = (ebat ** 2 * boy * 0.012) / (math.sqrt(3) * 1000) if ebat and boy else None
-        cols[3].markdown(f"**Kg/Adet (Br-3):** {fmt(kg)}")
-
-
-def render_kare():
-    st.header("KARE AD-MM-KG")
-    st.subheader("Kg/Adet (Br-3)")
-
-    for i in range(1, 6):
-        cols = st.columns([0.45, 1, 1, 1])
-        cols[0].markdown(f"**{i}. Ürün**")
-
-        ebat = cols[1].number_input(
-            "Ebat (mm)",
-            min_value=0.0,
-            step=0.1,
-            key=key("kare", "ebat", i),
-            label_visibility="visible" if i == 1 else "collapsed",
-        )
-        boy = cols[2].number_input(
-            "Boy (mm)",
-            min_value=0.0,
-            step=1.0,
-            key=key("kare", "boy", i),
-            label_visibility="visible" if i == 1 else "collapsed",
-        )
-
-        kg = (ebat * ebat * boy * 0.00785) / 1000 if ebat and boy else None
-        cols[3].markdown(f"**Kg/Adet (Br-3):** {fmt(kg)}")
-
-
-def render_lama():
-    st.header("LAMA AD-MM-KG")
-    st.subheader("Kg/Adet (Br-3)")
-
-    for i in range(1, 6):
-        cols = st.columns([0.45, 1, 1, 1, 1])
-        cols[0].markdown(f"**{i}. Ürün**")
-
-        gen = cols[1].number_input(
-            "Genişlik (mm)",
-            min_value=0.0,
-            step=0.1,
-            key=key("lama", "gen", i),
-            label_visibility="visible" if i == 1 else "collapsed",
-        )
-        yuk = cols[2].number_input(
-            "Yükseklik (mm)",
-            min_value=0.0,
-            step=0.1,
-            key=key("lama", "yuk", i),
-            label_visibility="visible" if i == 1 else "collapsed",
-        )
-        boy = cols[3].number_input(
-            "Boy (mm)",
-            min_value=0.0,
-            step=1.0,
-            key=key("lama", "boy", i),
-            label_visibility="visible" if i == 1 else "collapsed",
-        )
-
-        kg = (gen * yuk * boy * 0.00785) / 1000 if gen and yuk and boy else None
-        cols[4].markdown(f"**Kg/Adet (Br-3):** {fmt(kg)}")
-
-
-def render_kosebent():
-    st.header("KÖŞEBENT AD-MM-KG")
-    st.subheader("Kg/Adet (Br-3)")
-
-    for i in range(1, 6):
-        cols = st.columns([0.45, 1, 1, 1, 1])
-        cols[0].markdown(f"**{i}. Ürün**")
-
-        ebat = cols[1].number_input(
-            "Ebat (mm)",
-            min_value=0.0,
-            step=0.1,
-            key=key("kosebent", "ebat", i),
-            label_visibility="visible" if i == 1 else "collapsed",
-        )
-        et = cols[2].number_input(
-            "Et (mm)",
-            min_value=0.0,
-            step=0.1,
-            key=key("kosebent", "et", i),
-            label_visibility="visible" if i == 1 else "collapsed",
-        )
-        boy = cols[3].number_input(
-            "Boy (mm)",
-            min_value=0.0,
-            step=1.0,
-            key=key("kosebent", "boy", i),
-            label_visibility="visible" if i == 1 else "collapsed",
-        )
-
-        kg = (2 * ebat * et * boy * 0.00785) / 1000 if ebat and et and boy else None
-        cols[4].markdown(f"**Kg/Adet (Br-3):** {fmt(kg)}")
-
-
-def render_celik_cek_boru():
-    st.header("ÇELİK ÇEKME BORU AD-MM-KG")
-    st.subheader("Kg/Adet (Br-3)")
-
-    for i in range(1, 6):
-        cols = st.columns([0.45, 1, 1, 1, 1, 1])
-        cols[0].markdown(f"**{i}. Ürün**")
-
-        dis_cap = cols[1].number_input(
-            "Dış Çap (mm)",
-            min_value=0.0,
-            step=0.1,
-            key=key("celik_cek_boru", "dis", i),
-            label_visibility="visible" if i == 1 else "collapsed",
-        )
-        et = cols[2].number_input(
-            "Et (mm)",
-            min_value=0.0,
-            step=0.1,
-            key=key("celik_cek_boru", "et", i),
-            label_visibility="visible" if i == 1 else "collapsed",
-        )
-        boy = cols[3].number_input(
-            "Boy (mm)",
-            min_value=0.0,
-            step=1.0,
-            key=key("celik_cek_boru", "boy", i),
-            label_visibility="visible" if i == 1 else "collapsed",
-        )
-        ic_cap = cols[4].number_input(
-            "İç Çap (mm) (opsiyonel)",
-            min_value=0.0,
-            step=0.1,
-            key=key("celik_cek_boru", "ic", i),
-            label_visibility="visible" if i == 1 else "collapsed",
-        )
-
-        if dis_cap and boy and (et or ic_cap):
-            ic_eff = ic_cap if ic_cap > 0 else max(dis_cap - 2 * et, 0)
-            dis_hac = (dis_cap ** 2) * 0.0062832 * boy * 7.85 / 8000
-            ic_hac = (ic_eff ** 2) * 0.0062832 * boy * 7.85 / 8000
-            kg = dis_hac - ic_hac
-        else:
-            kg = None
-
-        cols[5].markdown(f"**Kg/Adet (Br-3):** {fmt(kg)}")
-
-
-def render_dik_boru_kutu():
-    st.header("DİK BORU & KUTU PROFİL AD-MM-MT")
-    st.subheader("mt/Adet hesaplanır")
-
-    for i in range(1, 6):
-        cols = st.columns([0.45, 1, 1])
-        cols[0].markdown(f"**{i}. Ürün**")
-
-        boy = cols[1].number_input(
-            "Boy (mm)",
-            min_value=0.0,
-            step=1.0,
-            key=key("dik_boru_kutu", "boy", i),
-            label_visibility="visible" if i == 1 else "collapsed",
-        )
-
-        mt = boy / 1000 if boy else None
-        cols[2].markdown(f"**mt/Adet:** {fmt(mt)}")
-
-
-def render_profil(mod_id: str, title: str, kats: Dict[int, float]):
-    st.header(title)
-    st.subheader("Kg/Adet (Br-3)")
-
-    ebats = sorted(kats.keys())
-
-    for i in range(1, 6):
-        cols = st.columns([0.45, 1, 1, 1])
-        cols[0].markdown(f"**{i}. Ürün**")
-
-        ebat = cols[1].selectbox(
-            "Ebat (mm)",
-            ebats,
-            key=key(mod_id, "ebat", i),
-            label_visibility="visible" if i == 1 else "collapsed",
-        )
-
-        boy = cols[2].number_input(
-            "Boy (mm)",
-            min_value=0.0,
-            step=1.0,
-            key=key(mod_id, "boy", i),
-            label_visibility="visible" if i == 1 else "collapsed",
-        )
-
-        kg = kats[ebat] * boy / 1000 if boy else None
-        cols[3].markdown(f"**Kg/Adet (Br-3):** {fmt(kg)}")
-
-
-def render_profil_cetveli():
-    st.header("Profil Ağırlık Cetveli")
-
-    st.write(
-        "Aşağıdaki tabloda HEA / HEB / NPU / NPI profiller için 1 mt/kg ve 6 mt (Boy=6 mt) ağırlıkları yer alır."
-    )
-
-    arama = st.text_input("Malzeme veya ebat ara (örn: HEB 200, NPU 100, 220)", "")
-
-    df = profil_df.copy()
-    if arama.strip():
-        df = df[df["Malzeme"].str.contains(arama.strip(), case=False, na=False)]
-
-    # Türkçe format için kopya oluştur
-    df_disp = df.copy()
-    for c in ["1 mt/Kg", "Boy=6 mt/Kg"]:
-        df_disp[c] = df_disp[c].apply(lambda v: fmt(v, 2))
-
-    st.dataframe(df_disp, use_container_width=True)
-
-
-# -------------------------------------------------
-# KODLAMA SİSTEMATİĞİ
-# -------------------------------------------------
-URETICI_MAP = {
-    "HK": "HUM kaynaklı imalat",
-    "HT": "HUM talaşlı imalat",
-    "FL": "Lazerci & sac işleme fason",
-    "FT": "Fason talaşlı imalat",
-}
-
-
-def build_mamul_code(prefix="M", siparis="", unite="", mamul_no=""):
-    parts = [prefix, siparis, unite, mamul_no]
-    return "-".join([p for p in parts if p.strip()])
-
-
-def build_yari_mamul_code(
-    prefix="Y", uretici="HK", sip="", mno="", res="", a1="", a2="", a3=""
-):
-    parts = [prefix + uretici, sip, mno]
-    if res.strip():
-        parts.append(res)
-    for x in (a1, a2, a3):
-        if x.strip():
-            parts.append(x)
-    return "-".join(parts)
-
-
-def render_kodlama():
-    st.header("Kodlama Sistematiği")
-
-    sol, sag = st.columns([1, 2])
-    kod = ""
-
-    with sol:
-        tip = st.radio("Tip:", ["MAMUL", "YARI MAMUL"], key="kod_tip")
-
-        if tip == "MAMUL":
-            si = st.text_input("Sipariş No", key="kod_sip_m")
-            un = st.text_input("Ünite", key="kod_un_m")
-            mn = st.text_input("Mamul No", key="kod_no_m")
-            kod = build_mamul_code("M", si, un, mn)
-        else:
-            ure = st.selectbox(
-                "Üretici",
-                list(URETICI_MAP.keys()),
-                key="kod_u",
-            )
-            si = st.text_input("Sipariş No", key="kod_sip_y")
-            mn = st.text_input("Mamul No", key="kod_no_y")
-            rs = st.text_input("Resim No", key="kod_res_y")
-            a1 = st.text_input("Alt Poz 1", key="kod_a1")
-            a2 = st.text_input("Alt Poz 2", key="kod_a2")
-            a3 = st.text_input("Alt Poz 3", key="kod_a3")
-            kod = build_yari_mamul_code("Y", ure, si, mn, rs, a1, a2, a3)
-
-    with sag:
-        st.subheader("Üretilen Kod")
-        st.code(kod if kod else "—")
-        st.write("Uzunluk:", len(kod))
-
-        st.markdown("**Üretici Kodları Açıklaması**")
-        for k, v in URETICI_MAP.items():
-            st.write(f"- **{k}** : {v}")
-
-
-# -------------------------------------------------
-# ROUTER
-# -------------------------------------------------
-if selected_mod == "kestamit":
-    render_levha_multi("kestamit", "KESTAMİT LEVHALAR AD-KG – Kg/Adet (Br-2)", yogunluk=1.365)
-
-elif selected_mod == "celik_levha":
-    render_levha_multi("celik_levha", "ÇELİK LEVHALAR AD-KG – Kg/Adet (Br-2)", yogunluk=7.85)
-
-elif selected_mod == "celik_mil":
-    render_celik_mil()
-
-elif selected_mod == "altikose":
-    render_altikose()
-
-elif selected_mod == "kare":
-    render_kare()
-
-elif selected_mod == "lama":
-    render_lama()
-
-elif selected_mod == "kosebent":
-    render_kosebent()
-
-elif selected_mod == "celik_cek_boru":
-    render_celik_cek_boru()
-
-elif selected_mod == "dik_boru_kutu":
-    render_dik_boru_kutu()
-
-elif selected_mod == "npu":
-    render_profil("npu", "NPU AD-MM-KG", NPU_KATSAYI)
-
-elif selected_mod == "heb":
-    render_profil("heb", "HEB AD-MM-KG", HEB_KATSAYI)
-
-elif selected_mod == "profil_cetveli":
-    render_profil_cetveli()
-
-elif selected_mod == "kodlama":
-    render_kodlama()
-
-# -------------------------------------------------
-# FOOTER
-# -------------------------------------------------
-st.markdown("---")
-st.caption(f"HUM Paneli • Python {sys.version.split()[0]}")
-
+# -*- coding: utf-8 -*-
+import sys
+
+# `python -m hum_panel ...` ile çağrılırsa Streamlit yüklenmeden komut satırı çalışır.
+if __name__ == "__main__" and "streamlit" not in sys.modules:
+    from hum.cli import main
+
+    sys.exit(main())
+
+import math
+import os
+import re
+import tempfile
+import time
+import zipfile
+from functools import partial
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from hum import gecmis, hesap, katalog, kodlama, olcum, oturum
+from hum.arayuz import (
+    ALAN_ETIKETLERI,
+    CSS,
+    MODUL_ETIKETLERI,
+    MODULES,
+    MODUL_KODU,
+    logo_html,
+    profil_gorunum,
+    profil_indeksi,
+    profil_tablosu,
+)
+from hum.bicim import fmt, fmt_dizi
+from hum.kodlama import URETICI_MAP, build_mamul_code, build_yari_mamul_code
+
+# pandas ve ağır modüller (BOM, kesim, yerleşim, işler, ızgara) ilk
+# kullanıldıkları modül seçilince yüklenir; soğuk başlangıçta sadece
+# seçili modülün ihtiyacı import edilir.
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from hum import isler, siparis
+
+# -------------------------------------------------
+# GENEL AYARLAR
+# -------------------------------------------------
+_rerun_t0 = time.perf_counter()
+
+st.set_page_config(
+    page_title="HUM İşlemler Paneli",
+    layout="wide",
+)
+
+# Katalog dosyası değişince süreç yeniden başlatılmadan yüklenir.
+katalog.izlemeyi_baslat()
+
+# HUM_OLCUM=1 ise /metrics sunucusu (bkz. hum/olcum.py).
+olcum.baslat()
+
+# -------------------------------------------------
+# GENEL TASARIM (CSS)
+# -------------------------------------------------
+st.markdown(CSS, unsafe_allow_html=True)
+
+# -------------------------------------------------
+# YARDIMCI FONKSİYONLAR
+# -------------------------------------------------
+def key(mod_id: str, field: str, row: int) -> str:
+    """Benzersiz Streamlit key üretimi."""
+    return f"{mod_id}_{field}_{row}"
+
+
+# -------------------------------------------------
+# RESET FONKSİYONLARI
+# -------------------------------------------------
+RESET_FIELDS: Dict[str, List[str]] = {
+    "kestamit": ["kal", "en", "boy"],
+    "celik_levha": ["kal", "en", "boy"],
+    "celik_mil": ["cap", "boy"],
+    "altikose": ["ebat", "boy"],
+    "kare": ["ebat", "boy"],
+    "lama": ["gen", "yuk", "boy"],
+    "kosebent": ["ebat", "et", "boy"],
+    "celik_cek_boru": ["dis", "et", "boy", "ic"],
+    "dik_boru_kutu": ["boy"],
+    "npu": ["ebat", "boy"],
+    "heb": ["ebat", "boy"],
+}
+
+
+def reset_module_state(mod_id: str):
+    golge = st.session_state.get("_oturum_golge", {})
+    for i in range(1, 6):
+        for f in RESET_FIELDS.get(mod_id, []):
+            kname = key(mod_id, f, i)
+            if kname in st.session_state:
+                del st.session_state[kname]
+            golge.pop(kname, None)
+    for kname in ("izgara", "izgara_taban", "izgara_editor"):
+        st.session_state.pop(f"{mod_id}_{kname}", None)
+
+
+def reset_all():
+    for mod in RESET_FIELDS:
+        reset_module_state(mod)
+    st.rerun()
+
+
+# -------------------------------------------------
+# OTURUM DURUMU (çok kopyalı çalışma, bkz. hum/oturum.py)
+# -------------------------------------------------
+# Kopyalar arasında taşınan girişler: formül modülleri, kenar çubuğu ve tekil kod.
+OTURUM_SAYILARI = {key(m, f, i) for m, alanlar in RESET_FIELDS.items() for f in alanlar for i in range(1, 6)}
+OTURUM_METINLERI = {
+    "kullanici", "siparis_no",
+    "kod_sip_m", "kod_un_m", "kod_no_m", "kod_sip_y", "kod_no_y", "kod_res_y", "kod_a1", "kod_a2", "kod_a3",
+}
+OTURUM_ANAHTARLARI = {"izgara_modu", "canli_mod"}
+OTURUM_SECENEKLERI: Dict[str, List[str]] = {
+    "secili_modul": MODUL_ETIKETLERI,
+    "kod_tip": ["MAMUL", "YARI MAMUL"],
+    "kod_u": list(URETICI_MAP),
+}
+OTURUM_ALANLARI = OTURUM_SAYILARI | OTURUM_METINLERI | OTURUM_ANAHTARLARI | set(OTURUM_SECENEKLERI)
+
+
+def _oturum_gecerli(k: str, v: object) -> bool:
+    """Geri yüklenecek değer widget'ın kabul edeceği türde mi (eski sürüm verisi olabilir)."""
+    if k in OTURUM_SAYILARI:
+        return type(v) in (int, float) and math.isfinite(v) and v >= 0
+    if k in OTURUM_METINLERI:
+        return isinstance(v, str)
+    if k in OTURUM_ANAHTARLARI:
+        return isinstance(v, bool)
+    return v in OTURUM_SECENEKLERI.get(k, ())
+
+
+def _oturum_yukle():
+    """URL'deki jetonun girişlerini yeni Streamlit oturumuna bir kez yükler."""
+    depo = oturum.depo()
+    if depo is None:
+        return
+    jeton = st.query_params.get("oturum")
+    if not oturum.gecerli_jeton(jeton):
+        jeton = oturum.yeni_jeton()
+        st.query_params["oturum"] = jeton
+    if st.session_state.get("_oturum_jeton") == jeton:
+        return
+    golge = {k: v for k, v in depo.oku(jeton).items() if k in OTURUM_ALANLARI and _oturum_gecerli(k, v)}
+    for k, v in golge.items():
+        st.session_state[k] = v
+    st.session_state["_oturum_jeton"] = jeton
+    # Gölge, widget'ı o an çizilmeyen girişleri de tutar (Streamlit onları siler).
+    st.session_state["_oturum_golge"] = golge
+    st.session_state["_oturum_yazilan"] = dict(golge)
+
+
+def _oturum_kaydet():
+    """Değişen girişleri depoya bırakır; yazım arka planda birleştirilir."""
+    jeton = st.session_state.get("_oturum_jeton")
+    if jeton is None:
+        return
+    golge = st.session_state["_oturum_golge"]
+    for k in OTURUM_ALANLARI:
+        if k in st.session_state:
+            v = st.session_state[k]
+            # Varsayılan (boş/sıfır) girişler saklanmaz.
+            if v is None or v == "" or (v == 0 and not isinstance(v, bool)):
+                golge.pop(k, None)
+            else:
+                golge[k] = v
+    if golge != st.session_state["_oturum_yazilan"]:
+        st.session_state["_oturum_yazilan"] = dict(golge)
+        oturum.depo().yaz(jeton, golge)
+
+    # Sipariş ayrı anahtarda; rerun sadece kopyalar, paketi yazıcı üretir.
+    sip = st.session_state.get("siparis_alani")
+    if sip is not None:
+        durum = (sip.surum, tuple(sip.fiyat.tolist()))
+        if st.session_state.get("_siparis_yazilan") != durum:
+            from hum import siparis
+
+            st.session_state["_siparis_yazilan"] = durum
+            anlik = sip.anlik()
+            oturum.depo().yaz(f"{jeton}.siparis", lambda: siparis.paket(anlik))
+
+
+_oturum_yukle()
+
+
+# -------------------------------------------------
+# SIDEBAR
+# -------------------------------------------------
+with st.sidebar:
+    # HUM logosu (pakette gelen hum_logo.png, süreç başına bir kez hazırlanır)
+    st.markdown(logo_html(), unsafe_allow_html=True)
+
+    st.markdown('<div class="sidebar-title">İŞLEMLER</div>', unsafe_allow_html=True)
+
+    if st.button("Tümünü Sıfırla"):
+        reset_all()
+
+    st.markdown("---")
+
+    selection = st.radio("İşlem seç:", MODUL_ETIKETLERI, key="secili_modul")
+    selected_mod = MODUL_KODU[selection]
+
+    izgara_modu = selected_mod in hesap.FORMULLER and st.toggle(
+        "Izgara modu (çok satır)", key="izgara_modu"
+    )
+    # Varsayılan oturum durumuna yazılır; geri yüklenen değerle çakışmaz.
+    st.session_state.setdefault("canli_mod", True)
+    canli = st.toggle(
+        "Canlı hesap",
+        key="canli_mod",
+        help="Kapalıyken girişler 'Hesapla' düğmesiyle topluca gönderilir.",
+    )
+
+    st.markdown("---")
+    st.text_input("Kullanıcı", key="kullanici")
+    st.text_input(
+        "Sipariş No",
+        key="siparis_no",
+        help="Hesaplanan satırlar bu siparişin geçmişine yazılır.",
+    )
+
+# -------------------------------------------------
+# NAVBAR
+# -------------------------------------------------
+st.markdown(
+    '<div class="hum-navbar">HUM Makine Paneli</div>',
+    unsafe_allow_html=True,
+)
+
+# -------------------------------------------------
+# MODÜLLER
+# -------------------------------------------------
+def _gecmise_yaz(mod_id: str, satirlar: List[Tuple[object, Dict[str, float], float]]):
+    """``(satır anahtarı, girdiler, miktar)`` satırlarından değişenleri hesap geçmişine bırakır.
+
+    Rerun'lar aynı satırı tekrar hesaplar; oturumda son yazılan giriş
+    tutulur ve sadece giriş (ya da sipariş) değişince kayıt düşülür.
+    """
+    siparis = st.session_state.get("siparis_no", "").strip()
+    son = st.session_state.setdefault("gecmis_son", {})
+    yeni = []
+    for no, girdiler, miktar in satirlar:
+        if not miktar > 0:  # boş/sıfırlanmış satır: tekrar girilirse yeniden yazılır
+            son.pop((mod_id, no), None)
+            continue
+        imza = (siparis, girdiler)
+        if son.get((mod_id, no)) != imza:
+            son[(mod_id, no)] = imza
+            yeni.append((girdiler, miktar))
+    if yeni:
+        gecmis.depo().ekle(
+            st.session_state.get("kullanici", "").strip(),
+            siparis,
+            mod_id,
+            yeni,
+            hesap.FORMULLER[mod_id].birim,
+        )
+
+
+def _sonuclari_yaz(hucreler, degerler, etiket: str, mod_id: str, girdiler: Dict[str, list]):
+    """Vektörel sonuçları satır hücrelerine yazar ve geçmişe bırakır."""
+    degerler = degerler.tolist()
+    for hucre, v in zip(hucreler, degerler):
+        hucre.markdown(f"**{etiket}:** {fmt(v)}")
+    dolu = [i for i, v in enumerate(degerler) if v > 0]
+    st.session_state["modul_sonuclari"] = (
+        mod_id, {a: [girdiler[a][i] for i in dolu] for a in girdiler}, None, [degerler[i] for i in dolu]
+    )
+    _gecmise_yaz(mod_id, [
+        (i, {a: girdiler[a][i] for a in girdiler}, v) for i, v in enumerate(degerler)
+    ])
+
+
+@olcum.zamanla("hum_render_seconds")
+def render_levha_multi(mod_id: str, title: str, yogunluk: float):
+    """Kestamit & Çelik Levha modülü (Br-2)."""
+    st.header(title)
+    st.subheader("Kg/Adet (Br-2) hesaplanır")
+
+    br = "(Br-2)"
+    kal, en, boy, hucreler = [], [], [], []
+
+    with st.container():
+        for i in range(1, 6):
+            cols = st.columns([0.45, 1, 1, 1, 1])
+            cols[0].markdown(f"**{i}. Ürün**")
+
+            kal.append(cols[1].number_input(
+                "Kalınlık (mm)",
+                min_value=0.0,
+                step=0.1,
+                key=key(mod_id, "kal", i),
+                label_visibility="visible" if i == 1 else "collapsed",
+            ))
+            en.append(cols[2].number_input(
+                "En (mm)",
+                min_value=0.0,
+                step=1.0,
+                key=key(mod_id, "en", i),
+                label_visibility="visible" if i == 1 else "collapsed",
+            ))
+            boy.append(cols[3].number_input(
+                "Boy (mm)",
+                min_value=0.0,
+                step=1.0,
+                key=key(mod_id, "boy", i),
+                label_visibility="visible" if i == 1 else "collapsed",
+            ))
+            hucreler.append(cols[4])
+
+        kg = hesap.levha_kg(kal, en, boy, yogunluk)
+        _sonuclari_yaz(hucreler, kg, f"Kg/Adet {br}", mod_id, {"kal": kal, "en": en, "boy": boy})
+
+
+@olcum.zamanla("hum_render_seconds")
+def render_celik_mil():
+    st.header("ÇELİK MİL AD-MM-KG")
+    st.subheader("Kg/Adet (Br-3)")
+
+    cap, boy, hucreler = [], [], []
+
+    for i in range(1, 6):
+        cols = st.columns([0.45, 1, 1, 1])
+        cols[0].markdown(f"**{i}. Ürün**")
+
+        cap.append(cols[1].number_input(
+            "Çap (mm)",
+            min_value=0.0,
+            step=0.1,
+            key=key("celik_mil", "cap", i),
+            label_visibility="visible" if i == 1 else "collapsed",
+        ))
+        boy.append(cols[2].number_input(
+            "Boy (mm)",
+            min_value=0.0,
+            step=1.0,
+            key=key("celik_mil", "boy", i),
+            label_visibility="visible" if i == 1 else "collapsed",
+        ))
+        hucreler.append(cols[3])
+
+    _sonuclari_yaz(
+        hucreler, hesap.celik_mil_kg(cap, boy), "Kg/Adet (Br-3)", "celik_mil", {"cap": cap, "boy": boy}
+    )
+
+
+@olcum.zamanla("hum_render_seconds")
+def render_altikose():
+    st.header("ALTIKÖŞE AD-MM-KG")
+    st.subheader("Kg/Adet (Br-3)")
+
+    ebat, boy, hucreler = [], [], []
+
+    for i in range(1, 6):
+        cols = st.columns([0.45, 1, 1, 1])
+        cols[0].markdown(f"**{i}. Ürün**")
+
+        ebat.append(cols[1].number_input(
+            "Ebat (mm)",
+            min_value=0.0,
+            step=0.1,
+            key=key("altikose", "ebat", i),
+            label_visibility="visible" if i == 1 else "collapsed",
+        ))
+        boy.append(cols[2].number_input(
+            "Boy (mm)",
+            min_value=0.0,
+            step=1.0,
+            key=key("altikose", "boy", i),
+            label_visibility="visible" if i == 1 else "collapsed",
+        ))
+        hucreler.append(cols[3])
+
+    _sonuclari_yaz(
+        hucreler, hesap.altikose_kg(ebat, boy), "Kg/Adet (Br-3)", "altikose", {"ebat": ebat, "boy": boy}
+    )
+
+
+@olcum.zamanla("hum_render_seconds")
+def render_kare():
+    st.header("KARE AD-MM-KG")
+    st.subheader("Kg/Adet (Br-3)")
+
+    ebat, boy, hucreler = [], [], []
+
+    for i in range(1, 6):
+        cols = st.columns([0.45, 1, 1, 1])
+        cols[0].markdown(f"**{i}. Ürün**")
+
+        ebat.append(cols[1].number_input(
+            "Ebat (mm)",
+            min_value=0.0,
+            step=0.1,
+            key=key("kare", "ebat", i),
+            label_visibility="visible" if i == 1 else "collapsed",
+        ))
+        boy.append(cols[2].number_input(
+            "Boy (mm)",
+            min_value=0.0,
+            step=1.0,
+            key=key("kare", "boy", i),
+            label_visibility="visible" if i == 1 else "collapsed",
+        ))
+        hucreler.append(cols[3])
+
+    _sonuclari_yaz(
+        hucreler, hesap.kare_kg(ebat, boy), "Kg/Adet (Br-3)", "kare", {"ebat": ebat, "boy": boy}
+    )
+
+
+@olcum.zamanla("hum_render_seconds")
+def render_lama():
+    st.header("LAMA AD-MM-KG")
+    st.subheader("Kg/Adet (Br-3)")
+
+    gen, yuk, boy, hucreler = [], [], [], []
+
+    for i in range(1, 6):
+        cols = st.columns([0.45, 1, 1, 1, 1])
+        cols[0].markdown(f"**{i}. Ürün**")
+
+        gen.append(cols[1].number_input(
+            "Genişlik (mm)",
+            min_value=0.0,
+            step=0.1,
+            key=key("lama", "gen", i),
+            label_visibility="visible" if i == 1 else "collapsed",
+        ))
+        yuk.append(cols[2].number_input(
+            "Yükseklik (mm)",
+            min_value=0.0,
+            step=0.1,
+            key=key("lama", "yuk", i),
+            label_visibility="visible" if i == 1 else "collapsed",
+        ))
+        boy.append(cols[3].number_input(
+            "Boy (mm)",
+            min_value=0.0,
+            step=1.0,
+            key=key("lama", "boy", i),
+            label_visibility="visible" if i == 1 else "collapsed",
+        ))
+        hucreler.append(cols[4])
+
+    _sonuclari_yaz(
+        hucreler, hesap.lama_kg(gen, yuk, boy), "Kg/Adet (Br-3)",
+        "lama", {"gen": gen, "yuk": yuk, "boy": boy},
+    )
+
+
+@olcum.zamanla("hum_render_seconds")
+def render_kosebent():
+    st.header("KÖŞEBENT AD-MM-KG")
+    st.subheader("Kg/Adet (Br-3)")
+
+    ebat, et, boy, hucreler = [], [], [], []
+
+    for i in range(1, 6):
+        cols = st.columns([0.45, 1, 1, 1, 1])
+        cols[0].markdown(f"**{i}. Ürün**")
+
+        ebat.append(cols[1].number_input(
+            "Ebat (mm)",
+            min_value=0.0,
+            step=0.1,
+            key=key("kosebent", "ebat", i),
+            label_visibility="visible" if i == 1 else "collapsed",
+        ))
+        et.append(cols[2].number_input(
+            "Et (mm)",
+            min_value=0.0,
+            step=0.1,
+            key=key("kosebent", "et", i),
+            label_visibility="visible" if i == 1 else "collapsed",
+        ))
+        boy.append(cols[3].number_input(
+            "Boy (mm)",
+            min_value=0.0,
+            step=1.0,
+            key=key("kosebent", "boy", i),
+            label_visibility="visible" if i == 1 else "collapsed",
+        ))
+        hucreler.append(cols[4])
+
+    _sonuclari_yaz(
+        hucreler, hesap.kosebent_kg(ebat, et, boy), "Kg/Adet (Br-3)",
+        "kosebent", {"ebat": ebat, "et": et, "boy": boy},
+    )
+
+
+@olcum.zamanla("hum_render_seconds")
+def render_celik_cek_boru():
+    st.header("ÇELİK ÇEKME BORU AD-MM-KG")
+    st.subheader("Kg/Adet (Br-3)")
+
+    dis_cap, et, boy, ic_cap, hucreler = [], [], [], [], []
+
+    for i in range(1, 6):
+        cols = st.columns([0.45, 1, 1, 1, 1, 1])
+        cols[0].markdown(f"**{i}. Ürün**")
+
+        dis_cap.append(cols[1].number_input(
+            "Dış Çap (mm)",
+            min_value=0.0,
+            step=0.1,
+            key=key("celik_cek_boru", "dis", i),
+            label_visibility="visible" if i == 1 else "collapsed",
+        ))
+        et.append(cols[2].number_input(
+            "Et (mm)",
+            min_value=0.0,
+            step=0.1,
+            key=key("celik_cek_boru", "et", i),
+            label_visibility="visible" if i == 1 else "collapsed",
+        ))
+        boy.append(cols[3].number_input(
+            "Boy (mm)",
+            min_value=0.0,
+            step=1.0,
+            key=key("celik_cek_boru", "boy", i),
+            label_visibility="visible" if i == 1 else "collapsed",
+        ))
+        ic_cap.append(cols[4].number_input(
+            "İç Çap (mm) (opsiyonel)",
+            min_value=0.0,
+            step=0.1,
+            key=key("celik_cek_boru", "ic", i),
+            label_visibility="visible" if i == 1 else "collapsed",
+        ))
+        hucreler.append(cols[5])
+
+    kg = hesap.celik_cek_boru_kg(dis_cap, et, boy, ic_cap)
+    _sonuclari_yaz(
+        hucreler, kg, "Kg/Adet (Br-3)",
+        "celik_cek_boru", {"dis": dis_cap, "et": et, "boy": boy, "ic": ic_cap},
+    )
+
+
+@olcum.zamanla("hum_render_seconds")
+def render_dik_boru_kutu():
+    st.header("DİK BORU & KUTU PROFİL AD-MM-MT")
+    st.subheader("mt/Adet hesaplanır")
+
+    boy, hucreler = [], []
+
+    for i in range(1, 6):
+        cols = st.columns([0.45, 1, 1])
+        cols[0].markdown(f"**{i}. Ürün**")
+
+        boy.append(cols[1].number_input(
+            "Boy (mm)",
+            min_value=0.0,
+            step=1.0,
+            key=key("dik_boru_kutu", "boy", i),
+            label_visibility="visible" if i == 1 else "collapsed",
+        ))
+        hucreler.append(cols[2])
+
+    _sonuclari_yaz(hucreler, hesap.dik_boru_mt(boy), "mt/Adet", "dik_boru_kutu", {"boy": boy})
+
+
+@olcum.zamanla("hum_render_seconds")
+def render_profil(mod_id: str, title: str, kats: Dict[int, float]):
+    st.header(title)
+    st.subheader("Kg/Adet (Br-3)")
+
+    ebats = sorted(kats.keys())
+    ebat, boy, hucreler = [], [], []
+
+    for i in range(1, 6):
+        cols = st.columns([0.45, 1, 1, 1])
+        cols[0].markdown(f"**{i}. Ürün**")
+
+        ebat.append(cols[1].selectbox(
+            "Ebat (mm)",
+            ebats,
+            key=key(mod_id, "ebat", i),
+            label_visibility="visible" if i == 1 else "collapsed",
+        ))
+
+        boy.append(cols[2].number_input(
+            "Boy (mm)",
+            min_value=0.0,
+            step=1.0,
+            key=key(mod_id, "boy", i),
+            label_visibility="visible" if i == 1 else "collapsed",
+        ))
+        hucreler.append(cols[3])
+
+    _sonuclari_yaz(
+        hucreler, hesap.profil_kg(ebat, boy, kats), "Kg/Adet (Br-3)", mod_id, {"ebat": ebat, "boy": boy}
+    )
+
+
+def _cetvel_bolumleri(indeks, tablo: "pd.DataFrame", arama: str, toplam: int):
+    """Aramanın tüm sonuçları (önbellekteki nesneler düğme çizilirken alınır)."""
+    from hum import disari
+
+    _, satirlar = indeks.sayfa(arama, 1, max(toplam, 1))
+    tablo = tablo.iloc[satirlar]
+    return [disari.Bolum("Profil Ağırlık Cetveli", [
+        disari.Kolon("Malzeme", "Malzeme", genislik=16),
+        disari.Kolon("1 mt/Kg", "1 mt/Kg", 2, 10),
+        disari.Kolon("Boy=6 mt/Kg", "Boy=6 mt/Kg", 2, 12),
+    ], lambda: disari.parcala(tablo))]
+
+
+@olcum.zamanla("hum_render_seconds")
+def render_profil_cetveli(kat: katalog.Katalog):
+    st.header("Profil Ağırlık Cetveli")
+
+    st.write(
+        "Aşağıdaki tabloda HEA / HEB / NPU / NPI profiller için 1 mt/kg ve 6 mt (Boy=6 mt) ağırlıkları yer alır."
+    )
+
+    arama = st.text_input("Malzeme veya ebat ara (örn: HEB 200, NPU 100, 220)", "")
+    indeks = profil_indeksi(kat.surum, kat)
+
+    sol, sag = st.columns([1, 1])
+    sayfa_boyu = sol.selectbox("Sayfa boyu", [25, 50, 100, 250], index=1, key="cetvel_sayfa_boyu")
+    toplam, _ = indeks.sayfa(arama, 1, sayfa_boyu)
+    sayfa_sayisi = max(1, -(-toplam // sayfa_boyu))
+    if st.session_state.get("cetvel_sayfa", 1) > sayfa_sayisi:
+        st.session_state["cetvel_sayfa"] = 1
+    sayfa = sag.number_input(
+        f"Sayfa (1–{sayfa_sayisi})",
+        min_value=1,
+        max_value=sayfa_sayisi,
+        value=1,
+        step=1,
+        key="cetvel_sayfa",
+    )
+
+    # İndeks eşleşmeleri önceden formatlanmış tablodan sadece bu sayfayı seçer.
+    _, satirlar = indeks.sayfa(arama, int(sayfa), sayfa_boyu)
+    st.caption(f"{toplam} sonuç")
+    # Dışa aktarma sayfayı değil, aramanın tüm sonuçlarını içerir.
+    _indirme_dugmeleri(
+        "profil_cetveli",
+        "Profil Ağırlık Cetveli" + (f" – {arama.strip()}" if arama.strip() else ""),
+        partial(_cetvel_bolumleri, indeks, profil_tablosu(kat.surum, kat), arama, toplam),
+        "cetvel_disari",
+        disabled=not toplam,
+    )
+    # Ölçümde seçim + widget serileştirmesi ayrı görünür.
+    with olcum.sure("hum_adim_seconds", adim="cetvel_dataframe"):
+        st.dataframe(profil_gorunum(kat.surum, kat).iloc[satirlar], use_container_width=True)
+
+    render_ters_arama(kat)
+
+
+TERS_ARAMA_TURLERI = {
+    "aralik": "Aralıkta",
+    "en_hafif": "En az (aile başına en hafif)",
+    "en_yakin": "En yakın",
+}
+
+
+@olcum.zamanla("hum_render_seconds")
+def render_ters_arama(kat: katalog.Katalog):
+    import pandas as pd
+
+    st.markdown("---")
+    st.subheader("Ağırlığa / Kesite Göre Bul")
+    indeks = kat.agirlik_indeksi()
+
+    c1, c2, c3 = st.columns([1, 1, 2])
+    olcu = c1.radio("Ölçüt", ["kg_m", "kesit"], key="ters_olcu",
+                    format_func=lambda o: "1 mt/Kg" if o == "kg_m" else "Kesit (cm²)")
+    tur = c2.radio("Sorgu", list(TERS_ARAMA_TURLERI), key="ters_tur", format_func=TERS_ARAMA_TURLERI.get)
+    aileler = c3.multiselect("Aileler (boş: tümü)", indeks.aileler, key="ters_aileler")
+
+    d1, d2 = st.columns(2)
+    if tur == "aralik":
+        alt = d1.number_input("En az", min_value=0.0, value=40.0, step=1.0, key="ters_alt")
+        ust = d2.number_input("En çok", min_value=0.0, value=60.0, step=1.0, key="ters_ust")
+        profiller = indeks.aralik(alt, ust, aileler, olcu)
+    elif tur == "en_hafif":
+        en_az = d1.number_input("En az", min_value=0.0, value=40.0, step=1.0, key="ters_en_az")
+        profiller = indeks.en_hafif(en_az, aileler, olcu)
+    else:
+        hedef = d1.number_input("Hedef", min_value=0.0, value=50.0, step=1.0, key="ters_hedef")
+        k = d2.number_input("Sonuç sayısı", min_value=1, max_value=50, value=5, step=1, key="ters_k")
+        profiller = indeks.en_yakin(hedef, int(k), aileler, olcu)
+
+    st.caption(f"{len(profiller)} profil")
+    if not profiller:
+        return
+    tablo = pd.DataFrame({
+        "Malzeme": [p.ad for p in profiller],
+        "1 mt/Kg": [p.kg_m for p in profiller],
+        "Kesit (cm²)": [p.kesit for p in profiller],
+    })
+    tablo.insert(2, "Boy=6 mt/Kg", tablo["1 mt/Kg"] * 6)
+    for c in ["1 mt/Kg", "Boy=6 mt/Kg", "Kesit (cm²)"]:
+        tablo[c] = fmt_dizi(tablo[c].to_numpy(), 2)
+    st.dataframe(tablo, use_container_width=True, hide_index=True)
+
+
+# -------------------------------------------------
+# ÖZEL KESİT (GENEL KESİT MOTORU)
+# -------------------------------------------------
+# Şekiller ``hum.kesit.SEKILLER``'dan gelir; yeni profil tipi için burada
+# kod gerekmez. "cokgen": kullanıcının girdiği köşe listesi.
+OZEL_KESIT_SATIR = 10
+COKGEN_ORNEK = "0;0\n100;0\n100;60\n0;60\n\n20;20\n40;20\n40;40\n20;40"
+
+
+def _cokgen_metni(metin: str) -> Tuple[List[Tuple[float, float]], List[List[Tuple[float, float]]]]:
+    """``x;y`` satırları; boş satır çokgenleri ayırır (ilki dış, kalanlar delik)."""
+    parcalar: List[List[Tuple[float, float]]] = [[]]
+    for satir in metin.splitlines():
+        satir = satir.strip()
+        if not satir:
+            if parcalar[-1]:
+                parcalar.append([])
+            continue
+        degerler = satir.replace(",", ".").replace(";", " ").split()
+        if len(degerler) != 2:
+            raise ValueError(f"Köşe 'x;y' biçiminde olmalı: {satir!r}")
+        parcalar[-1].append((float(degerler[0]), float(degerler[1])))
+    parcalar = [p for p in parcalar if p]
+    if not parcalar:
+        raise ValueError("Köşe girin.")
+    return parcalar[0], parcalar[1:]
+
+
+@olcum.zamanla("hum_render_seconds")
+def render_ozel_kesit(kat: katalog.Katalog):
+    import numpy as np
+    import pandas as pd
+
+    from hum import kesit
+
+    st.header("ÖZEL KESİT AD-MM-KG")
+    st.caption(
+        "Kesit parametrik şekilden ya da köşe koordinatlarından (delikli) tanımlanır; "
+        "alan bir kez hesaplanır, kg her boy ve malzeme için toplu bulunur."
+    )
+
+    c1, c2 = st.columns(2)
+    sekil_adi = c1.selectbox(
+        "Kesit",
+        [*kesit.SEKILLER, "cokgen"],
+        format_func=lambda s: kesit.SEKILLER[s].etiket if s in kesit.SEKILLER else "Çokgen (koordinat)",
+        key="ozel_kesit_sekil",
+    )
+    malzemeler = kat.malzemeler()
+    malzeme = c2.selectbox(
+        "Malzeme",
+        malzemeler,
+        index=malzemeler.index("celik") if "celik" in malzemeler else 0,
+        format_func=lambda m: f"{m} ({fmt(kat.yogunluk(m))} g/cm³)",
+        key="ozel_kesit_malzeme",
+    )
+
+    if sekil_adi == "cokgen":
+        metin = st.text_area(
+            "Köşeler (mm, her satır x;y — boş satırdan sonrakiler delik)",
+            COKGEN_ORNEK,
+            height=180,
+            key="ozel_kesit_cokgen",
+        )
+        try:
+            sekil = kesit.cokgen(*_cokgen_metni(metin))
+        except ValueError as e:
+            st.error(str(e))
+            return
+    else:
+        sekil = kesit.SEKILLER[sekil_adi]
+
+    etiketler = {**ALAN_ETIKETLERI, **dict(sekil.etiketler)}
+    alanlar = [*sekil.alanlar, "boy", "adet"]
+    taban = pd.DataFrame({c: pd.Series([None] * OZEL_KESIT_SATIR, dtype="float64") for c in alanlar})
+    taban["adet"] = 1.0
+    kolon_ayari = {c: st.column_config.NumberColumn(etiketler[c], min_value=0.0) for c in alanlar}
+    kolon_ayari["adet"] = st.column_config.NumberColumn("Adet", min_value=0, step=1)
+
+    sol, sag = st.columns([3, 2])
+    with sol:
+        duzenlenen = st.data_editor(
+            taban,
+            column_config=kolon_ayari,
+            num_rows="dynamic",
+            use_container_width=True,
+            key=f"ozel_kesit_{sekil_adi}_editor",
+        )
+    girdi = duzenlenen.apply(pd.to_numeric, errors="coerce").fillna({"adet": 1.0}).fillna(0.0)
+    parametreler = {a: girdi[a].to_numpy() for a in sekil.alanlar}
+    alan = np.broadcast_to(kesit.alan(sekil, parametreler), len(girdi))
+    kg = kesit.kg(sekil, parametreler, girdi["boy"].to_numpy(), malzeme)
+    toplam = kg * girdi["adet"].to_numpy()
+
+    with sag:
+        sonuc = pd.DataFrame({
+            "Alan (mm²)": fmt_dizi(alan, 2, binlik=True),
+            "Kg/mt": fmt_dizi(alan * kat.yogunluk(malzeme) * 1e-3, 3),
+            "Kg/Adet": fmt_dizi(kg),
+            "Kg Toplam": fmt_dizi(toplam, 3, binlik=True),
+        }, index=girdi.index)
+        st.dataframe(sonuc, use_container_width=True)
+
+    m1, m2 = st.columns(2)
+    m1.metric("Hesaplanan satır", int(np.count_nonzero(~np.isnan(kg))))
+    m2.metric("Toplam Kg", fmt(float(np.nansum(toplam))))
+
+
+# -------------------------------------------------
+# KESİM PLANI (BOY)
+# -------------------------------------------------
+# Boy bazlı kesilen malzemeler; kg/m formülden boy=1000 ile bulunur.
+KESIM_MALZEMELERI = ["celik_mil", "altikose", "kare", "lama", "kosebent", "celik_cek_boru", "npu", "heb"]
+
+
+_BINLIK = re.compile(r"\d{1,3}(\.\d{3})+")
+
+
+def _stok_boylari(metin: str) -> List[float]:
+    """``;`` ya da boşlukla ayrılmış stok boyları; virgül ondalık ayracıdır
+    (``6000,5`` ya da ``6.000,5``), virgülsüz ``6.000`` binlik gruplamadır."""
+    boylar = []
+    for t in metin.replace(";", " ").split():
+        if "," in t or _BINLIK.fullmatch(t):
+            t = t.replace(".", "").replace(",", ".")
+        try:
+            boylar.append(float(t))
+        except ValueError:
+            raise ValueError(f"Geçersiz stok boyu: {t!r}") from None
+    return boylar
+
+
+@olcum.zamanla("hum_render_seconds")
+def render_kesim(kat: katalog.Katalog):
+    import pandas as pd
+
+    from hum import kesim
+
+    st.header("Kesim Planı (Boy)")
+    st.write(
+        "Parça boyları ve adetlerinden kaç stok bar alınacağını, kesim desenlerini "
+        "ve fireyi hesaplar."
+    )
+    etiketler = dict(MODULES)
+
+    sol, sag = st.columns([1, 2])
+    with sol:
+        mod_id = st.selectbox(
+            "Malzeme", KESIM_MALZEMELERI, format_func=etiketler.get, key="kesim_malzeme"
+        )
+        olcu = {}
+        for alan in hesap.FORMULLER[mod_id].alanlar:
+            if alan == "boy":
+                continue
+            if mod_id in ("npu", "heb"):
+                olcu[alan] = st.selectbox(
+                    ALAN_ETIKETLERI[alan], sorted(kat.modul_katsayi(mod_id)), key=f"kesim_{mod_id}_{alan}"
+                )
+            else:
+                olcu[alan] = st.number_input(
+                    ALAN_ETIKETLERI[alan], min_value=0.0, step=1.0, key=f"kesim_{mod_id}_{alan}"
+                )
+        kolonlar = {a: [v] for a, v in olcu.items()}
+        kg_m = float(hesap.modul_hesapla(mod_id, {**kolonlar, "boy": [1000.0]})[0])
+        st.markdown(f"**Kg/mt:** {fmt(kg_m)}")
+
+        stok_metni = st.text_input(
+            "Stok boyları (mm)", "6000", key="kesim_stok", help="Birden çok boy ; ya da boşlukla ayrılır."
+        )
+        kerf = st.number_input("Testere payı (mm)", min_value=0.0, value=3.0, step=0.5, key="kesim_kerf")
+        sure = st.slider(
+            "İyileştirme süresi (sn)", 0.0, 5.0, 0.2, 0.1, key="kesim_sure",
+            help="0: sadece hızlı sezgisel plan.",
+        )
+        arka_plan = st.toggle(
+            "Arka planda çalıştır", key="kesim_arka_plan",
+            help="Uzun parça listelerinde plan panel yerine iş kuyruğunda hesaplanır.",
+        )
+
+    with sag:
+        taban = pd.DataFrame({"boy": pd.Series([None] * 10, dtype="float64"), "adet": 1.0})
+        parcalar = st.data_editor(
+            taban,
+            column_config={
+                "boy": st.column_config.NumberColumn("Boy (mm)", min_value=0.0),
+                "adet": st.column_config.NumberColumn("Adet", min_value=0, step=1),
+            },
+            num_rows="dynamic",
+            use_container_width=True,
+            key="kesim_parcalar",
+        )
+
+    parcalar = parcalar.apply(pd.to_numeric, errors="coerce").dropna()
+    hatali = parcalar.index[(parcalar["adet"] < 1) | (parcalar["adet"] % 1 != 0)]
+    if len(hatali):
+        st.error("Adet pozitif tam sayı olmalı; satır: " + ", ".join(str(i + 1) for i in hatali))
+        return
+    try:
+        stoklar = _stok_boylari(stok_metni)
+    except ValueError as e:
+        st.error(str(e))
+        return
+    if arka_plan:
+        if st.button("Kuyruğa gönder", type="primary", key="kesim_gonder", disabled=parcalar.empty):
+            _is_gonder("kesim", f"Kesim – {etiketler[mod_id]}", {
+                "parcalar": list(zip(parcalar["boy"].tolist(), parcalar["adet"].tolist())),
+                "stoklar": stoklar,
+                "kerf": kerf,
+                "sure": sure,
+                "kg_m": kg_m,
+            })
+        return
+    try:
+        plan = kesim.planla(
+            zip(parcalar["boy"].tolist(), parcalar["adet"].tolist()),
+            stoklar,
+            kerf=kerf,
+            sure=sure,
+        )
+    except ValueError as e:
+        st.error(str(e))
+        return
+    if not plan.bar_sayisi:
+        st.info("Parça boyu ve adet girin.")
+        return
+
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Stok bar", plan.bar_sayisi, help=f"Alt sınır: {plan.alt_sinir}")
+    m2.metric("Verim", f"%{fmt(plan.verim * 100, 1)}")
+    m3.metric("Fire (mt)", fmt(plan.fire_mm / 1000))
+    m4.metric("Satın alma (Kg)", fmt(plan.satin_alma_kg(kg_m)))
+
+    st.write(
+        "Stok: " + ", ".join(f"{n} × {s:g} mm" for s, n in plan.stok_adetleri.items())
+    )
+    st.dataframe(
+        pd.DataFrame(
+            {
+                "Adet": [d.adet for d in plan.desenler],
+                "Stok (mm)": [d.stok for d in plan.desenler],
+                "Kesimler (mm)": [" + ".join(f"{p:g}" for p in d.parcalar) for d in plan.desenler],
+                "Fire (mm)": [round(d.fire, 1) for d in plan.desenler],
+            }
+        ),
+        use_container_width=True,
+        hide_index=True,
+    )
+
+
+# -------------------------------------------------
+# LEVHA YERLEŞİM (NESTING)
+# -------------------------------------------------
+def _levha_olculeri(metin: str) -> List[Tuple[float, float]]:
+    """``"1500x3000, 2000x6000"`` -> ``[(1500, 3000), (2000, 6000)]``."""
+    olculer = []
+    for t in metin.replace(";", " ").replace(",", " ").split():
+        en, _, boy = t.lower().replace("×", "x").replace("*", "x").partition("x")
+        olculer.append((float(en), float(boy)))
+    return olculer
+
+
+@olcum.zamanla("hum_render_seconds")
+def render_levha_yerlesim():
+    import pandas as pd
+
+    from hum import yerlesim
+
+    st.header("Levha Yerleşim (Nesting)")
+    st.write(
+        "Kestamit ve çelik levha parçalarını kalınlığa göre gruplar, standart levhalara "
+        "yerleştirir; levha sayısı, verim ve satın alınacak ağırlığı verir."
+    )
+    etiketler = dict(MODULES)
+
+    sol, sag = st.columns([1, 2])
+    with sol:
+        olcu_metni = {}
+        for m in yerlesim.MALZEMELER:
+            olcu_metni[m] = st.text_input(
+                f"{etiketler[m].split(' AD')[0]} levha ölçüleri (en x boy)",
+                ", ".join(f"{e:g}x{b:g}" for e, b in yerlesim.STANDART_LEVHALAR[m]),
+                key=f"yerlesim_levha_{m}",
+            )
+        kerf = st.number_input("Kesim payı (mm)", min_value=0.0, value=3.0, step=0.5, key="yerlesim_kerf")
+        dondur = st.checkbox("Parça 90° çevrilebilir", value=True, key="yerlesim_dondur")
+
+    with sag:
+        taban = pd.DataFrame({
+            "malzeme": pd.Series(["celik_levha"] * 10, dtype="object"),
+            **{c: pd.Series([None] * 10, dtype="float64") for c in ("kal", "en", "boy")},
+            "adet": 1.0,
+        })
+        kolon_ayari = {
+            c: st.column_config.NumberColumn(ALAN_ETIKETLERI[c], min_value=0.0) for c in ("kal", "en", "boy")
+        }
+        kolon_ayari["malzeme"] = st.column_config.SelectboxColumn(
+            "Malzeme", options=list(yerlesim.MALZEMELER), required=True
+        )
+        kolon_ayari["adet"] = st.column_config.NumberColumn("Adet", min_value=0, step=1)
+        parcalar = st.data_editor(
+            taban,
+            column_config=kolon_ayari,
+            num_rows="dynamic",
+            use_container_width=True,
+            key="yerlesim_parcalar",
+        )
+
+    olculer = parcalar[["kal", "en", "boy", "adet"]].apply(pd.to_numeric, errors="coerce")
+    gecerli = olculer.notna().all(axis=1) & parcalar["malzeme"].isin(yerlesim.MALZEMELER)
+    try:
+        plan = yerlesim.yerlestir(
+            zip(
+                parcalar["malzeme"][gecerli],
+                olculer["kal"][gecerli],
+                olculer["en"][gecerli],
+                olculer["boy"][gecerli],
+                olculer["adet"][gecerli],
+            ),
+            {m: _levha_olculeri(v) for m, v in olcu_metni.items()},
+            kerf=kerf,
+            dondur=dondur,
+        )
+    except ValueError as e:
+        st.error(str(e))
+        return
+    if not plan.gruplar:
+        st.info("Malzeme, kalınlık, en, boy ve adet girin.")
+        return
+
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Levha", plan.levha_sayisi)
+    m2.metric("Satın alma (Kg)", fmt(plan.kg))
+    m3.metric("Hesap süresi (sn)", fmt(plan.sure), help=f"Sipariş özeti: {plan.ozet[:12]}")
+
+    st.dataframe(
+        pd.DataFrame({
+            "Malzeme": [etiketler[g.malzeme].split(" AD")[0] for g in plan.gruplar],
+            "Kalınlık (mm)": [g.kal for g in plan.gruplar],
+            "Levha (mm)": [f"{g.levha_en:g} x {g.levha_boy:g}" for g in plan.gruplar],
+            "Levha Adedi": [g.levha_sayisi for g in plan.gruplar],
+            "Parça Adedi": [g.parca_adedi for g in plan.gruplar],
+            "Verim (%)": [round(g.verim * 100, 1) for g in plan.gruplar],
+            "Kg": [round(g.kg, 2) for g in plan.gruplar],
+        }),
+        use_container_width=True,
+        hide_index=True,
+    )
+
+
+# -------------------------------------------------
+# TOPLU BOM HESABI
+# -------------------------------------------------
+@olcum.zamanla("hum_render_seconds")
+def render_bom():
+    from hum import bom
+
+    st.header("Toplu BOM Hesabı")
+    st.write(
+        "CSV veya XLSX malzeme listesi yükleyin. Kolonlar: `malzeme` "
+        f"({', '.join(hesap.FORMULLER)}), ölçüler "
+        f"({', '.join(hesap.OLCU_ALANLARI)}) ve `adet`."
+    )
+
+    dosya = st.file_uploader("BOM dosyası", type=["csv", "xlsx"], key="bom_dosya")
+    parca_boyu = st.number_input(
+        "Blok boyu (satır)",
+        min_value=1_000,
+        max_value=1_000_000,
+        value=bom.PARCA_BOYU,
+        step=10_000,
+        key="bom_parca",
+    )
+    if dosya is None:
+        return
+    b1, b2 = st.columns([1, 5])
+    hemen = b1.button("Hesapla", key="bom_hesapla")
+    if b2.button("Arka planda hesapla", key="bom_arka_plan", help="Büyük dosyalarda paneli bekletmez."):
+        _is_gonder("bom", dosya.name, {"parca_boyu": int(parca_boyu)}, dosya.getvalue(), dosya.name)
+    if not hemen:
+        return
+
+    toplam = bom.BomToplam()
+    durum = st.empty()
+    onizleme = None
+    satir = 0
+
+    # Hesap sırasında bellekte sadece bir blok tutulur, sonuçlar diske yazılır.
+    # İndirme düğmesi ise dosyanın tamamını belleğe okur; çok büyük dosyalar
+    # için "Arka planda hesapla" sonucu iş klasöründen, tıklanınca sunar.
+    cikti = tempfile.NamedTemporaryFile(
+        "w+", suffix=".csv", encoding="utf-8", newline="", delete=False
+    )
+    try:
+        try:
+            with cikti:
+                for i, df in enumerate(bom.bom_isle(dosya, dosya.name, int(parca_boyu), toplam)):
+                    df.to_csv(cikti, index=False, header=(i == 0))
+                    if onizleme is None:
+                        onizleme = df.head(200)
+                    satir += len(df)
+                    durum.write(f"İşlenen satır: {satir:,}".replace(",", "."))
+        except (ValueError, UnicodeDecodeError, KeyError, zipfile.BadZipFile) as e:
+            st.error(f"BOM dosyası okunamadı: {e}")
+            return
+
+        st.subheader("Malzeme Toplamları")
+        tablo = toplam.tablo()
+        tablo["Toplam"] = fmt_dizi(tablo["Toplam"].to_numpy(), 3, binlik=True)
+        st.dataframe(tablo, use_container_width=True)
+        if toplam.hatali:
+            st.warning(f"{toplam.hatali} satır eksik/tanınmayan veri nedeniyle hesaplanamadı.")
+
+        if onizleme is not None:
+            st.subheader("İlk Satırlar")
+            st.dataframe(onizleme, use_container_width=True)
+
+        with open(cikti.name, "rb") as f:
+            st.download_button(
+                "Sonuçları indir (CSV)",
+                f,
+                file_name=f"{os.path.splitext(dosya.name)[0]}_hesap.csv",
+                mime="text/csv",
+            )
+    finally:
+        os.unlink(cikti.name)
+
+
+# -------------------------------------------------
+# DIŞA AKTARMA (CSV / XLSX / PDF, bkz. hum/disari.py)
+# -------------------------------------------------
+DISARI_BICIMLERI = ("csv", "xlsx", "pdf")
+
+
+def _kisa_etiket(alan: str) -> str:
+    return ALAN_ETIKETLERI[alan].split(" (")[0]
+
+
+def _disari_ver(bicim: str, baslik: str, bolumler) -> bytes:
+    """İndirme anında çalışır: dosya üretilir ya da içerik özetiyle önbellekten okunur."""
+    from hum import disari
+
+    with open(disari.dosya(bicim, baslik, bolumler()), "rb") as f:
+        return f.read()
+
+
+def _indirme_dugmeleri(dosya_adi: str, baslik: str, bolumler, anahtar: str, disabled: bool = False):
+    """Biçim başına bir indirme düğmesi; dosya sadece tıklanınca üretilir."""
+    for kolon, bicim in zip(st.columns(len(DISARI_BICIMLERI)), DISARI_BICIMLERI):
+        kolon.download_button(
+            bicim.upper(),
+            data=partial(_disari_ver, bicim, baslik, bolumler),
+            file_name=f"{dosya_adi}.{bicim}",
+            key=f"{anahtar}_{bicim}",
+            on_click="ignore",
+            disabled=disabled,
+            use_container_width=True,
+        )
+
+
+def _modul_bolumleri(mod_id: str, title: str, kolonlar: Dict[str, list], adet: list, miktar: list):
+    import pandas as pd
+
+    from hum import disari
+
+    birim = "Kg" if hesap.FORMULLER[mod_id].birim == "kg" else "mt"
+    df = pd.DataFrame(kolonlar).assign(
+        adet=adet, miktar_adet=miktar, miktar_toplam=[m * a for m, a in zip(miktar, adet)]
+    )
+    kolon = [disari.Kolon(a, _kisa_etiket(a), 2, 10) for a in hesap.FORMULLER[mod_id].alanlar] + [
+        disari.Kolon("adet", "Adet", 0, 8),
+        disari.Kolon("miktar_adet", f"{birim}/Adet", 3, 12),
+        disari.Kolon("miktar_toplam", f"{birim} Toplam", 3, 14),
+    ]
+    return [disari.Bolum(title, kolon, lambda: [df])]
+
+
+# -------------------------------------------------
+# SİPARİŞ ÇALIŞMA ALANI
+# -------------------------------------------------
+SIPARIS_SAYFA_BOYLARI = [100, 250, 500, 1000]
+
+
+def _siparis() -> "siparis.Siparis":
+    """Oturumun sipariş çalışma alanı.
+
+    İlk kullanımda oturum deposundaki sipariş (başka kopyada başlamış
+    olabilir) geri yüklenir; yoksa varsayılan fiyatlarla boş kurulur.
+    """
+    from hum import siparis
+
+    if "siparis_alani" not in st.session_state:
+        sip = None
+        jeton = st.session_state.get("_oturum_jeton")
+        if jeton is not None:
+            veri = oturum.depo().oku(f"{jeton}.siparis")
+            try:
+                sip = siparis.Siparis.paketten(veri) if veri else None
+            except ValueError:
+                sip = None
+            if sip is not None:
+                st.session_state["_siparis_yazilan"] = (sip.surum, tuple(sip.fiyat.tolist()))
+        st.session_state["siparis_alani"] = siparis.Siparis(siparis.fiyatlari_oku()) if sip is None else sip
+    return st.session_state["siparis_alani"]
+
+
+def _siparise_ekle(mod_id: str, kolonlar: Dict[str, list], adet: list):
+    _siparis().ekle([mod_id] * len(adet), kolonlar, adet)
+    st.toast(f"{len(adet)} satır siparişe eklendi.")
+
+
+def _sonuc_cubugu(mod_id: str, title: str):
+    """Formül modülünün hesaplanan satırları: siparişe ekleme ve dışa aktarma."""
+    sonuc_mod, kolonlar, adet, miktar = st.session_state.get("modul_sonuclari", (None, {}, None, []))
+    if sonuc_mod != mod_id:
+        kolonlar, adet, miktar = {}, None, []
+    n = len(miktar)
+
+    sol, orta, sag = st.columns([1, 1, 3], vertical_alignment="bottom")
+    if adet is None:
+        # Tekil satırlarda adet burada girilir; ızgara modu kendi adet kolonunu kullanır.
+        adet = [float(sol.number_input("Adet", min_value=1, value=1, step=1, key=f"{mod_id}_siparis_adet"))] * n
+    orta.button(
+        f"Siparişe ekle ({n} satır)",
+        key=f"{mod_id}_siparise_ekle",
+        disabled=n == 0,
+        on_click=_siparise_ekle,
+        args=(mod_id, kolonlar, list(adet)),
+    )
+    with sag:
+        _indirme_dugmeleri(
+            mod_id, title, partial(_modul_bolumleri, mod_id, title, kolonlar, list(adet), miktar),
+            f"{mod_id}_disari", disabled=n == 0,
+        )
+    # Sipariş sayfası hiç açılmadıysa pandas burada yüklenmez.
+    sip = st.session_state.get("siparis_alani")
+    if sip is not None:
+        sag.caption(f"Siparişte {len(sip):,} satır".replace(",", "."))
+
+
+def _siparis_ozeti(sip: "siparis.Siparis", islenen: int):
+    m1, m2, m3, m4, m5 = st.columns(5)
+    m1.metric("Satır", f"{len(sip):,}".replace(",", "."))
+    m2.metric("Toplam Kg", fmt_dizi([sip.toplam("kg")], 2, binlik=True)[0])
+    m3.metric("Toplam mt", fmt_dizi([sip.toplam("mt")], 2, binlik=True)[0])
+    m4.metric("Tutar (TL)", fmt_dizi([sip.tutar], 2, binlik=True, sabit=True)[0])
+    m5.metric("Bu rerun'da işlenen", islenen)
+    if sip.hatali:
+        st.warning(f"{sip.hatali} satır eksik/tanınmayan veri nedeniyle hesaplanamadı.")
+
+    aileler = sip.aile_toplamlari()
+    malzemeler = sip.malzeme_toplamlari()
+    for tablo in (aileler, malzemeler):
+        tablo["Adet"] = fmt_dizi(tablo["Adet"].to_numpy(), 0, binlik=True, sabit=True)
+        tablo["Miktar"] = fmt_dizi(tablo["Miktar"].to_numpy(), 3, binlik=True)
+        tablo["Tutar"] = fmt_dizi(tablo["Tutar"].to_numpy(), 2, binlik=True, sabit=True)
+    aileler["Birim Fiyat"] = fmt_dizi(aileler["Birim Fiyat"].to_numpy(), 2, binlik=True, sabit=True)
+
+    sol, sag = st.columns([3, 2])
+    sol.caption("Aile toplamları")
+    sol.dataframe(aileler, hide_index=True, use_container_width=True)
+    sag.caption("Malzeme toplamları")
+    sag.dataframe(malzemeler, hide_index=True, use_container_width=True)
+
+
+def _siparis_bolumleri(sip: "siparis.Siparis"):
+    """Toplamlar ve satırlar; satırlar tek seferde kopyalanır (özet ile yazım aynı veriyi görür)."""
+    from hum import disari
+
+    K = disari.Kolon
+    aileler, malzemeler, satirlar = sip.aile_toplamlari(), sip.malzeme_toplamlari(), sip.satirlar()
+    toplam_kolonlari = [
+        K("Satır", "Satır", 0, 9), K("Adet", "Adet", 0, 11),
+        K("Miktar", "Miktar", 3, 16), K("Tutar", "Tutar (TL)", 2, 18, sabit=True),
+    ]
+    satir_kolonlari = (
+        [K("malzeme", "Malzeme", genislik=14)]
+        + [K(a, _kisa_etiket(a), 2, 9) for a in hesap.OLCU_ALANLARI]
+        + [
+            K("adet", "Adet", 0, 7), K("birim", "Birim", genislik=5),
+            K("miktar_adet", "Miktar/Adet", 3, 12), K("miktar_toplam", "Miktar Toplam", 3, 14),
+            K("tutar", "Tutar (TL)", 2, 15, sabit=True),
+        ]
+    )
+    return [
+        disari.Bolum("Aile Toplamları", [
+            K("Malzeme", "Malzeme", genislik=9), K("Aile", "Aile", genislik=24), K("Birim", "Birim", genislik=5),
+            *toplam_kolonlari[:3], K("Birim Fiyat", "Birim Fiyat", 2, 12, sabit=True), toplam_kolonlari[3],
+        ], lambda: [aileler]),
+        disari.Bolum("Malzeme Toplamları", [
+            K("Malzeme", "Malzeme", genislik=9), K("Birim", "Birim", genislik=5), *toplam_kolonlari,
+        ], lambda: [malzemeler]),
+        disari.Bolum("Sipariş Satırları", satir_kolonlari, lambda: disari.parcala(satirlar)),
+    ]
+
+
+@olcum.zamanla("hum_render_seconds")
+def render_siparis():
+    """Tüm modüllerden sipariş satırları; adet, birim fiyat ve grup toplamları."""
+    import pandas as pd
+
+    from hum import siparis
+
+    st.header("Sipariş Çalışma Alanı")
+    st.write(
+        "Formül modüllerinde 'Siparişe ekle' ile, dosyadan ya da aşağıdaki "
+        "tabloya yazarak satır eklenir. Toplamlar sadece değişen satırlarla güncellenir."
+    )
+    sip = _siparis()
+    ozet = st.container()
+
+    with st.expander("Birim fiyatlar (TL/kg, dik boru TL/mt)"):
+        fiyatlar = st.data_editor(
+            pd.DataFrame(
+                {
+                    "Aile": [siparis.AILE_ETIKETLERI[a] for a in siparis.AILELER],
+                    "Birim": [hesap.FORMULLER[a].birim for a in siparis.AILELER],
+                    "Fiyat": sip.fiyat,
+                },
+                index=siparis.AILELER,
+            ),
+            column_config={"Fiyat": st.column_config.NumberColumn("Birim fiyat (TL)", min_value=0.0)},
+            disabled=["Aile", "Birim"],
+            hide_index=True,
+            key="siparis_fiyat",
+        )
+        sip.fiyat_ayarla(fiyatlar["Fiyat"].fillna(0.0).to_dict())
+
+    with st.expander("Dosyadan satır ekle (CSV/XLSX)"):
+        st.caption("Kolonlar Toplu BOM ile aynıdır: `malzeme`, ölçüler ve `adet`.")
+        dosya = st.file_uploader("Sipariş dosyası", type=["csv", "xlsx"], key="siparis_dosya")
+        if dosya is not None and st.button("Satırları ekle", key="siparis_dosya_ekle"):
+            from hum import bom
+
+            n = sum(len(sip.tablo_ekle(df)) for df in bom.bom_parcalari(dosya, dosya.name))
+            st.success(f"{n:,} satır eklendi.".replace(",", "."))
+
+    st.subheader("Satırlar")
+    s1, s2, s3 = st.columns([1, 1, 2], vertical_alignment="bottom")
+    sayfa_boyu = s1.selectbox("Sayfa boyu", SIPARIS_SAYFA_BOYLARI, index=2, key="siparis_sayfa_boyu")
+    sayfa_sayisi = max(1, -(-len(sip) // sayfa_boyu))
+    if st.session_state.get("siparis_sayfa_no", 1) > sayfa_sayisi:
+        st.session_state["siparis_sayfa_no"] = sayfa_sayisi
+    sayfa_no = s2.number_input(
+        f"Sayfa (1–{sayfa_sayisi})",
+        min_value=1,
+        max_value=sayfa_sayisi,
+        value=1,
+        step=1,
+        key="siparis_sayfa_no",
+    )
+    if s3.button("Siparişi temizle", key="siparis_temizle"):
+        sip.temizle()
+
+    # Sayfa değişince ya da sipariş bu sayfa dışından değişince (modülden,
+    # dosyadan ekleme) taban yeniden kurulur ve düzenleyici sıfırlanır.
+    konum = (int(sayfa_no), int(sayfa_boyu))
+    sayfa = st.session_state.get("siparis_sayfa")
+    if (
+        sayfa is None
+        or sayfa.siparis is not sip
+        or not sayfa.guncel
+        or st.session_state.get("siparis_sayfa_konum") != konum
+    ):
+        bas = (konum[0] - 1) * konum[1]
+        sayfa = siparis.SiparisSayfasi(sip, sip.idler()[bas:bas + konum[1]])
+        st.session_state.pop(f"siparis_editor_{st.session_state.get('siparis_taban_no', 0)}", None)
+        st.session_state["siparis_taban_no"] = st.session_state.get("siparis_taban_no", 0) + 1
+        st.session_state["siparis_sayfa"] = sayfa
+        st.session_state["siparis_sayfa_konum"] = konum
+
+    kolon_ayari = {
+        c: st.column_config.NumberColumn(ALAN_ETIKETLERI[c], min_value=0.0)
+        for c in hesap.OLCU_ALANLARI
+    }
+    kolon_ayari["malzeme"] = st.column_config.SelectboxColumn(
+        "Malzeme", options=list(siparis.AILELER), required=True
+    )
+    kolon_ayari["adet"] = st.column_config.NumberColumn("Adet", min_value=0, step=1)
+
+    sol, sag = st.columns([3, 2])
+    with sol:
+        duzenlenen = st.data_editor(
+            sayfa.taban,
+            column_config=kolon_ayari,
+            num_rows="dynamic",
+            use_container_width=True,
+            key=f"siparis_editor_{st.session_state['siparis_taban_no']}",
+        )
+    islenen = sayfa.uygula(duzenlenen)
+
+    sonuc = sayfa.sonuclar()
+    with sag:
+        st.dataframe(
+            pd.DataFrame(
+                {
+                    "Birim": sonuc["birim"],
+                    "Miktar/Adet": fmt_dizi(sonuc["miktar_adet"].to_numpy()),
+                    "Miktar Toplam": fmt_dizi(sonuc["miktar_toplam"].to_numpy(), 3, binlik=True),
+                    "Tutar (TL)": fmt_dizi(sonuc["tutar"].to_numpy(), 2, binlik=True, sabit=True),
+                },
+                index=sonuc.index,
+            ),
+            use_container_width=True,
+        )
+
+    with ozet:
+        _siparis_ozeti(sip, islenen)
+        siparis_no = st.session_state.get("siparis_no", "").strip()
+        _indirme_dugmeleri(
+            f"siparis_{siparis_no or 'calisma'}",
+            f"Sipariş {siparis_no}".strip(),
+            partial(_siparis_bolumleri, sip),
+            "siparis_disari",
+            disabled=not len(sip),
+        )
+
+
+# -------------------------------------------------
+# IZGARA MODU
+# -------------------------------------------------
+@olcum.zamanla("hum_render_seconds")
+def render_izgara(mod_id: str, title: str, kat: katalog.Katalog):
+    """Modülün data_editor tabanlı çok satırlı hali; sadece değişen satırlar hesaplanır."""
+    import pandas as pd
+
+    from hum import izgara
+
+    formul = hesap.FORMULLER[mod_id]
+    birim = "Kg" if formul.birim == "kg" else "mt"
+    st.header(title)
+    st.subheader(f"{birim}/Adet – ızgara modu")
+
+    durum_key = f"{mod_id}_izgara"
+    satir_sayisi = st.number_input(
+        "Satır sayısı",
+        min_value=1,
+        max_value=20_000,
+        value=20,
+        step=10,
+        key=f"{mod_id}_izgara_n",
+    )
+    taban = st.session_state.get(f"{durum_key}_taban")
+    if taban is None or len(taban) != satir_sayisi:
+        # Satır sayısı değişince tablo ve hesap durumu sıfırlanır.
+        taban = pd.DataFrame(
+            {c: pd.Series([None] * int(satir_sayisi), dtype="float64") for c in formul.alanlar}
+        )
+        taban["adet"] = 1.0
+        st.session_state[f"{durum_key}_taban"] = taban
+        st.session_state[durum_key] = izgara.IzgaraHesap(mod_id)
+    hesapci = st.session_state[durum_key]
+
+    kolon_ayari = {
+        c: st.column_config.NumberColumn(ALAN_ETIKETLERI[c], min_value=0.0)
+        for c in formul.alanlar
+    }
+    kolon_ayari["adet"] = st.column_config.NumberColumn("Adet", min_value=0, step=1)
+    if mod_id in ("npu", "heb"):
+        kolon_ayari["ebat"] = st.column_config.SelectboxColumn(
+            "Ebat (mm)", options=sorted(kat.modul_katsayi(mod_id))
+        )
+
+    sol, sag = st.columns([3, 2])
+    with sol:
+        duzenlenen = st.data_editor(
+            taban,
+            column_config=kolon_ayari,
+            num_rows="dynamic",
+            use_container_width=True,
+            key=f"{durum_key}_editor",
+        )
+    sonuc = hesapci.guncelle(duzenlenen)
+    _gecmise_yaz(mod_id, [(("izgara", i), g, m) for i, g, m in hesapci.son_hesaplananlar()])
+    dolu = hesapci.dolu_satirlar()
+    st.session_state["modul_sonuclari"] = (
+        mod_id,
+        {a: dolu[a].tolist() for a in formul.alanlar},
+        dolu["adet"].tolist(),
+        dolu["miktar_adet"].tolist(),
+    )
+
+    with sag:
+        st.dataframe(
+            sonuc.rename(columns={
+                "miktar_adet": f"{birim}/Adet",
+                "miktar_toplam": f"{birim} Toplam",
+            }),
+            use_container_width=True,
+        )
+
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Hesaplanan satır", hesapci.satir)
+    m2.metric("Toplam adet", f"{hesapci.adet:,.0f}".replace(",", "."))
+    m3.metric(f"Toplam {birim}", fmt(hesapci.toplam))
+    m4.metric("Bu rerun'da hesaplanan", hesapci.son_kirli)
+
+
+# -------------------------------------------------
+# KODLAMA SİSTEMATİĞİ
+# -------------------------------------------------
+@olcum.zamanla("hum_render_seconds")
+def render_kodlama():
+    st.header("Kodlama Sistematiği")
+
+    sol, sag = st.columns([1, 2])
+    kod = ""
+
+    with sol:
+        tip = st.radio("Tip:", ["MAMUL", "YARI MAMUL"], key="kod_tip")
+
+        if tip == "MAMUL":
+            si = st.text_input("Sipariş No", key="kod_sip_m")
+            un = st.text_input("Ünite", key="kod_un_m")
+            mn = st.text_input("Mamul No", key="kod_no_m")
+            kod = build_mamul_code("M", si, un, mn)
+        else:
+            ure = st.selectbox(
+                "Üretici",
+                list(URETICI_MAP.keys()),
+                key="kod_u",
+            )
+            si = st.text_input("Sipariş No", key="kod_sip_y")
+            mn = st.text_input("Mamul No", key="kod_no_y")
+            rs = st.text_input("Resim No", key="kod_res_y")
+            a1 = st.text_input("Alt Poz 1", key="kod_a1")
+            a2 = st.text_input("Alt Poz 2", key="kod_a2")
+            a3 = st.text_input("Alt Poz 3", key="kod_a3")
+            kod = build_yari_mamul_code("Y", ure, si, mn, rs, a1, a2, a3)
+
+    depo = kodlama.depo()
+    with sag:
+        st.subheader("Üretilen Kod")
+        st.code(kod if kod else "—")
+        st.write("Uzunluk:", len(kod))
+        if kod and kod in depo:
+            st.warning("Bu kod daha önce verilmiş.")
+        elif kod and st.button("Kodu kaydet", key="kod_kaydet"):
+            depo.kaydet([kod])
+            st.success("Kod kaydedildi.")
+
+        st.markdown("**Üretici Kodları Açıklaması**")
+        for k, v in URETICI_MAP.items():
+            st.write(f"- **{k}** : {v}")
+
+    render_toplu_kodlama(depo)
+    render_kod_arama()
+
+
+@olcum.zamanla("hum_render_seconds")
+def render_toplu_kodlama(depo: kodlama.KodDeposu):
+    st.markdown("---")
+    st.subheader("Toplu Kod Üretimi")
+    st.write(
+        "CSV veya XLSX sipariş ağacı yükleyin. Kolonlar: "
+        f"{', '.join(f'`{c}`' for c in kodlama.KOLONLAR)} "
+        "(`tip`: MAMUL / YARI MAMUL; boşsa `uretici` doluysa yarı mamul)."
+    )
+    st.caption(f"Depoda {len(depo):,} verilmiş kod var.".replace(",", "."))
+
+    dosya = st.file_uploader("Sipariş tablosu", type=["csv", "xlsx"], key="kod_toplu_dosya")
+    if dosya is None:
+        return
+
+    if st.toggle("Arka planda üret", key="kod_toplu_arka_plan", help="Büyük tablolarda paneli bekletmez."):
+        kaydet = st.checkbox("Yeni kodları depoya kaydet", key="kod_toplu_arka_kaydet")
+        if st.button("Kuyruğa gönder", type="primary", key="kod_toplu_gonder"):
+            _is_gonder("kod", dosya.name, {"depo": depo.yol, "kaydet": kaydet}, dosya.getvalue(), dosya.name)
+        return
+
+    # Aynı dosya için sonuç oturumda tutulur; 'Kaydet' tıklaması yeniden üretmez.
+    onceki = st.session_state.get("kod_toplu_sonuc")
+    if onceki is None or onceki[0] != dosya.file_id:
+        import pandas as pd
+
+        from hum import bom
+
+        dosya.seek(0)
+        tablo = pd.concat(
+            kodlama.toplu_kodla(bom.bom_parcalari(dosya, dosya.name, metin=True), depo),
+            ignore_index=True,
+        )
+        onceki = (dosya.file_id, tablo, False)
+        st.session_state["kod_toplu_sonuc"] = onceki
+    _, tablo, kaydedildi = onceki
+
+    sayilar = tablo["durum"].value_counts()
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Yeni", int(sayilar.get("yeni", 0)))
+    m2.metric("Depoda mevcut", int(sayilar.get("mevcut", 0)))
+    m3.metric("Tekrar", int(sayilar.get("tekrar", 0)))
+    m4.metric("Hatalı", int(sayilar.get("hatali", 0)))
+
+    st.dataframe(tablo.head(500), use_container_width=True)
+    st.download_button(
+        "Kodları indir (CSV)",
+        tablo.to_csv(index=False).encode("utf-8"),
+        file_name=f"{os.path.splitext(dosya.name)[0]}_kodlar.csv",
+        mime="text/csv",
+    )
+
+    if kaydedildi:
+        st.success("Yeni kodlar depoya kaydedildi.")
+    elif sayilar.get("yeni", 0) and st.button("Yeni kodları kaydet", type="primary", key="kod_toplu_kaydet"):
+        n = depo.kaydet(tablo.loc[tablo["durum"] == "yeni", "kod"].tolist())
+        st.session_state["kod_toplu_sonuc"] = (dosya.file_id, tablo, True)
+        st.success(f"{n} kod depoya kaydedildi.")
+
+
+@olcum.zamanla("hum_render_seconds")
+def render_kod_arama():
+    st.markdown("---")
+    st.subheader("Kod Ara")
+    sorgu = st.text_input("Kod öneki (örn: YHK-2024)", key="kod_ara").strip()
+    if not sorgu:
+        return
+
+    import pandas as pd
+
+    from hum import kod_arama
+
+    # Ön ek/üretici kısmı büyük harfe çevrilir; diğer alanlar girildiği gibi aranır.
+    bas, ayirici, kalan = sorgu.partition("-")
+    toplam, kodlar = kod_arama.indeks().ara(bas.upper() + ayirici + kalan, 100)
+    st.caption(f"{toplam:,} eşleşme".replace(",", ".") + (" (ilk 100)" if toplam > 100 else ""))
+    if not kodlar:
+        return
+
+    alanlar = [kodlama.kod_coz(k) for k in kodlar]
+    st.dataframe(
+        pd.DataFrame({
+            "Kod": kodlar,
+            "Tip": [a.tip if a else "?" for a in alanlar],
+            "Üretici": [a.uretici if a else "" for a in alanlar],
+            "Sipariş No": [a.siparis if a else "" for a in alanlar],
+            "Ünite": [a.unite if a else "" for a in alanlar],
+            "Mamul No": [a.mamul_no if a else "" for a in alanlar],
+            "Resim No": [a.resim if a else "" for a in alanlar],
+            "Alt Poz": ["-".join(a.alt_poz) if a else "" for a in alanlar],
+        }),
+        use_container_width=True,
+        hide_index=True,
+    )
+
+
+# -------------------------------------------------
+# ARKA PLAN İŞLERİ
+# -------------------------------------------------
+IS_TURLERI = {"bom": "Toplu BOM", "kesim": "Kesim Planı", "kod": "Toplu Kod"}
+IS_DURUMLARI = {
+    "bekliyor": "⏳ Bekliyor",
+    "calisiyor": "⚙️ Çalışıyor",
+    "bitti": "✅ Bitti",
+    "hata": "❌ Hata",
+    "iptal": "⛔ İptal",
+}
+
+
+def _is_gonder(tur: str, ad: str, ayar: dict, girdi: Optional[bytes] = None, girdi_adi: str = ""):
+    from hum import isler
+
+    try:
+        is_id = isler.yonetici().gonder(tur, ad, ayar, girdi, girdi_adi)
+    except RuntimeError as e:
+        st.error(str(e))
+        return
+    st.success(f"İş kuyruğa alındı ({is_id}). İlerleme 'Arka Plan İşleri' sayfasında.")
+
+
+def _dosya_oku(yol: str) -> bytes:
+    with open(yol, "rb") as f:
+        return f.read()
+
+
+def _is_ozeti(i: "isler.Is") -> str:
+    o = i.ozet
+    if i.tur == "bom":
+        return f"{o['satir']:,} satır, {o['hatali']:,} hatalı".replace(",", ".")
+    if i.tur == "kesim":
+        return f"{o['bar_sayisi']} bar, verim %{fmt(o['verim'] * 100, 1)}, {fmt(o['satin_alma_kg'])} kg"
+    if i.tur == "kod":
+        d = o["durum"]
+        return (
+            f"{d.get('yeni', 0)} yeni, {d.get('mevcut', 0)} mevcut, {d.get('tekrar', 0)} tekrar, "
+            f"{d.get('hatali', 0)} hatalı; {o['kaydedilen']} kaydedildi"
+        )
+    return ""
+
+
+@st.fragment(run_every=2.0)
+def _is_listesi():
+    """İş listesi; sayfa açıkken 2 sn'de bir kendini yeniler."""
+    import pandas as pd
+
+    from hum import isler
+
+    y = isler.yonetici()
+    liste = y.liste()
+    if not liste:
+        st.info("Henüz iş yok. BOM, Kesim Planı ve Toplu Kod sayfalarından arka plan işi gönderilebilir.")
+        return
+
+    for i in liste:
+        with st.container(border=True):
+            sol, orta, sag = st.columns([3, 4, 2])
+            sol.markdown(f"**{i.ad}**  \n{IS_TURLERI.get(i.tur, i.tur)} • {i.id}")
+            if i.durum in ("bekliyor", "calisiyor"):
+                orta.progress(i.ilerleme, text=f"{IS_DURUMLARI[i.durum]} – {i.mesaj}")
+                sag.button("İptal", key=f"is_iptal_{i.id}", on_click=y.iptal, args=(i.id,))
+                continue
+            sure = f" • {i.bitis - i.olusturma:.1f} sn" if i.bitis else ""
+            aciklama = _is_ozeti(i) if i.durum == "bitti" else i.mesaj
+            orta.markdown(f"{IS_DURUMLARI.get(i.durum, i.durum)}{sure}  \n{aciklama}")
+            if i.sonuc:
+                sag.download_button(
+                    "İndir (CSV)",
+                    partial(_dosya_oku, i.sonuc),
+                    file_name=f"{os.path.splitext(i.ad)[0]}_sonuc.csv",
+                    mime="text/csv",
+                    key=f"is_indir_{i.id}",
+                    on_click="ignore",
+                )
+            sag.button("Sil", key=f"is_sil_{i.id}", on_click=y.sil, args=(i.id,))
+            if i.tur == "bom" and i.ozet.get("toplamlar"):
+                with st.expander("Malzeme toplamları"):
+                    st.dataframe(pd.DataFrame(i.ozet["toplamlar"]), use_container_width=True, hide_index=True)
+
+
+@olcum.zamanla("hum_render_seconds")
+def render_isler():
+    from hum import isler
+
+    st.header("Arka Plan İşleri")
+    y = isler.yonetici()
+    st.caption(f"{y.isci} işçi süreç • en çok {isler.BEKLEYEN_SINIRI} bekleyen iş • sonuçlar: {y.klasor}")
+    _is_listesi()
+
+
+# -------------------------------------------------
+# HESAP GEÇMİŞİ
+# -------------------------------------------------
+def _gecmis_sonraki(son_id: int):
+    st.session_state["gecmis_sayfa"][2].append(son_id)
+
+
+def _gecmis_onceki():
+    st.session_state["gecmis_sayfa"][2].pop()
+
+
+@olcum.zamanla("hum_render_seconds")
+def render_gecmis():
+    """Seçili siparişin hesap geçmişi; id imleçli sayfalar (yeniden eskiye)."""
+    import pandas as pd
+
+    st.header("Hesap Geçmişi")
+    siparis = st.session_state.get("siparis_no", "").strip()
+    st.caption(
+        f"Sipariş: **{siparis}**" if siparis else "Siparişsiz kayıtlar (Sipariş No kenar çubuğundan seçilir)"
+    )
+    boyut = st.selectbox("Sayfa boyu", (25, 50, 100, 250), index=1, key="gecmis_boyut")
+
+    # (sipariş, boyut, imleçler): imleçler[k], k. sayfanın "bu id'den eski" sınırı.
+    durum = st.session_state.get("gecmis_sayfa")
+    if durum is None or durum[:2] != (siparis, boyut):
+        durum = st.session_state["gecmis_sayfa"] = (siparis, boyut, [None])
+    imlecler = durum[2]
+
+    d = gecmis.depo()
+    kayitlar = d.sayfa(siparis, imlecler[-1], boyut)
+    toplam = d.sayi(siparis)
+
+    sol, orta, sag = st.columns([1, 1, 4])
+    sol.button("◀ Önceki", on_click=_gecmis_onceki, disabled=len(imlecler) == 1, key="gecmis_onceki")
+    orta.button(
+        "Sonraki ▶",
+        on_click=_gecmis_sonraki,
+        args=(kayitlar[-1].id if kayitlar else 0,),
+        disabled=len(kayitlar) < boyut,
+        key="gecmis_sonraki",
+    )
+    sag.caption(
+        f"{toplam:,} kayıt • sayfa {len(imlecler)}/{max(1, -(-toplam // boyut))}".replace(",", ".")
+    )
+    if not kayitlar:
+        st.info("Bu sipariş için kayıt yok.")
+        return
+
+    etiketler = dict(MODULES)
+    st.dataframe(
+        pd.DataFrame({
+            "Zaman": [time.strftime("%d.%m.%Y %H:%M:%S", time.localtime(k.zaman)) for k in kayitlar],
+            "Kullanıcı": [k.kullanici for k in kayitlar],
+            "Modül": [etiketler.get(k.modul, k.modul) for k in kayitlar],
+            "Girdiler": [", ".join(f"{a}={fmt(v)}" for a, v in k.girdiler.items()) for k in kayitlar],
+            "Miktar/Adet": fmt_dizi([k.miktar for k in kayitlar]),
+            "Birim": [k.birim for k in kayitlar],
+        }),
+        use_container_width=True,
+        hide_index=True,
+    )
+
+
+# -------------------------------------------------
+# ROUTER
+# -------------------------------------------------
+def modul_ciz(mod_id: str, title: str, izgara_modu: bool, kat: katalog.Katalog):
+    if izgara_modu:
+        render_izgara(mod_id, title, kat)
+
+    elif mod_id == "kestamit":
+        render_levha_multi("kestamit", "KESTAMİT LEVHALAR AD-KG – Kg/Adet (Br-2)", yogunluk=kat.yogunluk("kestamit"))
+
+    elif mod_id == "celik_levha":
+        render_levha_multi("celik_levha", "ÇELİK LEVHALAR AD-KG – Kg/Adet (Br-2)", yogunluk=kat.yogunluk("celik"))
+
+    elif mod_id == "celik_mil":
+        render_celik_mil()
+
+    elif mod_id == "altikose":
+        render_altikose()
+
+    elif mod_id == "kare":
+        render_kare()
+
+    elif mod_id == "lama":
+        render_lama()
+
+    elif mod_id == "kosebent":
+        render_kosebent()
+
+    elif mod_id == "celik_cek_boru":
+        render_celik_cek_boru()
+
+    elif mod_id == "dik_boru_kutu":
+        render_dik_boru_kutu()
+
+    elif mod_id == "npu":
+        render_profil("npu", "NPU AD-MM-KG", kat.modul_katsayi("npu"))
+
+    elif mod_id == "heb":
+        render_profil("heb", "HEB AD-MM-KG", kat.modul_katsayi("heb"))
+
+    elif mod_id == "ozel_kesit":
+        render_ozel_kesit(kat)
+
+    elif mod_id == "kesim":
+        render_kesim(kat)
+
+    elif mod_id == "levha_yerlesim":
+        render_levha_yerlesim()
+
+    elif mod_id == "bom":
+        render_bom()
+
+    elif mod_id == "siparis":
+        render_siparis()
+
+    elif mod_id == "profil_cetveli":
+        render_profil_cetveli(kat)
+
+    elif mod_id == "kodlama":
+        render_kodlama()
+
+    elif mod_id == "gecmis":
+        render_gecmis()
+
+    elif mod_id == "isler":
+        render_isler()
+
+
+@st.fragment
+def modul_parcasi(mod_id: str, title: str, izgara_modu: bool, canli: bool, kat: katalog.Katalog):
+    """Seçili modül; içindeki bir giriş değişince sadece bu parça yeniden çalışır.
+
+    Canlı mod kapalıysa hesap modüllerinin girişleri bir form içinde
+    toplanır ve 'Hesapla' ile tek seferde gönderilir.
+    """
+    ctx = get_script_run_ctx()
+    olcum.oturum_say(ctx.session_id if ctx else None)
+    olcum.say("hum_parca_total", modul=mod_id)
+
+    with olcum.sure("hum_parca_seconds", modul=mod_id):
+        if canli or mod_id not in hesap.FORMULLER:
+            modul_ciz(mod_id, title, izgara_modu, kat)
+        else:
+            with st.form(f"{mod_id}_form", border=False):
+                modul_ciz(mod_id, title, izgara_modu, kat)
+                st.form_submit_button("Hesapla", type="primary")
+        if mod_id in hesap.FORMULLER:
+            _sonuc_cubugu(mod_id, title)
+    # Parça tek başına yeniden çalıştığında da girişler saklanır.
+    _oturum_kaydet()
+
+
+# Rerun boyunca tek katalog sürümü kullanılır.
+modul_parcasi(selected_mod, selection, izgara_modu, canli, katalog.aktif())
+
+# -------------------------------------------------
+# FOOTER
+# -------------------------------------------------
+st.markdown("---")
+st.caption(f"HUM Paneli • Python {sys.version.split()[0]}")
+
+_oturum_kaydet()
+
+olcum.gozlem("hum_rerun_seconds", time.perf_counter() - _rerun_t0, modul=selected_mod)
+olcum.say("hum_rerun_total", modul=selected_mod)
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""HTTP API: doğrulama, sınırlar ve keep-alive (gerçek sunucu, rastgele port)."""
+import http.client
+import json
+import socket
+import threading
+
+import numpy as np
+import pytest
+
+from hum import api, hesap
+
+
+@pytest.fixture(scope="module")
+def sunucu():
+    s = api._sunucu("127.0.0.1", 0, False)
+    threading.Thread(target=s.serve_forever, daemon=True).start()
+    yield s.server_address[1]
+    s.shutdown()
+    s.server_close()
+
+
+@pytest.fixture
+def baglanti(sunucu):
+    con = http.client.HTTPConnection("127.0.0.1", sunucu, timeout=10)
+    yield con
+    con.close()
+
+
+def _istek(con, yontem, yol, govde=None):
+    veri = None if govde is None else json.dumps(govde).encode()
+    con.request(yontem, yol, body=veri, headers={"Content-Type": "application/json"})
+    r = con.getresponse()
+    return r.status, json.loads(r.read()), r
+
+
+def _ham(port, istek):
+    with socket.create_connection(("127.0.0.1", port), timeout=10) as s:
+        s.sendall(istek)
+        cevap = b""
+        while True:
+            parca = s.recv(65536)
+            if not parca:
+                return cevap
+            cevap += parca
+
+
+def test_hesap_bicimleri_formulle_ayni(baglanti):
+    beklenen = hesap.modul_hesapla("celik_mil", {"cap": np.array([50.0, 20.0]), "boy": np.array([1000.0, 500.0])})
+    kod, tek, _ = _istek(baglanti, "POST", "/v1/hesap/celik_mil", {"cap": 50, "boy": 1000, "adet": 2})
+    assert kod == 200 and tek["birim"] == "kg"
+    assert tek["miktar_adet"] == pytest.approx(beklenen[0]) and tek["miktar_toplam"] == pytest.approx(2 * beklenen[0])
+
+    kod, liste, _ = _istek(baglanti, "POST", "/v1/hesap/celik_mil", [{"cap": 50, "boy": 1000}, {"cap": 20, "boy": 500}, {"cap": 1}])
+    assert kod == 200 and liste["n"] == 3
+    assert [s["miktar_adet"] for s in liste["sonuclar"]] == [pytest.approx(v) for v in beklenen] + [None]
+
+    kod, kolon, _ = _istek(baglanti, "POST", "/v1/hesap/celik_mil", {"kolonlar": {"cap": [50, 20], "boy": [1000, 500], "adet": [None, 3]}})
+    assert kod == 200
+    assert kolon["miktar_toplam"] == [pytest.approx(beklenen[0]), pytest.approx(3 * beklenen[1])]
+
+
+def test_toplu_karisik(baglanti):
+    kod, sonuc, _ = _istek(baglanti, "POST", "/v1/toplu", {"satirlar": [
+        {"malzeme": "Celik_Mil", "cap": 50, "boy": 1000},
+        {"malzeme": "dik_boru_kutu", "boy": 2500, "adet": 2},
+        {"malzeme": "yok", "cap": 1},
+    ]})
+    assert kod == 200 and sonuc["n"] == 3
+    assert [s["birim"] for s in sonuc["sonuclar"]] == ["kg", "mt", None]
+    assert sonuc["sonuclar"][1]["miktar_toplam"] == pytest.approx(5.0)
+    assert sonuc["sonuclar"][2]["miktar_adet"] is None
+
+
+def test_dogrulama_hatalari(baglanti):
+    for yol, govde in [
+        ("/v1/hesap/celik_mil", {"cap": "elli", "boy": 1000}),
+        ("/v1/hesap/celik_mil", {"kolonlar": {"cap": [1, 2], "boy": [1]}}),
+        ("/v1/hesap/celik_mil", {"kolonlar": {"cap": [[1, 2]], "boy": [1]}}),
+        ("/v1/hesap/celik_mil", 42),
+        ("/v1/toplu", {"satirlar": [1, 2]}),
+    ]:
+        kod, sonuc, _ = _istek(baglanti, "POST", yol, govde)
+        assert kod == 400 and sonuc["hata"], (yol, govde)
+    baglanti.request("POST", "/v1/hesap/celik_mil", body=b"{bozuk")
+    r = baglanti.getresponse()
+    assert r.status == 400 and json.loads(r.read()) == {"hata": "Geçersiz JSON"}
+    assert _istek(baglanti, "POST", "/v1/hesap/yok", {})[0] == 404
+    assert _istek(baglanti, "GET", "/yok")[0] == 404
+
+
+def test_keep_alive_ayni_baglanti(baglanti):
+    kod, saglik, r = _istek(baglanti, "GET", "/saglik")
+    assert kod == 200 and saglik["durum"] == "ok" and "toplam;dur=" in r.getheader("Server-Timing")
+    soket = baglanti.sock
+    for _ in range(20):
+        assert _istek(baglanti, "POST", "/v1/hesap/lama", {"gen": 40, "yuk": 10, "boy": 1000})[0] == 200
+        # Hata yanıtı da bağlantıyı kapatmaz.
+        assert _istek(baglanti, "POST", "/v1/hesap/lama", {"gen": "x"})[0] == 400
+    assert baglanti.sock is soket
+    assert set(_istek(baglanti, "GET", "/v1/moduller")[1]) == set(hesap.FORMULLER)
+
+
+def test_sinirlar(sunucu, baglanti, monkeypatch):
+    monkeypatch.setattr(api, "SATIR_SINIRI", 3)
+    kod, sonuc, _ = _istek(baglanti, "POST", "/v1/hesap/lama", [{"gen": 1}] * 4)
+    assert kod == 413 and "3" in sonuc["hata"]
+    assert _istek(baglanti, "POST", "/v1/hesap/lama", [{"gen": 1}] * 3)[0] == 200
+
+    monkeypatch.setattr(api, "GOVDE_SINIRI", 10)
+    cevap = _ham(sunucu, b"POST /v1/hesap/lama HTTP/1.1\r\nHost: x\r\nContent-Length: 11\r\n\r\n")
+    assert cevap.startswith(b"HTTP/1.1 413") and b"Connection: close" in cevap
+
+    cevap = _ham(sunucu, b"POST /v1/hesap/lama HTTP/1.1\r\nHost: x\r\n\r\n")
+    assert cevap.startswith(b"HTTP/1.1 411") and b"Connection: close" in cevap
+
+
+@pytest.mark.parametrize("uzunluk", [b"abc", b"-1", b"1e3", b"\xd9\xa3"])
+def test_gecersiz_content_length(sunucu, uzunluk):
+    cevap = _ham(sunucu, b"POST /v1/hesap/lama HTTP/1.1\r\nHost: x\r\nContent-Length: " + uzunluk + b"\r\n\r\n{}")
+    assert cevap.startswith(b"HTTP/1.1 400") and b"Connection: close" in cevap
+
+
+def test_profil_arama(baglanti):
+    from hum import katalog
+
+    indeks = katalog.aktif().agirlik_indeksi()
+    kod, sonuc, _ = _istek(baglanti, "GET", "/v1/profil?alt=20&ust=30,5&aile=heb,npu")
+    assert kod == 200
+    assert [p["ad"] for p in sonuc["profiller"]] == [p.ad for p in indeks.aralik(20, 30.5, ["HEB", "NPU"])]
+    kod, sonuc, _ = _istek(baglanti, "GET", "/v1/profil?en_yakin=50&k=3")
+    assert kod == 200 and sonuc["n"] == 3
+    kod, sonuc, _ = _istek(baglanti, "GET", "/v1/profil?en_yakin=50&k=0")
+    assert kod == 200 and sonuc["n"] == 0
+    kod, sonuc, _ = _istek(baglanti, "GET", "/v1/profil?en_az=10&olcu=kesit")
+    assert kod == 200 and [p["ad"] for p in sonuc["profiller"]] == [p.ad for p in indeks.en_hafif(10, olcu="kesit")]
+    for sorgu in [
+        "", "alt=abc", "en_yakin=5&k=-1", "alt=1&aile=YOK", "alt=1&olcu=hacim",
+        "en_yakin=50&k=inf", "en_yakin=nan", "alt=nan", "alt=inf", "ust=-inf", "en_az=nan",
+    ]:
+        kod, sonuc, _ = _istek(baglanti, "GET", "/v1/profil?" + sorgu)
+        assert kod == 400 and sonuc["hata"], sorgu
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""Profil cetveli araması: token/önek indeksi ve sayfalama."""
+from hum.arama import ProfilIndeksi, tokenlar
+
+ROWS = [
+    ("NPU 80", 8.64, 51.84),
+    ("NPU 200", 25.30, 151.80),
+    ("HEB 100", 20.40, 122.40),
+    ("HEB 200", 61.30, 367.80),
+    ("HEB 220", 71.50, 429.00),
+    ("IPE 200", 22.40, 134.40),
+]
+
+
+def _adlar(ind, sorgu):
+    return [ind.rows[i][0] for i in ind.ara(sorgu)]
+
+
+def test_tokenlar():
+    assert tokenlar("heb200") == ["HEB", "200"]
+    assert tokenlar("  npu 42,6 ") == ["NPU", "42.6"]
+    assert tokenlar("") == []
+
+
+def test_tam_eslesme_onekten_once():
+    ind = ProfilIndeksi(ROWS)
+    assert len(ind) == len(ROWS)
+    assert _adlar(ind, "") == [r[0] for r in ROWS]
+    assert _adlar(ind, "heb 200") == ["HEB 200"]
+    # "20": HEB 200'de ebat öneki, HEB 100'de ağırlık (20,40) öneki.
+    assert _adlar(ind, "HEB 20") == ["HEB 200", "HEB 100"]
+    assert _adlar(ind, "200") == ["NPU 200", "HEB 200", "IPE 200"]
+    assert _adlar(ind, "xyz") == []
+
+
+def test_agirlik_ile_arama():
+    ind = ProfilIndeksi(ROWS)
+    assert _adlar(ind, "61,3") == ["HEB 200"]
+    assert _adlar(ind, "8.64") == ["NPU 80"]
+    # Ad eşleşmesi ağırlık eşleşmesinden önce gelir.
+    assert _adlar(ind, "22") == ["HEB 220", "IPE 200"]
+
+
+def test_sayfa():
+    ind = ProfilIndeksi(ROWS)
+    assert ind.sayfa("", 1, 4) == (6, [0, 1, 2, 3])
+    assert ind.sayfa("", 2, 4) == (6, [4, 5])
+    assert ind.sayfa("", 3, 4) == (6, [])
+    assert ind.sayfa("", 0, 4) == (6, [0, 1, 2, 3])
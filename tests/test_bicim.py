@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""fmt_dizi: varsayılanlarla fmt ile birebir aynı metin."""
+import numpy as np
+import pytest
+
+from hum.bicim import _tek, fmt, fmt_dizi
+
+
+def _degerler(ust):
+    rng = np.random.default_rng(3)
+    x = np.concatenate([
+        rng.uniform(-1000, 1000, 5000),
+        10 ** rng.uniform(-4, np.log10(ust), 5000) * rng.choice([-1, 1], 5000),
+        np.round(rng.uniform(0, 100, 2000), 4) + 0.0005,  # yarım ondalıklar
+        [0.0, -0.0, 0.0005, 0.0015, 2.675, 1.0005, -0.00049, 999.9995],
+    ])
+    return x
+
+
+@pytest.mark.parametrize("nd", [0, 1, 2, 3])
+def test_fmt_ile_ayni(nd):
+    x = _degerler(1e15)
+    assert fmt_dizi(x, nd).tolist() == [fmt(v, nd) for v in x.tolist()]
+
+
+def test_buyuk_degerler_fmt_ile_ayni():
+    # 10^-nd'den seyrek double'larda en kısa gösterim tam açılımdan kısadır.
+    x = [123456789012345.678, -12581250330581.87, 8799776154635.19, 2.0 ** 43 + 0.5]
+    assert fmt_dizi(x).tolist() == [fmt(v) for v in x]
+    assert fmt_dizi(x[:1]).tolist() == ["123456789012345,67"]
+    assert fmt_dizi(x[:1], binlik=True).tolist() == ["123.456.789.012.345,67"]
+
+
+def test_bos_ve_sekil():
+    x = np.array([[1.5, np.nan], [np.inf, -2.0]])
+    sonuc = fmt_dizi(x)
+    assert sonuc.shape == (2, 2)
+    assert sonuc.tolist() == [["1,5", "—"], ["—", "-2,0"]]
+    assert fmt_dizi([np.nan], bos="").tolist() == [""]
+    assert fmt_dizi([]).tolist() == []
+
+
+def test_binlik_ve_sabit():
+    x = np.array([1234567.891, -1000, 0.1, 999.9996])
+    assert fmt_dizi(x, 2, binlik=True).tolist() == ["1.234.567,89", "-1.000,0", "0,1", "1.000,0"]
+    assert fmt_dizi(x, 2, sabit=True).tolist() == ["1234567,89", "-1000,00", "0,10", "1000,00"]
+    assert fmt_dizi(x, 0, binlik=True, sabit=True).tolist() == ["1.234.568", "-1.000", "0", "1.000"]
+    y = _degerler(1e15)
+    for binlik in (False, True):
+        for sabit in (False, True):
+            assert fmt_dizi(y, 3, binlik, sabit).tolist() == [_tek(v, 3, binlik, sabit) for v in y.tolist()]
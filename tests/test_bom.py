@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""Toplu BOM: CSV/XLSX blok okuma, blok hesabı ve malzeme toplamları."""
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hum import bom, hesap
+
+
+def _bom(n=1234):
+    rng = np.random.default_rng(n)
+    df = pd.DataFrame({
+        "Malzeme": rng.choice(["celik_mil", "kare", "lama", "dik_boru_kutu", "bilinmeyen"], n),
+        "cap": np.round(rng.uniform(10, 100, n), 1),
+        "ebat": np.round(rng.uniform(10, 100, n), 1),
+        "gen": np.round(rng.uniform(10, 100, n), 1),
+        "yuk": np.round(rng.uniform(5, 20, n), 1),
+        "boy": np.round(rng.uniform(100, 6000, n), 1),
+        "Adet": rng.integers(1, 10, n),
+    })
+    df.loc[::50, "boy"] = np.nan
+    return df
+
+
+def _beklenen(df):
+    olcu = {c: df[c].to_numpy(dtype=float) for c in ("cap", "ebat", "gen", "yuk", "boy")}
+    return hesap.karisik_hesapla(df["Malzeme"].str.lower(), olcu)
+
+
+def _csv(df, ayirici):
+    metin = df.to_csv(index=False, sep=ayirici, decimal="," if ayirici == ";" else ".")
+    return io.BytesIO(metin.encode("utf-8"))
+
+
+@pytest.mark.parametrize("ayirici", [",", ";"])
+def test_csv_bloklar_halinde_hesaplanir(ayirici):
+    df = _bom()
+    toplam = bom.BomToplam()
+    bloklar = list(bom.bom_isle(_csv(df, ayirici), "bom.csv", parca_boyu=500, toplam=toplam))
+    assert [len(b) for b in bloklar] == [500, 500, 234]
+
+    sonuc = pd.concat(bloklar, ignore_index=True)
+    beklenen = _beklenen(df)
+    np.testing.assert_allclose(sonuc["miktar_adet"], beklenen, rtol=1e-12)
+    np.testing.assert_allclose(sonuc["miktar_toplam"], beklenen * df["Adet"], rtol=1e-12)
+    assert sonuc.loc[sonuc["malzeme"] == "dik_boru_kutu", "birim"].eq("mt").all()
+
+    # Malzeme toplamları bloklardan birikir, tek seferde gruplamayla aynıdır.
+    tablo = toplam.tablo().set_index("Malzeme")
+    gecerli = sonuc[sonuc["miktar_toplam"].notna()]
+    g = gecerli.groupby("malzeme")
+    assert toplam.hatali == int(sonuc["miktar_toplam"].isna().sum())
+    assert sorted(tablo.index) == sorted(g.groups)
+    np.testing.assert_allclose(tablo["Toplam"], g["miktar_toplam"].sum().loc[tablo.index], rtol=1e-12)
+    np.testing.assert_array_equal(tablo["Satır"], g.size().loc[tablo.index])
+
+
+def test_xlsx_bloklar(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    df = _bom(300)
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(list(df.columns))
+    for satir in df.itertuples(index=False):
+        ws.append([None if isinstance(v, float) and v != v else v for v in satir])
+    yol = str(tmp_path / "bom.xlsx")
+    wb.save(yol)
+
+    bloklar = list(bom.bom_isle(yol, parca_boyu=128))
+    assert [len(b) for b in bloklar] == [128, 128, 44]
+    sonuc = pd.concat(bloklar, ignore_index=True)
+    np.testing.assert_allclose(sonuc["miktar_adet"], _beklenen(df), rtol=1e-12)
+
+
+def test_csv_yaz_tek_baslik():
+    df = _bom(90)
+    hedef = io.StringIO()
+    toplam = bom.bom_csv_yaz(_csv(df, ","), hedef, "bom.csv", parca_boyu=40)
+    geri = pd.read_csv(io.StringIO(hedef.getvalue()))
+    assert len(geri) == 90 and "miktar_toplam" in geri
+    assert toplam.tablo()["Toplam"].sum() == pytest.approx(geri["miktar_toplam"].sum())
+
+
+def test_adet_ve_malzeme_eksik():
+    sonuc = bom.parca_hesapla(pd.DataFrame({"malzeme": [" Celik_Mil ", "kare"], "cap": [50, None], "boy": [1000, 1000]}))
+    assert sonuc["malzeme"].tolist() == ["celik_mil", "kare"]
+    assert sonuc["adet"].tolist() == [1.0, 1.0]
+    assert sonuc["miktar_adet"][0] == pytest.approx(hesap.celik_mil_kg(50, 1000))
+    assert np.isnan(sonuc["miktar_adet"][1])
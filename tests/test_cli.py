@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Komut satırı: ``calc`` CSV/JSON çıktısı ve dosya girişi."""
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from hum import cli, hesap
+
+
+def test_calc_csv_ondalik_virgul():
+    girdi = io.StringIO("cap;boy;adet\n50;1000;2\n12,5;1.250,5;\n;1000;3\n")
+    cikti = io.StringIO()
+    assert cli.calc("celik_mil", girdi, cikti, "csv", 2) == 3
+    satirlar = list(csv.DictReader(io.StringIO(cikti.getvalue())))
+    assert [s["boy"] for s in satirlar] == ["1000", "1.250,5", "1000"]  # girdi olduğu gibi
+    beklenen = hesap.celik_mil_kg([50, 12.5], [1000, 1250.5])
+    assert float(satirlar[0]["miktar_adet"]) == pytest.approx(beklenen[0])
+    assert float(satirlar[0]["miktar_toplam"]) == pytest.approx(2 * beklenen[0])
+    assert float(satirlar[1]["miktar_toplam"]) == pytest.approx(beklenen[1])  # boş adet 1
+    assert satirlar[2]["miktar_adet"] == "" and satirlar[2]["birim"] == "kg"
+
+
+def test_calc_karisik_json():
+    girdi = io.StringIO("malzeme,ebat,boy,gen,yuk\nkare,40,1000,,\nLAMA,,2000,40,10\ndik_boru_kutu,,2500,,\nyok,1,1,,\n")
+    cikti = io.StringIO()
+    cli.calc(cli.KARISIK, girdi, cikti, "json", 3)
+    kayitlar = json.loads(cikti.getvalue())
+    assert [k["birim"] for k in kayitlar] == ["kg", "kg", "mt", ""]
+    assert kayitlar[0]["miktar_adet"] == pytest.approx(float(hesap.kare_kg(40, 1000)))
+    assert kayitlar[1]["miktar_adet"] == pytest.approx(float(hesap.lama_kg(40, 10, 2000)))
+    assert kayitlar[2]["miktar_adet"] == pytest.approx(2.5)
+    assert kayitlar[3]["miktar_adet"] is None
+
+
+def test_main_dosyalar(tmp_path, capsys):
+    girdi, cikti = tmp_path / "girdi.csv", tmp_path / "cikti.csv"
+    n = 25_000
+    boy = np.arange(1, n + 1)
+    girdi.write_text("\ufeffebat,boy\n" + "".join(f"30,{b}\n" for b in boy), encoding="utf-8")
+    assert cli.main(["calc", "kare", "-i", str(girdi), "-o", str(cikti), "--chunk", "1000"]) == 0
+    with open(cikti, encoding="utf-8") as f:
+        satirlar = list(csv.DictReader(f))
+    assert len(satirlar) == n
+    np.testing.assert_allclose([float(s["miktar_adet"]) for s in satirlar], hesap.kare_kg(30, boy), rtol=1e-12)
+
+    assert cli.main(["moduller"]) == 0
+    assert "celik_mil\tkg\tcap,boy,adet" in capsys.readouterr().out
+
+
+def test_acilamayan_dosyalar(tmp_path, capsys):
+    assert cli.main(["calc", "kare", "-i", str(tmp_path / "yok.csv")]) == 1
+    assert capsys.readouterr().err.startswith("Girdi açılamadı:")
+    girdi = tmp_path / "g.csv"
+    girdi.write_text("ebat,boy\n30,1000\n", encoding="utf-8")
+    assert cli.main(["calc", "kare", "-i", str(girdi), "-o", str(tmp_path / "yok" / "c.csv")]) == 1
+    assert capsys.readouterr().err.startswith("Çıktı açılamadı:")
+
+
+def test_agir_moduller_yuklenmez():
+    kod = (
+        "import sys; from hum import cli; "
+        "cli.main(['moduller']); "
+        "print(sorted(m for m in ('pandas', 'streamlit', 'http.server') if m in sys.modules))"
+    )
+    kok = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    cikti = subprocess.run([sys.executable, "-c", kod], cwd=kok, capture_output=True, text=True, check=True)
+    assert cikti.stdout.strip().splitlines()[-1] == "[]"
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""Dışa aktarılan CSV/XLSX dosyaları openpyxl ve Toplu BOM okuyucusuyla geri okunabilmeli."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from hum import bom, disari, hesap
+
+openpyxl = pytest.importorskip("openpyxl")
+
+KOLONLAR = [
+    disari.Kolon("malzeme", "malzeme", genislik=14),
+    disari.Kolon("cap", "cap", 1),
+    disari.Kolon("ebat", "ebat", 1),
+    disari.Kolon("boy", "boy", 1),
+    disari.Kolon("adet", "adet", 0),
+    disari.Kolon("miktar_adet", "miktar_adet", 3),
+]
+
+
+def _tablo(n=2500):
+    rng = np.random.default_rng(n)
+    df = pd.DataFrame({
+        "malzeme": rng.choice(["celik_mil", "kare", "altikose"], n),
+        "cap": np.round(rng.uniform(10, 200, n), 1),
+        "ebat": np.round(rng.uniform(10, 200, n), 1),
+        "boy": np.round(rng.uniform(100, 6000, n), 1),
+        "adet": rng.integers(1, 50, n).astype(float),
+    })
+    df.loc[::17, "boy"] = np.nan  # boş hücreler boş kalmalı
+    df["miktar_adet"] = hesap.karisik_hesapla(df["malzeme"], {c: df[c] for c in ("cap", "ebat", "boy")})
+    return df
+
+
+def _bolum(df):
+    return [disari.Bolum("BOM", KOLONLAR, lambda: disari.parcala(df, 1000))]
+
+
+@pytest.mark.parametrize("bicim", ["csv", "xlsx"])
+def test_bom_okuyucusu_geri_okur(tmp_path, bicim):
+    df = _tablo()
+    yol = disari.dosya(bicim, "BOM", _bolum(df), hedef=str(tmp_path))
+    with open(yol, "rb") as f:
+        geri = pd.concat(list(bom.bom_parcalari(f, yol, parca_boyu=700)), ignore_index=True)
+    assert list(geri.columns) == [k.baslik for k in KOLONLAR]
+    assert geri["malzeme"].tolist() == df["malzeme"].tolist()
+    for c in ("cap", "ebat", "boy", "adet"):
+        np.testing.assert_array_equal(pd.to_numeric(geri[c]).to_numpy(dtype=float), df[c].to_numpy())
+
+    hesaplanan = bom.parca_hesapla(geri.drop(columns="miktar_adet"))
+    np.testing.assert_allclose(hesaplanan["miktar_adet"], df["miktar_adet"], rtol=1e-12)
+    # Dosyadaki (yuvarlanmış) sonuç da aynı değeri taşır.
+    np.testing.assert_allclose(pd.to_numeric(geri["miktar_adet"]), df["miktar_adet"], atol=5e-4 if bicim == "csv" else 1e-6)
+
+
+def test_xlsx_openpyxl_hucreleri(tmp_path):
+    df = _tablo(300)
+    yol = disari.dosya("xlsx", "BOM", _bolum(df) + [
+        disari.Bolum("Özet: [1/2]", [disari.Kolon("malzeme", "Malzeme")], lambda: [df.head(3)]),
+    ], hedef=str(tmp_path))
+    wb = openpyxl.load_workbook(yol)
+    assert wb.sheetnames == ["BOM", "Özet   1 2"]
+    satirlar = list(wb["BOM"].iter_rows(values_only=True))
+    assert satirlar[0] == tuple(k.baslik for k in KOLONLAR)
+    assert len(satirlar) == len(df) + 1
+    for hucre, (_, s) in zip(satirlar[1:], df.iterrows()):
+        assert hucre[0] == s["malzeme"]
+        for v, c in zip(hucre[1:], ("cap", "ebat", "boy", "adet", "miktar_adet")):
+            if np.isnan(s[c]):
+                assert v is None
+            else:
+                assert isinstance(v, (int, float)) and v == pytest.approx(s[c], abs=1e-6)
+    assert wb["BOM"]["B2"].number_format == "#,##0.0"
+
+
+def test_ayni_icerik_yeniden_uretilmez(tmp_path):
+    df = _tablo(100)
+    yol = disari.dosya("csv", "BOM", _bolum(df), hedef=str(tmp_path))
+    assert disari.dosya("csv", "BOM", _bolum(df), hedef=str(tmp_path)) == yol
+    df.loc[0, "adet"] += 1
+    assert disari.dosya("csv", "BOM", _bolum(df), hedef=str(tmp_path)) != yol
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Hesap geçmişi: toplu yazım, keyset sayfalama, eşzamanlı ekleme."""
+import threading
+
+from hum.gecmis import GecmisDeposu
+
+
+def test_sayfalar_yeniden_eskiye(tmp_path):
+    d = GecmisDeposu(str(tmp_path / "g.sqlite"))
+    for i in range(120):
+        d.ekle("ali", "S1" if i % 3 else "S2", "celik_mil", [({"cap": float(i), "boy": 1000.0}, i * 0.5)])
+    assert d.bosalt()
+    assert d.yazilan == 120 and d.dusen == 0
+    assert d.sayi("S1") == 80 and d.sayi("S2") == 40 and d.sayi("yok") == 0
+
+    gorulen, once = [], None
+    while True:
+        sayfa = d.sayfa("S1", once, boyut=25)
+        if not sayfa:
+            break
+        gorulen += sayfa
+        once = sayfa[-1].id
+    assert [k.girdiler["cap"] for k in gorulen] == [float(i) for i in reversed(range(120)) if i % 3]
+    k = gorulen[0]
+    assert (k.kullanici, k.siparis, k.modul, k.miktar, k.birim) == ("ali", "S1", "celik_mil", 59.5, "kg")
+    assert [k.id for k in gorulen] == sorted((k.id for k in gorulen), reverse=True)
+
+
+def test_iki_depo_ayni_dosya(tmp_path):
+    yol = str(tmp_path / "g.sqlite")
+    depolar = [GecmisDeposu(yol), GecmisDeposu(yol)]
+
+    def yaz(d, ad):
+        for _ in range(20):
+            d.ekle(ad, "S", "lama", [({"gen": 1.0}, 1.0)] * 50, birim="mt")
+
+    isler = [threading.Thread(target=yaz, args=(d, f"k{i}")) for i, d in enumerate(depolar)]
+    for t in isler:
+        t.start()
+    for t in isler:
+        t.join()
+    assert all(d.bosalt() for d in depolar)
+    assert depolar[0].sayi("S") == depolar[1].sayi("S") == 2000
+    assert {k.kullanici for k in depolar[1].sayfa("S", boyut=2000)} == {"k0", "k1"}
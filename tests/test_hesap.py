@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""Vektörel formüller, eski paneldeki satır satır formüllerle aynı sonucu vermeli."""
+import math
+
+import numpy as np
+import pytest
+
+from hum import hesap
+
+# Eski hum_panel.py'deki render_* döngülerinden (yoğunluk ve katsayılar sabit).
+NPU_KATSAYI = {65: 7.09, 80: 8.64, 100: 10.60, 120: 13.40, 140: 16.00,
+               160: 18.80, 180: 22.00, 200: 25.30, 300: 46.20, 320: 59.50}
+HEB_KATSAYI = {100: 20.40, 120: 26.70, 160: 42.60, 180: 51.20,
+               200: 61.30, 220: 71.50, 240: 83.20, 320: 127.00}
+
+
+def _levha(yogunluk):
+    return lambda kal, en, boy: yogunluk * kal * (en / 1000) * (boy / 1000) if kal and en and boy else None
+
+
+def _celik_mil(cap, boy):
+    return (cap ** 2) * 0.0062832 * boy * 7.85 / 8000 if cap and boy else None
+
+
+def _celik_cek_boru(dis, et, boy, ic):
+    if not (dis and boy and (et or ic)):
+        return None
+    ic_eff = ic if ic > 0 else max(dis - 2 * et, 0)
+    return (dis ** 2) * 0.0062832 * boy * 7.85 / 8000 - (ic_eff ** 2) * 0.0062832 * boy * 7.85 / 8000
+
+
+def _profil(kats):
+    return lambda ebat, boy: kats[ebat] * boy / 1000 if boy and ebat in kats else None
+
+
+ESKI = {
+    "kestamit": _levha(1.365),
+    "celik_levha": _levha(7.85),
+    "celik_mil": _celik_mil,
+    "altikose": lambda ebat, boy: (ebat ** 2 * boy * 0.012) / (math.sqrt(3) * 1000) if ebat and boy else None,
+    "kare": lambda ebat, boy: (ebat * ebat * boy * 0.00785) / 1000 if ebat and boy else None,
+    "lama": lambda gen, yuk, boy: (gen * yuk * boy * 0.00785) / 1000 if gen and yuk and boy else None,
+    "kosebent": lambda ebat, et, boy: (2 * ebat * et * boy * 0.00785) / 1000 if ebat and et and boy else None,
+    "celik_cek_boru": _celik_cek_boru,
+    "dik_boru_kutu": lambda boy: boy / 1000 if boy else None,
+    "npu": _profil(NPU_KATSAYI),
+    "heb": _profil(HEB_KATSAYI),
+}
+
+
+ALANLAR = {
+    "kestamit": ("kal", "en", "boy"),
+    "celik_levha": ("kal", "en", "boy"),
+    "celik_mil": ("cap", "boy"),
+    "altikose": ("ebat", "boy"),
+    "kare": ("ebat", "boy"),
+    "lama": ("gen", "yuk", "boy"),
+    "kosebent": ("ebat", "et", "boy"),
+    "celik_cek_boru": ("dis", "et", "boy", "ic"),
+    "dik_boru_kutu": ("boy",),
+    "npu": ("ebat", "boy"),
+    "heb": ("ebat", "boy"),
+}
+
+YENI = {
+    "kestamit": lambda kal, en, boy: hesap.levha_kg(kal, en, boy, 1.365),
+    "celik_levha": lambda kal, en, boy: hesap.levha_kg(kal, en, boy, 7.85),
+    "celik_mil": hesap.celik_mil_kg,
+    "altikose": hesap.altikose_kg,
+    "kare": hesap.kare_kg,
+    "lama": hesap.lama_kg,
+    "kosebent": hesap.kosebent_kg,
+    "celik_cek_boru": hesap.celik_cek_boru_kg,
+    "dik_boru_kutu": hesap.dik_boru_mt,
+    "npu": lambda ebat, boy: hesap.profil_kg(ebat, boy, NPU_KATSAYI),
+    "heb": lambda ebat, boy: hesap.profil_kg(ebat, boy, HEB_KATSAYI),
+}
+
+
+def _girdiler(mod_id, n, rng):
+    alanlar = ALANLAR[mod_id]
+    kolonlar = {a: rng.choice([0.0, 0.0, 2.5, 6.0, 40.0, 125.0, 1000.0, 6000.0], n) for a in alanlar}
+    if "ebat" in kolonlar and mod_id in ("npu", "heb"):
+        kats = NPU_KATSAYI if mod_id == "npu" else HEB_KATSAYI
+        kolonlar["ebat"] = rng.choice(sorted(kats) + [0, 110], n).astype(float)
+    return kolonlar
+
+
+def _karsilastir(mod_id, kolonlar, sonuc):
+    for i in range(len(sonuc)):
+        beklenen = ESKI[mod_id](*(float(kolonlar[a][i]) for a in ALANLAR[mod_id]))
+        if beklenen is None:
+            assert np.isnan(sonuc[i]), (mod_id, i)
+        else:
+            assert sonuc[i] == pytest.approx(beklenen, rel=1e-12), (mod_id, i)
+
+
+@pytest.mark.parametrize("mod_id", sorted(ESKI))
+def test_eski_skaler_formullerle_ayni(mod_id):
+    rng = np.random.default_rng(len(mod_id))
+    kolonlar = _girdiler(mod_id, 500, rng)
+    _karsilastir(mod_id, kolonlar, YENI[mod_id](*(kolonlar[a] for a in ALANLAR[mod_id])))
+
+
+@pytest.mark.parametrize("mod_id", sorted(ESKI))
+def test_modul_hesapla_eski_formullerle_ayni(mod_id):
+    assert hesap.FORMULLER[mod_id].alanlar == ALANLAR[mod_id]
+    rng = np.random.default_rng(len(mod_id) + 1)
+    kolonlar = _girdiler(mod_id, 500, rng)
+    _karsilastir(mod_id, kolonlar, hesap.modul_hesapla(mod_id, kolonlar))
+
+
+def test_karisik_modul_bazinda_ayni():
+    rng = np.random.default_rng(7)
+    malzeme = rng.choice(sorted(hesap.FORMULLER) + ["bilinmeyen"], 2000)
+    kolonlar = {a: rng.uniform(1, 500, 2000) for f in hesap.FORMULLER.values() for a in f.alanlar}
+    sonuc = hesap.karisik_hesapla(malzeme, kolonlar)
+    for mod_id in np.unique(malzeme):
+        sec = malzeme == mod_id
+        if mod_id == "bilinmeyen":
+            assert np.isnan(sonuc[sec]).all()
+        else:
+            alt = {a: v[sec] for a, v in kolonlar.items()}
+            np.testing.assert_array_equal(sonuc[sec], hesap.modul_hesapla(mod_id, alt))
+
+
+def test_kolonsuz_modul_satir_sayisini_korur():
+    # Hiç ölçü kolonu olmayan BOM satırları boyut hatası değil NaN vermeli.
+    assert len(hesap.modul_hesapla("celik_mil", {}, 3)) == 3
+    sonuc = hesap.karisik_hesapla(["celik_mil", "kare"], {})
+    assert sonuc.shape == (2,) and np.isnan(sonuc).all()
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Arka plan işleri: süreç havuzunda BOM/kesim/kod işleri, iptal ve yeniden başlatma."""
+import json
+import os
+import time
+
+import pytest
+
+from hum import isler
+from hum.isler import IsIptal, IsYoneticisi
+
+
+@pytest.fixture
+def yonetici(tmp_path):
+    y = IsYoneticisi(str(tmp_path / "isler"), 1)
+    yield y
+    y.kapat()
+
+
+def _bekle(y, is_id, sure=120.0):
+    son = time.monotonic() + sure
+    while time.monotonic() < son:
+        d = y.durum(is_id)
+        if d.durum in isler.BITMIS:
+            return d
+        time.sleep(0.1)
+    raise AssertionError(f"iş bitmedi: {y.durum(is_id)}")
+
+
+def test_isler_havuzda_calisir(yonetici, tmp_path):
+    csv = "Malzeme,cap,boy,Adet\n" + "celik_mil,20,1000,2\n" * 300 + "bilinmeyen,1,1,1\n"
+    bom_id = yonetici.gonder("bom", "bom", {"parca_boyu": 100}, csv.encode(), "liste.CSV")
+    kesim_id = yonetici.gonder("kesim", "kesim", {
+        "parcalar": [[1200, 5], [800, 3]], "stoklar": [6000], "kerf": 3.0, "sure": 0.2, "kg_m": 2.0,
+    })
+    kod_csv = "tip,siparis,mamul_no\nM,2401,001\nM,2401,001\nM,,002\n"
+    kod_id = yonetici.gonder("kod", "kod", {"depo": str(tmp_path / "kodlar"), "kaydet": True}, kod_csv.encode(), "k.csv")
+
+    d = _bekle(yonetici, bom_id)
+    assert d.durum == "bitti", d.mesaj
+    assert d.ozet["satir"] == 301 and d.ozet["hatali"] == 1
+    assert os.path.basename(d.sonuc) == "sonuc.csv"
+    assert sum(1 for _ in open(d.sonuc, encoding="utf-8")) == 302
+
+    d = _bekle(yonetici, kesim_id)
+    assert d.durum == "bitti", d.mesaj
+    assert d.ozet["bar_sayisi"] >= d.ozet["alt_sinir"] >= 2
+    assert d.ozet["satin_alma_kg"] == pytest.approx(d.ozet["bar_sayisi"] * 12.0)
+
+    d = _bekle(yonetici, kod_id)
+    assert d.durum == "bitti", d.mesaj
+    assert d.ozet["durum"] == {"yeni": 1, "tekrar": 1, "hatali": 1} and d.ozet["kaydedilen"] == 1
+
+    assert [i.id for i in yonetici.liste()] == sorted([bom_id, kesim_id, kod_id], reverse=True)
+    yonetici.sil(bom_id)
+    assert not os.path.exists(os.path.join(yonetici.klasor, bom_id))
+    with pytest.raises(ValueError):
+        yonetici.gonder("yok", "", {})
+
+
+def test_iptal_isareti_bloklar_arasinda_durdurur(tmp_path):
+    klasor = str(tmp_path / "is")
+    os.makedirs(klasor)
+    with open(os.path.join(klasor, "girdi.csv"), "w", encoding="utf-8") as f:
+        f.write("Malzeme,cap,boy\n" + "celik_mil,20,1000\n" * 500)
+    open(os.path.join(klasor, "iptal"), "w").close()
+    with pytest.raises(IsIptal):
+        isler._calistir("bom", klasor, {"girdi": "girdi.csv", "parca_boyu": 100})
+    assert not os.path.exists(os.path.join(klasor, "sonuc.csv"))
+
+
+def test_yarim_isler_acilista_hataya_cekilir(tmp_path):
+    klasor = str(tmp_path / "isler")
+    os.makedirs(os.path.join(klasor, "eski"))
+    with open(os.path.join(klasor, "eski", "is.json"), "w", encoding="utf-8") as f:
+        json.dump({"tur": "bom", "ad": "eski", "durum": "bekliyor", "olusturma": 1.0}, f)
+    y = IsYoneticisi(klasor, 1)
+    d = y.durum("eski")
+    assert d.durum == "hata" and d.mesaj == "Panel yeniden başladı"
+
+
+def test_sahibi_calisan_islere_dokunulmaz(tmp_path):
+    klasor = str(tmp_path / "isler")
+    makine = IsYoneticisi(klasor, 1).sahip["makine"]
+    sahipler = {
+        "olu": {"makine": makine, "pid": 2 ** 22 + 1},
+        "canli": {"makine": makine, "pid": os.getppid()},
+        "uzak": {"makine": makine + "-baska", "pid": 1},
+    }
+    for ad, sahip in sahipler.items():
+        os.makedirs(os.path.join(klasor, ad))
+        with open(os.path.join(klasor, ad, "is.json"), "w", encoding="utf-8") as f:
+            json.dump({"tur": "bom", "durum": "bekliyor", "sahip": sahip}, f)
+        open(os.path.join(klasor, ad, "sonuc.csv.tmp"), "w").close()
+    y = IsYoneticisi(klasor, 1)
+    assert {ad: y.durum(ad).durum for ad in sahipler} == {"olu": "hata", "canli": "bekliyor", "uzak": "bekliyor"}
+    assert not os.path.exists(os.path.join(klasor, "olu", "sonuc.csv.tmp"))
+    assert os.path.exists(os.path.join(klasor, "canli", "sonuc.csv.tmp"))
+
+
+def test_iptalde_gecici_sonuc_silinir(tmp_path):
+    klasor = str(tmp_path / "is")
+    os.makedirs(klasor)
+    with open(os.path.join(klasor, "girdi.csv"), "w", encoding="utf-8") as f:
+        f.write("Malzeme,cap,boy\n" + "celik_mil,20,1000\n" * 500)
+    ilerle = isler._Ilerleme(klasor)
+
+    def iptal_et(oran, mesaj="", zorla=False):
+        if oran > 0.3:
+            open(os.path.join(klasor, "iptal"), "w").close()
+        ilerle(oran, mesaj, zorla)
+
+    with pytest.raises(IsIptal):
+        isler._is_bom(klasor, {"girdi": "girdi.csv", "parca_boyu": 100}, iptal_et)
+    assert sorted(os.listdir(klasor)) == ["girdi.csv", "ilerleme.json", "iptal"]
+
+
+def test_kesim_isi_plan_sirasinda_iptal_edilir(tmp_path):
+    klasor = str(tmp_path / "is")
+    os.makedirs(klasor)
+    ilerle = isler._Ilerleme(klasor)
+    cagri = []
+
+    def iptal_et(oran, mesaj="", zorla=False):
+        cagri.append(oran)
+        if len(cagri) == 2:  # ilk iyileştirme turu
+            open(os.path.join(klasor, "iptal"), "w").close()
+        ilerle(oran, mesaj, zorla)
+
+    ayar = {"parcalar": [[1000.0 + 37 * i, 5] for i in range(40)], "stoklar": [6000.0], "kerf": 3.0, "sure": 30.0, "kg_m": 1.0}
+    with pytest.raises(IsIptal):
+        isler._is_kesim(klasor, ayar, iptal_et)
+    assert 0.9 not in cagri  # plan bitmeden kesildi
+    assert not os.path.exists(os.path.join(klasor, "sonuc.csv"))
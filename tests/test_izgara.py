@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""Izgara modu: artımlı toplam, her adımda baştan hesapla aynı olmalı."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from hum.hesap import modul_hesapla
+from hum.izgara import IzgaraHesap
+
+
+def _tam_hesap(mod_id, df, alanlar):
+    sayi = df.reindex(columns=alanlar + ["adet"]).apply(pd.to_numeric, errors="coerce")
+    miktar = modul_hesapla(mod_id, {a: sayi[a].to_numpy(np.float64) for a in alanlar})
+    adet = sayi["adet"].fillna(1).to_numpy(np.float64)
+    return miktar, float(np.nansum(miktar * adet))
+
+
+@pytest.mark.parametrize("mod_id", ["celik_mil", "lama", "heb"])
+def test_artimli_toplam_tam_hesapla_ayni(mod_id):
+    rng = np.random.default_rng(7)
+    iz = IzgaraHesap(mod_id)
+    alanlar = iz.alanlar
+    deger = {"ebat": [100, 200, 300, 999]}  # profil ebatları; 999 katalogda yok
+
+    def rastgele_satir():
+        satir = {a: float(rng.choice(deger.get(a, [10, 25.5, 40, 120]))) for a in alanlar}
+        satir["adet"] = float(rng.integers(1, 5)) if rng.random() > 0.2 else np.nan
+        if rng.random() < 0.1:
+            satir[alanlar[0]] = np.nan  # eksik girdi
+        return satir
+
+    df = pd.DataFrame([rastgele_satir() for _ in range(20)])
+    sonraki = len(df)
+    for adim in range(40):
+        islem = rng.integers(0, 4)
+        if islem == 0 and len(df):
+            i = df.index[rng.integers(len(df))]
+            df.loc[i] = pd.Series(rastgele_satir())
+        elif islem == 1:
+            df.loc[sonraki] = pd.Series(rastgele_satir())
+            sonraki += 1
+        elif islem == 2 and len(df) > 1:
+            df = df.drop(df.index[rng.integers(len(df))])
+        # islem 3: değişiklik yok
+
+        sonuc = iz.guncelle(df.copy())
+        miktar, toplam = _tam_hesap(mod_id, df, alanlar)
+        np.testing.assert_allclose(sonuc["miktar_adet"].to_numpy(), miktar, equal_nan=True)
+        assert iz.toplam == pytest.approx(toplam, rel=1e-9, abs=1e-9), adim
+        if islem == 3 and adim:
+            assert iz.son_kirli == 0
+
+
+def test_sadece_degisen_satirlar_hesaplanir():
+    iz = IzgaraHesap("celik_mil")
+    df = pd.DataFrame({"cap": [20.0, 30.0, 40.0], "boy": [1000.0] * 3, "adet": [1, 2, np.nan]})
+    iz.guncelle(df)
+    assert iz.son_kirli == 3 and iz.satir == 3 and iz.adet == 4
+    df.loc[1, "cap"] = 35.0
+    iz.guncelle(df)
+    assert iz.son_kirli == 1
+    df = df.astype({"cap": object})
+    df.loc[1, "cap"] = "abc"  # sayı değil: satır sonuçsuz kalır
+    iz.guncelle(df)
+    assert iz.satir == 2 and iz.adet == 2
+    assert iz.toplam == pytest.approx(_tam_hesap("celik_mil", df, iz.alanlar)[1])
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""Katalog: CSV -> .humk derleme, mmap okuma ve değişiklikte yeniden yükleme."""
+import os
+import shutil
+
+import pytest
+
+from hum import katalog
+
+KAYNAK = katalog.VARSAYILAN_CSV
+
+
+@pytest.fixture
+def gecici_katalog(tmp_path, monkeypatch):
+    """Kopya CSV'yi aktif katalog yapar; test sonunda önceki katalog geri gelir."""
+    yol = str(tmp_path / "katalog.csv")
+    shutil.copy(KAYNAK, yol)
+    onceki = katalog._aktif
+    monkeypatch.setenv("HUM_KATALOG", yol)
+    yield yol
+    katalog._aktif = onceki
+
+
+def test_derlenen_katalog_csv_ile_ayni(tmp_path):
+    hedef = katalog.derle(KAYNAK, str(tmp_path / "k.humk"))
+    kat = katalog.Katalog(hedef)
+    satirlar = [s.split(",") for s in open(KAYNAK, encoding="utf-8").read().splitlines()[1:]]
+    profiller = [s for s in satirlar if s[0] == "profil"]
+    assert len(kat) == len(profiller)
+    for _, aile, ebat, deger, _ in profiller:
+        assert kat.katsayi(aile.lower(), float(ebat)) == float(deger)
+    assert kat.katsayi("HEB", 999) is None
+    assert kat.yogunluk("celik") == 7.85 and kat.yogunluk("kestamit") == 1.365
+    heb = kat.modul_katsayi("heb")
+    assert heb[200] == 61.30 and 140 not in heb  # sadece modülde sunulan ebatlar
+    assert kat.profil_rows()[1] == ("HEB 100", 20.40, 122.40)
+
+
+def test_gecersiz_dosyalar(tmp_path):
+    bozuk = tmp_path / "bozuk.humk"
+    bozuk.write_bytes(b"XXXX" + b"\0" * 16)
+    with pytest.raises(ValueError):
+        katalog.Katalog(str(bozuk))
+    csv = tmp_path / "k.csv"
+    csv.write_text("tip,aile,ebat,deger,modul\nbaska,HEB,100,1,\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        katalog.derle(str(csv))
+
+
+def test_csv_degisince_yeniden_derlenir(gecici_katalog):
+    kat = katalog.yeniden_yukle()
+    assert katalog.aktif() is kat and kat.katsayi("HEB", 200) == 61.30
+    ikili = katalog.ikili_yol(gecici_katalog)
+    zaman = os.stat(ikili).st_mtime_ns
+
+    # İçerik aynıysa ikili dosya yeniden yazılmaz.
+    assert katalog.yeniden_yukle().surum == kat.surum
+    assert os.stat(ikili).st_mtime_ns == zaman
+
+    with open(gecici_katalog, "a", encoding="utf-8") as f:
+        f.write("profil,HEB,1000,314.00,heb\n")
+    yeni = katalog.yeniden_yukle()
+    assert yeni.surum != kat.surum and katalog.aktif() is yeni
+    assert yeni.katsayi("HEB", 1000) == 314.0 and yeni.modul_katsayi("heb")[1000] == 314.0
+    # Eski nesneyi tutan okuyucu kendi verisini görmeye devam eder.
+    assert kat.katsayi("HEB", 1000) is None and kat.katsayi("HEB", 200) == 61.30
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/maps"), reason="/proc gerekli")
+def test_esleme_acik_kalmaz(gecici_katalog):
+    # Açık eşleme Windows'ta os.replace'i engeller; tablolar kopyalanıp eşleme kapanır.
+    kat = katalog.yeniden_yukle()
+    ikili = os.path.realpath(katalog.ikili_yol(gecici_katalog))
+    with open("/proc/self/maps", encoding="utf-8") as f:
+        assert ikili not in f.read()
+    assert kat.katsayi("HEB", 200) == 61.30
+
+
+def test_izleyici_hatayi_loglar(gecici_katalog, monkeypatch, caplog):
+    katalog.yeniden_yukle()
+
+    class _Dur(Exception):
+        pass
+
+    turlar = []
+
+    def uyu(_):
+        turlar.append(1)
+        if len(turlar) == 1:
+            with open(gecici_katalog, "w", encoding="utf-8") as f:
+                f.write("tip,aile,ebat,deger,modul\nbaska,HEB,100,1,\n")
+        else:
+            raise _Dur()
+
+    monkeypatch.setattr(katalog.time, "sleep", uyu)
+    with pytest.raises(_Dur):
+        katalog._izle(0.0)
+    assert [r.name for r in caplog.records] == ["hum.katalog"]
+    assert "yeniden yüklenemedi" in caplog.records[0].getMessage() and caplog.records[0].exc_info
+    assert katalog.aktif().katsayi("HEB", 200) == 61.30
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""1D kesim planının değişmezleri: sığma, kerf, parça sayısı."""
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from hum import kesim
+
+
+def _kesim_parcalari(rng, tip):
+    return [(float(b), int(a)) for b, a in zip(rng.integers(200, 3000, tip), rng.integers(1, 30, tip))]
+
+
+@pytest.mark.parametrize("sure", [0.0, 0.2])
+@pytest.mark.parametrize("kerf", [0.0, 3.0])
+def test_kesim_plani_degismezleri(sure, kerf):
+    rng = np.random.default_rng(int(kerf * 10 + sure * 10))
+    parcalar = _kesim_parcalari(rng, 25)
+    stoklar = (3000.0, 4500.0, 6000.0)
+    plan = kesim.planla(parcalar, stoklar, kerf=kerf, sure=sure)
+
+    kesilen = Counter()
+    for d in plan.desenler:
+        assert d.stok in stoklar
+        # Her parça + kerf barın içinde, son parçadan sonra kerf gerekmez.
+        assert sum(d.parcalar) + kerf * (len(d.parcalar) - 1) <= d.stok + 1e-6
+        for p in d.parcalar:
+            kesilen[p] += d.adet
+    talep = Counter()
+    for b, a in parcalar:
+        talep[b] += a
+    assert kesilen == talep
+    assert plan.bar_sayisi == sum(d.adet for d in plan.desenler) >= plan.alt_sinir
+    assert plan.parca_mm == pytest.approx(sum(b * a for b, a in parcalar))
+    assert 0 < plan.verim <= 1
+
+
+def test_kesim_stoktan_uzun_parca():
+    with pytest.raises(ValueError):
+        kesim.planla([(7000, 1)], (6000,))
+
+
+@pytest.mark.parametrize("adet", [2.5, 0, -1])
+def test_kesim_gecersiz_adet(adet):
+    with pytest.raises(ValueError, match=r"2\. satır"):
+        kesim.planla([(1000, 2), (500, adet)], (6000,))
+
+
+def test_kesim_tam_sayi_float_adet():
+    plan = kesim.planla([(1000, 6.0), (500, 2)], (6000,))
+    assert plan.parca_mm == 7000
+
+
+def test_kesim_kontrol_iyilestirmeyi_keser():
+    class _Dur(Exception):
+        pass
+
+    cagri = []
+
+    def kontrol():
+        cagri.append(1)
+        if len(cagri) == 3:
+            raise _Dur
+
+    rng = np.random.default_rng(7)
+    with pytest.raises(_Dur):
+        kesim.planla(_kesim_parcalari(rng, 25), (6000.0,), kerf=3.0, sure=5.0, kontrol=kontrol)
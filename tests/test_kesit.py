@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Kesit motoru: kapalı formüllerle alan, geçersiz ölçüler ve alan önbelleği."""
+import math
+
+import numpy as np
+import pytest
+
+from hum import hesap, kesit
+
+
+@pytest.fixture(autouse=True)
+def _bos_onbellek():
+    kesit._alanlar.clear()
+    yield
+    kesit._alanlar.clear()
+
+
+def test_kapali_formuller():
+    ebat = np.array([10.0, 25.0, 60.0])
+    np.testing.assert_allclose(kesit.alan("daire", {"cap": ebat}), math.pi / 4 * ebat**2, rtol=1e-12)
+    np.testing.assert_allclose(kesit.alan("altikose", {"ebat": ebat}), math.sqrt(3) / 2 * ebat**2, rtol=1e-12)
+    np.testing.assert_allclose(kesit.alan("kosebent", {"ebat": ebat, "et": 3}), 2 * ebat * 3 - 9, rtol=1e-12)
+    np.testing.assert_allclose(
+        kesit.kg("dikdortgen", {"gen": ebat, "yuk": 10}, 1000),
+        hesap.lama_kg(ebat, 10, 1000), rtol=1e-12,
+    )
+
+
+def test_gecersiz_olculer_nan():
+    # Et çapın yarısını aşan boru dolu mil sayılmamalı.
+    a = kesit.alan("boru", {"dis": [50, 50, 50, 0], "et": [5, 25, 30, 5]})
+    assert a[0] == pytest.approx(math.pi / 4 * (50**2 - 40**2))
+    assert a[1] == pytest.approx(math.pi / 4 * 50**2)
+    assert np.isnan(a[2:]).all()
+    assert np.isnan(kesit.alan("kutu", {"gen": 40, "yuk": 20, "et": 10})).all()
+    assert np.isnan(kesit.alan("kosebent", {"ebat": 5, "et": 5})).all()
+
+
+def test_onbellek_buyurken_dogru_kalir():
+    rng = np.random.default_rng(5)
+    gorulen = []
+    for _ in range(300):
+        n = int(rng.integers(1, 400))
+        dis = rng.integers(10, 5000, n).astype(float)
+        et = rng.choice([1.0, 2.5, 4.0], n)
+        gorulen.append((dis, et))
+        np.testing.assert_allclose(
+            kesit.alan("boru", {"dis": dis, "et": et}), math.pi / 4 * (dis**2 - (dis - 2 * et) ** 2), rtol=1e-9
+        )
+    ob = kesit._alanlar["boru"]
+    assert 2 * ob.n <= len(ob.yuva_sira)
+    assert ob.n == len({(d, e) for dis, et in gorulen for d, e in zip(dis, et)})
+    # Önbellekten gelen alanlar da aynı.
+    dis, et = map(np.concatenate, zip(*gorulen))
+    np.testing.assert_allclose(
+        kesit.alan("boru", {"dis": dis, "et": et}), math.pi / 4 * (dis**2 - (dis - 2 * et) ** 2), rtol=1e-9
+    )
+
+
+def test_cokgen_delikli():
+    s = kesit.cokgen([(0, 0), (100, 0), (100, 50), (0, 50)], [[(10, 10), (20, 10), (20, 20), (10, 20)]])
+    assert kesit.alan(s, {})[0] == pytest.approx(4900)
+    with pytest.raises(ValueError):
+        kesit.cokgen([(0, 0), (1, 0)])
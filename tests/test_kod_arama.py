@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""Kod önek araması: indeks + kuyruk ve kuyruk sınırı."""
+from hum import kod_arama
+
+
+def _yaz(yol, kodlar):
+    with open(yol + ".txt", "a", encoding="utf-8") as f:
+        f.writelines(k + "\n" for k in kodlar)
+
+
+def test_onek_aramasi(tmp_path):
+    yol = str(tmp_path / "kodlar")
+    _yaz(yol, [f"M-{i:05d}" for i in range(0, 1000, 2)])
+    ix = kod_arama.KodIndeksi(yol)
+    _yaz(yol, [f"M-{i:05d}" for i in range(1, 100, 2)] + ["Y-1"])
+    ix.tazele()
+    assert len(ix) == 551
+    toplam, kodlar = ix.ara("M-000", limit=5)
+    assert toplam == 100 and kodlar == ["M-00000", "M-00001", "M-00002", "M-00003", "M-00004"]
+    assert ix.ara("Y")[0] == 1 and ix.ara("Z") == (0, [])
+
+
+def test_kuyruk_siniri_asilinca_indeks_yenilenir(tmp_path, monkeypatch):
+    monkeypatch.setattr(kod_arama, "KUYRUK_SINIRI", 10)
+    yol = str(tmp_path / "kodlar")
+    _yaz(yol, ["A"])
+    ix = kod_arama.KodIndeksi(yol)
+    _yaz(yol, [f"B{i}" for i in range(11)])
+    ix.tazele()
+    assert len(ix._kuyruk) == 0 and len(ix._ana) == 12
+    # Yeniden açılışta da sınır uygulanır.
+    _yaz(yol, [f"C{i}" for i in range(11)])
+    assert len(kod_arama.KodIndeksi(yol)._kuyruk) == 0
+    ix.tazele()
+    assert ix.ara("C")[0] == 11 and len(ix) == 23
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""Toplu kodlama tekil kod fonksiyonlarıyla aynı; kod deposu onarım ve eşzamanlılık."""
+import threading
+
+import numpy as np
+import pandas as pd
+
+from hum.kodlama import (
+    KodDeposu,
+    build_mamul_code,
+    build_yari_mamul_code,
+    kod_ozeti,
+    kod_tablosu,
+    toplu_kodla,
+)
+
+
+def _tablo():
+    return pd.DataFrame({
+        "Tip": ["MAMUL", "", "Y", "yari mamul", "M", "Y", "", "X", "Y"],
+        "Siparis": ["2401", "2401", "2402", "2402", "2403", "2404", "", "2405", "24-06"],
+        "Unite": ["U1", "", "", "", "", "", "", "", ""],
+        "Mamul_No": ["001", "002", "3", "004", "005", "006", "007", "008", "009"],
+        "Uretici": ["", "ht", "FL", "HK", "", "HK", "", "", "HK"],
+        "Resim": ["", "R7", "", "", "", "", "", "", ""],
+        "A1": ["", "1", "", "", "", "", "", "", ""],
+        "A2": ["", "2", "", "", "", "3", "", "", ""],
+        "A3": ["", "", "", "", "", "", "", "", ""],
+    })
+
+
+def test_kod_tablosu_tekil_fonksiyonlarla_ayni():
+    df = kod_tablosu(_tablo())
+    assert df["kod"].tolist()[:5] == [
+        build_mamul_code("M", "2401", "U1", "001"),
+        build_yari_mamul_code("Y", "HT", "2401", "002", "R7", "1", "2"),
+        build_yari_mamul_code("Y", "FL", "2402", "3"),
+        build_yari_mamul_code("Y", "HK", "2402", "004"),
+        build_mamul_code("M", "2403", "", "005"),
+    ]
+    assert df["hata"].tolist() == [
+        "", "", "", "", "", "alt poz sırası",
+        "sipariş/mamul no eksik", "bilinmeyen tip", "alan içinde '-'",
+    ]
+
+
+def test_sayisal_kolonlar():
+    # XLSX'ten sayı olarak okunan kolonlar: 2402.0 -> "2402"
+    df = kod_tablosu(pd.DataFrame({"siparis": [2402.0, 2403.0], "mamul_no": [7.0, 8.5]}))
+    assert df["kod"].tolist() == ["M-2402-7", "M-2403-8.5"]
+
+
+def test_toplu_kodla_durumlar(tmp_path):
+    depo = KodDeposu(str(tmp_path / "kodlar"))
+    depo.kaydet(["M-2401-U1-001"])
+    tablo = _tablo()
+    bloklar = list(toplu_kodla([tablo.iloc[:3], tablo.iloc[:3], tablo.iloc[3:]], depo))
+    assert [d["durum"].tolist() for d in bloklar] == [
+        ["mevcut", "yeni", "yeni"],
+        ["tekrar", "tekrar", "tekrar"],
+        ["yeni", "yeni", "hatali", "hatali", "hatali", "hatali"],
+    ]
+
+
+def test_yarim_yazma_onarilir(tmp_path):
+    yol = str(tmp_path / "kodlar")
+    depo = KodDeposu(yol)
+    assert depo.kaydet(["A", "B", "A"]) == 2 and depo.kaydet(["B"]) == 0
+    # Kesilen yazma: son satır yarım, özet dosyası eksik.
+    with open(yol + ".txt", "a", encoding="utf-8") as f:
+        f.write("C\nYAR")
+    with open(yol + ".hash", "r+b") as f:
+        f.truncate(8)
+    onarilan = KodDeposu(yol)
+    assert open(yol + ".txt", encoding="utf-8").read() == "A\nB\nC\n"
+    beklenen = np.array([kod_ozeti(k) for k in "ABC"], "<u8")
+    assert np.array_equal(np.fromfile(yol + ".hash", "<u8"), beklenen)
+    assert len(onarilan) == 3 and "C" in onarilan and "YAR" not in onarilan
+
+
+def test_eszamanli_kayit_tekrarsiz(tmp_path):
+    yol = str(tmp_path / "kodlar")
+    depolar = [KodDeposu(yol) for _ in range(4)]
+    kodlar = [f"M-{i:05d}" for i in range(400)]
+
+    def yaz(d, bas):
+        for i in range(bas, len(kodlar), 37):
+            d.kaydet(kodlar[i:i + 50])
+
+    isler = [threading.Thread(target=yaz, args=(d, i)) for i, d in enumerate(depolar)]
+    for t in isler:
+        t.start()
+    for t in isler:
+        t.join()
+    satirlar = open(yol + ".txt", encoding="utf-8").read().splitlines()
+    assert sorted(satirlar) == kodlar
+    ozetler = np.fromfile(yol + ".hash", "<u8").tolist()
+    assert ozetler == [kod_ozeti(k) for k in satirlar]
+    son = KodDeposu(yol)
+    assert len(son) == 400
+    for d in depolar:
+        d.tazele()
+        assert len(d) == 400
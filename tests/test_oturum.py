@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""Oturum deposu: birleşen yazımlar, SQLite kalıcılığı ve RESP istemcisi."""
+import socket
+import threading
+
+import pytest
+
+from hum import oturum
+from hum.oturum import RedisOturumDeposu, SqliteOturumDeposu
+
+
+def test_jeton_ve_paket():
+    j = oturum.yeni_jeton()
+    assert oturum.gecerli_jeton(j)
+    assert not oturum.gecerli_jeton("kisa") and not oturum.gecerli_jeton("a" * 20 + "/")
+    assert not oturum.gecerli_jeton(None)
+    d = {"mod": "heb", "ebat": 200, "ad": "çelik"}
+    assert oturum.coz(oturum.paketle(d)) == d
+    assert oturum.coz(b"bozuk") == {} and oturum.coz(None) == {}
+
+
+def test_sqlite_birlesen_yazimlar(tmp_path):
+    yol = str(tmp_path / "o.sqlite")
+    d = SqliteOturumDeposu(yol)
+    j = oturum.yeni_jeton()
+    for i in range(10):
+        d.yaz(j, {"sayac": i})
+    assert d.oku(j) == {"sayac": 9}  # yazılmadan önce de okunur
+    assert d.bosalt()
+    assert d.birlesen >= 1 and d.yazilan <= 10
+    # Başka kopya (ayrı depo) aynı dosyadan okur.
+    assert SqliteOturumDeposu(yol).oku(j) == {"sayac": 9}
+    assert SqliteOturumDeposu(yol).oku(oturum.yeni_jeton()) == {}
+
+
+def test_sqlite_suresi_gecen_silinir(tmp_path):
+    yol = str(tmp_path / "o.sqlite")
+    d = SqliteOturumDeposu(yol)
+    j = oturum.yeni_jeton()
+    d.yaz(j, {"a": 1})
+    assert d.bosalt()
+    assert SqliteOturumDeposu(yol, omur=-1).oku(j) == {}
+
+
+class _SahteRedis:
+    """GET/SET/AUTH/SELECT anlayan tek bağlantılık RESP sunucusu."""
+
+    def __init__(self):
+        self.veri = {}
+        self.komutlar = []
+        self._soket = socket.create_server(("127.0.0.1", 0))
+        self.port = self._soket.getsockname()[1]
+        threading.Thread(target=self._calis, daemon=True).start()
+
+    def _calis(self):
+        while True:
+            con, _ = self._soket.accept()
+            threading.Thread(target=self._hizmet, args=(con,), daemon=True).start()
+
+    def _hizmet(self, con):
+        f = con.makefile("rb")
+        while True:
+            satir = f.readline()
+            if not satir:
+                return
+            komut = []
+            for _ in range(int(satir[1:])):
+                n = int(f.readline()[1:])
+                komut.append(f.read(n + 2)[:-2])
+            self.komutlar.append(komut[0])
+            if komut[0] == b"GET":
+                v = self.veri.get(komut[1])
+                con.sendall(b"$-1\r\n" if v is None else b"$%d\r\n%s\r\n" % (len(v), v))
+            elif komut[0] == b"SET":
+                self.veri[komut[1]] = komut[2]
+                con.sendall(b"+OK\r\n")
+            elif komut[0] == b"AUTH" and komut[1] != b"gizli":
+                con.sendall(b"-ERR invalid password\r\n")
+            else:
+                con.sendall(b"+OK\r\n")
+
+
+def test_redis_boru_hatti():
+    s = _SahteRedis()
+    d = RedisOturumDeposu(f"redis://:gizli@127.0.0.1:{s.port}/2")
+    jetonlar = [oturum.yeni_jeton() for _ in range(3)]
+    for j in jetonlar:
+        d.yaz(j, {"j": j})
+    assert d.bosalt()
+    assert s.komutlar[:2] == [b"AUTH", b"SELECT"] and s.komutlar.count(b"SET") == 3
+    assert oturum.REDIS_ONEK + jetonlar[0].encode() in s.veri
+    assert RedisOturumDeposu(f"redis://127.0.0.1:{s.port}").oku(jetonlar[1]) == {"j": jetonlar[1]}
+
+    hatali = RedisOturumDeposu(f"redis://:yanlis@127.0.0.1:{s.port}")
+    assert hatali.oku(jetonlar[0]) == {} and hatali.hata == 1
+    hatali.yaz(jetonlar[0], {"x": 1})
+    assert not hatali.bosalt()
+    assert hatali.oku(jetonlar[0]) == {"x": 1}  # yazılamayan değer bekler
+
+
+def test_depo_kapali(monkeypatch):
+    monkeypatch.delenv("HUM_OTURUM", raising=False)
+    assert oturum.depo() is None
+    with pytest.raises(ValueError):
+        RedisOturumDeposu("redis://127.0.0.1:6379/abc")
+
+
+def test_fonksiyon_degeri_bir_kez_paketlenir(tmp_path):
+    d = SqliteOturumDeposu(str(tmp_path / "o.sqlite"))
+    j = oturum.yeni_jeton()
+    cagri = []
+
+    def degerler(i):
+        def uret():
+            cagri.append(i)
+            return {"siparis": list(range(i))}
+        return uret
+
+    for i in range(5):
+        d.yaz(j, degerler(i))
+    assert d.bosalt()
+    assert cagri == [4]  # birleşen eski değerler hiç üretilmez
+    assert SqliteOturumDeposu(d.yol).oku(j) == {"siparis": [0, 1, 2, 3]}
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Sipariş toplamları: artımlı güncelleme, baştan toplamayla (``yeniden_topla``) aynı kalmalı."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from hum import siparis
+from hum.hesap import OLCU_ALANLARI
+
+AILELER = list(siparis.AILELER)
+
+
+def _satirlar(rng, n):
+    malzeme = rng.choice(AILELER + ["bilinmeyen"], n).tolist()
+    kolonlar = {a: rng.choice([0.0, 5.0, 20.0, 40.0, 100.0, 120.0, 1000.0], n) for a in OLCU_ALANLARI}
+    return malzeme, kolonlar, rng.integers(1, 20, n).astype(float)
+
+
+def _toplamlar(sip):
+    return sip.aile_toplamlari(), sip.hatali, sip.toplam("kg"), sip.toplam("mt"), sip.tutar
+
+
+def _ayni(a, b):
+    pd.testing.assert_frame_equal(a[0], b[0], check_exact=False, rtol=1e-9, atol=1e-9)
+    assert a[1] == b[1]
+    for x, y in zip(a[2:], b[2:]):
+        assert x == pytest.approx(y, rel=1e-9, abs=1e-9)
+
+
+def test_artimli_toplamlar_yeniden_toplamayla_ayni():
+    rng = np.random.default_rng(11)
+    sip = siparis.Siparis({a: float(i + 1) for i, a in enumerate(AILELER)})
+    for _ in range(40):
+        islem = rng.integers(3)
+        idler = sip.idler()
+        if islem == 0 or len(idler) < 10:
+            sip.ekle(*_satirlar(rng, int(rng.integers(1, 200))))
+        elif islem == 1:
+            sec = rng.choice(idler, int(rng.integers(1, 10)), replace=False)
+            sip.guncelle(sec, *_satirlar(rng, len(sec)))
+        else:
+            sip.sil(rng.choice(idler, int(rng.integers(1, 10)), replace=False))
+        artimli = _toplamlar(sip)
+        sip.yeniden_topla()
+        _ayni(artimli, _toplamlar(sip))
+
+    # Toplamlar satır tablosundan da aynı çıkmalı.
+    df = sip.satirlar()
+    gecerli = df["miktar_toplam"].notna()
+    assert sip.hatali == int((~gecerli).sum())
+    assert sip.toplam("kg") == pytest.approx(df.loc[gecerli & (df["birim"] == "kg"), "miktar_toplam"].sum())
+    assert sip.tutar == pytest.approx(df["tutar"].sum())
+
+
+def test_silinen_kimlik_reddedilir():
+    sip = siparis.Siparis()
+    idler = sip.ekle(["celik_mil", "kare"], {"cap": [50, np.nan], "ebat": [np.nan, 40], "boy": [1000, 500]})
+    sip.sil(idler[:1])
+    with pytest.raises(KeyError):
+        sip.guncelle(idler[:1], ["celik_mil"], {"cap": [60], "boy": [1000]})
+    assert len(sip) == 1 and list(sip.idler()) == [idler[1]]
+
+
+@pytest.mark.parametrize("n", [0, 1, 300])
+def test_paket_geri_kurulur(n):
+    rng = np.random.default_rng(n)
+    sip = siparis.Siparis({"celik_mil": 42.5})
+    if n:
+        sip.ekle(*_satirlar(rng, n))
+    geri = siparis.Siparis.paketten(siparis.paket(sip.anlik()))
+    pd.testing.assert_frame_equal(
+        sip.satirlar().reset_index(drop=True), geri.satirlar().reset_index(drop=True)
+    )
+    _ayni(_toplamlar(sip), _toplamlar(geri))
+
+
+def test_bozuk_paket():
+    veri = siparis.paket(siparis.Siparis().anlik())
+    with pytest.raises(ValueError):
+        siparis.Siparis.paketten(dict(veri, n=5))
+    with pytest.raises(ValueError):
+        siparis.Siparis.paketten({"n": 1})
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Ters arama: bisect sonuçları katalog üzerinde kaba taramayla aynı olmalı."""
+import pytest
+
+from hum import katalog
+from hum.ters_arama import AgirlikIndeksi
+
+
+@pytest.fixture(scope="module")
+def kat(tmp_path_factory):
+    return katalog.Katalog(katalog.derle(katalog.VARSAYILAN_CSV, str(tmp_path_factory.mktemp("k") / "k.humk")))
+
+
+@pytest.fixture(scope="module")
+def ind(kat):
+    return AgirlikIndeksi(kat)
+
+
+def _tum(kat):
+    return [(kat.aileler[a], e, k) for a, e, k in zip(kat.aile.tolist(), kat.ebat.tolist(), kat.kg_m.tolist())]
+
+
+def test_aralik_kaba_taramayla_ayni(kat, ind):
+    tum = _tum(kat)
+    assert len(ind) == len(tum)
+    for alt, ust, aileler in [(20, 60, None), (None, 10, None), (50, None, ["heb", "NPU"]), (61.3, 61.3, None), (5, 4, None)]:
+        sonuc = ind.aralik(alt, ust, aileler)
+        secili = {a.upper() for a in aileler} if aileler else None
+        beklenen = sorted(
+            (k, a, e) for a, e, k in tum
+            if (alt is None or k >= alt) and (ust is None or k <= ust) and (secili is None or a in secili)
+        )
+        assert [(p.kg_m, p.aile, p.ebat) for p in sonuc] == beklenen
+
+
+def test_en_hafif_ve_en_yakin(kat, ind):
+    tum = _tum(kat)
+    for hedef in [0, 15.5, 61.3, 100, 10_000]:
+        beklenen = {}
+        for a, e, k in sorted(tum, key=lambda t: t[2]):
+            if k >= hedef:
+                beklenen.setdefault(a, k)
+        assert [p.kg_m for p in ind.en_hafif(hedef)] == sorted(beklenen.values())
+        for k in (1, 3, 7):
+            mesafe = sorted(abs(t[2] - hedef) for t in tum)[:k]
+            assert sorted(abs(p.kg_m - hedef) for p in ind.en_yakin(hedef, k)) == pytest.approx(mesafe)
+            sadece = ind.en_yakin(hedef, k, ["heb"])
+            assert {p.aile for p in sadece} <= {"HEB"}
+
+
+def test_kesit_ve_hatalar(kat, ind):
+    ro = kat.yogunluk("celik") * 0.1
+    assert ind.kg_m(10, "kesit") == pytest.approx(10 * ro)
+    assert [p.ad for p in ind.aralik(20 / ro, 30 / ro, olcu="kesit")] == [p.ad for p in ind.aralik(20, 30)]
+    with pytest.raises(ValueError):
+        ind.kg_m(1, "hacim")
+    with pytest.raises(ValueError):
+        ind.aralik(1, 2, ["YOK"])
+    assert kat.agirlik_indeksi() is kat.agirlik_indeksi()
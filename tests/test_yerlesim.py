@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""2D levha yerleşiminin değişmezleri: sığma, çakışmama, parça sayısı."""
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from hum import yerlesim
+
+
+def _cakisir(a, b):
+    return a.x < b.x + b.en and b.x < a.x + a.en and a.y < b.y + b.boy and b.y < a.y + a.boy
+
+
+@pytest.mark.parametrize("dondur", [True, False])
+@pytest.mark.parametrize("kerf", [0.0, 4.0])
+def test_yerlesim_degismezleri(dondur, kerf):
+    rng = np.random.default_rng(int(dondur) * 7 + int(kerf))
+    parcalar = [
+        (str(rng.choice(yerlesim.MALZEMELER)), float(rng.choice([5, 10])),
+         float(rng.integers(50, 900)), float(rng.integers(50, 1500)), int(rng.integers(1, 12)))
+        for _ in range(60)
+    ]
+    _dogrula(parcalar, yerlesim.yerlestir(parcalar, kerf=kerf, dondur=dondur), kerf, dondur)
+
+
+def _dogrula(parcalar, plan, kerf, dondur):
+    talep = Counter()
+    for m, kal, en, boy, adet in parcalar:
+        talep[(m, kal, en, boy)] += adet
+    yerlesen = Counter()
+    for g in plan.gruplar:
+        assert g.parca_adedi == sum(len(lv) for lv in g.levhalar)
+        for lv in g.levhalar:
+            for p in lv:
+                assert p.x >= 0 and p.y >= 0
+                assert p.x + p.en <= g.levha_en + 1e-6 and p.y + p.boy <= g.levha_boy + 1e-6
+                assert dondur or not p.dondu
+                olcu = (p.boy, p.en) if p.dondu else (p.en, p.boy)
+                yerlesen[(g.malzeme, g.kal) + olcu] += 1
+            for i, a in enumerate(lv):
+                for b in lv[i + 1:]:
+                    assert not _cakisir(a, b), (a, b)
+                    if kerf:
+                        # Komşu parçalar arasında en az kerf kadar boşluk kalır.
+                        assert not _cakisir(a._replace(en=a.en + kerf, boy=a.boy + kerf), b)
+    assert yerlesen == talep
+
+
+@pytest.mark.parametrize("dondur", [True, False])
+def test_tek_grup_cok_levha(dondur):
+    # Aynı malzeme/kalınlıkta çok levha: levha atlama ağacı her açık levhayı dolaşır.
+    rng = np.random.default_rng(11 + dondur)
+    parcalar = [
+        ("kestamit", 10.0, float(rng.integers(30, 900)), float(rng.integers(30, 1500)), int(rng.integers(1, 4)))
+        for _ in range(400)
+    ]
+    plan = yerlesim.yerlestir(parcalar, kerf=3.0, dondur=dondur)
+    assert len(plan.gruplar) == 1 and len(plan.gruplar[0].levhalar) > 20
+    _dogrula(parcalar, plan, 3.0, dondur)
+
+
+def test_yerlesim_sigmayan_parca():
+    with pytest.raises(ValueError):
+        yerlesim.yerlestir([("kestamit", 10, 5000, 5000, 1)], levhalar={"kestamit": [(1000, 2000)]})